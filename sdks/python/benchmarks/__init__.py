@@ -0,0 +1,13 @@
+"""Performance benchmarks for the Kadoa Python SDK.
+
+Run individual benchmarks from ``sdks/python``:
+
+    python -m benchmarks.bench_realtime_decode
+
+or the whole suite, recording results in ``benchmarks/results/``:
+
+    python -m benchmarks.suite
+
+API benchmarks run against ``benchmarks.api_server``, a local server
+generated from ``specs/openapi.json``.
+"""
@@ -0,0 +1,309 @@
+"""Local stand-in for the Kadoa public API, generated from ``specs/openapi.json``.
+
+Every operation in the spec gets a route answering with its success status
+and an example body sampled from the response schema (``example``/``default``
+values where the spec has them, otherwise the first enum value or a type
+placeholder). Benchmarks override the routes they exercise with handlers
+producing realistic payloads:
+
+    ```python
+    with MockApiServer() as server:
+        @server.route("GET", "/v4/workflows/{workflowId}")
+        def get_workflow(request):
+            return 200, {**server.sample("GET", "/v4/workflows/{workflowId}"),
+                         "runState": "FINISHED"}
+
+        client = server.client()
+        client.workflow.get("wf-1")
+    ```
+
+The server runs on a background thread (``ThreadingHTTPServer`` with HTTP/1.1
+keep-alive, so the SDK's connection pool behaves as against the real API)
+and needs nothing beyond the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+SPEC_PATH = Path(__file__).resolve().parents[3] / "specs" / "openapi.json"
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+
+_FORMAT_SAMPLES = {
+    "date-time": "2024-01-01T00:00:00Z",
+    "date": "2024-01-01",
+    "uuid": "00000000-0000-4000-8000-000000000000",
+    "email": "bench@example.com",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+}
+
+
+def load_spec(path: Optional[Path] = None) -> Dict[str, Any]:
+    return json.loads((path or SPEC_PATH).read_text(encoding="utf-8"))
+
+
+class SchemaSampler:
+    """Builds example values for OpenAPI 3.0 schemas.
+
+    Args:
+        spec: Parsed OpenAPI document (used to resolve ``$ref``)
+        max_depth: Nesting depth after which objects and arrays are left empty
+    """
+
+    def __init__(self, spec: Dict[str, Any], *, max_depth: int = 8) -> None:
+        self._spec = spec
+        self.max_depth = max_depth
+
+    def resolve(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        while "$ref" in schema:
+            node: Any = self._spec
+            for part in schema["$ref"].lstrip("#/").split("/"):
+                node = node[part]
+            schema = node
+        return schema
+
+    def sample(self, schema: Optional[Dict[str, Any]], depth: int = 0) -> Any:
+        if not schema:
+            return {}
+        schema = self.resolve(schema)
+        if "example" in schema:
+            return schema["example"]
+        if "default" in schema:
+            return schema["default"]
+        if "enum" in schema:
+            return schema["enum"][0]
+        if "allOf" in schema:
+            merged: Dict[str, Any] = {}
+            for part in schema["allOf"]:
+                value = self.sample(part, depth)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+        for combinator in ("oneOf", "anyOf"):
+            if schema.get(combinator):
+                return self.sample(schema[combinator][0], depth)
+
+        kind = schema.get("type")
+        if kind == "object" or "properties" in schema:
+            if depth >= self.max_depth:
+                return {}
+            return {
+                name: self.sample(prop, depth + 1)
+                for name, prop in schema.get("properties", {}).items()
+            }
+        if kind == "array":
+            if depth >= self.max_depth:
+                return []
+            return [self.sample(schema.get("items"), depth + 1)]
+        if kind == "string":
+            return _FORMAT_SAMPLES.get(schema.get("format", ""), "string")
+        if kind == "integer":
+            return max(int(schema.get("minimum", 1)), 1)
+        if kind == "number":
+            return float(schema.get("minimum", 1.0))
+        if kind == "boolean":
+            return True
+        return None
+
+
+class ApiRequest:
+    """A request received by the mock server, as passed to route handlers."""
+
+    __slots__ = ("method", "path", "params", "query", "headers", "body")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, str],
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        body: Any,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.params = params
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+
+Handler = Callable[[ApiRequest], Tuple[int, Any]]
+
+
+class _Route:
+    __slots__ = ("method", "template", "pattern", "status", "schema", "handler", "_body")
+
+    def __init__(self, method: str, template: str, status: int, schema: Any) -> None:
+        self.method = method
+        self.template = template
+        self.pattern = re.compile(
+            "^" + re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template.rstrip("/"))) + "/?$"
+        )
+        self.status = status
+        self.schema = schema
+        self.handler: Optional[Handler] = None
+        self._body: Optional[bytes] = None
+
+
+def _success_response(operation: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    for code, response in sorted(operation.get("responses", {}).items()):
+        if code.startswith("2"):
+            content = response.get("content") or {}
+            media = content.get("application/json") or next(iter(content.values()), {})
+            return int(code), media.get("schema")
+    return 200, None
+
+
+class MockApiServer:
+    """HTTP server answering every operation of the OpenAPI spec.
+
+    Args:
+        spec: Parsed OpenAPI document; defaults to ``specs/openapi.json``
+        api_key: Expected ``x-api-key``; other keys get a 401
+    """
+
+    def __init__(self, spec: Optional[Dict[str, Any]] = None, *, api_key: str = "bench") -> None:
+        self.spec = spec or load_spec()
+        self.api_key = api_key
+        self.sampler = SchemaSampler(self.spec)
+        self.requests: Dict[str, int] = {}
+        self._routes: List[_Route] = []
+        self._routes_by_key: Dict[Tuple[str, str], _Route] = {}
+        for template, item in self.spec.get("paths", {}).items():
+            for method in HTTP_METHODS:
+                if method in item:
+                    status, schema = _success_response(item[method])
+                    route = _Route(method.upper(), template, status, schema)
+                    self._routes.append(route)
+                    self._routes_by_key[(route.method, template)] = route
+        # Literal segments win over parameters (/v4/workflows/bulk vs /{workflowId})
+        self._routes.sort(key=lambda route: route.template.count("{"))
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _route(self, method: str, template: str) -> _Route:
+        route = self._routes_by_key.get((method.upper(), template))
+        if route is None:
+            raise KeyError(f"{method.upper()} {template} is not in the spec")
+        return route
+
+    def sample(self, method: str, template: str) -> Any:
+        """A fresh copy of the generated example body of an operation."""
+        return self.sampler.sample(self._route(method, template).schema)
+
+    def route(self, method: str, template: str) -> Callable[[Handler], Handler]:
+        """Decorator replacing the generated response of a spec operation.
+
+        The handler receives an ``ApiRequest`` and returns ``(status, body)``;
+        ``body`` is JSON encoded unless it is already ``bytes``.
+        """
+        route = self._route(method, template)
+
+        def register(handler: Handler) -> Handler:
+            route.handler = handler
+            return handler
+
+        return register
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.requests.clear()
+
+    def _match(self, method: str, path: str) -> Tuple[Optional[_Route], Dict[str, str]]:
+        for route in self._routes:
+            if route.method == method:
+                match = route.pattern.match(path)
+                if match is not None:
+                    return route, match.groupdict()
+        return None, {}
+
+    def _respond(
+        self, method: str, target: str, headers: Dict[str, str], raw_body: bytes
+    ) -> Tuple[int, bytes]:
+        parts = urlsplit(target)
+        route, params = self._match(method, parts.path)
+        if route is None:
+            return 404, b'{"error":true,"message":"Not found"}'
+        with self._lock:
+            key = f"{method} {route.template}"
+            self.requests[key] = self.requests.get(key, 0) + 1
+        if headers.get("x-api-key") != self.api_key:
+            return 401, b'{"error":true,"message":"Unauthorized"}'
+        if route.handler is None:
+            if route._body is None:
+                route._body = json.dumps(self.sampler.sample(route.schema)).encode()
+            return route.status, route._body
+
+        body = json.loads(raw_body) if raw_body else None
+        request = ApiRequest(
+            method, parts.path, params, dict(parse_qsl(parts.query)), headers, body
+        )
+        status, payload = route.handler(request)
+        if isinstance(payload, bytes):
+            return status, payload
+        return status, json.dumps(payload, separators=(",", ":")).encode()
+
+    def start(self) -> "MockApiServer":
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                headers = {name.lower(): value for name, value in self.headers.items()}
+                status, payload = server._respond(self.command, self.path, headers, raw_body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle  # noqa: N815
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="kadoa-mock-api", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def client(self, **config: Any) -> Any:
+        """A ``KadoaClient`` pointed at this server (environment and .env ignored)."""
+        from kadoa_sdk import KadoaClient, KadoaClientConfig
+
+        options = {"api_key": self.api_key, "base_url": self.base_url, "load_env": False}
+        return KadoaClient(KadoaClientConfig(**{**options, **config}))
+
+    def __enter__(self) -> "MockApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
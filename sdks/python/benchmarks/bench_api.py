@@ -0,0 +1,181 @@
+"""SDK operations against the local mock API (latency, throughput, peak memory).
+
+Runs the public client end to end (request building, urllib3 transport,
+deserialization, SDK result models) against ``benchmarks.api_server``:
+
+- ``fetch_all_data``: auto-pagination over ``--pages`` pages of
+  ``--page-size`` rows
+- ``list_workflows``: one listing of ``--workflows`` workflows
+- ``iter_all``: the same inventory through ``client.workflow.iter_all`` in
+  windows of 100, sequential, with concurrent prefetch, and projected to
+  ``id``/``state``
+- ``get_workflow`` / ``get_status``: one workflow poll, through the fully
+  validated ``client.workflow.get`` and the status-only ``get_status``
+- ``create_run_wait``: create a workflow, run it and wait for the job
+  (the mock reports the job finished on the first poll, so no polling sleep)
+
+Latency is the best of five timing runs; ``peak_kib`` is the tracemalloc peak
+of a single call, measured separately so tracing doesn't skew the timings.
+
+    python -m benchmarks.bench_api --pages 20 --page-size 100 --workflows 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+from benchmarks.api_server import ApiRequest, MockApiServer
+
+
+def _record(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"row-{index}",
+        "title": f"Product {index}",
+        "price": f"{index % 1000}.99",
+        "url": f"https://example.com/products/{index}",
+        "inStock": index % 3 != 0,
+        "tags": ["bench", f"group-{index % 10}"],
+    }
+
+
+def _install_routes(server: MockApiServer, pages: int, page_size: int, workflows: int) -> None:
+    total = pages * page_size
+    page_bodies = [
+        json.dumps(
+            {
+                "workflowId": "wf-bench",
+                "runId": "run-bench",
+                "executedAt": "2024-01-01T00:00:00Z",
+                "data": [_record(index) for index in range(start, min(start + page_size, total))],
+                "pagination": {
+                    "totalCount": total,
+                    "page": page + 1,
+                    "totalPages": pages,
+                    "limit": page_size,
+                },
+            }
+        ).encode()
+        for page, start in enumerate(range(0, total, page_size))
+    ]
+
+    @server.route("GET", "/v4/workflows/{workflowId}/data")
+    def data(request: ApiRequest) -> Tuple[int, Any]:
+        page = int(request.query.get("page", 1))
+        return 200, page_bodies[min(page, pages) - 1]
+
+    item = server.sample("GET", "/v4/workflows")["workflows"][0]
+    inventory = [{**item, "id": f"wf-{index}"} for index in range(workflows)]
+
+    @server.route("GET", "/v4/workflows")
+    def list_workflows(request: ApiRequest) -> Tuple[int, Any]:
+        skip = int(request.query.get("skip", 0))
+        limit = int(request.query.get("limit", workflows))
+        return 200, {
+            "workflows": inventory[skip : skip + limit],
+            "pagination": {"totalCount": workflows, "limit": limit},
+        }
+
+    created = {**server.sample("POST", "/v4/workflows"), "workflowId": "wf-bench"}
+    started = {**server.sample("PUT", "/v4/workflows/{workflowId}/run"), "jobId": "job-bench"}
+    finished = {
+        **server.sample("GET", "/v4/workflows/{workflowId}/jobs/{jobId}"),
+        "id": "job-bench",
+        "workflowId": "wf-bench",
+        "state": "FINISHED",
+    }
+    server.route("POST", "/v4/workflows")(lambda request: (201, created))
+    server.route("PUT", "/v4/workflows/{workflowId}/run")(lambda request: (200, started))
+    server.route("GET", "/v4/workflows/{workflowId}/jobs/{jobId}")(lambda request: (200, finished))
+
+
+def _scenarios(client: Any, workflows: int) -> Dict[str, Callable[[], Any]]:
+    from kadoa_sdk.extraction.extraction_acl import ListWorkflowsRequest
+    from kadoa_sdk.extraction.types import FetchDataOptions
+    from kadoa_sdk.workflows.workflows_core_service import CreateWorkflowInput
+
+    def fetch_all_data() -> Any:
+        return client.extraction.fetch_all_data(FetchDataOptions(workflow_id="wf-bench"))
+
+    def list_workflows() -> Any:
+        return client.workflow.list(ListWorkflowsRequest(limit=workflows))
+
+    def iter_all_sequential() -> Any:
+        return list(client.workflow.iter_all(page_size=100, prefetch=1))
+
+    def iter_all() -> Any:
+        return list(client.workflow.iter_all(page_size=100))
+
+    def iter_all_projected() -> Any:
+        return list(client.workflow.iter_all(page_size=100, project=("id", "state")))
+
+    def get_workflow() -> Any:
+        return client.workflow.get("wf-bench")
+
+    def get_status() -> Any:
+        return client.workflow.get_status("wf-bench")
+
+    def create_run_wait() -> Any:
+        workflow = client.workflow.create(CreateWorkflowInput(urls=["https://example.com"]))
+        job = client.workflow.run_workflow(workflow.id)
+        return client.workflow.wait_for_job_completion(workflow.id, job.job_id)
+
+    return {
+        "fetch_all_data": fetch_all_data,
+        "list_workflows": list_workflows,
+        "iter_all_sequential": iter_all_sequential,
+        "iter_all": iter_all,
+        "iter_all_projected": iter_all_projected,
+        "get_workflow": get_workflow,
+        "get_status": get_status,
+        "create_run_wait": create_run_wait,
+    }
+
+
+def _peak_kib(func: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(pages: int = 20, page_size: int = 100, workflows: int = 5_000) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    with MockApiServer() as server:
+        _install_routes(server, pages, page_size, workflows)
+        client = server.client(enable_metrics=False)
+        for name, scenario in _scenarios(client, workflows).items():
+            scenario()  # warm up connection pool and model classes
+            timings = []
+            for _ in range(5):
+                started = time.perf_counter()
+                scenario()
+                timings.append(time.perf_counter() - started)
+            best = min(timings)
+            results[f"api.{name}.ms"] = best * 1000
+            results[f"api.{name}.peak_kib"] = _peak_kib(scenario)
+        results["api.fetch_all_data.rows_per_sec"] = (
+            pages * page_size / (results["api.fetch_all_data.ms"] / 1000)
+        )
+        client.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--workflows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    for name, value in run(args.pages, args.page_size, args.workflows).items():
+        print(f"{name:50s} {value:>12,.1f}")
+
+
+if __name__ == "__main__":
+    main()
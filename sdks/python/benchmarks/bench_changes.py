@@ -0,0 +1,109 @@
+"""Change diff mapping: per-field models vs columnar coalescing.
+
+Builds one change with ``--diffs`` row diffs as decoded from the API (80%
+added/removed pairs sharing a row id, the rest unmatched; ``--fields`` fields
+each) and times mapping its differences with:
+
+- ``models``: ``_coalesce_differences``, one validated ``ChangeDifference``
+  and ``ChangeDifferenceField`` per diff and field
+- ``columnar``: ``_coalesce_columnar``, parallel key/value/previous-value
+  columns with row indices
+- ``columnar_view``: the columnar path plus building every model through the
+  lazy view (``ColumnarDifferences.to_models``)
+
+Timings are the best of ``--repeat`` runs; ``peak_kib`` is the tracemalloc
+peak of a single run.
+
+    python -m benchmarks.bench_changes --diffs 100000 --fields 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+
+def _raw_differences(diffs: int, fields: int) -> List[Dict[str, Any]]:
+    keys = [f"field_{index}" for index in range(fields)]
+    pairs = diffs * 4 // 10
+    raw: List[Dict[str, Any]] = []
+    for row in range(pairs):
+        raw.append(
+            {
+                "type": "added",
+                "fields": [{"key": key, "value": f"{key} {row} new"} for key in keys],
+                "rowRef": {"currentRowId": f"row-{row}"},
+            }
+        )
+        raw.append(
+            {
+                "type": "removed",
+                "fields": [{"key": key, "value": f"{key} {row} old"} for key in keys],
+                "rowRef": {"previousRowId": f"row-{row}"},
+            }
+        )
+    for row in range(pairs, pairs + diffs - len(raw)):
+        kind = "added" if row % 2 else "removed"
+        ref = {"currentRowId": f"row-{row}"} if row % 2 else {"previousRowId": f"row-{row}"}
+        raw.append(
+            {
+                "type": kind,
+                "fields": [{"key": key, "value": f"{key} {row}"} for key in keys],
+                "rowRef": ref,
+            }
+        )
+    return raw
+
+
+def _best_ms(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def _peak_kib(func: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(diffs: int = 100_000, fields: int = 5, repeat: int = 3) -> Dict[str, float]:
+    from kadoa_sdk.changes.changes_service import _coalesce_columnar, _coalesce_differences
+
+    raw = _raw_differences(diffs, fields)
+    scenarios: Dict[str, Callable[[], Any]] = {
+        "models": lambda: _coalesce_differences(raw),
+        "columnar": lambda: _coalesce_columnar(raw),
+        "columnar_view": lambda: _coalesce_columnar(raw).to_models(),
+    }
+
+    results: Dict[str, float] = {}
+    for name, scenario in scenarios.items():
+        elapsed_ms = _best_ms(scenario, repeat)
+        results[f"changes.coalesce_{name}.ms"] = elapsed_ms
+        results[f"changes.coalesce_{name}.diffs_per_sec"] = diffs / (elapsed_ms / 1000)
+        results[f"changes.coalesce_{name}.peak_kib"] = _peak_kib(scenario)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--diffs", type=int, default=100_000)
+    parser.add_argument("--fields", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, value in run(args.diffs, args.fields, args.repeat).items():
+        print(f"{name:50s} {value:>12,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""SDK import time and client construction cost.
+
+``import`` is the wall time of ``import kadoa_sdk`` in a fresh interpreter
+(best of ``--imports`` runs). ``construct`` is the time to build a
+``KadoaClient`` with an explicit API key and base URL; the background PyPI
+version check is replaced with a no-op so the result doesn't depend on the
+network. ``peak_kib`` is the tracemalloc peak of one construction.
+
+    python -m benchmarks.bench_client --number 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict
+from unittest import mock
+
+_IMPORT_TIMER = (
+    "import time; started = time.perf_counter(); import kadoa_sdk; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def import_seconds(runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_TIMER], check=True, capture_output=True, text=True
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return min(timings)
+
+
+def _constructor() -> Callable[[], Any]:
+    from kadoa_sdk import KadoaClient, KadoaClientConfig
+
+    config = KadoaClientConfig(api_key="bench", base_url="http://127.0.0.1:9", load_env=False)
+    return lambda: KadoaClient(config)
+
+
+def run(number: int = 200, imports: int = 5) -> Dict[str, float]:
+    results: Dict[str, float] = {"client.import.ms": import_seconds(imports) * 1000}
+    with mock.patch("kadoa_sdk.client.client.check_for_updates", lambda: None):
+        construct = _constructor()
+        construct()
+        seconds = min(timeit.repeat(construct, number=number, repeat=5)) / number
+        results["client.construct.ms"] = seconds * 1000
+        tracemalloc.start()
+        try:
+            construct()
+            results["client.construct.peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200, help="constructions per timing run")
+    parser.add_argument("--imports", type=int, default=5, help="fresh interpreters timed")
+    args = parser.parse_args()
+
+    for name, value in run(args.number, args.imports).items():
+        print(f"{name:50s} {value:>12,.2f}")
+
+
+if __name__ == "__main__":
+    main()
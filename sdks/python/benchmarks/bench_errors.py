@@ -0,0 +1,105 @@
+"""Error-path throughput (errors per second).
+
+Simulates the service pattern ``try: ... except Exception as e: raise
+KadoaHttpError.wrap(e, message=..., details=...)`` for bulk deletes, 404
+sweeps and response-validation failures that attach the API response model
+to ``details``. ``to_json`` measures the deferred materialization cost paid
+when an error is actually reported.
+
+    python -m benchmarks.bench_errors --number 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class _Field(BaseModel):
+    name: str
+    data_type: str = "STRING"
+    description: Optional[str] = None
+
+
+class _WorkflowResponse(BaseModel):
+    workflow_id: Optional[str] = None
+    name: str = "bench"
+    urls: List[str] = []
+    fields: List[_Field] = []
+    state: str = "ACTIVE"
+
+
+RESPONSE = _WorkflowResponse(
+    urls=[f"https://example.com/{i}" for i in range(10)],
+    fields=[_Field(name=f"field_{i}", description="x" * 40) for i in range(20)],
+)
+
+
+def _scenarios() -> Dict[str, Callable[[], object]]:
+    from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+
+    def wrap_generic() -> object:
+        try:
+            raise ConnectionResetError("connection reset by peer")
+        except Exception as error:
+            return KadoaHttpError.wrap(
+                error, message="Failed to delete workflow", details={"workflowId": "wf-1"}
+            )
+
+    def not_found() -> object:
+        try:
+            raise KadoaHttpError(
+                "Not found",
+                http_status=404,
+                endpoint="/v4/workflows/wf-1",
+                method="DELETE",
+                response_body={"error": "not found"},
+                code=KadoaErrorCode.NOT_FOUND,
+            )
+        except Exception as error:
+            return KadoaHttpError.wrap(error, details={"workflowId": "wf-1"})
+
+    def response_details() -> object:
+        try:
+            raise KadoaSdkError(
+                KadoaSdkError.ERROR_MESSAGES["NO_WORKFLOW_ID"],
+                code=KadoaErrorCode.INTERNAL_ERROR,
+                details={"response": RESPONSE},
+            )
+        except Exception as error:
+            return KadoaHttpError.wrap(error, message="Failed to create workflow")
+
+    def response_details_to_json() -> object:
+        error = response_details()
+        return error.to_json()  # type: ignore[attr-defined]
+
+    return {
+        "wrap_generic": wrap_generic,
+        "not_found": not_found,
+        "response_details": response_details,
+        "response_details_to_json": response_details_to_json,
+    }
+
+
+def run(number: int = 50_000) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for name, scenario in _scenarios().items():
+        seconds = min(timeit.repeat(scenario, number=number, repeat=5))
+        results[f"errors.{name}.per_second"] = number / seconds
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50_000, help="errors per timing run")
+    args = parser.parse_args()
+
+    for name, value in run(args.number).items():
+        print(f"{name:60s} {value:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
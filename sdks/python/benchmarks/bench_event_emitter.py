@@ -0,0 +1,66 @@
+"""KadoaEventEmitter emit cost (microseconds per emit).
+
+Measures ``emit`` with 0, 1 and 100 listeners, with validated and lazy events,
+plus 100 listeners subscribed to a different event name (the event is never
+built).
+
+    python -m benchmarks.bench_event_emitter --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Dict
+
+PAYLOAD = {
+    "workflowId": "wf-bench",
+    "previousState": "ACTIVE",
+    "currentState": "ACTIVE",
+    "previousRunState": "RUNNING",
+    "currentRunState": "FINISHED",
+}
+
+
+def measure(listeners: int, validate: bool, named: bool, number: int) -> float:
+    """Return microseconds per ``emit`` call."""
+    from kadoa_sdk.core.events import KadoaEventEmitter
+
+    emitter = KadoaEventEmitter(validate_events=validate)
+    for _ in range(listeners):
+        if named:
+            emitter.on_event(lambda event: None, event_names=["extraction:completed"])
+        else:
+            emitter.on_event(lambda event: None)
+
+    def emit() -> None:
+        emitter.emit("extraction:status_changed", PAYLOAD)  # type: ignore[arg-type]
+
+    return min(timeit.repeat(emit, number=number, repeat=5)) / number * 1e6
+
+
+def run(number: int = 20_000) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for validate in (True, False):
+        mode = "validated" if validate else "lazy"
+        for listeners in (0, 1, 100):
+            results[f"event_emitter.{mode}.{listeners}_listeners.us_per_emit"] = measure(
+                listeners, validate, named=False, number=number
+            )
+        results[f"event_emitter.{mode}.100_other_event.us_per_emit"] = measure(
+            100, validate, named=True, number=number
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000, help="emits per timing run")
+    args = parser.parse_args()
+
+    for name, value in run(args.number).items():
+        print(f"{name:60s} {value:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Workflow data page fetching: validated vs raw (``validate=False``) path.
+
+Fetches ``--pages`` pages of ``--rows`` rows from the local mock API with
+``client.extraction.fetch_all_data``, once through the generated client's
+model deserialization plus the SDK result models (default) and once through
+the raw fast path, which parses the response JSON once and builds results
+without pydantic validation.
+
+    python -m benchmarks.bench_fetch_data --rows 10000 --pages 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict, Tuple
+
+from benchmarks.api_server import ApiRequest, MockApiServer
+from benchmarks.bench_api import _record
+
+
+def _install_pages(server: MockApiServer, pages: int, rows: int) -> None:
+    bodies = [
+        json.dumps(
+            {
+                "workflowId": "wf-bench",
+                "runId": "run-bench",
+                "executedAt": "2024-01-01T00:00:00Z",
+                "data": [_record(page * rows + index) for index in range(rows)],
+                "pagination": {
+                    "totalCount": pages * rows,
+                    "page": page + 1,
+                    "totalPages": pages,
+                    "limit": rows,
+                },
+            }
+        ).encode()
+        for page in range(pages)
+    ]
+
+    @server.route("GET", "/v4/workflows/{workflowId}/data")
+    def data(request: ApiRequest) -> Tuple[int, Any]:
+        return 200, bodies[min(int(request.query.get("page", 1)), pages) - 1]
+
+
+def run(rows: int = 10_000, pages: int = 3, repeat: int = 5) -> Dict[str, float]:
+    from kadoa_sdk.extraction.types import FetchDataOptions
+
+    results: Dict[str, float] = {}
+    with MockApiServer() as server:
+        _install_pages(server, pages, rows)
+        client = server.client(enable_metrics=False)
+        options = FetchDataOptions(workflow_id="wf-bench", limit=rows)
+        for label, validate in (("validated", True), ("raw", False)):
+            client.extraction.fetch_all_data(options, validate=validate)
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                fetched = client.extraction.fetch_all_data(options, validate=validate)
+                timings.append(time.perf_counter() - started)
+            assert len(fetched) == rows * pages
+            best = min(timings)
+            results[f"fetch_data.{label}.ms_per_page"] = best * 1000 / pages
+            results[f"fetch_data.{label}.rows_per_sec"] = rows * pages / best
+        client.close()
+    results["fetch_data.raw.speedup"] = (
+        results["fetch_data.validated.ms_per_page"] / results["fetch_data.raw.ms_per_page"]
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="rows per page")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, value in run(args.rows, args.pages, args.repeat).items():
+        print(f"{name:50s} {value:>12,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Debug logging cost on hot paths (nanoseconds per call).
+
+Compares a status-change style ``logger.debug`` call with eagerly evaluated
+arguments against the same call behind an ``isEnabledFor`` guard, with
+logging disabled and enabled (JSON formatter writing to memory, with and
+without 1% sampling). The ``overhead`` metric is the guarded disabled call
+minus an empty statement.
+
+    python -m benchmarks.bench_logging --number 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import timeit
+from types import SimpleNamespace
+from typing import Dict
+
+STATUS = SimpleNamespace(state="ACTIVE", run_state="RUNNING")
+
+
+def _logger(enabled: bool, sample_rate: float = 1.0) -> logging.Logger:
+    from kadoa_sdk.core.logger import JsonFormatter, SamplingFilter
+
+    logger = logging.getLogger(f"kadoa.bench.{enabled}.{sample_rate}")
+    logger.propagate = False
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(JsonFormatter())
+    logger.handlers[:] = [handler]
+    logger.filters[:] = [SamplingFilter(sample_rate)] if sample_rate < 1 else []
+    logger.setLevel(logging.DEBUG if enabled else logging.WARNING)
+    return logger
+
+
+def _time(statement: str, namespace: Dict[str, object], number: int) -> float:
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(number=number, repeat=5)) / number * 1e9
+
+
+def run(number: int = 200_000) -> Dict[str, float]:
+    unguarded = (
+        "logger.debug('status change: id=%s state=%s->%s runState=%s->%s', 'wf-1', "
+        "getattr(last, 'state', None) if last else None, last.state, "
+        "getattr(last, 'run_state', None) if last else None, last.run_state)"
+    )
+    guarded = f"if logger.isEnabledFor(DEBUG): {unguarded}"
+
+    results: Dict[str, float] = {}
+    baseline = _time("pass", {}, number)
+    results["logging.baseline.ns_per_call"] = baseline
+    for label, logger in (
+        ("disabled", _logger(False)),
+        ("enabled_sampled_1pct", _logger(True, 0.01)),
+        ("enabled", _logger(True)),
+    ):
+        namespace = {"logger": logger, "last": STATUS, "DEBUG": logging.DEBUG}
+        results[f"logging.{label}.unguarded.ns_per_call"] = _time(unguarded, namespace, number)
+        results[f"logging.{label}.guarded.ns_per_call"] = _time(guarded, namespace, number)
+    results["logging.disabled.guarded.overhead_ns"] = max(
+        results["logging.disabled.guarded.ns_per_call"] - baseline, 0.0
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000, help="calls per timing run")
+    args = parser.parse_args()
+
+    for name, value in run(args.number).items():
+        print(f"{name:60s} {value:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
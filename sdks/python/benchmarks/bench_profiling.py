@@ -0,0 +1,90 @@
+"""Profiling hook cost per SDK operation (nanoseconds per call).
+
+Times an ``@operation``-decorated function that issues one request through
+the instrumented API client mixin (against an in-memory fake transport),
+outside and inside ``profile()``. The ``overhead`` metrics are relative to
+the same call with no profiler active.
+
+    python -m benchmarks.bench_profiling --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Any, Callable, Dict
+
+
+class _FakeResponse:
+    status = 200
+    data = b"{}"
+
+    def read(self) -> bytes:
+        return self.data
+
+
+class _FakeGeneratedApiClient:
+    def param_serialize(self, method: str, resource_path: str, **kwargs: Any) -> Any:
+        return method, "https://api.test" + resource_path, {}, None, []
+
+    def call_api(self, method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        return _FakeResponse()
+
+    def response_deserialize(self, response_data: Any, response_types_map: Any = None) -> Any:
+        return self._ApiClient__deserialize({}, "object")
+
+    def _ApiClient__deserialize(self, data: Any, klass: Any) -> Any:  # noqa: N802
+        return data
+
+
+def _call() -> Callable[[], Any]:
+    from kadoa_sdk.core.instrumentation import ApiClientInstrumentationMixin
+    from kadoa_sdk.core.metrics import MetricsRegistry
+    from kadoa_sdk.core.operations import operation
+
+    class Client(ApiClientInstrumentationMixin, _FakeGeneratedApiClient):
+        metrics = MetricsRegistry(enabled=False)
+
+    client = Client()
+
+    @operation("get_workflow")
+    def get_workflow() -> Any:
+        serialized = client.param_serialize(method="GET", resource_path="/v4/workflows/wf-1")
+        return client.response_deserialize(client.call_api(*serialized), {})
+
+    return get_workflow
+
+
+def _time(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+
+
+def run(number: int = 20_000) -> Dict[str, float]:
+    from kadoa_sdk.core.profiling import profile
+
+    call = _call()
+    results: Dict[str, float] = {}
+    results["profiling.off.ns_per_call"] = _time(call, number)
+    with profile(max_events=0):
+        results["profiling.on.ns_per_call"] = _time(call, number)
+    with profile():
+        results["profiling.on_with_events.ns_per_call"] = _time(call, number)
+    for variant in ("on", "on_with_events"):
+        results[f"profiling.{variant}.overhead_ns"] = max(
+            results[f"profiling.{variant}.ns_per_call"] - results["profiling.off.ns_per_call"],
+            0.0,
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000, help="calls per timing run")
+    args = parser.parse_args()
+
+    for name, value in run(args.number).items():
+        print(f"{name:60s} {value:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
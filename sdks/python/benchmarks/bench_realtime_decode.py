@@ -0,0 +1,96 @@
+"""Realtime decode throughput (events/sec).
+
+Plays a burst of event and heartbeat frames from a local fake WebSocket server
+and measures how fast ``Realtime`` delivers events to a listener, once per
+installed JSON backend.
+
+    python -m benchmarks.bench_realtime_decode --events 50000 --heartbeat-every 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.realtime_server import FakeRealtimeServer, Frame, event_frame, heartbeat_frame
+
+
+def build_frames(events: int, heartbeat_every: int) -> List[Frame]:
+    frames: List[Frame] = []
+    for index in range(events):
+        if heartbeat_every and index % heartbeat_every == 0:
+            frames.append(heartbeat_frame(index))
+        frames.append(event_frame(index))
+    return frames
+
+
+async def measure(backend: Optional[str], frames: List[Frame], events: int) -> float:
+    """Return events/sec delivered to a listener using the given decoder backend."""
+    from kadoa_sdk.core.json_codec import get_json_decoder
+    from kadoa_sdk.core.realtime import Realtime, RealtimeConfig
+
+    done = asyncio.Event()
+    received = 0
+
+    def listener(_event: object) -> None:
+        nonlocal received
+        received += 1
+        if received == events:
+            done.set()
+
+    async with FakeRealtimeServer(frames) as server:
+        server.configure_sdk()
+        realtime = Realtime(
+            RealtimeConfig(
+                api_key="bench",
+                json_decoder=get_json_decoder(backend) if backend else None,  # type: ignore[arg-type]
+            )
+        )
+        realtime.on_event(listener)
+        started = time.perf_counter()
+        await realtime.connect()
+        await asyncio.wait_for(done.wait(), timeout=120)
+        elapsed = time.perf_counter() - started
+        await realtime.close_async()
+    return events / elapsed
+
+
+def installed_backends() -> List[str]:
+    from kadoa_sdk.core.json_codec import get_json_decoder
+
+    backends = []
+    for backend in ("json", "orjson", "msgspec"):
+        try:
+            get_json_decoder(backend)  # type: ignore[arg-type]
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+def run(events: int = 20_000, heartbeat_every: int = 10) -> Dict[str, float]:
+    frames = build_frames(events, heartbeat_every)
+    results: Dict[str, float] = {}
+    for backend in installed_backends():
+        results[f"realtime_decode.{backend}.events_per_sec"] = asyncio.run(
+            measure(backend, frames, events)
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument(
+        "--heartbeat-every", type=int, default=10, help="one heartbeat per N events (0 = none)"
+    )
+    args = parser.parse_args()
+
+    for name, value in run(args.events, args.heartbeat_every).items():
+        print(f"{name:50s} {value:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
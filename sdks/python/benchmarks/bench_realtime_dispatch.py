@@ -0,0 +1,58 @@
+"""Realtime listener dispatch cost with many per-workflow listeners.
+
+Compares global listeners that filter on ``workflowId`` themselves with
+listeners registered through ``on_event(..., workflow_ids=[...])``.
+
+    python -m benchmarks.bench_realtime_dispatch --listeners 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+
+def _per_event_us(realtime: Any, events: int) -> float:
+    event = {"type": "workflow_finished", "timestamp": 0, "message": {"workflowId": "wf-0"}}
+    notify = realtime._notify_event_listeners
+    started = time.perf_counter()
+    for _ in range(events):
+        notify(event)
+    return (time.perf_counter() - started) / events * 1e6
+
+
+def run(listeners: int = 500, events: int = 20_000) -> Dict[str, float]:
+    from kadoa_sdk.core.realtime import Realtime, RealtimeConfig
+
+    def make_waiter(workflow_id: str) -> Callable[[Dict[str, Any]], None]:
+        def waiter(event: Dict[str, Any]) -> None:
+            if event["message"].get("workflowId") == workflow_id:
+                pass
+
+        return waiter
+
+    global_realtime = Realtime(RealtimeConfig(api_key="bench"))
+    indexed_realtime = Realtime(RealtimeConfig(api_key="bench"))
+    for index in range(listeners):
+        global_realtime.on_event(make_waiter(f"wf-{index}"))
+        indexed_realtime.on_event(lambda event: None, workflow_ids=[f"wf-{index}"])
+
+    return {
+        "realtime_dispatch.global_filtering.us_per_event": _per_event_us(global_realtime, events),
+        "realtime_dispatch.indexed.us_per_event": _per_event_us(indexed_realtime, events),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--listeners", type=int, default=500)
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for name, value in run(args.listeners, args.events).items():
+        print(f"{name:50s} {value:>12,.2f}")
+
+
+if __name__ == "__main__":
+    main()
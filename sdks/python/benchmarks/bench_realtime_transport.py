@@ -0,0 +1,77 @@
+"""Legacy vs stream realtime transport throughput (events/sec).
+
+Both transports run against the local fake realtime server and acknowledge
+each event over HTTP. The legacy transport receives one event per frame; the
+stream transport (private until its protocol is confirmed) receives batched
+frames.
+
+    python -m benchmarks.bench_realtime_transport --events 20000 --batch-size 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import warnings
+from typing import Dict, List
+
+from benchmarks.realtime_server import FakeRealtimeServer, Frame, batch_frame, event_frame
+
+
+def build_frames(transport: str, events: int, batch_size: int) -> List[Frame]:
+    singles = [event_frame(index, with_id=True) for index in range(events)]
+    if transport == "legacy":
+        return list(singles)
+    return [
+        batch_frame(singles[start : start + batch_size]) for start in range(0, events, batch_size)
+    ]
+
+
+async def measure(transport: str, events: int, batch_size: int) -> float:
+    from kadoa_sdk.core.realtime import Realtime, RealtimeConfig
+
+    done = asyncio.Event()
+    received = 0
+
+    def listener(_event: object) -> None:
+        nonlocal received
+        received += 1
+        if received == events:
+            done.set()
+
+    async with FakeRealtimeServer(build_frames(transport, events, batch_size)) as server:
+        server.configure_sdk()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            realtime = Realtime(RealtimeConfig(api_key="bench"), _transport=transport)  # type: ignore[arg-type]
+        realtime.on_event(listener)
+        started = time.perf_counter()
+        await realtime.connect()
+        await asyncio.wait_for(done.wait(), timeout=300)
+        elapsed = time.perf_counter() - started
+        await realtime.close_async()
+    return events / elapsed
+
+
+def run(events: int = 5_000, batch_size: int = 100) -> Dict[str, float]:
+    return {
+        f"realtime_transport.{transport}.events_per_sec": asyncio.run(
+            measure(transport, events, batch_size)
+        )
+        for transport in ("legacy", "stream")
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    for name, value in run(args.events, args.batch_size).items():
+        print(f"{name:50s} {value:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Workflow lookups: local ``WorkflowIndex`` vs API search.
+
+Builds a ``WorkflowIndex`` over ``--workflows`` workflows served by the local
+mock API (full list items and projected to the indexed fields), then times
+lookups by name and by tag plus state against the index, and the same name
+lookup through ``client.workflow.get_by_name`` without an index, which
+searches the listing on every call.
+
+    python -m benchmarks.bench_workflow_index --workflows 5000 --lookups 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Dict, Tuple
+
+from benchmarks.api_server import ApiRequest, MockApiServer
+
+_STATES = ("ACTIVE", "PAUSED", "DRAFT")
+
+
+def _install_inventory(server: MockApiServer, workflows: int) -> None:
+    item = server.sample("GET", "/v4/workflows")["workflows"][0]
+    inventory = [
+        {
+            **item,
+            "id": f"wf-{index}",
+            "name": f"workflow {index}",
+            "state": _STATES[index % len(_STATES)],
+            "tags": [f"group-{index % 20}", "bench"],
+            "templateId": None,
+            "updateInterval": "DAILY" if index % 2 else "HOURLY",
+        }
+        for index in range(workflows)
+    ]
+
+    @server.route("GET", "/v4/workflows")
+    def list_workflows(request: ApiRequest) -> Tuple[int, Any]:
+        search = request.query.get("search")
+        matches = [w for w in inventory if search in w["name"]] if search else inventory
+        skip = int(request.query.get("skip", 0))
+        limit = int(request.query.get("limit", 25))
+        return 200, {
+            "workflows": matches[skip : skip + limit],
+            "pagination": {"totalCount": len(matches), "limit": limit},
+        }
+
+
+def _us_per_call(func: Any, number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) * 1e6 / number
+
+
+def run(workflows: int = 5_000, lookups: int = 10_000) -> Dict[str, float]:
+    from kadoa_sdk.workflows import WorkflowIndex
+
+    results: Dict[str, float] = {}
+    with MockApiServer() as server:
+        _install_inventory(server, workflows)
+        client = server.client(enable_metrics=False)
+        service = client.workflow
+
+        for label, project in (("build", None), ("build_projected", ())):
+            index = WorkflowIndex(service, project=project)
+            started = time.perf_counter()
+            index.build()
+            results[f"workflow_index.{label}.ms"] = (time.perf_counter() - started) * 1000
+        assert len(index) == workflows
+
+        name = f"workflow {workflows - 1}"
+        results["workflow_index.get_by_name.us_per_lookup"] = _us_per_call(
+            lambda: index.get_by_name(name), lookups
+        )
+        results["workflow_index.find_tag_state.us_per_lookup"] = _us_per_call(
+            lambda: index.find(tag="group-7", state="PAUSED"), lookups
+        )
+        results["workflow_index.get_by_name_api.us_per_lookup"] = _us_per_call(
+            lambda: service.get_by_name(name), max(1, lookups // 1_000)
+        )
+        client.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=5_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for name, value in run(args.workflows, args.lookups).items():
+        print(f"{name:50s} {value:>12,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Replay recorded realtime traffic against ``Realtime`` for capacity testing.
+
+Recordings are produced by ``kadoa_sdk.core.realtime_recorder.RealtimeRecorder``
+(or synthesized with ``--synthesize``). Frames are played from a local
+WebSocket server at the recorded pace scaled by ``--speed`` (``1x``, ``10x``,
+``max``). A ``control.draining`` frame ends playback on the current socket and
+the next connection continues where it left off, so reconnect and cursor
+resume behaviour is exercised too.
+
+    python -m benchmarks.realtime_replay traffic.kdrt --speed 10x
+    python -m benchmarks.realtime_replay --synthesize 20000 --drain-every 5000 --speed max
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import struct
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from websockets.asyncio.server import ServerConnection
+
+from benchmarks.realtime_server import FakeRealtimeServer, event_frame, heartbeat_frame
+
+ReplayFrame = Tuple[float, bytes]  # (offset in seconds, payload)
+
+
+@dataclass
+class ReplayReport:
+    frames: int
+    events_expected: int
+    events_received: int
+    dropped: int
+    duplicates: int
+    reconnects: int
+    resumed_with_cursor: int
+    duration_s: float
+    throughput_eps: float
+    latency_p50_ms: float
+    latency_p90_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+
+
+def load_frames(path: str, max_gap_s: float = 5.0) -> List[ReplayFrame]:
+    """Load frame entries of a recording as offsets relative to the first frame.
+
+    Gaps longer than ``max_gap_s`` (e.g. between recording sessions) are capped.
+    """
+    from kadoa_sdk.core.realtime_recorder import RECORD_FRAME, read_recording
+
+    frames: List[ReplayFrame] = []
+    offset = 0.0
+    previous_ns: Optional[int] = None
+    for entry in read_recording(path):
+        if entry.kind != RECORD_FRAME:
+            continue
+        if previous_ns is not None:
+            offset += min(max(0, entry.timestamp_ns - previous_ns) / 1e9, max_gap_s)
+        previous_ns = entry.timestamp_ns
+        frames.append((offset, entry.payload))
+    return frames
+
+
+def synthesize(
+    path: str, events: int, heartbeat_every: int = 10, drain_every: int = 0, rate: float = 1000
+) -> None:
+    """Write a synthetic recording with ``events`` events at ``rate`` events/sec."""
+    from kadoa_sdk.core.realtime_recorder import MAGIC, RECORD_CONNECT, RECORD_FRAME
+
+    header = struct.Struct("<BQI")
+    interval_ns = int(1e9 / rate)
+    timestamp_ns = time.time_ns()
+
+    with open(path, "wb") as file:
+
+        def write(kind: int, payload: bytes) -> None:
+            file.write(header.pack(kind, timestamp_ns, len(payload)))
+            file.write(payload)
+
+        file.write(MAGIC)
+        write(RECORD_CONNECT, b"")
+        for index in range(events):
+            if heartbeat_every and index % heartbeat_every == 0:
+                write(RECORD_FRAME, heartbeat_frame(index).encode())
+            if drain_every and index and index % drain_every == 0:
+                write(RECORD_FRAME, b'{"type":"control.draining","retryAfterMs":0}')
+            write(RECORD_FRAME, event_frame(index, with_id=True).encode())
+            timestamp_ns += interval_ns
+
+
+def _event_keys(payload: bytes) -> List[str]:
+    """Return ids (or cursors) of the events carried by a frame."""
+    if payload.startswith(b'{"type":"heartbeat"'):
+        return []
+    try:
+        data: Any = json.loads(payload)
+    except ValueError:
+        return []
+    items = data if isinstance(data, list) else [data]
+    keys = []
+    for item in items:
+        if not isinstance(item, dict) or item.get("type") in ("heartbeat", "control.draining"):
+            continue
+        key = item.get("id") or item.get("_cursor")
+        if isinstance(key, str):
+            keys.append(key)
+    return keys
+
+
+class ReplaySource:
+    """Feeds recorded frames to whichever socket is currently connected."""
+
+    def __init__(self, frames: List[ReplayFrame], speed: Optional[float]) -> None:
+        self.frames = frames
+        self.speed = speed
+        self.index = 0
+        self.sent_at: Dict[str, float] = {}
+        self.finished = asyncio.Event()
+
+    async def __call__(self, ws: ServerConnection, subscribe: Dict[str, Any]) -> None:
+        if self.index >= len(self.frames):
+            return
+        started = time.perf_counter()
+        base_offset = self.frames[self.index][0]
+        while self.index < len(self.frames):
+            offset, payload = self.frames[self.index]
+            if self.speed:
+                delay = started + (offset - base_offset) / self.speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            sent_at = time.perf_counter()
+            for key in _event_keys(payload):
+                self.sent_at.setdefault(key, sent_at)
+            await ws.send(payload.decode())
+            self.index += 1
+            if b'"control.draining"' in payload:
+                return
+        self.finished.set()
+
+
+async def replay(
+    frames: List[ReplayFrame],
+    speed: Optional[float],
+    transport: str = "legacy",
+    idle_timeout_s: float = 2.0,
+) -> ReplayReport:
+    from kadoa_sdk.core.realtime import Realtime, RealtimeConfig
+
+    expected = {key for _, payload in frames for key in _event_keys(payload)}
+    source = ReplaySource(frames, speed)
+    received_at: Dict[str, float] = {}
+    duplicates = 0
+    last_event = time.perf_counter()
+
+    def listener(event: Dict[str, Any]) -> None:
+        nonlocal duplicates, last_event
+        now = time.perf_counter()
+        last_event = now
+        key = event.get("id") or event.get("_cursor")
+        if not isinstance(key, str):
+            return
+        if key in received_at:
+            duplicates += 1
+        else:
+            received_at[key] = now
+
+    async with FakeRealtimeServer(frame_source=source) as server:
+        server.configure_sdk()
+        realtime = Realtime(
+            RealtimeConfig(api_key="replay", reconnect_delay=0),
+            _transport=transport,  # type: ignore[arg-type]
+        )
+        realtime.on_event(listener)
+        started = time.perf_counter()
+        await realtime.connect()
+        await source.finished.wait()
+        while (
+            len(received_at) < len(expected) and time.perf_counter() - last_event < idle_timeout_s
+        ):
+            await asyncio.sleep(0.01)
+        duration = (last_event if received_at else time.perf_counter()) - started
+        await realtime.close_async()
+
+    latencies = sorted(
+        (received_at[key] - source.sent_at[key]) * 1000
+        for key in received_at
+        if key in source.sent_at
+    )
+
+    def percentile(fraction: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    resumed = sum(1 for message in server.subscriptions[1:] if message.get("lastCursor"))
+    return ReplayReport(
+        frames=len(frames),
+        events_expected=len(expected),
+        events_received=len(received_at),
+        dropped=len(expected - received_at.keys()),
+        duplicates=duplicates,
+        reconnects=max(0, len(server.subscriptions) - 1),
+        resumed_with_cursor=resumed,
+        duration_s=duration,
+        throughput_eps=len(received_at) / duration if duration > 0 else 0.0,
+        latency_p50_ms=statistics.median(latencies) if latencies else 0.0,
+        latency_p90_ms=percentile(0.90),
+        latency_p99_ms=percentile(0.99),
+        latency_max_ms=latencies[-1] if latencies else 0.0,
+    )
+
+
+def parse_speed(value: str) -> Optional[float]:
+    """Parse ``1x``/``10x``/``max`` (None means as fast as possible)."""
+    value = value.strip().lower()
+    if value == "max":
+        return None
+    return float(value.rstrip("x"))
+
+
+def run(events: int = 10_000, speed: str = "max", drain_every: int = 2_500) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "synthetic.kdrt")
+        synthesize(path, events, drain_every=drain_every, rate=5_000)
+        report = asyncio.run(replay(load_frames(path), parse_speed(speed)))
+    return {f"realtime_replay.{key}": float(value) for key, value in asdict(report).items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?", help="recording file (.kdrt)")
+    parser.add_argument("--speed", default="1x", help="1x, 10x, max or any multiplier")
+    parser.add_argument("--transport", default="legacy", choices=["legacy", "stream"])
+    parser.add_argument("--synthesize", type=int, metavar="EVENTS", help="replay synthetic traffic")
+    parser.add_argument("--drain-every", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=1000, help="synthetic events/sec at 1x")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.recording
+        if args.synthesize:
+            path = os.path.join(directory, "synthetic.kdrt")
+            synthesize(path, args.synthesize, drain_every=args.drain_every, rate=args.rate)
+        if not path:
+            parser.error("a recording file or --synthesize is required")
+        report = asyncio.run(replay(load_frames(path), parse_speed(args.speed), args.transport))
+
+    for key, value in asdict(report).items():
+        print(
+            f"{key:24s} {value:>14,.2f}" if isinstance(value, float) else f"{key:24s} {value:>14,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
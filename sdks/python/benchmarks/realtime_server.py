@@ -0,0 +1,142 @@
+"""Local stand-in for the Kadoa realtime stack.
+
+Serves the three endpoints ``Realtime`` talks to:
+
+- ``POST /v4/oauth2/token`` (public API) returning a dummy token and team id
+- ``POST /api/v1/events/ack`` (realtime API) accepting acknowledgements
+- a WebSocket endpoint that waits for the subscribe message and then plays a
+  scripted list of frames
+
+Use ``FakeRealtimeServer.configure_sdk()`` to point ``get_settings()`` at it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Union
+
+from aiohttp import web
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+Frame = Union[str, bytes]
+FrameSource = Callable[[ServerConnection, dict[str, Any]], Awaitable[None]]
+
+
+def event_frame(index: int, *, with_id: bool = False, workflow_id: str = "wf-bench") -> str:
+    """Build a representative workflow status event frame."""
+    payload: dict[str, Any] = {
+        "type": "workflow.status_changed",
+        "timestamp": 1_700_000_000_000 + index,
+        "_cursor": f"cursor-{index}",
+        "message": {
+            "workflowId": workflow_id,
+            "previousState": "ACTIVE",
+            "currentState": "ACTIVE",
+            "previousRunState": "RUNNING",
+            "currentRunState": "FINISHED",
+        },
+    }
+    if with_id:
+        payload["id"] = f"event-{index}"
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def batch_frame(frames: Iterable[str]) -> str:
+    """Combine single-event frames into one stream-transport batch frame."""
+    return "[" + ",".join(frames) + "]"
+
+
+def heartbeat_frame(index: int = 0) -> str:
+    return json.dumps({"type": "heartbeat", "timestamp": index}, separators=(",", ":"))
+
+
+class FakeRealtimeServer:
+    """Token/ack HTTP server plus WebSocket server bound to localhost.
+
+    Args:
+        frames: Frames sent to every client after it subscribes. Ignored when
+            ``frame_source`` is given.
+        frame_source: Coroutine driving a connection after the subscribe message
+            was received. Receives the socket and the parsed subscribe message.
+    """
+
+    def __init__(
+        self,
+        frames: Optional[Iterable[Frame]] = None,
+        *,
+        frame_source: Optional[FrameSource] = None,
+    ) -> None:
+        self._frames: List[Frame] = list(frames or [])
+        self._frame_source = frame_source
+        self._runner: Optional[web.AppRunner] = None
+        self._ws_server: Optional[Server] = None
+        self.http_port = 0
+        self.ws_port = 0
+        self.subscriptions: List[dict[str, Any]] = []
+        self.acks = 0
+        self.connected = asyncio.Event()
+
+    @property
+    def http_uri(self) -> str:
+        return f"http://127.0.0.1:{self.http_port}"
+
+    @property
+    def ws_uri(self) -> str:
+        return f"ws://127.0.0.1:{self.ws_port}"
+
+    async def _token(self, request: web.Request) -> web.Response:
+        return web.json_response({"access_token": "bench-token", "team_id": "bench-team"})
+
+    async def _ack(self, request: web.Request) -> web.Response:
+        self.acks += 1
+        return web.json_response({"ok": True})
+
+    async def _handle_socket(self, ws: ServerConnection) -> None:
+        subscribe = json.loads(await ws.recv())
+        self.subscriptions.append(subscribe)
+        self.connected.set()
+        if self._frame_source is not None:
+            await self._frame_source(ws, subscribe)
+        else:
+            for frame in self._frames:
+                await ws.send(frame)
+        await ws.wait_closed()
+
+    async def start(self) -> "FakeRealtimeServer":
+        app = web.Application()
+        app.router.add_post("/v4/oauth2/token", self._token)
+        app.router.add_post("/api/v1/events/ack", self._ack)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.http_port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+        self._ws_server = await serve(self._handle_socket, "127.0.0.1", 0, max_size=None)
+        self.ws_port = next(iter(self._ws_server.sockets)).getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._ws_server is not None:
+            self._ws_server.close()
+            await self._ws_server.wait_closed()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def configure_sdk(self) -> None:
+        """Point the SDK settings at this server (clears the settings cache)."""
+        from kadoa_sdk.core.settings import get_settings
+
+        os.environ["KADOA_PUBLIC_API_URI"] = self.http_uri
+        os.environ["KADOA_REALTIME_API_URI"] = self.http_uri
+        os.environ["KADOA_WSS_API_URI"] = self.ws_uri
+        os.environ["KADOA_WSS_NEO_API_URI"] = self.ws_uri
+        get_settings.cache_clear()
+
+    async def __aenter__(self) -> "FakeRealtimeServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
@@ -0,0 +1,169 @@
+"""Run the benchmark suite and track results over time.
+
+Each run writes one JSON document (metrics plus commit, SDK version, Python
+and platform) to ``--output`` and appends it as a line to ``--history``, so
+``benchmarks/results/history.jsonl`` accumulates a time series that can be
+plotted or diffed. With ``--compare`` the run is checked against a previous
+result (a results file, or the last line of a history file) and the command
+exits with status 1 when a metric regressed by more than ``--threshold``.
+
+Metric direction follows the name: ``*per_sec*``/``*per_second`` are
+throughputs (higher is better); ``*.ms``, ``*_ns``, ``*.peak_kib``,
+``*ms_per_*``, ``*ns_per_*`` and ``*us_per_*`` are costs (lower is better).
+
+    python -m benchmarks.suite --quick
+    python -m benchmarks.suite --suite api --suite client --compare benchmarks/results/history.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# name -> (module, run() kwargs for --quick)
+SUITES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "client": ("benchmarks.bench_client", {"number": 20, "imports": 2}),
+    "api": ("benchmarks.bench_api", {"pages": 5, "workflows": 500}),
+    "fetch_data": ("benchmarks.bench_fetch_data", {"rows": 2_000, "pages": 2, "repeat": 2}),
+    "changes": ("benchmarks.bench_changes", {"diffs": 10_000, "repeat": 2}),
+    "workflow_index": ("benchmarks.bench_workflow_index", {"workflows": 500, "lookups": 1_000}),
+    "realtime_transport": ("benchmarks.bench_realtime_transport", {"events": 1_000}),
+    "realtime_dispatch": ("benchmarks.bench_realtime_dispatch", {"events": 2_000}),
+    "errors": ("benchmarks.bench_errors", {"number": 5_000}),
+    "logging": ("benchmarks.bench_logging", {"number": 20_000}),
+    "profiling": ("benchmarks.bench_profiling", {"number": 2_000}),
+}
+
+_HIGHER_IS_BETTER = ("per_sec",)
+_LOWER_IS_BETTER = ("ms_per_", "ns_per_", "us_per_")
+_LOWER_IS_BETTER_SUFFIXES = (".ms", "_ns", ".peak_kib")
+
+
+def direction(metric: str) -> int:
+    """+1 if larger values are better, -1 if smaller are, 0 if unknown."""
+    if any(marker in metric for marker in _HIGHER_IS_BETTER):
+        return 1
+    if metric.endswith(_LOWER_IS_BETTER_SUFFIXES) or any(
+        marker in metric for marker in _LOWER_IS_BETTER
+    ):
+        return -1
+    return 0
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suites(names: List[str], quick: bool = False) -> Dict[str, Any]:
+    from kadoa_sdk.version import __version__
+
+    metrics: Dict[str, float] = {}
+    durations: Dict[str, float] = {}
+    for name in names:
+        module_name, quick_kwargs = SUITES[name]
+        module = importlib.import_module(module_name)
+        started = time.perf_counter()
+        metrics.update(module.run(**(quick_kwargs if quick else {})))
+        durations[name] = round(time.perf_counter() - started, 3)
+        print(f"{name}: done in {durations[name]:.1f}s", file=sys.stderr)
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "suites": durations,
+        "metrics": metrics,
+    }
+
+
+def load_result(path: Path) -> Dict[str, Any]:
+    """A results file, or the most recent entry of a ``.jsonl`` history."""
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        lines = [line for line in text.splitlines() if line.strip()]
+        if not lines:
+            raise ValueError(f"{path} has no results")
+        return json.loads(lines[-1])
+    return json.loads(text)
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Tuple[str, float, float, float]]:
+    """Metrics that got worse by more than ``threshold`` (relative).
+
+    Returns:
+        ``(metric, baseline, current, relative change)`` per regression
+    """
+    regressions = []
+    for metric, value in current["metrics"].items():
+        sign = direction(metric)
+        previous = baseline.get("metrics", {}).get(metric)
+        if sign == 0 or not previous:
+            continue
+        change = (value - previous) / previous
+        if -sign * change > threshold:
+            regressions.append((metric, previous, value, change))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--suite", action="append", choices=sorted(SUITES), help="suite to run (repeatable)"
+    )
+    parser.add_argument("--quick", action="store_true", help="small sizes, for smoke runs")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    parser.add_argument("--history", type=Path, default=RESULTS_DIR / "history.jsonl")
+    parser.add_argument("--no-history", action="store_true", help="don't append to --history")
+    parser.add_argument("--compare", type=Path, help="baseline results (.json or .jsonl)")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative change")
+    args = parser.parse_args()
+
+    # Read the baseline first: it may be the history file this run appends to.
+    baseline = load_result(args.compare) if args.compare else None
+    result = run_suites(args.suite or list(SUITES), quick=args.quick)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    if not args.no_history:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with args.history.open("a", encoding="utf-8") as history:
+            history.write(json.dumps(result, separators=(",", ":")) + "\n")
+
+    for name, value in sorted(result["metrics"].items()):
+        print(f"{name:60s} {value:>14,.2f}")
+
+    if baseline is not None:
+        regressions = compare(baseline, result, args.threshold)
+        label = baseline.get("commit") or baseline.get("timestamp")
+        for metric, previous, value, change in regressions:
+            print(f"REGRESSION {metric}: {previous:,.2f} -> {value:,.2f} ({change:+.1%})")
+        print(f"{len(regressions)} regression(s) against {label}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,27 @@
 from .changes_service import ChangesService
+from .checkpoints import ChangeCheckpointStore, FileCheckpointStore, MemoryCheckpointStore
 from .types import (
     Change,
     ChangeDifference,
     ChangeDifferenceField,
     ChangeDifferenceType,
+    ChangeDownload,
+    ColumnarDifferences,
     ListChangesOptions,
     ListChangesResult,
 )
 
 __all__ = [
     "Change",
+    "ChangeCheckpointStore",
     "ChangeDifference",
     "ChangeDifferenceField",
     "ChangeDifferenceType",
+    "ChangeDownload",
     "ChangesService",
+    "ColumnarDifferences",
+    "FileCheckpointStore",
     "ListChangesOptions",
     "ListChangesResult",
+    "MemoryCheckpointStore",
 ]
@@ -1,34 +1,72 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timedelta, timezone
+from itertools import chain, repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlsplit
 
-from ..core.exceptions import KadoaErrorCode, KadoaSdkError
-from ..core.http import get_workflows_api
+from ..core.downloads import (
+    DEFAULT_CHUNK_SIZE,
+    download_to_path,
+    iter_chunks,
+    raise_for_download_status,
+)
+from ..core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from ..core.http import get_notifications_api, get_workflows_api
+from ..core.json_codec import get_json_decoder
+from ..core.operations import operation
+from ..core.pagination import iter_windows
+from .checkpoints import ChangeCheckpointStore
 from .types import (
     Change,
     ChangeDifference,
     ChangeDifferenceField,
+    ChangeDownload,
+    ColumnarDifferences,
     ListChangesOptions,
     ListChangesResult,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..client import KadoaClient
+    from ..core.realtime import Realtime
+
+DEFAULT_CHANGES_PAGE_SIZE = 100
+DEFAULT_STREAM_OVERLAP_MS = 5_000
+DEFAULT_STREAM_POLL_INTERVAL_MS = 60_000
+# Realtime event types that announce new changes; used as wake-up signals only
+CHANGE_EVENT_TYPES = ("workflow_data_change",)
+# Changes whose data is still being stored are held back for this long
+_PENDING_GRACE = timedelta(minutes=5)
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+_CHANGE_FILES_PREFIX = "/changes/files/"
+
+
+def _get(raw: Any, name: str, key: str) -> Any:
+    """Read ``name`` from a generated model or ``key`` from decoded JSON."""
+    if isinstance(raw, dict):
+        return raw.get(key)
+    return getattr(raw, name, None)
 
 
 def _map_field(raw: Any) -> ChangeDifferenceField:
     return ChangeDifferenceField(
-        key=getattr(raw, "key", None),
-        value=getattr(raw, "value", None),
-        previous_value=getattr(raw, "previous_value", None),
+        key=_get(raw, "key", "key"),
+        value=_get(raw, "value", "value"),
+        previous_value=_get(raw, "previous_value", "previousValue"),
     )
 
 
 def _map_difference(raw: Any) -> ChangeDifference:
-    fields_raw = getattr(raw, "fields", None) or []
+    fields_raw = _get(raw, "fields", "fields") or []
     return ChangeDifference(
-        type=getattr(raw, "type", None),
+        type=_get(raw, "type", "type"),
         fields=[_map_field(f) for f in fields_raw] if fields_raw else None,
     )
 
@@ -36,64 +74,68 @@ def _map_difference(raw: Any) -> ChangeDifference:
 def _merge_added_removed(added: Any, removed: Any) -> ChangeDifference:
     """Pair an added+removed for the same row into a single 'changed' diff."""
     previous_by_key: Dict[str, Optional[str]] = {}
-    for f in getattr(removed, "fields", None) or []:
-        key = getattr(f, "key", None)
+    for f in _get(removed, "fields", "fields") or []:
+        key = _get(f, "key", "key")
         if key is not None:
-            previous_by_key[key] = getattr(f, "value", None)
+            previous_by_key[key] = _get(f, "value", "value")
 
     fields: List[ChangeDifferenceField] = []
     added_keys = set()
-    for f in getattr(added, "fields", None) or []:
-        key = getattr(f, "key", None)
+    for f in _get(added, "fields", "fields") or []:
+        key = _get(f, "key", "key")
         added_keys.add(key)
         fields.append(
             ChangeDifferenceField(
                 key=key,
-                value=getattr(f, "value", None),
+                value=_get(f, "value", "value"),
                 previous_value=previous_by_key.get(key) if key is not None else None,
             )
         )
 
-    for f in getattr(removed, "fields", None) or []:
-        key = getattr(f, "key", None)
+    for f in _get(removed, "fields", "fields") or []:
+        key = _get(f, "key", "key")
         if key not in added_keys:
             fields.append(
                 ChangeDifferenceField(
                     key=key,
                     value=None,
-                    previous_value=getattr(f, "value", None),
+                    previous_value=_get(f, "value", "value"),
                 )
             )
 
     return ChangeDifference(type="changed", fields=fields)
 
 
-def _coalesce_differences(raw: Optional[List[Any]]) -> Optional[List[ChangeDifference]]:
-    """Coalesce added+removed pairs sharing rowRef identity into 'changed' diffs.
+def _partition_differences(
+    raw: List[Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any], List[Any]]:
+    """Split diffs into added and removed diffs keyed by row id, and the rest.
 
-    Mirrors the Node SDK behavior. ``row_ref`` is present on the wire but not
-    in the OpenAPI spec; we read it defensively.
+    ``row_ref`` is present on the wire but not in the OpenAPI spec; we read it
+    defensively.
     """
-    if not raw:
-        return None
-
     added_by_row: Dict[str, Any] = {}
     removed_by_row: Dict[str, Any] = {}
     passthrough: List[Any] = []
 
     for diff in raw:
-        row_ref = getattr(diff, "row_ref", None)
-        # Pydantic models with alias 'rowRef' may also expose attribute names
-        if row_ref is None and hasattr(diff, "model_extra"):
-            row_ref = (diff.model_extra or {}).get("rowRef") or (diff.model_extra or {}).get(
-                "row_ref"
-            )
-        diff_type = getattr(diff, "type", None)
-        current_row_id = getattr(row_ref, "current_row_id", None) if row_ref else None
-        previous_row_id = getattr(row_ref, "previous_row_id", None) if row_ref else None
+        if isinstance(diff, dict):
+            row_ref = diff.get("rowRef")
+            diff_type = diff.get("type")
+        else:
+            row_ref = getattr(diff, "row_ref", None)
+            # Pydantic models with alias 'rowRef' may also expose attribute names
+            if row_ref is None and hasattr(diff, "model_extra"):
+                row_ref = (diff.model_extra or {}).get("rowRef") or (diff.model_extra or {}).get(
+                    "row_ref"
+                )
+            diff_type = getattr(diff, "type", None)
         if isinstance(row_ref, dict):
             current_row_id = row_ref.get("currentRowId") or row_ref.get("current_row_id")
             previous_row_id = row_ref.get("previousRowId") or row_ref.get("previous_row_id")
+        else:
+            current_row_id = getattr(row_ref, "current_row_id", None) if row_ref else None
+            previous_row_id = getattr(row_ref, "previous_row_id", None) if row_ref else None
 
         if diff_type == "added" and current_row_id:
             added_by_row[current_row_id] = diff
@@ -102,6 +144,19 @@ def _coalesce_differences(raw: Optional[List[Any]]) -> Optional[List[ChangeDiffe
         else:
             passthrough.append(diff)
 
+    return added_by_row, removed_by_row, passthrough
+
+
+def _coalesce_differences(raw: Optional[List[Any]]) -> Optional[List[ChangeDifference]]:
+    """Coalesce added+removed pairs sharing rowRef identity into 'changed' diffs.
+
+    Mirrors the Node SDK behavior.
+    """
+    if not raw:
+        return None
+
+    added_by_row, removed_by_row, passthrough = _partition_differences(raw)
+
     result: List[ChangeDifference] = []
     for row_id, added in added_by_row.items():
         removed = removed_by_row.pop(row_id, None)
@@ -119,22 +174,132 @@ def _coalesce_differences(raw: Optional[List[Any]]) -> Optional[List[ChangeDiffe
     return result
 
 
-def _map_change(raw: Any) -> Change:
-    created_at = getattr(raw, "created_at", None)
+def _field_columns(fields: Optional[List[Any]]) -> Tuple[List[Any], List[Any], List[Any]]:
+    if not fields:
+        return [], [], []
+    if isinstance(fields[0], dict):
+        return (
+            [f.get("key") for f in fields],
+            [f.get("value") for f in fields],
+            [f.get("previousValue") for f in fields],
+        )
+    return (
+        [getattr(f, "key", None) for f in fields],
+        [getattr(f, "value", None) for f in fields],
+        [getattr(f, "previous_value", None) for f in fields],
+    )
+
+
+def _coalesce_columnar(raw: Optional[List[Any]]) -> Optional[ColumnarDifferences]:
+    """Columnar variant of ``_coalesce_differences``.
+
+    Produces the same differences, in the same order, as parallel columns:
+    field attributes are gathered with one list comprehension per diff and
+    column instead of one model per field.
+    """
+    if not raw:
+        return None
+
+    added_by_row, removed_by_row, passthrough = _partition_differences(raw)
+    columns = ColumnarDifferences()
+    types, offsets, rows = columns.types, columns.offsets, columns.rows
+    keys, values, previous_values = columns.keys, columns.values, columns.previous_values
+
+    def emit(
+        diff_type: Any, diff_keys: List[Any], diff_values: List[Any], diff_previous: List[Any]
+    ) -> None:
+        rows.extend(repeat(len(types), len(diff_keys)))
+        types.append(diff_type)
+        keys.extend(diff_keys)
+        values.extend(diff_values)
+        previous_values.extend(diff_previous)
+        offsets.append(len(keys))
+
+    for row_id, added in added_by_row.items():
+        added_columns = _field_columns(_get(added, "fields", "fields"))
+        removed = removed_by_row.pop(row_id, None)
+        if removed is None:
+            emit(_get(added, "type", "type"), *added_columns)
+            continue
+        added_keys, added_values, _ = added_columns
+        removed_keys, removed_values, _ = _field_columns(_get(removed, "fields", "fields"))
+        previous_by_key = dict(zip(removed_keys, removed_values))
+        previous_by_key.pop(None, None)
+        known = set(added_keys)
+        dropped = [(k, v) for k, v in zip(removed_keys, removed_values) if k not in known]
+        emit(
+            "changed",
+            added_keys + [k for k, _ in dropped],
+            added_values + [None] * len(dropped),
+            [previous_by_key.get(k) for k in added_keys] + [v for _, v in dropped],
+        )
+
+    for diff in chain(removed_by_row.values(), passthrough):
+        emit(_get(diff, "type", "type"), *_field_columns(_get(diff, "fields", "fields")))
+
+    return columns
+
+
+def _map_change(raw: Any, columnar: bool = False) -> Change:
+    """Map a change from a generated model or from decoded JSON.
+
+    With ``columnar`` the differences are mapped to ``difference_columns``
+    instead of ``differences``.
+    """
+    created_at = _get(raw, "created_at", "createdAt")
     if isinstance(created_at, datetime):
         created_at = created_at.isoformat()
+    differences = _get(raw, "differences", "differences")
     return Change(
-        id=getattr(raw, "id", None),
-        workflow_id=getattr(raw, "workflow_id", None),
-        data=getattr(raw, "data", None),
-        differences=_coalesce_differences(getattr(raw, "differences", None)),
-        url=getattr(raw, "url", None),
-        summary=getattr(raw, "summary", None),
-        screenshot_url=getattr(raw, "screenshot_url", None),
+        id=_get(raw, "id", "id"),
+        workflow_id=_get(raw, "workflow_id", "workflowId"),
+        data=_get(raw, "data", "data"),
+        differences=None if columnar else _coalesce_differences(differences),
+        difference_columns=_coalesce_columnar(differences) if columnar else None,
+        url=_get(raw, "url", "url"),
+        summary=_get(raw, "summary", "summary"),
+        screenshot_url=_get(raw, "screenshot_url", "screenshotUrl"),
         created_at=created_at,
     )
 
 
+def _encoded_path(file: str) -> str:
+    """Accept an encoded file path or a ``.../changes/files/<path>`` URL."""
+    path = urlsplit(file).path if "://" in file else file
+    if _CHANGE_FILES_PREFIX in path:
+        path = path.split(_CHANGE_FILES_PREFIX, 1)[1]
+    return unquote(path)
+
+
+def _download_target(change: Union[Change, Tuple[str, str]]) -> Tuple[str, str]:
+    if isinstance(change, Change):
+        if not change.workflow_id or not change.id:
+            raise KadoaSdkError(
+                "Change download needs a workflow id and a change id",
+                code=KadoaErrorCode.VALIDATION_ERROR,
+                details={"workflowId": change.workflow_id, "changeId": change.id},
+            )
+        return change.workflow_id, change.id
+    workflow_id, change_id = change
+    return workflow_id, change_id
+
+
+def _format_timestamp(moment: datetime) -> str:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
 class ChangesService:
     """Service for querying workflow change diffs.
 
@@ -148,8 +313,18 @@ class ChangesService:
     def _api(self):
         return get_workflows_api(self.client)
 
-    def list(self, options: Optional[ListChangesOptions] = None) -> ListChangesResult:
-        """List changes across one or more workflows."""
+    @operation("list_changes")
+    def list(
+        self, options: Optional[ListChangesOptions] = None, *, columnar: bool = False
+    ) -> ListChangesResult:
+        """List changes across one or more workflows.
+
+        Args:
+            options: Filters and paging
+            columnar: Map differences to ``Change.difference_columns`` (see
+                ``ColumnarDifferences``) instead of ``ChangeDifference`` models;
+                much cheaper for changes with many row diffs
+        """
         opts = options or ListChangesOptions()
         response = self._api().v4_changes_get(
             workflow_ids=opts.workflow_ids,
@@ -161,13 +336,19 @@ class ChangesService:
         )
         changes_raw = getattr(response, "changes", None) or []
         return ListChangesResult(
-            changes=[_map_change(c) for c in changes_raw],
+            changes=[_map_change(c, columnar) for c in changes_raw],
             pagination=getattr(response, "pagination", None),
             changes_count=getattr(response, "changes_count", None) or 0,
         )
 
-    def get(self, change_id: str) -> Change:
-        """Get a single change by ID."""
+    @operation("get_change")
+    def get(self, change_id: str, *, columnar: bool = False) -> Change:
+        """Get a single change by ID.
+
+        Args:
+            change_id: Change ID
+            columnar: Map differences to ``Change.difference_columns``
+        """
         response = self._api().v4_changes_change_id_get(change_id=change_id)
         if response is None:
             raise KadoaSdkError(
@@ -175,4 +356,422 @@ class ChangesService:
                 code=KadoaErrorCode.NOT_FOUND,
                 details={"changeId": change_id},
             )
-        return _map_change(response)
+        return _map_change(response, columnar)
+
+    def _changes_raw(self, use_v4: bool, params: Dict[str, Any]) -> Dict[str, Any]:
+        api = self._api()
+        if use_v4:
+            response = api.v4_changes_get_without_preload_content(**params)
+        else:
+            response = api.v5_changes_get_without_preload_content(**params)
+        raise_for_download_status(response, "Failed to list changes", {"params": params})
+        try:
+            raw = response.read()
+        finally:
+            response.release_conn()
+        payload: Dict[str, Any] = get_json_decoder()(raw) if raw else {}
+        return payload
+
+    @operation("list_changes")
+    def _changes_window(
+        self, use_v4: bool, params: Dict[str, Any], skip: int, limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        window = {**params, "skip": skip, "limit": limit}
+        try:
+            payload = self._changes_raw(use_v4, window)
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error, message="Failed to list changes", details={"params": window}
+            )
+        pagination = payload.get("pagination") or {}
+        total = pagination.get("totalCount")
+        if total is None:
+            total = payload.get("changesCount")
+        return payload.get("changes") or [], total
+
+    def stream(
+        self,
+        workflow_ids: Optional[Union[str, Iterable[str]]] = None,
+        *,
+        since: Optional[Union[str, datetime]] = None,
+        checkpoint: Optional[ChangeCheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        exclude: Optional[str] = None,
+        page_size: int = DEFAULT_CHANGES_PAGE_SIZE,
+        prefetch: int = 4,
+        follow: bool = False,
+        realtime: Optional["Realtime"] = None,
+        poll_interval_ms: int = DEFAULT_STREAM_POLL_INTERVAL_MS,
+        overlap_ms: int = DEFAULT_STREAM_OVERLAP_MS,
+        columnar: bool = False,
+    ) -> Iterator[Change]:
+        """
+        Stream changes incrementally, resuming from a ``createdAt`` watermark.
+
+        Each pass lists the changes created between the watermark and now in
+        ``skip``/``limit`` windows (the upper bound keeps the windows stable
+        while new changes arrive), fetching up to ``prefetch`` windows
+        concurrently and mapping changes only as they are consumed. After a
+        pass the watermark moves to its upper bound and is saved to
+        ``checkpoint``. The next pass starts ``overlap_ms`` before the
+        watermark to tolerate clock skew between client and API; changes
+        already delivered are skipped by id.
+
+        Changes whose data is still being stored (``dataPending``) are held
+        back, and the watermark stays before them, until their data is
+        available or they are older than five minutes.
+
+        Delivery is at-least-once across restarts: a consumer stopped during a
+        pass, or restarted within the overlap, sees some changes again.
+
+        Args:
+            workflow_ids: Workflow ids (a list or a comma-separated string);
+                all ACTIVE workflows if omitted
+            since: Start of the first pass when ``checkpoint`` has no
+                watermark yet; the whole history if omitted
+            checkpoint: Store the watermark is loaded from and saved to
+            checkpoint_key: Key in ``checkpoint`` (default: the workflow ids)
+            exclude: Fields to omit from each change (e.g. ``"data"``); served
+                by ``/v4/changes``, everything else by ``/v5/changes``
+            page_size: Changes per request
+            prefetch: Windows requested concurrently (1 fetches sequentially)
+            follow: Keep tailing new changes after catching up; the iterator
+                then only ends when closed
+            realtime: Connection whose ``workflow_data_change`` events start
+                the next pass right away while following
+            poll_interval_ms: Pause between passes while following, unless a
+                realtime event arrives first
+            overlap_ms: How far each pass reaches back before the watermark
+            columnar: Map differences to ``Change.difference_columns``
+
+        Yields:
+            Changes, in the order the API returns them within each pass
+
+        Raises:
+            KadoaHttpError: If a request fails; the watermark of the current
+                pass is not saved
+
+        Example:
+            ```python
+            store = FileCheckpointStore("changes.json")
+            for change in client.changes.stream([workflow_id], checkpoint=store):
+                warehouse.upsert(change)
+            ```
+        """
+        if workflow_ids is None or isinstance(workflow_ids, str):
+            ids_param = workflow_ids or None
+        else:
+            ids_param = ",".join(dict.fromkeys(workflow_ids)) or None
+        key = checkpoint_key or ids_param or "*"
+        watermark = checkpoint.load(key) if checkpoint is not None else None
+        if watermark is None and since is not None:
+            watermark = since if isinstance(since, str) else _format_timestamp(since)
+        start = _parse_timestamp(watermark)
+        if watermark is not None and start is None:
+            raise KadoaSdkError(
+                f"Invalid change watermark: {watermark}",
+                code=KadoaErrorCode.VALIDATION_ERROR,
+                details={"watermark": watermark, "checkpointKey": key},
+            )
+        overlap = timedelta(milliseconds=max(0, overlap_ms))
+
+        wake = threading.Event()
+        unsubscribe = None
+        if follow and realtime is not None:
+            unsubscribe = realtime.on_event(
+                lambda _event: wake.set(),
+                types=CHANGE_EVENT_TYPES,
+                workflow_ids=ids_param.split(",") if ids_param else None,
+            )
+        # id -> createdAt of delivered changes the next pass may list again
+        delivered: Dict[str, datetime] = {}
+        try:
+            while True:
+                wake.clear()
+                end = datetime.now(timezone.utc)
+                params: Dict[str, Any] = {"end_date": _format_timestamp(end)}
+                if ids_param:
+                    params["workflow_ids"] = ids_param
+                if start is not None:
+                    params["start_date"] = _format_timestamp(start - overlap)
+                if exclude:
+                    params["exclude"] = exclude
+                fetch_window = functools.partial(self._changes_window, bool(exclude), params)
+
+                horizon = end - overlap - _PENDING_GRACE
+                held_from: Optional[datetime] = None
+                seen: Dict[str, datetime] = {}
+                for window in iter_windows(fetch_window, page_size=page_size, prefetch=prefetch):
+                    for raw in window:
+                        change_id = raw.get("id")
+                        if change_id in delivered:
+                            continue
+                        created_at = _parse_timestamp(raw.get("createdAt"))
+                        if raw.get("dataPending") and created_at is not None:
+                            if created_at > end - _PENDING_GRACE:
+                                if held_from is None or created_at < held_from:
+                                    held_from = created_at
+                                continue
+                        if change_id is not None and created_at is not None:
+                            if created_at >= horizon:
+                                seen[change_id] = created_at
+                        yield _map_change(raw, columnar)
+
+                start = end if held_from is None else held_from
+                floor = start - overlap
+                delivered = {
+                    change_id: created_at
+                    for source in (delivered, seen)
+                    for change_id, created_at in source.items()
+                    if created_at >= floor
+                }
+                if checkpoint is not None:
+                    checkpoint.save(key, _format_timestamp(start))
+                if not follow:
+                    return
+                wake.wait(max(0, poll_interval_ms) / 1000)
+        finally:
+            if unsubscribe is not None:
+                unsubscribe()
+
+    @operation("download_change_csv")
+    def _open_csv(
+        self,
+        workflow_id: str,
+        change_id: str,
+        expires: Optional[str],
+        sig: Optional[str],
+        headers: Optional[Dict[str, str]],
+    ) -> Any:
+        params: Dict[str, Any] = {"workflow_id": workflow_id, "change_id": change_id}
+        if expires is not None:
+            params["expires"] = expires
+        if sig is not None:
+            params["sig"] = sig
+        api = get_notifications_api(self.client)
+        method = api.v5_notifications_workflows_workflow_id_changes_change_id_csv_get_without_preload_content  # noqa: E501
+        details = {"workflowId": workflow_id, "changeId": change_id}
+        try:
+            return method(**params, _headers=headers)
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error, message="Failed to download change CSV", details=details
+            )
+
+    @operation("download_change_file")
+    def _open_file(self, encoded_path: str, headers: Optional[Dict[str, str]]) -> Any:
+        api = self._api()
+        try:
+            return api.v4_changes_files_encoded_path_get_without_preload_content(
+                encoded_path=encoded_path, _headers=headers
+            )
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error,
+                message="Failed to download change file",
+                details={"encodedPath": encoded_path},
+            )
+
+    def iter_csv(
+        self,
+        workflow_id: str,
+        change_id: str,
+        *,
+        expires: Optional[str] = None,
+        sig: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream the changed-records CSV of a change in chunks.
+
+        The CSV is never held in memory as a whole and never goes through
+        JSON model parsing.
+
+        Args:
+            workflow_id: Workflow ID
+            change_id: Change ID, or ``"latest"`` for the most recent change
+            expires: ``expires`` parameter of a signed notification link
+            sig: ``sig`` parameter of a signed notification link
+            chunk_size: Bytes per chunk
+
+        Yields:
+            Raw CSV bytes
+
+        Raises:
+            KadoaHttpError: If the request fails (e.g. 409 when the change set
+                is no longer retrievable)
+        """
+        response = self._open_csv(workflow_id, change_id, expires, sig, None)
+        raise_for_download_status(
+            response,
+            "Failed to download change CSV",
+            {"workflowId": workflow_id, "changeId": change_id},
+        )
+        yield from iter_chunks(response, chunk_size)
+
+    def download_csv(
+        self,
+        workflow_id: str,
+        change_id: str,
+        destination: Union[str, os.PathLike[str]],
+        *,
+        expires: Optional[str] = None,
+        sig: Optional[str] = None,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ChangeDownload:
+        """
+        Stream the changed-records CSV of a change to a file.
+
+        The body is written to ``<destination>.part`` in chunks and renamed
+        once complete. With ``resume`` a partial file left by an interrupted
+        download is continued with a ``Range`` request.
+
+        Args:
+            workflow_id: Workflow ID
+            change_id: Change ID, or ``"latest"`` for the most recent change
+            destination: Target file
+            expires: ``expires`` parameter of a signed notification link
+            sig: ``sig`` parameter of a signed notification link
+            resume: Continue a partial download
+            chunk_size: Bytes per chunk
+
+        Returns:
+            The download, with path and size
+
+        Raises:
+            KadoaHttpError: If the request fails
+        """
+        path, size, resumed = download_to_path(
+            functools.partial(self._open_csv, workflow_id, change_id, expires, sig),
+            destination,
+            resume=resume,
+            chunk_size=chunk_size,
+            message="Failed to download change CSV",
+            details={"workflowId": workflow_id, "changeId": change_id},
+        )
+        return ChangeDownload(workflow_id, change_id, path, size, resumed)
+
+    def download_csvs(
+        self,
+        changes: Iterable[Union[Change, Tuple[str, str]]],
+        directory: Union[str, os.PathLike[str]],
+        *,
+        max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[ChangeDownload]:
+        """
+        Download the CSVs of many changes in parallel.
+
+        Each CSV is streamed to ``<directory>/<workflow_id>_<change_id>.csv``
+        on up to ``max_concurrency`` threads. A failed download doesn't stop
+        the others: its error is returned in ``ChangeDownload.error`` and its
+        partial file is resumed by the next call.
+
+        Args:
+            changes: ``Change`` objects or ``(workflow_id, change_id)`` pairs
+            directory: Target directory
+            max_concurrency: Downloads running at once
+            resume: Continue partial downloads
+            chunk_size: Bytes per chunk
+
+        Returns:
+            One download per distinct change, in input order
+
+        Example:
+            ```python
+            result = client.changes.list(ListChangesOptions(workflow_ids=workflow_id))
+            for download in client.changes.download_csvs(result.changes, "exports"):
+                if download.error is None:
+                    load_csv(download.path)
+            ```
+        """
+        targets = list(dict.fromkeys(_download_target(change) for change in changes))
+        folder = Path(directory)
+
+        def download(workflow_id: str, change_id: str) -> ChangeDownload:
+            try:
+                return self.download_csv(
+                    workflow_id,
+                    change_id,
+                    folder / f"{workflow_id}_{change_id}.csv",
+                    resume=resume,
+                    chunk_size=chunk_size,
+                )
+            except Exception as error:
+                wrapped = KadoaHttpError.wrap(
+                    error,
+                    message="Failed to download change CSV",
+                    details={"workflowId": workflow_id, "changeId": change_id},
+                )
+                return ChangeDownload(workflow_id, change_id, error=wrapped)
+
+        if not targets:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrency, len(targets))),
+            thread_name_prefix="kadoa-download",
+        ) as executor:
+            futures = [
+                executor.submit(copy_context().run, download, workflow_id, change_id)
+                for workflow_id, change_id in targets
+            ]
+            return [future.result() for future in futures]
+
+    def iter_file(self, file: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a change file (e.g. a PDF) from ``/v4/changes/files`` in chunks.
+
+        Args:
+            file: Base64-encoded file path, or a URL ending in
+                ``/changes/files/<encoded path>``
+            chunk_size: Bytes per chunk
+
+        Yields:
+            Raw file bytes
+
+        Raises:
+            KadoaHttpError: If the request fails
+        """
+        encoded_path = _encoded_path(file)
+        response = self._open_file(encoded_path, None)
+        raise_for_download_status(
+            response, "Failed to download change file", {"encodedPath": encoded_path}
+        )
+        yield from iter_chunks(response, chunk_size)
+
+    def download_file(
+        self,
+        file: str,
+        destination: Union[str, os.PathLike[str]],
+        *,
+        resume: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Path:
+        """
+        Stream a change file (e.g. a PDF) from ``/v4/changes/files`` to disk.
+
+        Args:
+            file: Base64-encoded file path, or a URL ending in
+                ``/changes/files/<encoded path>``
+            destination: Target file
+            resume: Continue a partial download
+            chunk_size: Bytes per chunk
+
+        Returns:
+            The destination path
+
+        Raises:
+            KadoaHttpError: If the request fails
+        """
+        encoded_path = _encoded_path(file)
+        path, _, _ = download_to_path(
+            functools.partial(self._open_file, encoded_path),
+            destination,
+            resume=resume,
+            chunk_size=chunk_size,
+            message="Failed to download change file",
+            details={"encodedPath": encoded_path},
+        )
+        return path
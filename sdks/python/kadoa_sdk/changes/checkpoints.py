@@ -0,0 +1,81 @@
+"""Checkpoint stores for ``ChangesService.stream`` watermarks.
+
+A checkpoint store maps a stream key (by default the streamed workflow ids)
+to the ``createdAt`` watermark up to which changes have been delivered, so a
+restarted consumer resumes where the previous one stopped. Any object with
+``load``/``save`` methods works, e.g. one backed by the warehouse the changes
+are mirrored into.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Protocol, Union
+
+
+class ChangeCheckpointStore(Protocol):
+    def load(self, key: str) -> Optional[str]: ...
+
+    def save(self, key: str, watermark: str) -> None: ...
+
+
+class MemoryCheckpointStore:
+    """Keeps watermarks in memory, for the lifetime of the process."""
+
+    __slots__ = ("_watermarks",)
+
+    def __init__(self) -> None:
+        self._watermarks: Dict[str, str] = {}
+
+    def load(self, key: str) -> Optional[str]:
+        return self._watermarks.get(key)
+
+    def save(self, key: str, watermark: str) -> None:
+        self._watermarks[key] = watermark
+
+
+class FileCheckpointStore:
+    """Keeps watermarks in a JSON file.
+
+    The file is rewritten through a temporary file and an atomic rename, so a
+    crash during ``save`` leaves the previous watermarks intact.
+
+    Args:
+        path: JSON file; created on the first save
+    """
+
+    __slots__ = ("path", "_lock")
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        self.path = Path(path)
+        self._lock = Lock()
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, watermark: str) -> None:
+        with self._lock:
+            watermarks = self._read()
+            watermarks[key] = watermark
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(watermarks, handle, indent=2, sort_keys=True)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
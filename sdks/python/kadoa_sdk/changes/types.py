@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, List, Literal, Optional
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Union, overload
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 ChangeDifferenceType = Literal["added", "removed", "changed"]
 
@@ -18,8 +20,97 @@ class ChangeDifference(BaseModel):
     fields: Optional[List[ChangeDifferenceField]] = None
 
 
+class ColumnarDifferences(Sequence):  # type: ignore[type-arg]
+    """Differences of one change as parallel columns instead of models.
+
+    Difference ``i`` has type ``types[i]`` and owns the fields at positions
+    ``offsets[i]:offsets[i + 1]`` of ``keys``, ``values`` and
+    ``previous_values``; ``rows[j]`` is the index of the difference field
+    ``j`` belongs to. Values are kept as returned by the API.
+
+    The object is also a lazy sequence of ``ChangeDifference``: indexing or
+    iterating builds models for the accessed differences only.
+    """
+
+    __slots__ = ("types", "offsets", "rows", "keys", "values", "previous_values")
+
+    def __init__(self) -> None:
+        self.types: List[Optional[str]] = []
+        self.offsets: List[int] = [0]
+        self.rows: List[int] = []
+        self.keys: List[Optional[str]] = []
+        self.values: List[Any] = []
+        self.previous_values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @overload
+    def __getitem__(self, index: int) -> ChangeDifference: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ChangeDifference]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ChangeDifference, List[ChangeDifference]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.types)))]
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError("difference index out of range")
+        return ChangeDifference.model_validate(self._difference_dict(index))
+
+    def _difference_dict(self, index: int) -> Dict[str, Any]:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        keys, values, previous_values = self.keys, self.values, self.previous_values
+        fields = [
+            {"key": keys[j], "value": values[j], "previous_value": previous_values[j]}
+            for j in range(start, end)
+        ]
+        return {"type": self.types[index], "fields": fields or None}
+
+    def __repr__(self) -> str:
+        return f"ColumnarDifferences(differences={len(self.types)}, fields={len(self.keys)})"
+
+    @property
+    def field_count(self) -> int:
+        return len(self.keys)
+
+    def to_models(self) -> List[ChangeDifference]:
+        """Build the ``ChangeDifference`` models for all differences.
+
+        Validates all differences in one call, which is much cheaper than
+        building them one by one.
+        """
+        return _DIFFERENCES_ADAPTER.validate_python(
+            [self._difference_dict(index) for index in range(len(self.types))]
+        )
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """One column per attribute, one entry per field (e.g. for a DataFrame)."""
+        types = self.types
+        return {
+            "row": list(self.rows),
+            "type": [types[row] for row in self.rows],
+            "key": list(self.keys),
+            "value": list(self.values),
+            "previous_value": list(self.previous_values),
+        }
+
+
+_DIFFERENCES_ADAPTER = TypeAdapter(List[ChangeDifference])
+
+
 class Change(BaseModel):
-    """A single change event detected by the monitoring system."""
+    """A single change event detected by the monitoring system.
+
+    Changes mapped with ``columnar=True`` leave ``differences`` unset and carry
+    ``difference_columns`` instead.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     id: Optional[str] = None
     workflow_id: Optional[str] = None
@@ -29,6 +120,37 @@ class Change(BaseModel):
     summary: Optional[str] = None
     screenshot_url: Optional[str] = None
     created_at: Optional[str] = None
+    difference_columns: Optional[ColumnarDifferences] = Field(default=None, exclude=True)
+
+
+class ChangeDownload:
+    """Outcome of one change CSV download in ``ChangesService.download_csvs``.
+
+    ``error`` is set (and ``path`` is None) when the download failed; a
+    partial file is then kept for a resumed attempt.
+    """
+
+    __slots__ = ("workflow_id", "change_id", "path", "size", "resumed", "error")
+
+    def __init__(
+        self,
+        workflow_id: str,
+        change_id: str,
+        path: Optional[Path] = None,
+        size: int = 0,
+        resumed: bool = False,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.workflow_id = workflow_id
+        self.change_id = change_id
+        self.path = path
+        self.size = size
+        self.resumed = resumed
+        self.error = error
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else f"path={self.path!r}"
+        return f"ChangeDownload(change_id={self.change_id!r}, size={self.size}, {outcome})"
 
 
 class ListChangesOptions(BaseModel):
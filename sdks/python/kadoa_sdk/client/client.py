@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
 
 from ..core.core_acl import Configuration, RESTClientObject, create_api_client
 from ..core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from ..core.hooks import HookPipeline, HttpRequest, HttpResponse
+from ..core.instrumentation import log_http_request
+from ..core.logger import http as http_logger
+from ..core.metrics import (
+    MetricsRegistry,
+    RequestBytes,
+    error_code_for,
+    measure_request_bodies,
+    retry_count,
+)
+from ..core.operations import current_operation
+from ..core.profiling import Profiler, current_profiler
+from ..core.profiling import profile as profile_operations
 from ..core.realtime import Realtime, RealtimeConfig
-from ..core.settings import get_settings
+from ..core.settings import KadoaSettings, default_settings, get_settings
+from ..core.tracing import end_http_span, inject_trace_headers, start_http_span
 from ..core.version_check import check_for_updates
 from ..changes import ChangesService
 from ..extraction import ExtractionModule
@@ -24,6 +42,16 @@ from .models import KadoaClientConfig, KadoaClientStatus, RealtimeOptions
 from .wiring import create_crawler_domain, create_notification_domain, create_validation_domain
 
 
+def _settings_for(config: KadoaClientConfig) -> KadoaSettings:
+    """Settings backing the values ``config`` leaves open.
+
+    The environment (and .env files) is only read when the config leaves a
+    value open and ``load_env`` is set.
+    """
+    needs_env = config.base_url is None or config.timeout is None or not config.api_key
+    return get_settings() if needs_env and config.load_env else default_settings()
+
+
 class KadoaClient:
     """Main client for interacting with the Kadoa API.
 
@@ -51,7 +79,8 @@ class KadoaClient:
     """
 
     def __init__(self, config: KadoaClientConfig) -> None:
-        settings = get_settings()
+        settings = _settings_for(config)
+        self._load_env = config.load_env
 
         self._base_url = config.base_url if config.base_url is not None else settings.public_api_uri
 
@@ -102,7 +131,13 @@ class KadoaClient:
             )
 
         self._configuration = configuration
-        self._api_client = create_api_client(self._configuration)
+        self.metrics = MetricsRegistry(enabled=config.enable_metrics)
+        self.hooks = HookPipeline()
+        for hook in config.hooks or ():
+            self.hooks.add(hook)
+        self._api_client = create_api_client(
+            self._configuration, metrics=self.metrics, hooks=self.hooks
+        )
 
         self._realtime: Optional[Realtime] = None
 
@@ -136,11 +171,23 @@ class KadoaClient:
             Realtime: The realtime connection instance
         """
         if not self._realtime:
-            realtime_config = RealtimeConfig(api_key=self._api_key, **(options or {}))
+            realtime_options: RealtimeOptions = {"hooks": self.hooks, **(options or {})}
+            realtime_config = RealtimeConfig(
+                api_key=self._api_key, settings=self._realtime_settings(), **realtime_options
+            )
             self._realtime = Realtime(realtime_config)
             await self._realtime.connect()
         return self._realtime
 
+    def _realtime_settings(self) -> KadoaSettings:
+        """Realtime endpoints for this client.
+
+        The OAuth token comes from the client's API; the realtime URIs are only
+        configurable through the environment, which ``load_env=False`` skips.
+        """
+        settings = get_settings() if self._load_env else default_settings()
+        return settings.model_copy(update={"public_api_uri": self._base_url})
+
     def disconnect_realtime(self) -> None:
         """Disconnect from realtime WebSocket server."""
         if self._realtime:
@@ -198,6 +245,32 @@ class KadoaClient:
         """Create a prepared extraction using the fluent builder API."""
         return self._extraction_builder.extract(options)
 
+    @contextmanager
+    def profile(
+        self,
+        *,
+        speedscope_path: Optional[Union[str, Path]] = None,
+        max_events: int = 200_000,
+    ) -> Iterator[Profiler]:
+        """Break down where SDK operations in the block spend their time.
+
+        Each operation's wall time is split into connect, network, decode,
+        validation and post-processing; see ``kadoa_sdk.core.profiling``.
+
+        Args:
+            speedscope_path: Also write a speedscope flame graph file here
+            max_events: Upper bound on events recorded for the flame graph
+
+        Example:
+            ```python
+            with client.profile(speedscope_path="fetch.speedscope.json") as profiler:
+                client.extraction.fetch_all_data(FetchDataOptions(workflow_id=workflow_id))
+            print(profiler.report().to_text())
+            ```
+        """
+        with profile_operations(speedscope_path=speedscope_path, max_events=max_events) as profiler:
+            yield profiler
+
     def _build_auth_headers(self) -> dict[str, str]:
         api_key = None
         if getattr(self._configuration, "api_key", None):
@@ -225,17 +298,50 @@ class KadoaClient:
         if headers:
             request_headers.update(headers)
 
+        http_span = start_http_span(method, endpoint, url)
+        inject_trace_headers(request_headers, http_span)
+
         rest = RESTClientObject(self._configuration)
+        if self.metrics.enabled or http_span is not None:
+            measure_request_bodies(rest.pool_manager)
+        request_bytes = RequestBytes()
+        operation = current_operation() or f"{method} {endpoint}"
+        request = HttpRequest(method, url, request_headers, body, operation) if self.hooks else None
+        profiler = current_profiler()
+        started = time.perf_counter()
+        status: Optional[int] = None
+        bytes_in = 0
+        retries = 0
+        error: Optional[Exception] = None
         try:
-            response = rest.request(
-                method,
-                url,
-                headers=request_headers,
-                body=body,
-            )
+            if request is not None:
+                self.hooks.before_request(request)
+                method, url, request_headers, body = (
+                    request.method,
+                    request.url,
+                    request.headers,
+                    request.body,
+                )
+            with profiler.phase("network") if profiler is not None else nullcontext():
+                with request_bytes:
+                    response = rest.request(
+                        method,
+                        url,
+                        headers=request_headers,
+                        body=body,
+                    )
+                response_data = response.read()
+            status = response.status
+            retries = retry_count(response)
+            if request is not None:
+                hook_response = HttpResponse(
+                    response.status, dict(response.getheaders() or {}), response_data
+                )
+                self.hooks.after_response(request, hook_response)
+                response_data = hook_response.data
+            bytes_in = len(response_data or b"")
 
             if response.status >= 400:
-                response_data = response.read()
                 try:
                     error_data = json.loads(response_data) if response_data else {}
                 except json.JSONDecodeError:
@@ -250,9 +356,32 @@ class KadoaClient:
                     code=KadoaHttpError.map_status_to_code(response.status),
                 )
 
-            response_data = response.read()
-            return json.loads(response_data) if response_data else {}
+            if profiler is None:
+                return json.loads(response_data) if response_data else {}
+            with profiler.phase("decode"):
+                return json.loads(response_data) if response_data else {}
+        except Exception as exc:
+            error = exc
+            if request is not None:
+                self.hooks.on_error(request, exc)
+            raise
         finally:
-            pass  # RESTClientObject doesn't have a close method
-
-
+            # RESTClientObject doesn't have a close method
+            self.metrics.record(
+                operation,
+                time.perf_counter() - started,
+                status=status,
+                error_code=error_code_for(error) if error is not None else None,
+                bytes_in=bytes_in,
+                bytes_out=request_bytes.sent or 0,
+                retries=retries,
+            )
+            end_http_span(
+                http_span,
+                status=status,
+                error=error,
+                bytes_in=bytes_in,
+                bytes_out=request_bytes.sent,
+            )
+            if http_logger.isEnabledFor(logging.DEBUG):
+                log_http_request(f"{method} {url}", started, status=status, error=error)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional, TypedDict
+from typing import Any, List, Optional, TypedDict
 
 from pydantic import BaseModel
 
+from ..core.hooks import HookPipeline
+from ..core.json_codec import JsonDecoder
+from ..core.realtime_recorder import RealtimeRecorder
 from ..notifications import NotificationSettingsEventType
 from ..user import KadoaUser
 
@@ -12,12 +15,24 @@ class KadoaClientConfig(BaseModel):
     api_key: Optional[str] = None
     base_url: Optional[str] = None
     timeout: Optional[int] = None
+    # Record per-operation request metrics (client.metrics); off by default
+    # to keep the request path free of the bookkeeping
+    enable_metrics: bool = False
+    # Read KADOA_* environment variables and .env files for values not given
+    # here. With False, missing values fall back to the SDK defaults.
+    load_env: bool = True
+    # Request/response hooks (kadoa_sdk.core.hooks.HttpHook), run in this order
+    hooks: Optional[List[Any]] = None
 
 
 class RealtimeOptions(TypedDict, total=False):
     heartbeat_interval: int
     reconnect_delay: int
     missed_heartbeats_limit: int
+    json_decoder: JsonDecoder
+    server_side_filters: bool
+    recorder: RealtimeRecorder
+    hooks: HookPipeline
 
 
 class KadoaClientStatus(BaseModel):
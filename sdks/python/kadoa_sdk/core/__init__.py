@@ -4,6 +4,8 @@ from .exceptions import (
     KadoaHttpError,
     KadoaSdkError,
 )
+from .hooks import HookPipeline, HttpHook, HttpRequest, HttpResponse
+from .json_codec import JsonDecoder, get_json_decoder
 from .logger import (
     client,
     crawl,
@@ -16,8 +18,12 @@ from .logger import (
     workflow,
     wss,
 )
+from .metrics import MetricsRegistry, MetricsSnapshot
+from .profiling import Profiler, ProfileReport
 from .realtime import Realtime, RealtimeConfig, RealtimeEvent
+from .realtime_recorder import RealtimeRecorder
 from .settings import KadoaSettings, get_settings
+from .tracing import disable_tracing, enable_tracing
 from .utils import PollingOptions, poll_until
 
 __all__ = [
@@ -25,6 +31,8 @@ __all__ = [
     "KadoaHttpError",
     "KadoaErrorCode",
     "ERROR_MESSAGES",
+    "JsonDecoder",
+    "get_json_decoder",
     "create_logger",
     "client",
     "wss",
@@ -35,9 +43,20 @@ __all__ = [
     "notifications",
     "schemas",
     "validation",
+    "HookPipeline",
+    "HttpHook",
+    "HttpRequest",
+    "HttpResponse",
+    "MetricsRegistry",
+    "MetricsSnapshot",
+    "Profiler",
+    "ProfileReport",
     "Realtime",
     "RealtimeConfig",
     "RealtimeEvent",
+    "RealtimeRecorder",
+    "enable_tracing",
+    "disable_tracing",
     "PollingOptions",
     "poll_until",
     "KadoaSettings",
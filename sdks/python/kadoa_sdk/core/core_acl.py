@@ -4,31 +4,59 @@ Wraps generated core types (ApiClient, Configuration, ApiException, RESTClientOb
 Downstream code must import from this module instead of `openapi_client/**`.
 """
 
+from typing import Optional
+
 from openapi_client import ApiClient, Configuration
 from openapi_client.exceptions import ApiException
 from openapi_client.rest import RESTClientObject
 
 from ..version import SDK_LANGUAGE, SDK_NAME, __version__
+from .hooks import HookPipeline
+from .instrumentation import ApiClientInstrumentationMixin
+from .metrics import MetricsRegistry
 
 __all__ = [
     "ApiClient",
     "Configuration",
     "ApiException",
     "RESTClientObject",
+    "InstrumentedApiClient",
     "create_api_client",
 ]
 
 
-def create_api_client(configuration: Configuration) -> ApiClient:
+class InstrumentedApiClient(ApiClientInstrumentationMixin, ApiClient):
+    """ApiClient that records request metrics and tracing spans and runs hooks."""
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[HookPipeline] = None,
+    ) -> None:
+        super().__init__(configuration)
+        self.metrics = metrics
+        self.hooks = hooks
+
+
+def create_api_client(
+    configuration: Configuration,
+    *,
+    metrics: Optional[MetricsRegistry] = None,
+    hooks: Optional[HookPipeline] = None,
+) -> ApiClient:
     """Create an ApiClient instance with proper SDK headers.
 
     Args:
         configuration: The configuration to use for the ApiClient
+        metrics: Registry receiving request metrics (none recorded when omitted)
+        hooks: Request/response hooks run for every request
 
     Returns:
-        ApiClient instance with User-Agent, X-SDK-Version, and X-SDK-Language headers set
+        ApiClient instance with User-Agent, X-SDK-Version, and X-SDK-Language headers set.
+        Requests are traced once ``kadoa_sdk.core.tracing.enable_tracing()`` is called.
     """
-    api_client = ApiClient(configuration)
+    api_client = InstrumentedApiClient(configuration, metrics, hooks)
     api_client.user_agent = f"{SDK_NAME}/{__version__}"
     api_client.default_headers["X-SDK-Version"] = __version__
     api_client.default_headers["X-SDK-Language"] = SDK_LANGUAGE
@@ -0,0 +1,107 @@
+"""Streamed downloads of binary and CSV endpoints.
+
+Generated ``*_without_preload_content`` methods return the raw urllib3
+response, so bodies can be read in chunks instead of being loaded and
+deserialized at once. ``download_to_path`` writes the chunks to
+``<destination>.part`` and renames the file when the body is complete; with
+``resume`` an existing partial file is continued with an HTTP ``Range``
+request.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from .exceptions import KadoaHttpError
+from .json_codec import JSON_DECODE_ERRORS, get_json_decoder
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Bytes of an error body kept for KadoaHttpError.response_body
+_ERROR_BODY_LIMIT = 64 * 1024
+
+# Range header for a resumed download (None to start over) -> raw response
+ResponseOpener = Callable[[Optional[Dict[str, str]]], Any]
+
+
+def raise_for_download_status(
+    response: Any, message: str, details: Optional[Dict[str, Any]] = None
+) -> None:
+    """Raise ``KadoaHttpError`` (and release the connection) unless 200/206."""
+    if response.status in (200, 206):
+        return
+    try:
+        raw = response.read(_ERROR_BODY_LIMIT)
+    finally:
+        response.release_conn()
+    body: Any = raw.decode("utf-8", "replace") if raw else None
+    if raw:
+        try:
+            body = get_json_decoder()(raw)
+        except JSON_DECODE_ERRORS:
+            pass
+    raise KadoaHttpError(
+        message,
+        http_status=response.status,
+        response_body=body,
+        code=KadoaHttpError.map_status_to_code(response.status),
+        details=details,
+    )
+
+
+def iter_chunks(response: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the body of a raw response in chunks, releasing it afterwards."""
+    try:
+        for chunk in response.stream(chunk_size):
+            if chunk:
+                yield chunk
+    finally:
+        response.release_conn()
+
+
+def download_to_path(
+    open_response: ResponseOpener,
+    destination: Union[str, os.PathLike[str]],
+    *,
+    resume: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    message: str = "Download failed",
+    details: Optional[Dict[str, Any]] = None,
+) -> Tuple[Path, int, bool]:
+    """Stream a response body to ``destination``.
+
+    Args:
+        open_response: Sends the request with the given extra headers
+        destination: Target file; parent directories are created
+        resume: Continue ``<destination>.part`` from its current size. A
+            server that ignores the range (``200``) restarts the file.
+        chunk_size: Bytes read and written per chunk
+        message: Error message for failed requests
+        details: Error details for failed requests
+
+    Returns:
+        The destination path, its size and whether a partial file was resumed
+
+    Raises:
+        KadoaHttpError: If the request fails; the partial file is kept
+    """
+    path = Path(destination)
+    partial = path.with_name(path.name + ".part")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    offset = partial.stat().st_size if resume and partial.exists() else 0
+
+    response = open_response({"Range": f"bytes={offset}-"} if offset else None)
+    if offset and response.status == 416:
+        # The partial file already holds the whole body
+        response.release_conn()
+        os.replace(partial, path)
+        return path, offset, True
+    raise_for_download_status(response, message, details)
+
+    resumed = offset > 0 and response.status == 206
+    with partial.open("ab" if resumed else "wb") as handle:
+        for chunk in iter_chunks(response, chunk_size):
+            handle.write(chunk)
+    os.replace(partial, path)
+    return path, path.stat().st_size, resumed
@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 from datetime import datetime
-from threading import RLock
-from typing import Any, Dict, List, Literal, Optional, Protocol, TypedDict, Union
+from threading import Lock
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from pydantic import BaseModel
 
@@ -110,18 +126,106 @@ class KadoaEvent(BaseModel):
     payload: EventPayloadMap
     metadata: Optional[Dict[str, Any]] = None
 
+    @classmethod
+    def construct_lazy(
+        cls,
+        event_name: KadoaEventName,
+        payload: EventPayloadMap,
+        source: str = "sdk",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "KadoaEvent":
+        """Build an event without running validation.
+
+        Attribute access behaves like a validated event. Call ``validated()``
+        when the payload needs to be checked against the event schema.
+        """
+        return cls.model_construct(
+            type=event_name,
+            timestamp=datetime.now(),
+            source=source,
+            payload=payload,
+            metadata=metadata,
+        )
+
+    def validated(self) -> "KadoaEvent":
+        """Return a validated copy of this event.
+
+        Raises:
+            pydantic.ValidationError: If the event does not match the schema
+        """
+        return type(self).model_validate(
+            {name: getattr(self, name) for name in type(self).model_fields}
+        )
+
 
 AnyKadoaEvent = KadoaEvent
 
 
 class EventListener(Protocol):
-    def __call__(self, event: AnyKadoaEvent) -> None: ...
+    def __call__(self, event: AnyKadoaEvent) -> Optional[Awaitable[None]]: ...
+
+
+ListenerTuple = Tuple[EventListener, ...]
 
 
 class KadoaEventEmitter:
-    def __init__(self) -> None:
-        self._listeners: List[EventListener] = []
-        self._lock = RLock()
+    """Event emitter with lock-free dispatch.
+
+    Listener collections are immutable tuples that get replaced on every
+    subscription change (copy-on-write). ``emit`` reads a snapshot without
+    taking a lock, so a slow listener never blocks other emitters or
+    subscribers, and listeners may subscribe or unsubscribe while an event is
+    being dispatched (the change applies from the next emit on).
+
+    When no listener is subscribed to an event name, ``emit`` returns before
+    the ``KadoaEvent`` is built.
+    """
+
+    def __init__(self, validate_events: bool = True) -> None:
+        """
+        Args:
+            validate_events: Validate every emitted event. When False, listeners
+                receive lazily-validated events (see ``KadoaEvent.construct_lazy``).
+        """
+        self._listeners: ListenerTuple = ()
+        self._named_listeners: Dict[KadoaEventName, ListenerTuple] = {}
+        self._lock = Lock()  # serializes writers only
+        self._validate_events = validate_events
+
+    def has_listeners(self, event_name: Optional[KadoaEventName] = None) -> bool:
+        """Check whether an emit of ``event_name`` would reach any listener.
+
+        Without ``event_name``, checks for any listener at all. Useful to skip
+        building expensive payloads.
+        """
+        if self._listeners:
+            return True
+        if event_name is None:
+            return bool(self._named_listeners)
+        return event_name in self._named_listeners
+
+    def _snapshot(self, event_name: KadoaEventName) -> ListenerTuple:
+        named = self._named_listeners.get(event_name)
+        if named is None:
+            return self._listeners
+        return self._listeners + named if self._listeners else named
+
+    def _build_event(
+        self,
+        event_name: KadoaEventName,
+        payload: EventPayloadMap,
+        source: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> KadoaEvent:
+        if self._validate_events:
+            return KadoaEvent(
+                type=event_name,
+                timestamp=datetime.now(),
+                source=source,
+                payload=payload,
+                metadata=metadata,
+            )
+        return KadoaEvent.construct_lazy(event_name, payload, source, metadata)
 
     def emit(
         self,
@@ -130,37 +234,127 @@ class KadoaEventEmitter:
         source: str = "sdk",
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
-        event = KadoaEvent(
-            type=event_name,
-            timestamp=datetime.now(),
-            source=source,
-            payload=payload,
-            metadata=metadata,
-        )
-        with self._lock:
-            for listener in list(self._listeners):
-                try:
-                    listener(event)
-                except Exception:
-                    pass
-
-    def on_event(self, listener: EventListener) -> None:
+        """Dispatch an event to its listeners.
+
+        Listener errors are swallowed. Coroutines returned by async listeners
+        are scheduled on the running event loop, or run to completion when no
+        loop is running.
+        """
+        listeners = self._snapshot(event_name)
+        if not listeners:
+            return
+        event = self._build_event(event_name, payload, source, metadata)
+        for listener in listeners:
+            try:
+                result = listener(event)
+            except Exception:
+                continue
+            if result is not None and inspect.isawaitable(result):
+                _schedule(result)
+
+    async def emit_async(
+        self,
+        event_name: KadoaEventName,
+        payload: EventPayloadMap,
+        source: str = "sdk",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Dispatch an event and await all async listeners concurrently.
+
+        Listener errors are swallowed.
+        """
+        listeners = self._snapshot(event_name)
+        if not listeners:
+            return
+        event = self._build_event(event_name, payload, source, metadata)
+        pending: List[Awaitable[None]] = []
+        for listener in listeners:
+            try:
+                result = listener(event)
+            except Exception:
+                continue
+            if result is not None and inspect.isawaitable(result):
+                pending.append(result)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def on_event(
+        self,
+        listener: EventListener,
+        event_names: Optional[Iterable[KadoaEventName]] = None,
+    ) -> Callable[[], None]:
+        """Subscribe a listener.
+
+        Args:
+            listener: Sync or async callable receiving the ``KadoaEvent``
+            event_names: Only deliver these event names (default: all events)
+
+        Returns:
+            Function that removes this subscription
+        """
         with self._lock:
-            self._listeners.append(listener)
-
-    def once_event(self, listener: EventListener) -> None:
-        def once_wrapper(event: AnyKadoaEvent) -> None:
+            if event_names is None:
+                self._listeners = self._listeners + (listener,)
+            else:
+                named = dict(self._named_listeners)
+                for event_name in dict.fromkeys(event_names):
+                    named[event_name] = named.get(event_name, ()) + (listener,)
+                self._named_listeners = named
+        return lambda: self.off_event(listener)
+
+    def once_event(
+        self,
+        listener: EventListener,
+        event_names: Optional[Iterable[KadoaEventName]] = None,
+    ) -> Callable[[], None]:
+        """Subscribe a listener that is called for the first matching event only."""
+        fired = Lock()
+
+        def once_wrapper(event: AnyKadoaEvent) -> Optional[Awaitable[None]]:
+            # Concurrent emitters may both hold a snapshot containing the wrapper.
+            if not fired.acquire(blocking=False):
+                return None
             self.off_event(once_wrapper)
-            listener(event)
+            return listener(event)
 
-        self.on_event(once_wrapper)
+        return self.on_event(once_wrapper, event_names)
 
     def off_event(self, listener: EventListener) -> None:
         with self._lock:
-            self._listeners = [
-                listener_item for listener_item in self._listeners if listener_item is not listener
-            ]
+            self._listeners = tuple(item for item in self._listeners if item is not listener)
+            named: Dict[KadoaEventName, ListenerTuple] = {}
+            for event_name, listeners in self._named_listeners.items():
+                remaining = tuple(item for item in listeners if item is not listener)
+                if remaining:
+                    named[event_name] = remaining
+            self._named_listeners = named
 
     def remove_all_event_listeners(self) -> None:
         with self._lock:
-            self._listeners.clear()
+            self._listeners = ()
+            self._named_listeners = {}
+
+
+# Strong references to scheduled listener tasks until they finish
+_pending_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _schedule(awaitable: Awaitable[None]) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        try:
+            asyncio.run(_await_quietly(awaitable))
+        except Exception:
+            pass
+        return
+    task = loop.create_task(_await_quietly(awaitable))
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+async def _await_quietly(awaitable: Awaitable[None]) -> None:
+    try:
+        await awaitable
+    except Exception:
+        pass
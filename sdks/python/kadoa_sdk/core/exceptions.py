@@ -1,8 +1,17 @@
+"""SDK exception types.
+
+Errors are cheap to raise: ``details`` only stores references (e.g. to
+response models, or a callable producing the dict) and is materialized into
+plain JSON-compatible values the first time it is read, so ``to_json()`` and
+``to_detailed_string()`` pay the serialization cost only when asked. Error
+attributes live in ``__slots__``.
+"""
+
 from __future__ import annotations
 
 import json
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
 from .core_acl import ApiException
 
@@ -30,8 +39,28 @@ class KadoaErrorCode(str, Enum):
 # Type alias for type hints (backward compatibility)
 KadoaErrorCodeType = str
 
+# Error details, or a callable building them on first access
+ErrorDetails = Union[Dict[str, Any], Callable[[], Optional[Dict[str, Any]]]]
+
+
+def _dump(value: Any) -> Any:
+    model_dump = getattr(value, "model_dump", None)
+    if model_dump is not None and not isinstance(value, type):
+        return model_dump()
+    return value
+
+
+def _materialize_details(details: Optional[ErrorDetails]) -> Optional[Dict[str, Any]]:
+    if callable(details):
+        details = details()
+    if details is None:
+        return None
+    return {key: _dump(value) for key, value in details.items()}
+
 
 class KadoaSdkError(Exception):
+    __slots__ = ("name", "code", "cause", "_details", "_details_ready")
+
     ERROR_MESSAGES = {
         # General errors
         "CONFIG_ERROR": "Invalid configuration provided",
@@ -72,20 +101,51 @@ class KadoaSdkError(Exception):
         message: str,
         *,
         code: KadoaErrorCodeType = KadoaErrorCode.UNKNOWN,
-        details: Optional[Dict[str, Any]] = None,
+        details: Optional[ErrorDetails] = None,
         cause: Optional[Exception] = None,
     ) -> None:
+        """
+        Args:
+            message: Error message
+            code: Error code (``KadoaErrorCode``)
+            details: Additional context. Values may reference pydantic models, and
+                the whole dict may be given as a callable; both are only
+                materialized (``model_dump()``) when ``details`` is first read.
+            cause: Underlying exception
+        """
         super().__init__(message)
         self.name = "KadoaSdkError"
         self.code = code
-        self.details = details
         self.cause = cause
+        self._details = details
+        self._details_ready = details is None
+
+    @property
+    def details(self) -> Optional[Dict[str, Any]]:
+        """Additional error context, materialized on first access."""
+        if not self._details_ready:
+            self._details = _materialize_details(self._details)
+            self._details_ready = True
+        return self._details  # type: ignore[return-value]
+
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._details = value
+        self._details_ready = True
+
+    def __reduce__(self) -> Any:
+        state = dict(getattr(self, "__dict__", None) or {})
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return type(self), self.args, state
 
     @classmethod
     def from_error(
         cls,
         error: Any,
-        details: Optional[Dict[str, Any]] = None,
+        details: Optional[ErrorDetails] = None,
     ) -> "KadoaSdkError":
         """Create exception from unknown error type
 
@@ -141,7 +201,7 @@ class KadoaSdkError(Exception):
         error: Any,
         *,
         message: Optional[str] = None,
-        details: Optional[Dict[str, Any]] = None,
+        details: Optional[ErrorDetails] = None,
     ) -> "KadoaSdkError":
         if isinstance(error, KadoaSdkError):
             return error
@@ -160,6 +220,8 @@ class KadoaSdkError(Exception):
 
 
 class KadoaHttpError(KadoaSdkError):
+    __slots__ = ("http_status", "request_id", "endpoint", "method", "response_body")
+
     def __init__(
         self,
         message: str,
@@ -170,7 +232,7 @@ class KadoaHttpError(KadoaSdkError):
         method: Optional[str] = None,
         response_body: Optional[object] = None,
         code: KadoaErrorCodeType = KadoaErrorCode.UNKNOWN,
-        details: Optional[Dict[str, Any]] = None,
+        details: Optional[ErrorDetails] = None,
         cause: Optional[Exception] = None,
     ) -> None:
         super().__init__(message, code=code, details=details, cause=cause)
@@ -186,7 +248,7 @@ class KadoaHttpError(KadoaSdkError):
         error: ApiException,
         *,
         message: Optional[str] = None,
-        details: Optional[Dict[str, Any]] = None,
+        details: Optional[ErrorDetails] = None,
     ) -> "KadoaHttpError":
         status = getattr(error, "status", None)
         response_body = getattr(error, "data", None) or getattr(error, "body", None)
@@ -203,7 +265,7 @@ class KadoaHttpError(KadoaSdkError):
 
     @staticmethod
     def wrap(
-        error: Exception, *, message: Optional[str] = None, details: Optional[Dict[str, Any]] = None
+        error: Exception, *, message: Optional[str] = None, details: Optional[ErrorDetails] = None
     ) -> "KadoaSdkError":
         if isinstance(error, KadoaHttpError):
             return error
@@ -213,15 +275,9 @@ class KadoaHttpError(KadoaSdkError):
             return KadoaHttpError.from_api_exception(error, message=message, details=details)
 
         # Check for SSL certificate errors and provide user-friendly message
-        error_str = str(error).lower()
-        error_type = type(error).__name__
-        if (
-            "ssl" in error_str
-            or "certificate" in error_str
-            or "cert" in error_str
-            or "SSLError" in error_type
-            or "CERTIFICATE_VERIFY_FAILED" in str(error)
-        ):
+        error_text = str(error)
+        error_str = error_text.lower()
+        if "cert" in error_str or "ssl" in error_str or "SSLError" in type(error).__name__:
             return KadoaHttpError(
                 (
                     "SSL certificate verification failed. This usually happens when Python cannot "
@@ -241,7 +297,7 @@ class KadoaHttpError(KadoaSdkError):
                         "Reinstall certifi: pip install --force-reinstall certifi",
                         "Check your network/proxy settings",
                     ],
-                    "original_error": str(error),
+                    "original_error": error_text,
                 },
             )
 
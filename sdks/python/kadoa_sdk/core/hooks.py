@@ -0,0 +1,209 @@
+"""Request/response hooks for the SDK's HTTP transport.
+
+Every HTTP request made through a ``KadoaClient`` (the generated API clients
+returned by ``core.http.get_*_api`` and ``KadoaClient.make_raw_request``)
+runs through the client's ``HookPipeline``:
+
+- ``before_request(request)`` runs in registration order and may modify the
+  request (method, url, headers, body) in place
+- ``after_response(request, response)`` runs in reverse registration order
+  for every HTTP response, including 4xx/5xx, and may replace
+  ``response.data``
+- ``on_error(request, error)`` runs in reverse registration order when the
+  request fails, either in transport or with an HTTP error status
+
+Responses handed to the caller unread (the generated
+``*_without_preload_content`` methods) run ``after_response`` once the body
+has been read in full, with that body as ``response.data``, or with
+``data=None`` when the connection is released after streaming it.
+
+Hook methods may be plain functions or coroutines. On the (synchronous) SDK
+transport a coroutine hook is run to completion before the request proceeds;
+async transports await it directly.
+
+Example:
+    ```python
+    from kadoa_sdk.core.hooks import HttpHook
+
+    class UserAgentHook(HttpHook):
+        def before_request(self, request):
+            request.headers["User-Agent"] = "my-app/1.0"
+
+    client.hooks.add(UserAgentHook())
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class HttpRequest:
+    """An outgoing HTTP request as seen by hooks."""
+
+    __slots__ = ("method", "url", "headers", "body", "operation")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        operation: Optional[str] = None,
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.body = body
+        self.operation = operation
+
+    def __repr__(self) -> str:
+        return f"HttpRequest({self.method} {self.url})"
+
+
+class HttpResponse:
+    """A received HTTP response as seen by hooks."""
+
+    __slots__ = ("status", "headers", "data")
+
+    def __init__(self, status: int, headers: Optional[Dict[str, str]], data: Optional[bytes]):
+        self.status = status
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"HttpResponse({self.status}, {len(self.data or b'')} bytes)"
+
+
+class HttpHook:
+    """Base class for transport hooks; override the stages you need."""
+
+    def before_request(self, request: HttpRequest) -> Optional[Awaitable[None]]:
+        return None
+
+    def after_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> Optional[Awaitable[None]]:
+        return None
+
+    def on_error(self, request: HttpRequest, error: BaseException) -> Optional[Awaitable[None]]:
+        return None
+
+
+def _overrides(hook: Any, stage: str) -> bool:
+    method = getattr(hook, stage, None)
+    return callable(method) and getattr(method, "__func__", None) is not getattr(HttpHook, stage)
+
+
+def _run_to_completion(awaitable: Awaitable[Any]) -> Any:
+    async def runner() -> Any:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(runner())
+    # A synchronous SDK call made from inside an event loop: the loop is
+    # blocked by the call anyway, so run the hook on a private loop.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, runner()).result()
+
+
+def _call(hook_stage: Callable[..., Any], *args: Any) -> None:
+    result = hook_stage(*args)
+    if result is not None and inspect.isawaitable(result):
+        _run_to_completion(result)
+
+
+async def _acall(hook_stage: Callable[..., Any], *args: Any) -> None:
+    result = hook_stage(*args)
+    if result is not None and inspect.isawaitable(result):
+        await result
+
+
+class HookPipeline:
+    """Ordered chain of ``HttpHook`` instances.
+
+    The chain is copy-on-write: adding or removing hooks rebuilds per-stage
+    tuples of bound methods, so dispatch takes no lock and skips hooks that
+    don't implement a stage. An empty pipeline is falsy, letting the
+    transport skip hook processing entirely.
+    """
+
+    def __init__(self) -> None:
+        self._hooks: Tuple[Any, ...] = ()
+        self._before: Tuple[Callable[..., Any], ...] = ()
+        self._after: Tuple[Callable[..., Any], ...] = ()
+        self._error: Tuple[Callable[..., Any], ...] = ()
+        self._lock = Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    @property
+    def hooks(self) -> Tuple[Any, ...]:
+        return self._hooks
+
+    def add(self, hook: Any, *, first: bool = False) -> Callable[[], None]:
+        """Register ``hook`` at the end (or start) of the chain.
+
+        Args:
+            hook: ``HttpHook`` subclass instance, or any object with some of the
+                ``before_request``/``after_response``/``on_error`` methods
+            first: Run the hook before the already registered ones
+
+        Returns:
+            Function removing the hook again
+        """
+        with self._lock:
+            self._set((hook, *self._hooks) if first else (*self._hooks, hook))
+        return lambda: self.remove(hook)
+
+    def remove(self, hook: Any) -> None:
+        with self._lock:
+            self._set(tuple(existing for existing in self._hooks if existing is not hook))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._set(())
+
+    def _set(self, hooks: Tuple[Any, ...]) -> None:
+        self._hooks = hooks
+        self._before = tuple(h.before_request for h in hooks if _overrides(h, "before_request"))
+        reverse = hooks[::-1]
+        self._after = tuple(h.after_response for h in reverse if _overrides(h, "after_response"))
+        self._error = tuple(h.on_error for h in reverse if _overrides(h, "on_error"))
+
+    def before_request(self, request: HttpRequest) -> None:
+        for stage in self._before:
+            _call(stage, request)
+
+    def after_response(self, request: HttpRequest, response: HttpResponse) -> None:
+        for stage in self._after:
+            _call(stage, request, response)
+
+    def on_error(self, request: HttpRequest, error: BaseException) -> None:
+        for stage in self._error:
+            _call(stage, request, error)
+
+    async def abefore_request(self, request: HttpRequest) -> None:
+        for stage in self._before:
+            await _acall(stage, request)
+
+    async def aafter_response(self, request: HttpRequest, response: HttpResponse) -> None:
+        for stage in self._after:
+            await _acall(stage, request, response)
+
+    async def aon_error(self, request: HttpRequest, error: BaseException) -> None:
+        for stage in self._error:
+            await _acall(stage, request, error)
+
+
+__all__ = ["HookPipeline", "HttpHook", "HttpRequest", "HttpResponse"]
@@ -4,7 +4,7 @@ import weakref
 from typing import TYPE_CHECKING
 
 from ..notifications.notifications_acl import NotificationsApi
-from .core_acl import create_api_client
+from .core_acl import ApiClient, create_api_client
 
 if TYPE_CHECKING:  # pragma: no cover
     from openapi_client.api.templates_api import TemplatesApi
@@ -35,12 +35,20 @@ _variables_cache: weakref.WeakKeyDictionary["KadoaClient", "VariablesApi"] = (
 )
 
 
+def _create_api_client(client: "KadoaClient") -> ApiClient:
+    return create_api_client(
+        client.configuration,
+        metrics=getattr(client, "metrics", None),
+        hooks=getattr(client, "hooks", None),
+    )
+
+
 def get_crawl_api(client: "KadoaClient") -> "CrawlApi":
     from ..extraction.extraction_acl import CrawlApi  # noqa: PLC0415
 
     api = _crawl_cache.get(client)
     if api is None:
-        api = CrawlApi(create_api_client(client.configuration))
+        api = CrawlApi(_create_api_client(client))
         _crawl_cache[client] = api
     return api
 
@@ -50,7 +58,7 @@ def get_workflows_api(client: "KadoaClient") -> "WorkflowsApi":
 
     api = _workflows_cache.get(client)
     if api is None:
-        api = WorkflowsApi(create_api_client(client.configuration))
+        api = WorkflowsApi(_create_api_client(client))
         _workflows_cache[client] = api
     return api
 
@@ -58,7 +66,7 @@ def get_workflows_api(client: "KadoaClient") -> "WorkflowsApi":
 def get_notifications_api(client: "KadoaClient") -> NotificationsApi:
     api = _notifications_cache.get(client)
     if api is None:
-        api = NotificationsApi(create_api_client(client.configuration))
+        api = NotificationsApi(_create_api_client(client))
         _notifications_cache[client] = api
     return api
 
@@ -68,7 +76,7 @@ def get_schemas_api(client: "KadoaClient") -> "SchemasApi":
 
     api = _schemas_cache.get(client)
     if api is None:
-        api = SchemasApi(create_api_client(client.configuration))
+        api = SchemasApi(_create_api_client(client))
         _schemas_cache[client] = api
     return api
 
@@ -78,7 +86,7 @@ def get_validation_api(client: "KadoaClient") -> "DataValidationApi":
 
     api = _validation_cache.get(client)
     if api is None:
-        api = DataValidationApi(create_api_client(client.configuration))
+        api = DataValidationApi(_create_api_client(client))
         _validation_cache[client] = api
     return api
 
@@ -88,7 +96,7 @@ def get_templates_api(client: "KadoaClient") -> "TemplatesApi":
 
     api = _templates_cache.get(client)
     if api is None:
-        api = TemplatesApi(create_api_client(client.configuration))
+        api = TemplatesApi(_create_api_client(client))
         _templates_cache[client] = api
     return api
 
@@ -98,6 +106,6 @@ def get_variables_api(client: "KadoaClient") -> "VariablesApi":
 
     api = _variables_cache.get(client)
     if api is None:
-        api = VariablesApi(create_api_client(client.configuration))
+        api = VariablesApi(_create_api_client(client))
         _variables_cache[client] = api
     return api
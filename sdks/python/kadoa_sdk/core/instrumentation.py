@@ -0,0 +1,418 @@
+"""Request instrumentation for the generated ``ApiClient``.
+
+The generated API methods call ``param_serialize`` -> ``call_api`` ->
+``response_deserialize`` on the same thread; ``*_without_preload_content``
+methods skip ``response_deserialize`` and hand the urllib3 response to the
+caller, so requests made through them are completed when the body has been
+read in full or the connection is released. ``ApiClientInstrumentationMixin``
+hooks those three steps to record metrics (``kadoa_sdk.core.metrics``), open
+client spans with W3C trace context headers (``kadoa_sdk.core.tracing``) and
+run the client's request/response hooks (``kadoa_sdk.core.hooks``). Finished
+requests are logged to ``kadoa.http`` at DEBUG level, and inside
+``client.profile()`` the network, decode and model validation phases are
+timed (``kadoa_sdk.core.profiling``).
+Per-request state is carried between the steps in context variables.
+
+Ordering: the span is started and metrics timing begins before the
+``before_request`` hooks run, so both cover everything the hooks do.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from .hooks import HookPipeline, HttpRequest, HttpResponse
+from .logger import http as http_logger
+from .metrics import (
+    MetricsRegistry,
+    RequestBytes,
+    error_code_for,
+    error_code_for_status,
+    measure_request_bodies,
+    payload_size,
+    retry_count,
+)
+from .operations import current_operation
+from .profiling import current_profiler
+from .tracing import end_http_span, get_tracer, inject_trace_headers, start_http_span
+
+
+class _PendingRequest:
+    __slots__ = (
+        "operation",
+        "started",
+        "bytes_out",
+        "response",
+        "span",
+        "request",
+        "log_target",
+        "done",
+    )
+
+    def __init__(
+        self,
+        operation: str,
+        started: float,
+        bytes_out: int,
+        response: Any,
+        span: Any,
+        request: Optional[HttpRequest],
+        log_target: Optional[str],
+    ) -> None:
+        self.operation = operation
+        self.started = started
+        self.bytes_out = bytes_out
+        self.response = response
+        self.span = span
+        self.request = request
+        self.log_target = log_target
+        self.done = False
+
+
+def log_http_request(
+    target: str,
+    started: float,
+    *,
+    status: Optional[int] = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """DEBUG-log a finished request to ``kadoa.http``.
+
+    Callers check ``http_logger.isEnabledFor(logging.DEBUG)`` first so the
+    disabled path does no work.
+    """
+    duration_ms = round((time.perf_counter() - started) * 1000, 1)
+    extra = {"request": target, "status": status, "duration_ms": duration_ms}
+    if error is not None:
+        http_logger.debug("%s failed after %sms: %s", target, duration_ms, error, extra=extra)
+    else:
+        http_logger.debug("%s -> %s in %sms", target, status, duration_ms, extra=extra)
+
+
+_pending_route: ContextVar[Optional[str]] = ContextVar("kadoa_pending_route", default=None)
+_pending_request: ContextVar[Optional[_PendingRequest]] = ContextVar(
+    "kadoa_pending_request", default=None
+)
+
+
+class ApiClientInstrumentationMixin:
+    """Adds metrics, tracing and hooks to a generated ``ApiClient``.
+
+    Requests are attributed to the active SDK operation, falling back to the
+    ``"<METHOD> <path template>"`` of the generated endpoint. When metrics and
+    tracing are disabled and no hooks are registered, requests pass through
+    untouched.
+    """
+
+    metrics: Optional[MetricsRegistry] = None
+    hooks: Optional[HookPipeline] = None
+
+    def param_serialize(self, method: str, resource_path: str, *args: Any, **kwargs: Any) -> Any:
+        serialized = super().param_serialize(method, resource_path, *args, **kwargs)  # type: ignore[misc]
+        _pending_route.set(f"{method} {resource_path}")
+        return serialized
+
+    def call_api(
+        self,
+        method: str,
+        url: str,
+        header_params: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        route = _pending_route.get()
+        _pending_route.set(None)
+        metrics = self.metrics if self.metrics is not None and self.metrics.enabled else None
+        hooks = self.hooks if self.hooks else None
+        log_request = http_logger.isEnabledFor(logging.DEBUG)
+        if metrics is None and hooks is None and not log_request and get_tracer() is None:
+            response = self._timed_call_api(method, url, header_params, body, *args, **kwargs)
+            if current_profiler() is not None:
+                _track_response(response, self, None)
+            return response
+
+        route = route or f"{method} {urlsplit(url).path}"
+        operation = current_operation() or route
+        http_span = start_http_span(method, route.partition(" ")[2], url)
+        if http_span is not None:
+            header_params = dict(header_params or {})
+            inject_trace_headers(header_params, http_span)
+        started = time.perf_counter()
+        request: Optional[HttpRequest] = None
+        try:
+            if hooks is not None:
+                request = HttpRequest(method, url, header_params, body, operation)
+                hooks.before_request(request)
+                method, url, header_params, body = (
+                    request.method,
+                    request.url,
+                    request.headers,
+                    request.body,
+                )
+            if metrics is None and http_span is None:
+                bytes_out = 0
+                response = self._timed_call_api(method, url, header_params, body, *args, **kwargs)
+            else:
+                measure_request_bodies(
+                    getattr(getattr(self, "rest_client", None), "pool_manager", None)
+                )
+                with RequestBytes() as request_bytes:
+                    response = self._timed_call_api(
+                        method, url, header_params, body, *args, **kwargs
+                    )
+                bytes_out = (
+                    request_bytes.sent if request_bytes.sent is not None else payload_size(body)
+                )
+        except Exception as error:
+            if request is not None and hooks is not None:
+                hooks.on_error(request, error)
+            if metrics is not None:
+                metrics.record(
+                    operation,
+                    time.perf_counter() - started,
+                    status=getattr(error, "status", None),
+                    error_code=error_code_for(error),
+                    bytes_out=payload_size(body),
+                )
+            end_http_span(http_span, error=error, bytes_out=payload_size(body))
+            if log_request:
+                log_http_request(f"{method} {url}", started, error=error)
+            raise
+        log_target = f"{method} {url}" if log_request else None
+        pending = _PendingRequest(
+            operation, started, bytes_out, response, http_span, request, log_target
+        )
+        _track_response(response, self, pending)
+        _pending_request.set(pending)
+        return response
+
+    def response_deserialize(self, response_data: Any, *args: Any, **kwargs: Any) -> Any:
+        pending = _pending_request.get()
+        if pending is None or pending.response is not response_data or pending.done:
+            return self._timed_response_deserialize(response_data, *args, **kwargs)
+        _pending_request.set(None)
+        status: int = response_data.status
+        error: Optional[BaseException] = None
+        request = pending.request
+        try:
+            if request is not None and self.hooks is not None:
+                response = HttpResponse(
+                    status, _response_headers(response_data), getattr(response_data, "data", None)
+                )
+                self.hooks.after_response(request, response)
+                response_data.data = response.data
+            return self._timed_response_deserialize(response_data, *args, **kwargs)
+        except Exception as exc:
+            error = exc
+            if request is not None and self.hooks is not None:
+                self.hooks.on_error(request, exc)
+            raise
+        finally:
+            self._finish_request(
+                pending,
+                status,
+                error,
+                len(getattr(response_data, "data", None) or b""),
+                response_data,
+            )
+
+    def _finish_request(
+        self,
+        pending: _PendingRequest,
+        status: Optional[int],
+        error: Optional[BaseException],
+        bytes_in: int,
+        response: Any,
+    ) -> None:
+        if pending.done:
+            return
+        pending.done = True
+        if self.metrics is not None:
+            if error is not None:
+                error_code = error_code_for(error)
+            elif status is not None and status >= 400:
+                error_code = error_code_for_status(status)
+            else:
+                error_code = None
+            self.metrics.record(
+                pending.operation,
+                time.perf_counter() - pending.started,
+                status=status,
+                error_code=error_code,
+                bytes_in=bytes_in,
+                bytes_out=pending.bytes_out,
+                retries=retry_count(response),
+            )
+        end_http_span(
+            pending.span,
+            status=status,
+            error=error,
+            bytes_in=bytes_in,
+            bytes_out=pending.bytes_out,
+        )
+        if pending.log_target is not None:
+            log_http_request(pending.log_target, pending.started, status=status, error=error)
+
+    def _timed_call_api(self, *args: Any, **kwargs: Any) -> Any:
+        profiler = current_profiler()
+        if profiler is None:
+            return super().call_api(*args, **kwargs)  # type: ignore[misc]
+        # Body reads happen after call_api returns and are timed by _TrackedResponse.
+        with profiler.phase("network"):
+            return super().call_api(*args, **kwargs)  # type: ignore[misc]
+
+    def _timed_response_deserialize(self, *args: Any, **kwargs: Any) -> Any:
+        profiler = current_profiler()
+        if profiler is None:
+            return super().response_deserialize(*args, **kwargs)  # type: ignore[misc]
+        with profiler.phase("decode"):
+            return super().response_deserialize(*args, **kwargs)  # type: ignore[misc]
+
+    def _ApiClient__deserialize(self, data: Any, klass: Any) -> Any:  # noqa: N802
+        # Generated ApiClient.deserialize hands parsed JSON to its private
+        # __deserialize, which builds the response models: time it as validation.
+        profiler = current_profiler()
+        if profiler is None or profiler.in_phase("validation"):
+            return super()._ApiClient__deserialize(data, klass)  # type: ignore[misc]
+        with profiler.phase("validation"):
+            return super()._ApiClient__deserialize(data, klass)  # type: ignore[misc]
+
+
+class _TrackedResponse:
+    """urllib3 response of an instrumented request.
+
+    Returned to callers of the ``*_without_preload_content`` methods, which
+    never reach ``response_deserialize``: the request is completed once the
+    body has been read in full (``read()``), the connection is released or the
+    response is closed. Completing runs the ``after_response`` hooks (with the
+    body if it was read at once, else ``data=None``) and, for HTTP error
+    statuses, the ``on_error`` hooks. Inside ``profile()`` body reads are
+    timed as network. Everything else is delegated to the urllib3 response.
+    """
+
+    __slots__ = ("_raw", "_client", "_pending", "_bytes_in")
+
+    def __init__(
+        self,
+        raw: Any,
+        client: ApiClientInstrumentationMixin,
+        pending: Optional[_PendingRequest],
+    ) -> None:
+        self._raw = raw
+        self._client = client
+        self._pending = pending
+        self._bytes_in = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+    @property
+    def data(self) -> Any:
+        # Read by the generated RESTResponse.read() of preloaded requests.
+        return _in_network_phase(lambda: self._raw.data)
+
+    def read(self, amt: Optional[int] = None, *args: Any, **kwargs: Any) -> Any:
+        try:
+            data = _in_network_phase(lambda: self._raw.read(amt, *args, **kwargs))
+        except Exception as error:
+            self._complete(error=error)
+            raise
+        self._bytes_in += len(data or b"")
+        if amt is None:
+            # Hooks see (and may replace) the body only when it was read at once.
+            if len(data or b"") == self._bytes_in:
+                return self._complete(data, whole=True)
+            self._complete()
+        return data
+
+    def stream(self, *args: Any, **kwargs: Any) -> Any:
+        chunks = iter(self._raw.stream(*args, **kwargs))
+        try:
+            while True:
+                chunk = _in_network_phase(lambda: next(chunks, None))
+                if chunk is None:
+                    break
+                self._bytes_in += len(chunk)
+                yield chunk
+        except Exception as error:
+            self._complete(error=error)
+            raise
+
+    def release_conn(self) -> None:
+        try:
+            self._raw.release_conn()
+        finally:
+            self._complete()
+
+    def close(self) -> None:
+        try:
+            self._raw.close()
+        finally:
+            self._complete()
+
+    def _complete(
+        self,
+        data: Optional[bytes] = None,
+        *,
+        whole: bool = False,
+        error: Optional[BaseException] = None,
+    ) -> Optional[bytes]:
+        pending = self._pending
+        if pending is None or pending.done:
+            return data
+        status = getattr(self._raw, "status", None)
+        hooks = self._client.hooks
+        try:
+            if pending.request is not None and hooks is not None:
+                if error is None:
+                    response = HttpResponse(
+                        status or 0, dict(getattr(self._raw, "headers", None) or {}), data
+                    )
+                    hooks.after_response(pending.request, response)
+                    if whole:
+                        data = response.data
+                    if status is not None and status >= 400:
+                        hooks.on_error(pending.request, _http_status_error(status))
+                else:
+                    hooks.on_error(pending.request, error)
+        finally:
+            self._client._finish_request(pending, status, error, self._bytes_in, self._raw)
+        return data
+
+
+def _track_response(
+    response: Any, client: ApiClientInstrumentationMixin, pending: Optional[_PendingRequest]
+) -> None:
+    raw = getattr(response, "response", None)
+    if raw is not None:
+        response.response = _TrackedResponse(raw, client, pending)
+
+
+def _in_network_phase(read: Callable[[], Any]) -> Any:
+    profiler = current_profiler()
+    if profiler is None or profiler.in_phase("network"):
+        return read()
+    with profiler.phase("network"):
+        return read()
+
+
+def _http_status_error(status: int) -> BaseException:
+    from .exceptions import KadoaHttpError  # noqa: PLC0415
+
+    return KadoaHttpError(
+        f"HTTP {status}", http_status=status, code=KadoaHttpError.map_status_to_code(status)
+    )
+
+
+def _response_headers(response_data: Any) -> Dict[str, str]:
+    getheaders = getattr(response_data, "getheaders", None)
+    headers = getheaders() if getheaders is not None else None
+    return dict(headers or {})
+
+
+__all__ = ["ApiClientInstrumentationMixin", "log_http_request"]
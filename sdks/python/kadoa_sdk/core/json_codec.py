@@ -0,0 +1,117 @@
+"""JSON decoding helpers with optional fast backends.
+
+The SDK only depends on the standard library ``json`` module. When ``orjson``
+or ``msgspec`` is installed, the faster backend is picked up automatically
+(``pip install "kadoa-sdk[fast-json]"`` installs orjson, the ``msgspec``
+extra installs msgspec).
+All decoders accept ``bytes`` directly, so callers never need to build an
+intermediate ``str`` copy of the payload.
+
+Example:
+    ```python
+    from kadoa_sdk.core.json_codec import get_json_decoder
+
+    decode = get_json_decoder()          # orjson > msgspec > json
+    decode(b'{"type": "heartbeat"}')
+    decode = get_json_decoder("json")    # force the stdlib backend
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Literal, Optional, Tuple, Type, Union
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+JsonDecoder = Callable[[JsonInput], Any]
+JsonBackend = Literal["orjson", "msgspec", "json"]
+
+_BACKEND_PREFERENCE: Tuple[JsonBackend, ...] = ("orjson", "msgspec", "json")
+
+
+def _stdlib_loads(data: JsonInput) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _load_backend(backend: JsonBackend) -> Optional[JsonDecoder]:
+    """Return the decode function for a backend, or None if it is not installed."""
+    if backend == "json":
+        return _stdlib_loads
+    if backend == "orjson":
+        try:
+            import orjson  # noqa: PLC0415
+        except ImportError:
+            return None
+        loads: JsonDecoder = orjson.loads
+        return loads
+    if backend == "msgspec":
+        try:
+            import msgspec  # noqa: PLC0415
+        except ImportError:
+            return None
+        decode: JsonDecoder = msgspec.json.Decoder().decode
+        return decode
+    raise ValueError(f"Unknown JSON backend: {backend}")
+
+
+def _with_stdlib_fallback(fast: JsonDecoder) -> JsonDecoder:
+    """Retry rejected input with the stdlib decoder.
+
+    The stdlib accepts a few non-standard literals (NaN, Infinity) that the fast
+    backends reject, so auto-selected decoders stay as lenient as ``json.loads``.
+    The fallback only runs on the error path.
+    """
+
+    def decode(data: JsonInput) -> Any:
+        try:
+            return fast(data)
+        except ValueError:
+            return _stdlib_loads(data)
+
+    return decode
+
+
+@lru_cache(maxsize=None)
+def get_json_decoder(backend: Optional[JsonBackend] = None) -> JsonDecoder:
+    """Get a JSON decode function.
+
+    Args:
+        backend: Backend to use. When omitted, the fastest installed backend is
+            selected (orjson, then msgspec, then the stdlib ``json`` module) and
+            input it rejects is retried with the stdlib decoder.
+
+    Returns:
+        Callable that decodes ``bytes`` or ``str`` into Python objects
+
+    Raises:
+        ValueError: If the requested backend is unknown
+        ImportError: If the requested backend is not installed
+    """
+    if backend is not None:
+        decoder = _load_backend(backend)
+        if decoder is None:
+            raise ImportError(f"JSON backend '{backend}' is not installed")
+        return decoder
+
+    for candidate in _BACKEND_PREFERENCE[:-1]:
+        decoder = _load_backend(candidate)
+        if decoder is not None:
+            return _with_stdlib_fallback(decoder)
+    return _stdlib_loads
+
+
+# Every supported backend raises a ValueError subclass for malformed input
+# (json/orjson JSONDecodeError, msgspec DecodeError, UnicodeDecodeError).
+JSON_DECODE_ERRORS: Tuple[Type[Exception], ...] = (ValueError,)
+
+
+__all__ = [
+    "JSON_DECODE_ERRORS",
+    "JsonBackend",
+    "JsonDecoder",
+    "JsonInput",
+    "get_json_decoder",
+]
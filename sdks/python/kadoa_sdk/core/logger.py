@@ -5,11 +5,39 @@ Supports DEBUG environment variable configuration like Node.js SDK:
     DEBUG=kadoa:*              # Enable all SDK logs
     DEBUG=kadoa:extraction     # Enable only extraction logs
     DEBUG=kadoa:client,kadoa:http  # Enable multiple modules
+
+Additional environment variables:
+    KADOA_LOG_FORMAT=json      # Output format of the DEBUG handler: text (default), json, logfmt
+    KADOA_LOG_SAMPLE=wss=0.01,http=0.1  # Keep this fraction of DEBUG/INFO records per namespace
+
+The environment is parsed once (see ``get_log_config``). Hot paths guard
+debug calls with ``logger.isEnabledFor(logging.DEBUG)`` so disabled logging
+costs no argument evaluation or formatting.
 """
 
+import itertools
+import json
 import logging
 import os
-from typing import Set
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Literal, Optional, Set
+
+from pydantic import BaseModel, ConfigDict
+
+LogFormat = Literal["text", "json", "logfmt"]
+
+_TEXT_FORMAT = "%(name)s %(levelname)s: %(message)s"
+
+
+class LogConfig(BaseModel):
+    """Logging configuration parsed from the environment"""
+
+    model_config = ConfigDict(frozen=True)
+
+    debug_namespaces: FrozenSet[str] = frozenset()
+    format: LogFormat = "text"
+    sample_rates: Dict[str, float] = {}
 
 
 def _parse_debug_env() -> Set[str]:
@@ -48,6 +76,32 @@ def _parse_debug_env() -> Set[str]:
     return enabled
 
 
+def _parse_sample_env() -> Dict[str, float]:
+    """Parse KADOA_LOG_SAMPLE ("wss=0.01,http=0.1"); invalid entries are ignored."""
+    rates: Dict[str, float] = {}
+    for entry in os.getenv("KADOA_LOG_SAMPLE", "").split(","):
+        namespace, _, rate = entry.partition("=")
+        namespace = namespace.strip().removeprefix("kadoa:")
+        try:
+            value = float(rate)
+        except ValueError:
+            continue
+        if namespace:
+            rates[namespace] = min(max(value, 0.0), 1.0)
+    return rates
+
+
+@lru_cache(maxsize=1)
+def get_log_config() -> LogConfig:
+    """Logging configuration from the environment, parsed once and cached."""
+    log_format = os.getenv("KADOA_LOG_FORMAT", "text").strip().lower()
+    return LogConfig(
+        debug_namespaces=frozenset(_parse_debug_env()),
+        format=log_format if log_format in ("json", "logfmt") else "text",  # type: ignore[arg-type]
+        sample_rates=_parse_sample_env(),
+    )
+
+
 def _should_enable_logger(namespace: str, enabled_patterns: Set[str]) -> bool:
     """Check if a logger namespace should be enabled based on DEBUG env var.
 
@@ -69,13 +123,102 @@ def _should_enable_logger(namespace: str, enabled_patterns: Set[str]) -> bool:
     return namespace in enabled_patterns
 
 
+_STANDARD_RECORD_FIELDS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def _record_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {
+        "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+        "level": record.levelname.lower(),
+        "logger": record.name,
+        "msg": record.getMessage(),
+    }
+    for key, value in record.__dict__.items():
+        if key not in _STANDARD_RECORD_FIELDS and not key.startswith("_"):
+            fields[key] = value
+    return fields
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Fields passed via ``extra=`` are included as top-level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = _record_fields(record)
+        if record.exc_info:
+            fields["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(fields, default=str)
+
+
+class LogfmtFormatter(logging.Formatter):
+    """Formats records as logfmt (``key=value`` pairs)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = _record_fields(record)
+        if record.exc_info:
+            fields["exc_info"] = self.formatException(record.exc_info)
+        return " ".join(f"{key}={_logfmt_value(value)}" for key, value in fields.items())
+
+
+def _logfmt_value(value: Any) -> str:
+    text = str(value)
+    if text and not any(char in text for char in ' ="\n'):
+        return text
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in ``1 / rate`` records below WARNING; warnings and errors always pass."""
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+        self._every = round(1 / rate) if rate > 0 else 0
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        if self._every == 0:
+            return False
+        return next(self._counter) % self._every == 0
+
+
+def _formatter_for(log_format: str) -> logging.Formatter:
+    if log_format == "json":
+        return JsonFormatter()
+    if log_format == "logfmt":
+        return LogfmtFormatter()
+    return logging.Formatter(_TEXT_FORMAT)
+
+
+def set_sample_rate(namespace: str, rate: Optional[float]) -> None:
+    """Sample DEBUG/INFO records of ``kadoa.<namespace>`` (``None`` disables sampling).
+
+    Args:
+        namespace: Logger namespace, e.g. ``"wss"`` or ``"http"``
+        rate: Fraction of records to keep (0.0 - 1.0)
+    """
+    logger = logging.getLogger(f"kadoa.{namespace}")
+    for existing in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+        logger.removeFilter(existing)
+    if rate is not None and rate < 1:
+        logger.addFilter(SamplingFilter(max(rate, 0.0)))
+
+
 def _configure_logging_from_env() -> None:
     """Configure logging levels based on DEBUG environment variable.
 
     This function is called automatically when the module is imported.
     It sets DEBUG level for loggers matching the DEBUG env var pattern.
     """
-    enabled_patterns = _parse_debug_env()
+    config = get_log_config()
+    for namespace, rate in config.sample_rates.items():
+        set_sample_rate(namespace, rate)
+
+    enabled_patterns = set(config.debug_namespaces)
     if not enabled_patterns:
         return
 
@@ -83,7 +226,7 @@ def _configure_logging_from_env() -> None:
     # This ensures debug messages are actually output
     if not logging.root.handlers:
         handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(name)s %(levelname)s: %(message)s"))
+        handler.setFormatter(_formatter_for(config.format))
         logging.root.addHandler(handler)
         logging.root.setLevel(logging.DEBUG)
 
@@ -102,6 +245,13 @@ def _configure_logging_from_env() -> None:
             logger.setLevel(logging.DEBUG)
 
 
+def reload_log_config() -> LogConfig:
+    """Re-read the logging environment variables and apply them."""
+    get_log_config.cache_clear()
+    _configure_logging_from_env()
+    return get_log_config()
+
+
 def create_logger(namespace: str) -> logging.Logger:
     """Create a logger with the kadoa namespace prefix
 
@@ -114,7 +264,7 @@ def create_logger(namespace: str) -> logging.Logger:
     logger = logging.getLogger(f"kadoa.{namespace}")
 
     # Configure based on DEBUG env var
-    enabled_patterns = _parse_debug_env()
+    enabled_patterns = set(get_log_config().debug_namespaces)
     if enabled_patterns and _should_enable_logger(namespace, enabled_patterns):
         logger.setLevel(logging.DEBUG)
 
@@ -136,7 +286,14 @@ schemas = create_logger("schemas")
 validation = create_logger("validation")
 
 __all__ = [
+    "JsonFormatter",
+    "LogConfig",
+    "LogfmtFormatter",
+    "SamplingFilter",
     "create_logger",
+    "get_log_config",
+    "reload_log_config",
+    "set_sample_rate",
     "client",
     "wss",
     "extraction",
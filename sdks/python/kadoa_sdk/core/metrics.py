@@ -0,0 +1,361 @@
+"""Client-side request metrics.
+
+With ``enable_metrics=True`` every HTTP call made through the SDK is
+recorded against the logical operation that issued it (see
+``kadoa_sdk.core.operations``): request and error counts (by
+``KadoaErrorCode``), HTTP status codes, bytes in/out, urllib3 retries and a
+fixed-memory latency histogram.
+
+Example:
+    ```python
+    client = KadoaClient(KadoaClientConfig(api_key=api_key, enable_metrics=True))
+    client.workflow.list()
+
+    snapshot = client.metrics.snapshot()
+    print(snapshot.operations["list_workflows"].latency.p99_ms)
+    print(snapshot.to_prometheus())          # Prometheus text exposition
+    client.metrics.enable_opentelemetry()    # requires opentelemetry-api
+    ```
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics_export import OpenTelemetryMetricsExporter
+
+# Histogram layout: values (microseconds) below 2**_SUB_BUCKET_BITS get one
+# bucket each; above that every power of two is split into
+# 2**(_SUB_BUCKET_BITS - 1) linear sub-buckets, bounding the relative error
+# to ~3% (HdrHistogram-style log-linear buckets).
+_SUB_BUCKET_BITS = 6
+_HALF_SUB_BUCKETS = 1 << (_SUB_BUCKET_BITS - 1)
+_MAX_TRACKABLE_US = (1 << 38) - 1  # ~76 hours
+
+
+def _bucket_index(value: int) -> int:
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    if shift <= 0:
+        return value
+    return shift * _HALF_SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < 2 * _HALF_SUB_BUCKETS:
+        return index
+    shift = (index - _HALF_SUB_BUCKETS) // _HALF_SUB_BUCKETS
+    mantissa = index - shift * _HALF_SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Fixed-memory log-linear latency histogram (microsecond resolution).
+
+    Memory use is constant (~1.2k counters) regardless of the number of
+    recorded values. Values above ~76 hours are clamped.
+    """
+
+    _BUCKET_COUNT = _bucket_index(_MAX_TRACKABLE_US) + 1
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * self._BUCKET_COUNT
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        value = min(max(int(seconds * 1_000_000), 0), _MAX_TRACKABLE_US)
+        self._counts[_bucket_index(value)] += 1
+        if self.count == 0 or value < self.min_us:
+            self.min_us = value
+        if value > self.max_us:
+            self.max_us = value
+        self.count += 1
+        self.total_us += value
+
+    def percentile(self, percentile: float) -> float:
+        """Value at ``percentile`` (0-100) in milliseconds."""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(percentile / 100 * self.count + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(_bucket_upper_bound(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self) -> "LatencySummary":
+        return LatencySummary(
+            count=self.count,
+            min_ms=self.min_us / 1000,
+            mean_ms=self.total_us / self.count / 1000 if self.count else 0.0,
+            p50_ms=self.percentile(50),
+            p90_ms=self.percentile(90),
+            p99_ms=self.percentile(99),
+            max_ms=self.max_us / 1000,
+            sum_ms=self.total_us / 1000,
+        )
+
+
+class LatencySummary(BaseModel):
+    """Latency distribution of an operation"""
+
+    model_config = ConfigDict(frozen=True)
+
+    count: int
+    min_ms: float
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    sum_ms: float
+
+
+class OperationMetrics(BaseModel):
+    """Counters of a single SDK operation"""
+
+    model_config = ConfigDict(frozen=True)
+
+    operation: str
+    requests: int
+    errors: int
+    errors_by_code: Dict[str, int]
+    status_codes: Dict[int, int]
+    bytes_in: int
+    bytes_out: int
+    retries: int
+    latency: LatencySummary
+
+
+class MetricsSnapshot(BaseModel):
+    """Point-in-time copy of all recorded metrics"""
+
+    model_config = ConfigDict(frozen=True)
+
+    operations: Dict[str, OperationMetrics]
+    taken_at: float
+
+    def to_prometheus(self, prefix: str = "kadoa_sdk") -> str:
+        """Render the snapshot in the Prometheus text exposition format."""
+        from .metrics_export import to_prometheus_text  # noqa: PLC0415
+
+        return to_prometheus_text(self, prefix=prefix)
+
+
+class _OperationRecorder:
+    __slots__ = (
+        "requests",
+        "errors_by_code",
+        "status_codes",
+        "bytes_in",
+        "bytes_out",
+        "retries",
+        "latency",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors_by_code: Dict[str, int] = {}
+        self.status_codes: Dict[int, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        self.latency = LatencyHistogram()
+
+
+class MetricsRegistry:
+    """Thread-safe store of per-operation request metrics.
+
+    Args:
+        enabled: Record metrics. A disabled registry ignores ``record`` calls and
+            requests skip all metrics bookkeeping.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._operations: Dict[str, _OperationRecorder] = {}
+        self._lock = Lock()
+        self._otel_exporter: Optional["OpenTelemetryMetricsExporter"] = None
+
+    def record(
+        self,
+        operation: str,
+        duration_s: float,
+        *,
+        status: Optional[int] = None,
+        error_code: Optional[str] = None,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        retries: int = 0,
+    ) -> None:
+        """Record one completed (or failed) request of ``operation``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            recorder = self._operations.get(operation)
+            if recorder is None:
+                recorder = self._operations[operation] = _OperationRecorder()
+            recorder.requests += 1
+            if error_code is not None:
+                recorder.errors_by_code[error_code] = recorder.errors_by_code.get(error_code, 0) + 1
+            if status is not None:
+                recorder.status_codes[status] = recorder.status_codes.get(status, 0) + 1
+            recorder.bytes_in += bytes_in
+            recorder.bytes_out += bytes_out
+            recorder.retries += retries
+            recorder.latency.record(duration_s)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Copy the current metrics."""
+        with self._lock:
+            operations = {
+                name: OperationMetrics(
+                    operation=name,
+                    requests=recorder.requests,
+                    errors=sum(recorder.errors_by_code.values()),
+                    errors_by_code=dict(recorder.errors_by_code),
+                    status_codes=dict(recorder.status_codes),
+                    bytes_in=recorder.bytes_in,
+                    bytes_out=recorder.bytes_out,
+                    retries=recorder.retries,
+                    latency=recorder.latency.summary(),
+                )
+                for name, recorder in self._operations.items()
+            }
+        return MetricsSnapshot(operations=operations, taken_at=time.time())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+
+    def enable_opentelemetry(
+        self, meter_provider: Optional[Any] = None
+    ) -> "OpenTelemetryMetricsExporter":
+        """Publish these metrics through OpenTelemetry observable instruments.
+
+        Args:
+            meter_provider: Meter provider to use (default: the global provider)
+
+        Raises:
+            ImportError: If ``opentelemetry-api`` is not installed
+        """
+        if self._otel_exporter is None:
+            from .metrics_export import OpenTelemetryMetricsExporter  # noqa: PLC0415
+
+            self._otel_exporter = OpenTelemetryMetricsExporter(self, meter_provider)
+        return self._otel_exporter
+
+
+def payload_size(body: Any) -> int:
+    """Size in bytes of an encoded (``bytes`` or ``str``) request body.
+
+    Other bodies are only encoded by the transport; their size is taken from
+    the encoded body through ``measure_request_bodies`` and counted as 0 here.
+    """
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body) if body.isascii() else len(body.encode())
+    return 0
+
+
+class RequestBytes:
+    """Collects the size of the request body sent inside the ``with`` block.
+
+    A plain context manager class (no generator) to keep the per-request cost
+    to one context variable set and reset.
+    """
+
+    __slots__ = ("sent", "_token")
+
+    def __init__(self) -> None:
+        self.sent: Optional[int] = None
+
+    def __enter__(self) -> "RequestBytes":
+        self._token = _request_bytes.set(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _request_bytes.reset(self._token)
+
+
+_request_bytes: ContextVar[Optional[RequestBytes]] = ContextVar("kadoa_request_bytes", default=None)
+
+
+def measure_request_bodies(pool_manager: Any) -> None:
+    """Report the encoded request bodies sent through a urllib3 pool manager.
+
+    The generated REST client JSON-encodes request bodies right before handing
+    them to urllib3, so measuring them there avoids serializing every body a
+    second time. Sizes go to the ``RequestBytes`` block active in the calling
+    context; outside of one the wrapper only does a context variable lookup.
+    """
+    if pool_manager is None or getattr(pool_manager, "_kadoa_measured", False):
+        return
+    urlopen = pool_manager.urlopen
+
+    def measured_urlopen(method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        counter = _request_bytes.get()
+        if counter is not None:
+            counter.sent = payload_size(kwargs.get("body"))
+        return urlopen(method, url, *args, **kwargs)
+
+    pool_manager.urlopen = measured_urlopen
+    pool_manager._kadoa_measured = True
+
+
+def retry_count(response: Any) -> int:
+    """Number of urllib3 retries behind a (REST) response."""
+    raw = getattr(response, "response", response)
+    history = getattr(getattr(raw, "retries", None), "history", None)
+    return len(history) if history else 0
+
+
+def error_code_for(error: BaseException) -> str:
+    """Map an exception raised by an HTTP call to a ``KadoaErrorCode`` value."""
+    from .core_acl import ApiException  # noqa: PLC0415
+    from .exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError  # noqa: PLC0415
+
+    if isinstance(error, KadoaSdkError):
+        code: Any = error.code
+    elif isinstance(error, ApiException):
+        code = KadoaHttpError.map_status_to_code(error)
+    elif isinstance(error, TimeoutError) or "timeout" in type(error).__name__.lower():
+        code = KadoaErrorCode.TIMEOUT
+    elif isinstance(error, OSError) or type(error).__module__.startswith("urllib3"):
+        code = KadoaErrorCode.NETWORK_ERROR
+    else:
+        code = KadoaErrorCode.UNKNOWN
+    return str(getattr(code, "value", code))
+
+
+def error_code_for_status(status: int) -> str:
+    """``KadoaErrorCode`` value for an HTTP error status read without raising."""
+    from .exceptions import KadoaHttpError  # noqa: PLC0415
+
+    code: Any = KadoaHttpError.map_status_to_code(status)
+    return str(getattr(code, "value", code))
+
+
+__all__ = [
+    "LatencyHistogram",
+    "LatencySummary",
+    "MetricsRegistry",
+    "MetricsSnapshot",
+    "OperationMetrics",
+    "RequestBytes",
+    "error_code_for",
+    "error_code_for_status",
+    "measure_request_bodies",
+    "payload_size",
+    "retry_count",
+]
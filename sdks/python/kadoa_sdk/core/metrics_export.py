@@ -0,0 +1,142 @@
+"""Exporters for ``kadoa_sdk.core.metrics``.
+
+Imported lazily by ``MetricsSnapshot.to_prometheus`` and
+``MetricsRegistry.enable_opentelemetry`` so that neither the exporters nor
+``opentelemetry`` are loaded unless requested.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import MetricsRegistry, MetricsSnapshot
+
+_QUANTILES = (("0.5", "p50_ms"), ("0.9", "p90_ms"), ("0.99", "p99_ms"))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def to_prometheus_text(snapshot: "MetricsSnapshot", prefix: str = "kadoa_sdk") -> str:
+    """Render a metrics snapshot in the Prometheus text exposition format (0.0.4)."""
+    lines: List[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> str:
+        metric = f"{prefix}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        return metric
+
+    operations = sorted(snapshot.operations.values(), key=lambda item: item.operation)
+
+    metric = family("requests_total", "counter", "HTTP requests per SDK operation")
+    for item in operations:
+        lines.append(f"{metric}{_labels(operation=item.operation)} {item.requests}")
+
+    metric = family("errors_total", "counter", "Failed requests by Kadoa error code")
+    for item in operations:
+        for code, count in sorted(item.errors_by_code.items()):
+            lines.append(f"{metric}{_labels(operation=item.operation, code=code)} {count}")
+
+    metric = family("responses_total", "counter", "Responses by HTTP status code")
+    for item in operations:
+        for status, count in sorted(item.status_codes.items()):
+            lines.append(f"{metric}{_labels(operation=item.operation, status=status)} {count}")
+
+    for name, attribute, help_text in (
+        ("received_bytes_total", "bytes_in", "Response body bytes received"),
+        ("sent_bytes_total", "bytes_out", "Request body bytes sent"),
+        ("retries_total", "retries", "Transport-level retries"),
+    ):
+        metric = family(name, "counter", help_text)
+        for item in operations:
+            lines.append(f"{metric}{_labels(operation=item.operation)} {getattr(item, attribute)}")
+
+    metric = family("request_duration_seconds", "summary", "Request latency")
+    for item in operations:
+        for quantile, attribute in _QUANTILES:
+            value = getattr(item.latency, attribute) / 1000
+            labels = _labels(operation=item.operation, quantile=quantile)
+            lines.append(f"{metric}{labels} {value:.6f}")
+        labels = _labels(operation=item.operation)
+        lines.append(f"{metric}_sum{labels} {item.latency.sum_ms / 1000:.6f}")
+        lines.append(f"{metric}_count{labels} {item.latency.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryMetricsExporter:
+    """Publishes a ``MetricsRegistry`` through OpenTelemetry observable instruments.
+
+    Args:
+        registry: Registry to observe
+        meter_provider: Meter provider (default: the global provider)
+
+    Raises:
+        ImportError: If ``opentelemetry-api`` is not installed
+    """
+
+    def __init__(self, registry: "MetricsRegistry", meter_provider: Optional[Any] = None) -> None:
+        try:
+            from opentelemetry import metrics as otel_metrics  # noqa: PLC0415
+            from opentelemetry.metrics import CallbackOptions, Observation  # noqa: PLC0415
+        except ImportError as error:
+            raise ImportError(
+                "OpenTelemetry metrics export requires opentelemetry-api: "
+                "pip install 'kadoa-sdk[otel]'"
+            ) from error
+
+        from ..version import __version__  # noqa: PLC0415
+
+        self._registry = registry
+        self._observation = Observation
+        provider = meter_provider or otel_metrics.get_meter_provider()
+        meter = provider.get_meter("kadoa_sdk", __version__)
+
+        def counter(attribute: str) -> Any:
+            def callback(options: CallbackOptions) -> Iterable[Any]:
+                for item in self._registry.snapshot().operations.values():
+                    yield Observation(getattr(item, attribute), {"operation": item.operation})
+
+            return callback
+
+        meter.create_observable_counter(
+            "kadoa_sdk.requests", callbacks=[counter("requests")], unit="{request}"
+        )
+        meter.create_observable_counter(
+            "kadoa_sdk.errors", callbacks=[self._errors], unit="{request}"
+        )
+        meter.create_observable_counter(
+            "kadoa_sdk.received_bytes", callbacks=[counter("bytes_in")], unit="By"
+        )
+        meter.create_observable_counter(
+            "kadoa_sdk.sent_bytes", callbacks=[counter("bytes_out")], unit="By"
+        )
+        meter.create_observable_counter(
+            "kadoa_sdk.retries", callbacks=[counter("retries")], unit="{retry}"
+        )
+        meter.create_observable_gauge(
+            "kadoa_sdk.request_duration", callbacks=[self._latency], unit="ms"
+        )
+
+    def _errors(self, options: Any) -> Iterable[Any]:
+        for item in self._registry.snapshot().operations.values():
+            for code, count in item.errors_by_code.items():
+                yield self._observation(count, {"operation": item.operation, "code": code})
+
+    def _latency(self, options: Any) -> Iterable[Any]:
+        for item in self._registry.snapshot().operations.values():
+            for quantile, attribute in _QUANTILES:
+                yield self._observation(
+                    getattr(item.latency, attribute),
+                    {"operation": item.operation, "quantile": quantile},
+                )
+
+
+__all__ = ["OpenTelemetryMetricsExporter", "to_prometheus_text"]
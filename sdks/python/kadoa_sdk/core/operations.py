@@ -0,0 +1,88 @@
+"""Logical SDK operation context.
+
+Public service methods are tagged with the logical operation they perform
+(``fetch_data``, ``create_workflow``, ...). HTTP calls issued while an
+operation is active are attributed to it by the instrumentation layer, so
+metrics are reported per SDK operation rather than per raw URL. When tracing
+is enabled each operation also opens a ``kadoa.<name>`` span, and inside
+``client.profile()`` it is timed by the active profiler.
+
+Example:
+    ```python
+    from kadoa_sdk.core.operations import operation
+
+    class WorkflowsCoreService:
+        @operation("get_workflow")
+        def get(self, workflow_id: str) -> GetWorkflowResponse: ...
+    ```
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar, cast
+
+from .profiling import Profiler, current_profiler
+from .tracing import get_tracer, span
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current_operation: ContextVar[Optional[str]] = ContextVar("kadoa_current_operation", default=None)
+
+
+def current_operation() -> Optional[str]:
+    """Name of the innermost active SDK operation, if any."""
+    return _current_operation.get()
+
+
+@contextmanager
+def operation_scope(name: str) -> Iterator[None]:
+    """Attribute everything inside the block to the operation ``name``."""
+    token = _current_operation.set(name)
+    try:
+        yield
+    finally:
+        _current_operation.reset(token)
+
+
+def _profiled(profiler: Optional[Profiler], name: str) -> Any:
+    return profiler.operation(name) if profiler is not None else nullcontext()
+
+
+def operation(name: str) -> Callable[[F], F]:
+    """Decorator tagging a sync or async method as the SDK operation ``name``."""
+    span_name = f"kadoa.{name}"
+    attributes = {"kadoa.operation": name}
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with operation_scope(name):
+                    profiler = current_profiler()
+                    if profiler is None and get_tracer() is None:
+                        return await func(*args, **kwargs)
+                    with span(span_name, attributes), _profiled(profiler, name):
+                        return await func(*args, **kwargs)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with operation_scope(name):
+                profiler = current_profiler()
+                if profiler is None and get_tracer() is None:
+                    return func(*args, **kwargs)
+                with span(span_name, attributes), _profiled(profiler, name):
+                    return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+__all__ = ["current_operation", "operation", "operation_scope"]
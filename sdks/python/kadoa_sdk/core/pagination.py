@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
-from typing import Callable, Generic, List, Optional, TypeVar
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from typing import Callable, Deque, Generic, List, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel
 
@@ -92,3 +98,121 @@ class PagedIterator(Generic[T]):
         async for page in self.pages(options):
             for item in page.data:
                 yield item
+
+
+# (skip, limit) -> (items, total count if the API reports it)
+WindowFetcher = Callable[[int, int], Tuple[List[T], Optional[int]]]
+
+
+def iter_windows(
+    fetch_window: WindowFetcher[T],
+    *,
+    start: int = 0,
+    page_size: int = 100,
+    prefetch: int = 4,
+    deadline: Optional[float] = None,
+) -> Generator[List[T], None, None]:
+    """Yield consecutive skip/limit windows in order.
+
+    The first window is fetched alone to learn the total count; the remaining
+    windows are then fetched on up to ``prefetch`` worker threads while the
+    caller consumes earlier ones. Without a total count the walk is sequential
+    and stops at the first short window. Closing the iterator early cancels
+    windows that haven't started and doesn't wait for those in flight.
+
+    Args:
+        fetch_window: Fetches one window; called from worker threads
+        start: Offset of the first window
+        page_size: Window size
+        prefetch: Windows in flight at once (1 disables concurrency)
+        deadline: ``time.monotonic()`` value at which the walk ends, even
+            while waiting for a window
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, prefetch), thread_name_prefix="kadoa-page")
+    pending: Deque[Future[Tuple[List[T], Optional[int]]]] = deque()
+
+    def submit(offset: Optional[int]) -> None:
+        if offset is not None:
+            # A fresh context per window: operation/profiling context
+            # variables carry over into the worker thread.
+            pending.append(executor.submit(copy_context().run, fetch_window, offset, page_size))
+
+    def take() -> Optional[Tuple[List[T], Optional[int]]]:
+        future = pending.popleft()
+        if deadline is None:
+            return future.result()
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            return None
+
+    try:
+        submit(start)
+        window = take()
+        if window is None:
+            return
+        items, total = window
+        yield items
+        skip = start + page_size
+        if total is None or prefetch <= 1:
+            while (len(items) == page_size) if total is None else (skip < total):
+                submit(skip)
+                window = take()
+                if window is None:
+                    return
+                items = window[0]
+                yield items
+                skip += page_size
+            return
+
+        offsets = iter(range(skip, total, page_size))
+        for _ in range(prefetch):
+            submit(next(offsets, None))
+        while pending:
+            window = take()
+            if window is None:
+                return
+            submit(next(offsets, None))
+            yield window[0]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_windows(
+    fetch_window: WindowFetcher[T],
+    *,
+    start: int = 0,
+    page_size: int = 100,
+    prefetch: int = 4,
+) -> AsyncGenerator[List[T], None]:
+    """Async variant of ``iter_windows``; windows are fetched in worker threads."""
+    items, total = await asyncio.to_thread(fetch_window, start, page_size)
+    yield items
+    skip = start + page_size
+    if total is None or prefetch <= 1:
+        while (len(items) == page_size) if total is None else (skip < total):
+            items, _ = await asyncio.to_thread(fetch_window, skip, page_size)
+            yield items
+            skip += page_size
+        return
+
+    offsets = iter(range(skip, total, page_size))
+    pending: Deque[asyncio.Task[Tuple[List[T], Optional[int]]]] = deque()
+
+    def submit() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            pending.append(
+                asyncio.ensure_future(asyncio.to_thread(fetch_window, offset, page_size))
+            )
+
+    try:
+        for _ in range(prefetch):
+            submit()
+        while pending:
+            items, _ = await pending.popleft()
+            submit()
+            yield items
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,373 @@
+"""Opt-in per-operation time breakdown.
+
+Inside ``client.profile()`` every SDK operation (see
+``kadoa_sdk.core.operations``) is timed and its wall time split into:
+
+- ``connect``: TCP connect and TLS handshake (urllib3 connection setup)
+- ``network``: waiting for the HTTP request/response, excluding connect
+- ``decode``: response bytes to Python objects (text decode, JSON parsing)
+- ``validation``: construction of the generated response models
+- ``post_processing``: SDK work in the operation itself (result models,
+  pagination, list building), i.e. the operation's remaining self time
+
+Nested operations (``fetch_all_data`` calling ``fetch_data`` per page) are
+reported separately; a parent's breakdown only holds its own self time.
+Thread CPU time is recorded per operation (inclusive).
+
+Outside a profile the instrumentation costs one context variable lookup per
+operation and request, so the hooks stay in place in production.
+
+Example:
+    ```python
+    with client.profile(speedscope_path="fetch.speedscope.json") as profiler:
+        client.extraction.fetch_all_data(FetchDataOptions(workflow_id=workflow_id))
+
+    print(profiler.report().to_text())
+    ```
+
+The speedscope file opens in https://www.speedscope.app.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict
+
+PHASES = ("connect", "network", "decode", "validation")
+UNATTRIBUTED = "(no operation)"
+
+_active_profiler: ContextVar[Optional["Profiler"]] = ContextVar(
+    "kadoa_active_profiler", default=None
+)
+_stack: ContextVar[Tuple["_Node", ...]] = ContextVar("kadoa_profile_stack", default=())
+
+
+def current_profiler() -> Optional["Profiler"]:
+    """The profiler active in this context, if any."""
+    return _active_profiler.get()
+
+
+class OperationProfile(BaseModel):
+    """Time breakdown of one SDK operation (milliseconds)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    operation: str
+    calls: int
+    wall_ms: float
+    cpu_ms: float
+    connect_ms: float
+    network_ms: float
+    decode_ms: float
+    validation_ms: float
+    post_processing_ms: float
+
+
+class ProfileReport(BaseModel):
+    """Result of a ``client.profile()`` block"""
+
+    model_config = ConfigDict(frozen=True)
+
+    duration_ms: float
+    operations: Dict[str, OperationProfile]
+
+    def to_text(self) -> str:
+        """Render the report as a fixed-width table."""
+        columns = ("calls", "wall", "cpu", "connect", "network", "decode", "validation", "post")
+        header = f"{'operation':32s}" + "".join(f"{name:>12s}" for name in columns)
+        lines = [header, "-" * len(header)]
+        for item in sorted(self.operations.values(), key=lambda op: -op.wall_ms):
+            values = (
+                item.wall_ms,
+                item.cpu_ms,
+                item.connect_ms,
+                item.network_ms,
+                item.decode_ms,
+                item.validation_ms,
+                item.post_processing_ms,
+            )
+            lines.append(
+                f"{item.operation[:32]:32s}{item.calls:>12d}"
+                + "".join(f"{value:>12.1f}" for value in values)
+            )
+        lines.append(f"total {self.duration_ms:.1f} ms (times in ms)")
+        return "\n".join(lines)
+
+
+class _Node:
+    __slots__ = ("name", "is_phase", "started", "started_cpu", "children", "totals")
+
+    def __init__(self, name: str, is_phase: bool, totals: "_Totals") -> None:
+        self.name = name
+        self.is_phase = is_phase
+        self.started = time.perf_counter()
+        self.started_cpu = time.thread_time() if not is_phase else 0.0
+        self.children = 0.0
+        self.totals = totals
+
+
+class _Totals:
+    __slots__ = ("calls", "wall", "cpu", "phases")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.phases: Dict[str, float] = dict.fromkeys((*PHASES, "post_processing"), 0.0)
+
+
+class _Scope:
+    # A plain context manager class: roughly half the cost of a generator
+    # based @contextmanager, which matters at four scopes per request.
+    __slots__ = ("profiler", "name", "is_phase", "node", "token")
+
+    def __init__(self, profiler: "Profiler", name: str, is_phase: bool) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.is_phase = is_phase
+
+    def __enter__(self) -> None:
+        self.node, self.token = self.profiler._open(self.name, self.is_phase)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.profiler._close(self.node, self.token)
+
+
+class Profiler:
+    """Collects operation and phase timings of one ``profile()`` block.
+
+    Args:
+        max_events: Upper bound on recorded speedscope events; aggregated
+            timings are always complete.
+    """
+
+    def __init__(self, max_events: int = 200_000) -> None:
+        self.max_events = max_events
+        self._lock = Lock()
+        self._totals: Dict[str, _Totals] = {}
+        self._events: Dict[str, List[Tuple[str, int, float]]] = {}
+        self._frames: Dict[str, int] = {}
+        self._lanes: Dict[Tuple[int, int], List[Tuple[str, int, float]]] = {}
+        self._event_count = 0
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+
+    def _totals_for(self, operation: str) -> _Totals:
+        totals = self._totals.get(operation)
+        if totals is None:
+            with self._lock:
+                totals = self._totals.setdefault(operation, _Totals())
+        return totals
+
+    def _event(self, kind: str, name: str, at: float) -> None:
+        if self._event_count >= self.max_events:
+            return
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:  # no running event loop
+            task = None
+        key = (threading.get_ident(), id(task))
+        with self._lock:
+            events = self._lanes.get(key)
+            if events is None:
+                lane = threading.current_thread().name
+                if task is not None:
+                    lane += f" / {task.get_name()}"
+                events = self._events.setdefault(lane, [])
+                self._lanes[key] = events
+            frame = self._frames.get(name)
+            if frame is None:
+                frame = self._frames[name] = len(self._frames)
+            events.append((kind, frame, at))
+            self._event_count += 1
+
+    def _open(self, name: str, is_phase: bool) -> Tuple[_Node, Any]:
+        stack = _stack.get()
+        if is_phase:
+            totals = stack[-1].totals if stack else self._totals_for(UNATTRIBUTED)
+        else:
+            totals = self._totals_for(name)
+        node = _Node(name, is_phase, totals)
+        token = _stack.set((*stack, node))
+        self._event("O", name, node.started)
+        return node, token
+
+    def _close(self, node: _Node, token: Any) -> None:
+        ended = time.perf_counter()
+        _stack.reset(token)
+        self._event("C", node.name, ended)
+        elapsed = ended - node.started
+        self_time = elapsed - node.children
+        stack = _stack.get()
+        if stack:
+            stack[-1].children += elapsed
+        totals = node.totals
+        with self._lock:
+            if node.is_phase:
+                totals.phases[node.name] += self_time
+            else:
+                totals.calls += 1
+                totals.wall += elapsed
+                totals.cpu += time.thread_time() - node.started_cpu
+                totals.phases["post_processing"] += self_time
+
+    def operation(self, name: str) -> "_Scope":
+        """Time an SDK operation (used by the ``@operation`` decorator)."""
+        return _Scope(self, name, False)
+
+    def phase(self, name: str) -> "_Scope":
+        """Attribute the block to ``name`` (one of ``PHASES``) of the current operation."""
+        return _Scope(self, name, True)
+
+    def in_phase(self, name: str) -> bool:
+        stack = _stack.get()
+        return bool(stack) and stack[-1].name == name and stack[-1].is_phase
+
+    def report(self) -> ProfileReport:
+        """Aggregated breakdown per operation."""
+        end = self._finished if self._finished is not None else time.perf_counter()
+        with self._lock:
+            operations = {
+                name: OperationProfile(
+                    operation=name,
+                    calls=totals.calls,
+                    wall_ms=totals.wall * 1000,
+                    cpu_ms=totals.cpu * 1000,
+                    connect_ms=totals.phases["connect"] * 1000,
+                    network_ms=totals.phases["network"] * 1000,
+                    decode_ms=totals.phases["decode"] * 1000,
+                    validation_ms=totals.phases["validation"] * 1000,
+                    post_processing_ms=totals.phases["post_processing"] * 1000,
+                )
+                for name, totals in self._totals.items()
+            }
+        return ProfileReport(duration_ms=(end - self._started) * 1000, operations=operations)
+
+    def to_speedscope(self, name: str = "kadoa_sdk") -> Dict[str, Any]:
+        """Recorded events in the speedscope file format (one evented profile per thread/task)."""
+        end = self._finished if self._finished is not None else time.perf_counter()
+        with self._lock:
+            frames = [{"name": frame} for frame in self._frames]
+            lanes = {lane: list(events) for lane, events in self._events.items()}
+        profiles = [
+            {
+                "type": "evented",
+                "name": f"{name} {lane}",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": (end - self._started) * 1000,
+                "events": [
+                    {"type": kind, "frame": frame, "at": (at - self._started) * 1000}
+                    for kind, frame, at in events
+                ],
+            }
+            for lane, events in lanes.items()
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "kadoa_sdk",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def write_speedscope(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.to_speedscope()), encoding="utf-8")
+
+
+def _probe_connect(connect: Any) -> Any:
+    @functools.wraps(connect)
+    def probed(self: Any, *args: Any, **kwargs: Any) -> Any:
+        profiler = _active_profiler.get()
+        if profiler is None or profiler.in_phase("connect"):
+            return connect(self, *args, **kwargs)
+        with profiler.phase("connect"):
+            return connect(self, *args, **kwargs)
+
+    return probed
+
+
+_probe_lock = Lock()
+_probe_sessions = 0
+_probed_connects: Dict[Any, Any] = {}
+
+
+def _install_connect_probe() -> None:
+    """Attribute urllib3 connection setup to the ``connect`` phase.
+
+    urllib3's connect methods are wrapped while at least one ``profile()``
+    block is open (sessions are counted) and restored when the last one exits.
+    """
+    global _probe_sessions
+    with _probe_lock:
+        _probe_sessions += 1
+        if _probe_sessions > 1:
+            return
+        try:
+            from urllib3.connection import HTTPConnection, HTTPSConnection  # noqa: PLC0415
+        except ImportError:  # pragma: no cover
+            return
+        for connection_class in (HTTPConnection, HTTPSConnection):
+            connect = connection_class.__dict__.get("connect")
+            if connect is not None:
+                _probed_connects[connection_class] = connect
+                connection_class.connect = _probe_connect(connect)  # type: ignore[method-assign]
+
+
+def _remove_connect_probe() -> None:
+    global _probe_sessions
+    with _probe_lock:
+        _probe_sessions -= 1
+        if _probe_sessions > 0:
+            return
+        for connection_class, connect in _probed_connects.items():
+            # Leave the method alone if someone else wrapped it after us.
+            probed = connection_class.__dict__.get("connect")
+            if getattr(probed, "__wrapped__", None) is connect:
+                connection_class.connect = connect  # type: ignore[method-assign]
+        _probed_connects.clear()
+
+
+@contextmanager
+def profile(
+    *,
+    speedscope_path: Optional[Union[str, Path]] = None,
+    max_events: int = 200_000,
+) -> Iterator[Profiler]:
+    """Profile SDK operations run in this context.
+
+    Args:
+        speedscope_path: Write a speedscope file here when the block exits
+        max_events: Upper bound on recorded speedscope events
+    """
+    _install_connect_probe()
+    profiler = Profiler(max_events=max_events)
+    token = _active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active_profiler.reset(token)
+        _remove_connect_probe()
+        profiler._finished = time.perf_counter()
+        if speedscope_path is not None:
+            profiler.write_speedscope(speedscope_path)
+
+
+__all__ = [
+    "OperationProfile",
+    "PHASES",
+    "ProfileReport",
+    "Profiler",
+    "current_profiler",
+    "profile",
+]
@@ -4,23 +4,63 @@ from __future__ import annotations
 
 import asyncio
 import json
-import time
+import logging
 from threading import Lock
-from typing import Any, Callable, Literal, NotRequired, Optional, TypedDict
+from typing import Any, Callable, Iterable, Literal, NotRequired, Optional, TypedDict
 
 import aiohttp
 import websockets
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from websockets.asyncio.client import ClientConnection
 
+from kadoa_sdk.core.hooks import HookPipeline, HttpRequest, HttpResponse
+from kadoa_sdk.core.json_codec import JSON_DECODE_ERRORS, JsonDecoder, get_json_decoder
 from kadoa_sdk.core.logger import wss as logger
-from kadoa_sdk.core.settings import get_settings
+from kadoa_sdk.core.realtime_recorder import RealtimeRecorder
+from kadoa_sdk.core.settings import KadoaSettings, get_settings
+from kadoa_sdk.core.tracing import end_http_span, inject_trace_headers, span, start_http_span
 from kadoa_sdk.version import __version__
 
 SDK_VERSION = __version__
 
 SocketRole = Literal["active", "replacement"]
 
+# "legacy" talks to wss_api_uri. "stream" talks to wss_neo_api_uri and also
+# accepts batched frames (a JSON array of events); it stays private until that
+# endpoint's wire protocol is confirmed. Both acknowledge every event over HTTP.
+_RealtimeTransport = Literal["legacy", "stream"]
+
+# Heartbeats are the bulk of idle traffic; a prefix check lets them skip a full parse.
+# Frames with any other layout fall through to the decoder and are still recognized.
+_HEARTBEAT_FRAME_PREFIXES = (b'{"type":"heartbeat"', b'{"type": "heartbeat"')
+_HEARTBEAT_TEXT_PREFIXES = ('{"type":"heartbeat"', '{"type": "heartbeat"')
+
+
+def _is_heartbeat_frame(message: bytes | str) -> bool:
+    """Return True if a raw frame is a heartbeat, without decoding it."""
+    if isinstance(message, str):
+        return message.startswith(_HEARTBEAT_TEXT_PREFIXES)
+    return message.startswith(_HEARTBEAT_FRAME_PREFIXES)
+
+
+def _event_workflow_id(event: dict[str, Any]) -> Optional[str]:
+    """Extract the workflow id from an event, checking nested payloads."""
+    workflow_id = event.get("workflowId")
+    if isinstance(workflow_id, str):
+        return workflow_id
+    for key in ("message", "data", "payload"):
+        nested = event.get(key)
+        if isinstance(nested, dict):
+            workflow_id = nested.get("workflowId") or nested.get("workflow_id")
+            if isinstance(workflow_id, str):
+                return workflow_id
+    return None
+
+
+EventListener = Callable[["RealtimeEvent"], None]
+# event type -> workflow id -> listeners. ``None`` keys match any type/workflow.
+ListenerIndex = dict[Optional[str], dict[Optional[str], tuple[EventListener, ...]]]
+
 
 class RealtimeEvent(TypedDict):
     """Realtime event received from WebSocket"""
@@ -43,9 +83,26 @@ class RealtimeConfig(BaseModel):
     """Configuration for Realtime WebSocket connection"""
 
     api_key: str
-    heartbeat_interval: int = 10000  # milliseconds
+    # milliseconds; kept for compatibility, liveness is driven by missed_heartbeats_limit
+    heartbeat_interval: int = 10000
     reconnect_delay: int = 5000  # milliseconds
     missed_heartbeats_limit: int = 30000  # milliseconds
+    # Decoder for incoming frames. Defaults to the fastest installed backend
+    # (orjson > msgspec > json), see kadoa_sdk.core.json_codec.
+    json_decoder: Optional[JsonDecoder] = None
+    # Send listener filters to the server in the subscribe message so it can skip
+    # unmatched events. Only enable for servers that support subscribe filters;
+    # listeners are always filtered client-side as well.
+    server_side_filters: bool = False
+    # Capture raw frames for offline replay (see kadoa_sdk.core.realtime_recorder)
+    recorder: Optional[RealtimeRecorder] = None
+    # Request/response hooks for the OAuth token request (KadoaClient passes its own)
+    hooks: Optional[HookPipeline] = None
+    # API, ack and WebSocket endpoints (KadoaClient passes its own); defaults to
+    # get_settings(), read on first connect
+    settings: Optional[KadoaSettings] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class Realtime:
@@ -53,17 +110,27 @@ class Realtime:
 
     _MAX_RECONNECT_DELAY_MS = 60_000
 
-    def __init__(self, config: RealtimeConfig) -> None:
+    def __init__(
+        self, config: RealtimeConfig, *, _transport: _RealtimeTransport = "legacy"
+    ) -> None:
         self._api_key = config.api_key
         self._heartbeat_interval = config.heartbeat_interval
         self._reconnect_delay = config.reconnect_delay
         self._missed_heartbeats_limit = config.missed_heartbeats_limit
+        self._decode: JsonDecoder = config.json_decoder or get_json_decoder()
+        self._server_side_filters = config.server_side_filters
+        self._transport = _transport
+        self._recorder = config.recorder
+        self._hooks = config.hooks
+        self._config_settings = config.settings
 
         self._ws: Optional[ClientConnection] = None
         self._draining_sockets: set[ClientConnection] = set()
-        self._last_heartbeat: float = time.time() * 1000  # milliseconds
+        # Per-socket liveness: loop.time() of the last heartbeat and the watchdog timer
+        # that fires when the socket has been silent for missed_heartbeats_limit.
+        self._heartbeat_at: dict[ClientConnection, float] = {}
+        self._watchdogs: dict[ClientConnection, asyncio.TimerHandle] = {}
         self._is_connecting: bool = False
-        self._heartbeat_task: Optional[asyncio.Task[None]] = None
         self._reconnect_task: Optional[asyncio.Task[None]] = None
         self._message_tasks: set[asyncio.Task[None]] = set()
         self._is_closed: bool = False
@@ -72,8 +139,12 @@ class Realtime:
         self._recent_event_ids: set[str] = set()
         self._recent_event_id_queue: list[str] = []
         self._max_recent_event_ids = 1000
+        self._team_id: Optional[str] = None
+        self._sent_filters: Optional[dict[str, list[str]]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
-        self._event_listeners: list[Callable[[RealtimeEvent], None]] = []
+        self._event_listeners: list[EventListener] = []
+        self._filtered_listeners: ListenerIndex = {}
         self._connection_listeners: list[Callable[[bool, Optional[str]], None]] = []
         self._error_listeners: list[Callable[[Any], None]] = []
         self._listeners_lock = Lock()
@@ -94,30 +165,54 @@ class Realtime:
             asyncio.set_event_loop(loop)
             return loop
 
+    def _settings(self) -> KadoaSettings:
+        return self._config_settings or get_settings()
+
     async def _get_oauth_token(self) -> tuple[str, str]:
         """Get OAuth token and team ID from API"""
-        settings = get_settings()
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{settings.public_api_uri}/v4/oauth2/token",
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": self._api_key,
-                    "x-sdk-version": SDK_VERSION,
-                },
-            ) as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to get OAuth token: {response.status}")
-                data = await response.json()
-                return data["access_token"], data["team_id"]
+        url = f"{self._settings().public_api_uri}/v4/oauth2/token"
+        headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self._api_key,
+            "x-sdk-version": SDK_VERSION,
+        }
+        http_span = start_http_span("POST", "/v4/oauth2/token", url)
+        inject_trace_headers(headers, http_span)
+        hooks = self._hooks if self._hooks else None
+        request = HttpRequest("POST", url, headers) if hooks is not None else None
+        status: Optional[int] = None
+        error: Optional[BaseException] = None
+        try:
+            if request is not None and hooks is not None:
+                await hooks.abefore_request(request)
+                url, headers = request.url, request.headers
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, headers=headers) as response:
+                    status = response.status
+                    body = await response.read()
+                    if request is not None and hooks is not None:
+                        hook_response = HttpResponse(status, dict(response.headers), body)
+                        await hooks.aafter_response(request, hook_response)
+                        body = hook_response.data or b""
+                    if response.status != 200:
+                        raise Exception(f"Failed to get OAuth token: {response.status}")
+                    data = json.loads(body)
+                    return data["access_token"], data["team_id"]
+        except Exception as exc:
+            error = exc
+            if request is not None and hooks is not None:
+                await hooks.aon_error(request, exc)
+            raise
+        finally:
+            end_http_span(http_span, status=status, error=error)
 
     async def _acknowledge_event(self, event_id: str) -> None:
         """Acknowledge event to server"""
-        settings = get_settings()
+        ack_url = f"{self._settings().realtime_api_uri}/api/v1/events/ack"
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(
-                    f"{settings.realtime_api_uri}/api/v1/events/ack",
+                    ack_url,
                     headers={"Content-Type": "application/json"},
                     json={"id": event_id},
                 ):
@@ -125,66 +220,86 @@ class Realtime:
         except Exception as e:
             logger.debug("Failed to acknowledge event: %s", e)
 
-    def _handle_heartbeat(self) -> None:
+    def _handle_heartbeat(self, ws: ClientConnection) -> None:
         """Handle heartbeat message"""
-        logger.debug("Heartbeat received")
-        self._last_heartbeat = time.time() * 1000
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Heartbeat received")
+        if ws in self._heartbeat_at:
+            self._heartbeat_at[ws] = asyncio.get_running_loop().time()
 
-    async def _start_heartbeat_check(self) -> None:
-        """Start monitoring heartbeat messages"""
-        while self._ws is not None and not self._is_closed:
-            await asyncio.sleep(self._heartbeat_interval / 1000.0)
-            if self._ws is None or self._is_closed:
-                break
+    def _arm_watchdog(self, ws: ClientConnection) -> None:
+        """Start the liveness watchdog for a socket.
 
-            try:
-                if self._ws.close_code is not None:
-                    break
-            except Exception:
-                break
+        Heartbeats only record a timestamp. The timer fires once per
+        missed_heartbeats_limit and re-arms itself at the new deadline, so a
+        healthy socket costs one wakeup per limit period and no polling task.
+        """
+        self._disarm_watchdog(ws)
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._heartbeat_at[ws] = now
+        self._watchdogs[ws] = loop.call_at(
+            now + self._missed_heartbeats_limit / 1000.0, self._check_watchdog, ws
+        )
+
+    def _check_watchdog(self, ws: ClientConnection) -> None:
+        """Watchdog timer callback: close the socket if its deadline has passed."""
+        if ws not in self._watchdogs:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = self._heartbeat_at[ws] + self._missed_heartbeats_limit / 1000.0
+        if loop.time() < deadline:
+            self._watchdogs[ws] = loop.call_at(deadline, self._check_watchdog, ws)
+            return
+
+        self._disarm_watchdog(ws)
+        logger.debug(
+            "No heartbeat received in %d seconds! Closing connection.",
+            self._missed_heartbeats_limit / 1000,
+        )
+        self._track_message_task(loop.create_task(ws.close()))
 
-            if time.time() * 1000 - self._last_heartbeat > self._missed_heartbeats_limit:
-                logger.debug(
-                    "No heartbeat received in %d seconds! Closing connection.",
-                    self._missed_heartbeats_limit / 1000,
-                )
-                await self._ws.close()
-                break
+    def _disarm_watchdog(self, ws: ClientConnection) -> None:
+        """Cancel the liveness watchdog for a socket."""
+        handle = self._watchdogs.pop(ws, None)
+        if handle is not None:
+            handle.cancel()
+        self._heartbeat_at.pop(ws, None)
 
     async def _handle_messages(self, ws: ClientConnection) -> None:
         """Handle incoming WebSocket messages for a specific socket."""
         try:
+            decode = self._decode
+            recorder = self._recorder
             while True:
-                message = await ws.recv()
-                if isinstance(message, bytes):
-                    message = message.decode("utf-8", errors="replace")
-
-                try:
-                    data = json.loads(message)
-                except json.JSONDecodeError as e:
-                    logger.debug("Failed to parse incoming message: %s", e)
+                # decode=False hands over the raw UTF-8 payload of text frames,
+                # so the decoder parses bytes without an intermediate str copy.
+                message = await ws.recv(decode=False)
+
+                if _is_heartbeat_frame(message):
+                    if recorder is not None and recorder.include_heartbeats:
+                        recorder.record_frame(message)
+                    self._handle_heartbeat(ws)
                     continue
 
-                if data.get("type") == "heartbeat":
-                    if ws is self._ws:
-                        self._handle_heartbeat()
-                    continue
+                if recorder is not None:
+                    recorder.record_frame(message)
 
-                if data.get("type") == "control.draining":
-                    await self._handle_drain_signal(ws, data)
+                try:
+                    data = decode(message)
+                except JSON_DECODE_ERRORS as e:
+                    logger.debug("Failed to parse incoming message: %s", e)
                     continue
 
-                cursor = data.get("_cursor")
-                if isinstance(cursor, str):
-                    self._last_cursor = cursor
-
-                event_id = data.get("id")
-                if isinstance(event_id, str):
-                    asyncio.create_task(self._acknowledge_event(event_id))
-                    if self._is_duplicate_event(event_id):
-                        continue
-
-                self._notify_event_listeners(data)
+                if isinstance(data, dict):
+                    await self._handle_payload(ws, data)
+                elif isinstance(data, list) and self._transport == "stream":
+                    for item in data:
+                        if isinstance(item, dict):
+                            await self._handle_payload(ws, item)
+                else:
+                    logger.debug("Ignoring non-object message")
         except websockets.exceptions.ConnectionClosed:
             logger.debug("WebSocket connection closed")
             await self._handle_socket_closed(ws, "Connection closed")
@@ -192,6 +307,29 @@ class Realtime:
             logger.debug("Error handling messages: %s", e)
             await self._handle_socket_closed(ws, str(e))
 
+    async def _handle_payload(self, ws: ClientConnection, data: dict[str, Any]) -> None:
+        """Handle a single decoded message (event, heartbeat or control)."""
+        message_type = data.get("type")
+        if message_type == "heartbeat":
+            self._handle_heartbeat(ws)
+            return
+
+        if message_type == "control.draining":
+            await self._handle_drain_signal(ws, data)  # type: ignore[arg-type]
+            return
+
+        cursor = data.get("_cursor")
+        if isinstance(cursor, str):
+            self._last_cursor = cursor
+
+        event_id = data.get("id")
+        if isinstance(event_id, str):
+            asyncio.create_task(self._acknowledge_event(event_id))
+            if self._is_duplicate_event(event_id):
+                return
+
+        self._notify_event_listeners(data)  # type: ignore[arg-type]
+
     async def _handle_drain_signal(
         self, ws: ClientConnection, message: DrainControlMessage
     ) -> None:
@@ -209,12 +347,14 @@ class Realtime:
     async def _handle_socket_closed(self, ws: ClientConnection, reason: str) -> None:
         """Handle an individual socket closing."""
         self._draining_sockets.discard(ws)
+        self._disarm_watchdog(ws)
+        if self._recorder is not None and not self._is_closed:
+            self._recorder.record_disconnect(reason)
 
         if ws is not self._ws:
             return
 
         self._ws = None
-        self._stop_heartbeat_check()
 
         if self._is_closed:
             return
@@ -230,7 +370,6 @@ class Realtime:
         self._is_connecting = False
         self._is_connected_state = False
         self._connection_reason = reason
-        self._stop_heartbeat_check()
         self._notify_connection_listeners(False, reason)
         await self._schedule_reconnect(self._reconnect_delay, False)
 
@@ -243,7 +382,9 @@ class Realtime:
             return
 
         async def reconnect_after_delay() -> None:
-            await asyncio.sleep(self._normalize_reconnect_delay(delay_ms) / 1000.0)
+            delay = self._normalize_reconnect_delay(delay_ms)
+            with span("kadoa.realtime.reconnect_wait", {"kadoa.realtime.delay_ms": delay}):
+                await asyncio.sleep(delay / 1000.0)
             if self._is_closed or self._is_connecting:
                 return
             if not replacement and self._ws is not None:
@@ -275,17 +416,29 @@ class Realtime:
             self._MAX_RECONNECT_DELAY_MS,
         )
 
-    def _stop_heartbeat_check(self) -> None:
-        """Stop heartbeat monitoring"""
-        if self._heartbeat_task and not self._heartbeat_task.done():
-            self._heartbeat_task.cancel()
-        self._heartbeat_task = None
-
-    def _notify_event_listeners(self, event: RealtimeEvent) -> None:
-        """Notify all event listeners"""
+    def _matching_listeners(self, event: RealtimeEvent) -> list[EventListener]:
+        """Collect global listeners plus filtered listeners matching the event."""
         with self._listeners_lock:
             listeners = list(self._event_listeners)
-        for listener in listeners:
+            if not self._filtered_listeners:
+                return listeners
+
+            event_type = event.get("type")
+            workflow_id = _event_workflow_id(event)  # type: ignore[arg-type]
+            by_type = self._filtered_listeners.get(event_type)
+            if by_type:
+                listeners.extend(by_type.get(None, ()))
+                if workflow_id is not None:
+                    listeners.extend(by_type.get(workflow_id, ()))
+            if workflow_id is not None:
+                any_type = self._filtered_listeners.get(None)
+                if any_type:
+                    listeners.extend(any_type.get(workflow_id, ()))
+        return listeners
+
+    def _notify_event_listeners(self, event: RealtimeEvent) -> None:
+        """Notify global listeners and filtered listeners matching the event"""
+        for listener in self._matching_listeners(event):
             try:
                 listener(event)
             except Exception as e:
@@ -323,31 +476,113 @@ class Realtime:
 
         self._ws = ws
         self._draining_sockets.discard(ws)
-        self._last_heartbeat = time.time() * 1000
         self._is_connecting = False
         self._is_connected_state = True
         self._connection_reason = None
 
-        self._heartbeat_task = asyncio.create_task(self._start_heartbeat_check())
+        self._arm_watchdog(ws)
+        if self._recorder is not None:
+            self._recorder.record_connect()
         self._track_message_task(asyncio.create_task(self._handle_messages(ws)))
         if role == "active" or not self._has_connected_once:
             self._notify_connection_listeners(True)
 
     async def _connect_socket(self, role: SocketRole) -> None:
         """Open a websocket and subscribe, optionally resuming from the last cursor."""
-        access_token, team_id = await self._get_oauth_token()
-
-        settings = get_settings()
-        uri = f"{settings.wss_api_uri}?access_token={access_token}"
-        ws = await websockets.connect(uri)
+        attributes = {"kadoa.realtime.transport": self._transport, "kadoa.realtime.role": role}
+        with span("kadoa.realtime.connect", attributes):
+            access_token, team_id = await self._get_oauth_token()
+
+            settings = self._settings()
+            base_uri = (
+                settings.wss_neo_api_uri if self._transport == "stream" else settings.wss_api_uri
+            )
+            uri = f"{base_uri}?access_token={access_token}"
+            ws = await websockets.connect(uri)
+
+            self._team_id = team_id
+            self._loop = asyncio.get_running_loop()
+            await ws.send(json.dumps(self._build_subscribe_message(team_id)))
+        logger.debug("Connected to WebSocket")
+        self._promote_socket(ws, role)
 
+    def _build_subscribe_message(self, team_id: str) -> dict[str, Any]:
+        """Build the subscribe message, with cursor resume and filter hints."""
         subscribe_msg: dict[str, Any] = {"action": "subscribe", "channel": team_id}
         if self._last_cursor:
             subscribe_msg["lastCursor"] = self._last_cursor
 
-        await ws.send(json.dumps(subscribe_msg))
-        logger.debug("Connected to WebSocket")
-        self._promote_socket(ws, role)
+        self._sent_filters = self._server_filter_hints()
+        if self._sent_filters:
+            subscribe_msg["filters"] = self._sent_filters
+        return subscribe_msg
+
+    def _server_filter_hints(self) -> Optional[dict[str, list[str]]]:
+        """Compute filters the server may apply without dropping wanted events.
+
+        A dimension is only sent when every listener constrains it, so the server
+        always delivers a superset of what listeners need.
+        """
+        if not self._server_side_filters:
+            return None
+
+        with self._listeners_lock:
+            if self._event_listeners or not self._filtered_listeners:
+                return None
+            types: set[str] = set()
+            workflow_ids: set[str] = set()
+            all_typed = all_scoped = True
+            for event_type, by_workflow in self._filtered_listeners.items():
+                if event_type is None:
+                    all_typed = False
+                else:
+                    types.add(event_type)
+                for workflow_id in by_workflow:
+                    if workflow_id is None:
+                        all_scoped = False
+                    else:
+                        workflow_ids.add(workflow_id)
+
+        hints: dict[str, list[str]] = {}
+        if all_typed:
+            hints["types"] = sorted(types)
+        if all_scoped:
+            hints["workflowIds"] = sorted(workflow_ids)
+        return hints or None
+
+    def _refresh_server_filters(self) -> None:
+        """Re-send the subscribe message when listener filters widen."""
+        if not self._server_side_filters or self._team_id is None:
+            return
+        ws, loop = self._ws, self._loop
+        if ws is None or loop is None or loop.is_closed():
+            return
+
+        hints = self._server_filter_hints()
+        if hints == self._sent_filters or not self._widens(hints):
+            return
+
+        message = json.dumps(self._build_subscribe_message(self._team_id))
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._track_message_task(loop.create_task(ws.send(message)))
+        else:
+            asyncio.run_coroutine_threadsafe(ws.send(message), loop)
+
+    def _widens(self, hints: Optional[dict[str, list[str]]]) -> bool:
+        """Return True if ``hints`` lets through events the sent filters block."""
+        sent = self._sent_filters
+        if sent is None:
+            return False
+        if hints is None:
+            return True
+        for key, values in sent.items():
+            if key not in hints or not set(hints[key]) <= set(values):
+                return True
+        return False
 
     def _is_duplicate_event(self, event_id: str) -> bool:
         """Return True if the event id was recently seen."""
@@ -385,24 +620,72 @@ class Realtime:
                 raise
             await self._schedule_reconnect(self._reconnect_delay, False)
 
-    def on_event(self, listener: Callable[[RealtimeEvent], None]) -> Callable[[], None]:
+    def on_event(
+        self,
+        listener: EventListener,
+        *,
+        types: Optional[Iterable[str]] = None,
+        workflow_ids: Optional[Iterable[str]] = None,
+    ) -> Callable[[], None]:
         """Subscribe to realtime events
 
+        Filtered listeners are kept in an index keyed by event type and workflow
+        id, so each event is only dispatched to the listeners that match it.
+
         Args:
             listener: Function to handle incoming events
+            types: Only deliver events with one of these ``type`` values
+            workflow_ids: Only deliver events for one of these workflow ids
 
         Returns:
             Unsubscribe function
+
+        Example:
+            ```python
+            realtime.on_event(handle, types=["workflow_finished"], workflow_ids=[workflow_id])
+            ```
         """
+        if types is None and workflow_ids is None:
+            with self._listeners_lock:
+                self._event_listeners.append(listener)
+
+            def unsubscribe() -> None:
+                with self._listeners_lock:
+                    if listener in self._event_listeners:
+                        self._event_listeners.remove(listener)
+
+            self._refresh_server_filters()
+            return unsubscribe
+
+        type_keys: list[Optional[str]] = list(dict.fromkeys(types)) if types is not None else [None]
+        workflow_keys: list[Optional[str]] = (
+            list(dict.fromkeys(workflow_ids)) if workflow_ids is not None else [None]
+        )
+        keys = [(t, w) for t in type_keys for w in workflow_keys]
+
         with self._listeners_lock:
-            self._event_listeners.append(listener)
+            for event_type, workflow_id in keys:
+                by_workflow = self._filtered_listeners.setdefault(event_type, {})
+                by_workflow[workflow_id] = by_workflow.get(workflow_id, ()) + (listener,)
 
-        def unsubscribe() -> None:
+        def unsubscribe_filtered() -> None:
             with self._listeners_lock:
-                if listener in self._event_listeners:
-                    self._event_listeners.remove(listener)
-
-        return unsubscribe
+                for event_type, workflow_id in keys:
+                    by_workflow = self._filtered_listeners.get(event_type)
+                    if not by_workflow or workflow_id not in by_workflow:
+                        continue
+                    bucket = list(by_workflow[workflow_id])
+                    if listener in bucket:
+                        bucket.remove(listener)
+                    if bucket:
+                        by_workflow[workflow_id] = tuple(bucket)
+                    else:
+                        del by_workflow[workflow_id]
+                        if not by_workflow:
+                            del self._filtered_listeners[event_type]
+
+        self._refresh_server_filters()
+        return unsubscribe_filtered
 
     def on_connection(self, listener: Callable[[bool, Optional[str]], None]) -> Callable[[], None]:
         """Subscribe to connection state changes
@@ -450,7 +733,8 @@ class Realtime:
     async def close_async(self) -> None:
         """Close WebSocket connection (async)"""
         self._is_closed = True
-        self._stop_heartbeat_check()
+        for ws in list(self._watchdogs):
+            self._disarm_watchdog(ws)
 
         if self._reconnect_task and not self._reconnect_task.done():
             self._reconnect_task.cancel()
@@ -464,6 +748,8 @@ class Realtime:
         self._ws = None
         self._draining_sockets.clear()
         for ws in sockets_to_close:
+            if self._recorder is not None:
+                self._recorder.record_disconnect("Client closed")
             try:
                 await ws.close()
             except Exception:
@@ -473,8 +759,12 @@ class Realtime:
             task.cancel()
         self._message_tasks.clear()
 
+        if self._recorder is not None:
+            self._recorder.flush()
+
         with self._listeners_lock:
             self._event_listeners.clear()
+            self._filtered_listeners.clear()
             self._connection_listeners.clear()
             self._error_listeners.clear()
 
@@ -486,6 +776,17 @@ class Realtime:
         else:
             loop.run_until_complete(self.close_async())
 
+    def get_latency_ms(self) -> Optional[float]:
+        """Round-trip time of the last WebSocket ping/pong on the active socket.
+
+        Returns:
+            Latency in milliseconds, or None before the first pong is received
+        """
+        latency = getattr(self._ws, "latency", None) if self._ws is not None else None
+        if not isinstance(latency, int | float) or latency <= 0:
+            return None
+        return latency * 1000.0
+
     def is_connected(self) -> bool:
         """Check if WebSocket is connected"""
         if self._ws is None:
@@ -0,0 +1,141 @@
+"""Recorder for raw realtime traffic.
+
+Captures every frame a ``Realtime`` connection receives (events, heartbeats,
+``control.draining``) plus socket connect/disconnect markers into a compact,
+append-only binary file. Recordings can be replayed offline for capacity
+testing, see ``benchmarks/realtime_replay.py``.
+
+File layout: the ``KDRT1\\n`` magic header followed by records of
+``<kind:uint8><timestamp_ns:uint64><length:uint32><payload>``, where the
+timestamp is wall-clock nanoseconds so several sessions can share one file.
+
+Example:
+    ```python
+    from kadoa_sdk.core import Realtime, RealtimeConfig
+    from kadoa_sdk.core.realtime_recorder import RealtimeRecorder
+
+    recorder = RealtimeRecorder("traffic.kdrt")
+    realtime = Realtime(RealtimeConfig(api_key=api_key, recorder=recorder))
+    ```
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import time
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Union
+
+MAGIC = b"KDRT1\n"
+
+RECORD_FRAME = 0
+RECORD_CONNECT = 1
+RECORD_DISCONNECT = 2
+
+_HEADER = struct.Struct("<BQI")
+
+
+class RecordedFrame(NamedTuple):
+    """A single entry of a realtime recording."""
+
+    kind: int
+    timestamp_ns: int
+    payload: bytes
+
+
+class RealtimeRecorder:
+    """Append-only recorder for realtime frames.
+
+    Args:
+        path: Recording file. Created if missing, appended to otherwise.
+        include_heartbeats: Record heartbeat frames (default True)
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike[str]], *, include_heartbeats: bool = True
+    ) -> None:
+        self._path = os.fspath(path)
+        self._include_heartbeats = include_heartbeats
+        self._file: Optional[BinaryIO] = None
+        self.frames_recorded = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def include_heartbeats(self) -> bool:
+        return self._include_heartbeats
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            is_new = not os.path.exists(self._path) or os.path.getsize(self._path) == 0
+            self._file = open(self._path, "ab")
+            if is_new:
+                self._file.write(MAGIC)
+        return self._file
+
+    def _write(self, kind: int, payload: bytes) -> None:
+        file = self._open()
+        file.write(_HEADER.pack(kind, time.time_ns(), len(payload)))
+        file.write(payload)
+
+    def record_frame(self, frame: Union[bytes, str]) -> None:
+        """Record a raw frame exactly as received."""
+        self._write(RECORD_FRAME, frame.encode() if isinstance(frame, str) else bytes(frame))
+        self.frames_recorded += 1
+
+    def record_connect(self) -> None:
+        """Record that a socket was opened and subscribed."""
+        self._write(RECORD_CONNECT, b"")
+
+    def record_disconnect(self, reason: str = "") -> None:
+        """Record that a socket closed."""
+        self._write(RECORD_DISCONNECT, reason.encode())
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "RealtimeRecorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def read_recording(path: Union[str, os.PathLike[str]]) -> Iterator[RecordedFrame]:
+    """Iterate over the entries of a recording file.
+
+    Raises:
+        ValueError: If the file is not a realtime recording or is truncated
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a realtime recording: {os.fspath(path)}")
+        while True:
+            header = file.read(_HEADER.size)
+            if not header:
+                return
+            if len(header) < _HEADER.size:
+                raise ValueError("Truncated realtime recording")
+            kind, timestamp_ns, length = _HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length:
+                raise ValueError("Truncated realtime recording")
+            yield RecordedFrame(kind, timestamp_ns, payload)
+
+
+__all__ = [
+    "RECORD_CONNECT",
+    "RECORD_DISCONNECT",
+    "RECORD_FRAME",
+    "RealtimeRecorder",
+    "RecordedFrame",
+    "read_recording",
+]
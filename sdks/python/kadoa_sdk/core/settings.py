@@ -10,6 +10,9 @@ Supported Environment Variables:
     KADOA_WSS_API_URI (str, default: "wss://realtime.kadoa.com"): WebSocket URL for realtime
     KADOA_REALTIME_API_URI (str, default: "https://realtime.kadoa.com"): Realtime API URL
     DEBUG (str, optional): Enable debug logging (e.g., "kadoa:*", "kadoa:extraction")
+    KADOA_LOG_FORMAT (str, default: "text"): Debug log format: text, json or logfmt
+    KADOA_LOG_SAMPLE (str, optional): Per-namespace log sampling (e.g., "wss=0.01,http=0.1")
+    KADOA_NO_DOTENV (bool, optional): Set to 1/true to skip .env file discovery
 
 Configuration Precedence:
     1. Environment variables (highest priority)
@@ -23,6 +26,11 @@ The SDK automatically loads variables from:
     - System environment variables (checked first)
     - .env file in workspace root or Python SDK root (used as fallback)
 
+The .env search walks the filesystem upward, so it only runs the first time
+``get_settings()`` is called (never at import time) and is skipped entirely with
+``KADOA_NO_DOTENV=1``. A ``KadoaClient`` configured with ``api_key``,
+``base_url`` and ``timeout`` (or ``load_env=False``) never loads settings.
+
 Example:
     ```python
     from kadoa_sdk.core.settings import get_settings
@@ -35,24 +43,49 @@ Example:
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
-from dotenv import find_dotenv
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def dotenv_disabled() -> bool:
+    """Whether .env discovery is switched off via ``KADOA_NO_DOTENV``."""
+    return os.getenv("KADOA_NO_DOTENV", "").strip().lower() in _TRUTHY
 
 
+@lru_cache(maxsize=1)
 def _find_env_file() -> Optional[str]:
     """Find .env file using python-dotenv's standard search.
 
     Searches upward from current file location and current working directory.
+    Returns None without touching the filesystem when ``KADOA_NO_DOTENV`` is set.
     """
+    if dotenv_disabled():
+        return None
+
+    from dotenv import find_dotenv  # noqa: PLC0415
+
     # find_dotenv searches upward from caller's file location, usecwd=True also checks CWD
     env_path = find_dotenv(usecwd=True)
     return env_path if env_path else None
 
 
+# Placeholder for the class-level env_file: replaced by the located .env file
+# when settings load, so an explicit ``_env_file`` can still be told apart.
+_LOCATE_ENV_FILE = Path(".env")
+
+
 class KadoaSettings(BaseSettings):
     """Centralized settings for Kadoa SDK loaded from environment variables.
 
@@ -97,8 +130,9 @@ class KadoaSettings(BaseSettings):
     )
 
     model_config = SettingsConfigDict(
-        # .env file path (used as fallback when env vars are not set)
-        env_file=_find_env_file(),
+        # The .env file (fallback when env vars are not set) is located when
+        # settings are loaded, see settings_customise_sources()
+        env_file=_LOCATE_ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -107,6 +141,24 @@ class KadoaSettings(BaseSettings):
         # This is the standard Pydantic Settings behavior
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Locate the .env file on load instead of at class definition.
+
+        An explicit ``_env_file`` (a path, or None to skip the .env file) is
+        used as given.
+        """
+        if getattr(dotenv_settings, "env_file", None) is _LOCATE_ENV_FILE:
+            dotenv_settings = DotEnvSettingsSource(settings_cls, env_file=_find_env_file())
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+
     @field_validator("public_api_uri", "wss_api_uri", "wss_neo_api_uri", "realtime_api_uri")
     @classmethod
     def validate_uri(cls, v: str) -> str:
@@ -135,3 +187,8 @@ def get_settings() -> KadoaSettings:
         KadoaSettings: Settings instance loaded from environment variables
     """
     return KadoaSettings()
+
+
+def default_settings() -> KadoaSettings:
+    """Settings with the built-in defaults, without reading the environment."""
+    return KadoaSettings.model_construct()
@@ -0,0 +1,131 @@
+"""Optional OpenTelemetry tracing.
+
+Tracing is off by default and costs a single ``None`` check per hook until
+``enable_tracing()`` is called. Once enabled the SDK opens:
+
+- one span per public SDK operation (``kadoa.fetch_data``, ...)
+- a client span per HTTP call, with W3C trace context headers
+  (``traceparent``/``tracestate``) injected into the outgoing request
+- a span per ``poll_until`` attempt
+- spans for realtime connects and reconnect waits
+
+``opentelemetry-api`` is only imported by ``enable_tracing()``.
+
+Example:
+    ```python
+    from opentelemetry.sdk.trace import TracerProvider
+    from kadoa_sdk.core.tracing import enable_tracing
+
+    enable_tracing(TracerProvider())
+    client.extraction.run(...)
+    ```
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, MutableMapping, Optional
+
+_tracer: Optional[Any] = None
+_trace_api: Optional[Any] = None
+_propagate: Optional[Any] = None
+
+
+def enable_tracing(tracer_provider: Optional[Any] = None) -> None:
+    """Start emitting spans.
+
+    Args:
+        tracer_provider: OpenTelemetry tracer provider (default: the global provider)
+
+    Raises:
+        ImportError: If ``opentelemetry-api`` is not installed
+    """
+    global _tracer, _trace_api, _propagate
+    try:
+        from opentelemetry import propagate, trace  # noqa: PLC0415
+    except ImportError as error:
+        raise ImportError(
+            "Tracing requires opentelemetry-api: pip install 'kadoa-sdk[otel]'"
+        ) from error
+
+    from kadoa_sdk.version import __version__  # noqa: PLC0415
+
+    _trace_api = trace
+    _propagate = propagate
+    _tracer = trace.get_tracer("kadoa_sdk", __version__, tracer_provider=tracer_provider)
+
+
+def disable_tracing() -> None:
+    """Stop emitting spans."""
+    global _tracer
+    _tracer = None
+
+
+def get_tracer() -> Optional[Any]:
+    """The active tracer, or None when tracing is disabled."""
+    return _tracer
+
+
+@contextmanager
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Any]]:
+    """Open an internal span as a child of the current span (no-op when disabled)."""
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def start_http_span(method: str, route: str, url: str) -> Optional[Any]:
+    """Start (without activating) a client span for an outgoing HTTP request."""
+    if _tracer is None:
+        return None
+    assert _trace_api is not None
+    return _tracer.start_span(
+        f"{method} {route}",
+        kind=_trace_api.SpanKind.CLIENT,
+        attributes={"http.request.method": method, "url.full": url, "http.route": route},
+    )
+
+
+def inject_trace_headers(headers: MutableMapping[str, str], http_span: Optional[Any]) -> None:
+    """Add W3C trace context headers for ``http_span`` to ``headers``."""
+    if http_span is None or _propagate is None or _trace_api is None:
+        return
+    _propagate.inject(headers, context=_trace_api.set_span_in_context(http_span))
+
+
+def end_http_span(
+    http_span: Optional[Any],
+    *,
+    status: Optional[int] = None,
+    error: Optional[BaseException] = None,
+    bytes_in: Optional[int] = None,
+    bytes_out: Optional[int] = None,
+) -> None:
+    """Record the outcome of an HTTP request and end its span."""
+    if http_span is None or _trace_api is None:
+        return
+    if status is not None:
+        http_span.set_attribute("http.response.status_code", status)
+    if bytes_out:
+        http_span.set_attribute("http.request.body.size", bytes_out)
+    if bytes_in is not None:
+        http_span.set_attribute("http.response.body.size", bytes_in)
+    if error is not None:
+        http_span.record_exception(error)
+        http_span.set_attribute("error.type", type(error).__name__)
+    if error is not None or (status is not None and status >= 400):
+        http_span.set_status(_trace_api.Status(_trace_api.StatusCode.ERROR))
+    http_span.end()
+
+
+__all__ = [
+    "disable_tracing",
+    "enable_tracing",
+    "end_http_span",
+    "get_tracer",
+    "inject_trace_headers",
+    "span",
+    "start_http_span",
+]
@@ -6,6 +6,7 @@ import time
 from typing import Callable, Generic, Optional, TypeVar
 
 from .exceptions import KadoaErrorCode, KadoaSdkError
+from .tracing import span
 
 T = TypeVar("T")
 
@@ -84,9 +85,13 @@ def poll_until(
         attempts += 1
 
         # Execute poll function
-        current = poll_fn()
+        with span("kadoa.poll_attempt", {"kadoa.poll.attempt": attempts}) as attempt_span:
+            current = poll_fn()
+            complete = is_complete(current)
+            if attempt_span is not None:
+                attempt_span.set_attribute("kadoa.poll.complete", complete)
 
-        if is_complete(current):
+        if complete:
             duration = int(time.time() * 1000 - start)
             return PollingResult(result=current, attempts=attempts, duration=duration)
 
@@ -46,12 +46,21 @@ from .crawler_acl import (
 
 # Services
 from .crawler_config_service import CrawlerConfigService
-from .crawler_session_service import CrawlerSessionService
+from .crawler_session_service import (
+    ArtifactDownload,
+    CrawledPage,
+    CrawlerSessionService,
+)
+from .crawler_session_tracker import CrawlProgress, CrawlSessionTracker
 
 __all__ = [
     # Services
     "CrawlerConfigService",
     "CrawlerSessionService",
+    "CrawledPage",
+    "ArtifactDownload",
+    "CrawlProgress",
+    "CrawlSessionTracker",
     # API Client
     "CrawlerApi",
     "CrawlerApiInterface",
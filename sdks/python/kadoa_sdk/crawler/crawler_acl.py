@@ -12,6 +12,7 @@ from typing import Literal, TypedDict, Union
 
 # API Client
 from openapi_client.api.crawler_api import CrawlerApi
+from openapi_client.api.files_api import FilesApi
 
 # Nested config types
 from openapi_client.models.create_crawler_config_request_artifact_options import (
@@ -63,6 +64,9 @@ from openapi_client.models.pause_crawler_session_request import PauseCrawlerSess
 from openapi_client.models.resume_crawler_session_request import ResumeCrawlerSessionRequest
 from openapi_client.models.start_crawler_session_request import StartCrawlerSessionRequest
 from openapi_client.models.start_session_with_config_request import StartSessionWithConfigRequest
+from openapi_client.models.v4_files_bulk_download_post_request import (
+    V4FilesBulkDownloadPostRequest,
+)
 
 # Session item
 from openapi_client.models.crawler_session_item import CrawlerSessionItem
@@ -101,6 +105,7 @@ StartCrawlRequest = StartCrawlerSessionRequest
 StartWithConfigRequest = StartSessionWithConfigRequest
 PauseSessionRequest = PauseCrawlerSessionRequest
 ResumeSessionRequest = ResumeCrawlerSessionRequest
+BulkDownloadRequest = V4FilesBulkDownloadPostRequest
 
 # ============================================================================
 # CONFIG RESPONSE TYPES
@@ -169,6 +174,7 @@ __all__ = [
     # API Client
     "CrawlerApi",
     "CrawlerApiInterface",
+    "FilesApi",
     # Enums
     "PageStatus",
     # Config request types
@@ -184,6 +190,7 @@ __all__ = [
     "StartWithConfigRequest",
     "PauseSessionRequest",
     "ResumeSessionRequest",
+    "BulkDownloadRequest",
     # Config response types
     "CrawlerConfig",
     "DeleteConfigResult",
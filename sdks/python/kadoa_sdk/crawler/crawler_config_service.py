@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ..client import KadoaClient
 
+from ..core.operations import operation
 from .crawler_acl import (
     CrawlerApi,
     CrawlerConfig,
@@ -29,19 +30,28 @@ class CrawlerConfigService:
         if self._crawler_api is None:
             from ..core.core_acl import create_api_client
 
-            self._crawler_api = CrawlerApi(create_api_client(self._client.configuration))
+            self._crawler_api = CrawlerApi(
+                create_api_client(
+                    self._client.configuration,
+                    metrics=getattr(self._client, "metrics", None),
+                    hooks=getattr(self._client, "hooks", None),
+                )
+            )
         return self._crawler_api
 
+    @operation("create_crawler_config")
     def create_config(self, body: CreateConfigRequest) -> CrawlerConfig:
         """Create a new crawler configuration."""
         return self.crawler_api.v4_crawl_config_post(
             create_crawler_config_request=body,
         )
 
+    @operation("get_crawler_config")
     def get_config(self, config_id: str) -> CrawlerConfig:
         """Get a crawler configuration by ID."""
         return self.crawler_api.v4_crawl_config_config_id_get(config_id=config_id)
 
+    @operation("delete_crawler_config")
     def delete_config(self, config_id: str) -> DeleteConfigResult:
         """Delete a crawler configuration."""
         return self.crawler_api.v4_crawl_config_delete(
@@ -2,14 +2,48 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import os
+import shutil
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from contextvars import copy_context
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 if TYPE_CHECKING:
     from ..client import KadoaClient
+    from ..core.realtime import Realtime
 
+from ..core.downloads import (
+    DEFAULT_CHUNK_SIZE,
+    download_to_path,
+    iter_chunks,
+    raise_for_download_status,
+)
+from ..core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from ..core.operations import operation
+from ..core.pagination import iter_windows
 from .crawler_acl import (
+    BulkDownloadRequest,
     CrawlerApi,
     CrawlerSession,
+    FilesApi,
     GetAllDataOptions,
     GetPageOptions,
     GetPagesOptions,
@@ -19,12 +53,120 @@ from .crawler_acl import (
     ResumeSessionRequest,
     SessionDataList,
     SessionOperationResult,
+    SessionPage,
     SessionPagesResult,
     SessionStatus,
     StartCrawlRequest,
     StartSessionResult,
     StartWithConfigRequest,
 )
+from .crawler_session_tracker import (
+    DEFAULT_MAX_POLL_INTERVAL_MS,
+    DEFAULT_MIN_POLL_INTERVAL_MS,
+    CrawlProgress,
+    CrawlSessionTracker,
+    ProgressListener,
+)
+
+DEFAULT_PAGE_CONCURRENCY = 8
+DEFAULT_PAGES_PAGE_SIZE = 100
+DEFAULT_BULK_BATCH_SIZE = 100
+DEFAULT_ARTIFACT_CONCURRENCY = 4
+
+
+class CrawledPage:
+    """A crawled page with its content, as yielded by ``iter_pages``.
+
+    ``index`` is the page's position in the session's page listing; pass
+    ``index + 1`` as ``start`` to restart a walk after this page. ``error`` is
+    set (and ``content`` is None) when fetching the content failed.
+    """
+
+    __slots__ = ("index", "id", "url", "status", "content", "error")
+
+    def __init__(
+        self,
+        index: int,
+        id: str,
+        url: Optional[str] = None,
+        status: Optional[str] = None,
+        content: Optional[PageContent] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.index = index
+        self.id = id
+        self.url = url
+        self.status = status
+        self.content = content
+        self.error = error
+
+    def __repr__(self) -> str:
+        outcome = f", error={self.error!r}" if self.error is not None else ""
+        return (
+            f"CrawledPage(index={self.index}, id={self.id!r}, url={self.url!r}{outcome})"
+        )
+
+
+class ArtifactDownload:
+    """Outcome of one file in ``CrawlerSessionService.download_artifacts``.
+
+    ``bulk`` tells whether the file came out of a bulk-download archive or was
+    fetched on its own. ``error`` is set (and ``path`` is None) when the file
+    could not be downloaded.
+    """
+
+    __slots__ = ("name", "path", "size", "bulk", "error")
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[Path] = None,
+        size: int = 0,
+        bulk: bool = False,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.size = size
+        self.bulk = bulk
+        self.error = error
+
+    def __repr__(self) -> str:
+        outcome = (
+            f"error={self.error!r}" if self.error is not None else f"path={self.path!r}"
+        )
+        return f"ArtifactDownload(name={self.name!r}, size={self.size}, {outcome})"
+
+
+def _artifact_path(root: Path, name: str) -> Path:
+    """Resolve ``name`` below ``root``, rejecting names that escape it."""
+    target = (root / name.lstrip("/")).resolve()
+    if root not in target.parents:
+        raise KadoaSdkError(
+            "Artifact name escapes the download directory",
+            code=KadoaErrorCode.VALIDATION_ERROR,
+            details={"name": name},
+        )
+    return target
+
+
+def _member_lookup(names: List[str]) -> Callable[[str], Optional[str]]:
+    """Map archive member names back to requested names.
+
+    Members are matched by their full name, then by base name when that is
+    unambiguous among the requested files (archives may flatten paths).
+    """
+    exact = {name.lstrip("/"): name for name in names}
+    bases: Dict[str, Optional[str]] = {}
+    for name in names:
+        base = name.rsplit("/", 1)[-1]
+        bases[base] = None if base in bases else name
+
+    def lookup(member: str) -> Optional[str]:
+        member = member.lstrip("/")
+        return exact.get(member) or bases.get(member.rsplit("/", 1)[-1])
+
+    return lookup
 
 
 class CrawlerSessionService:
@@ -33,6 +175,7 @@ class CrawlerSessionService:
     def __init__(self, client: "KadoaClient") -> None:
         self._client = client
         self._crawler_api: Optional[CrawlerApi] = None
+        self._files_api: Optional[FilesApi] = None
 
     @property
     def crawler_api(self) -> CrawlerApi:
@@ -40,9 +183,31 @@ class CrawlerSessionService:
         if self._crawler_api is None:
             from ..core.core_acl import create_api_client
 
-            self._crawler_api = CrawlerApi(create_api_client(self._client.configuration))
+            self._crawler_api = CrawlerApi(
+                create_api_client(
+                    self._client.configuration,
+                    metrics=getattr(self._client, "metrics", None),
+                    hooks=getattr(self._client, "hooks", None),
+                )
+            )
         return self._crawler_api
 
+    @property
+    def files_api(self) -> FilesApi:
+        """Get or create the files API client."""
+        if self._files_api is None:
+            from ..core.core_acl import create_api_client
+
+            self._files_api = FilesApi(
+                create_api_client(
+                    self._client.configuration,
+                    metrics=getattr(self._client, "metrics", None),
+                    hooks=getattr(self._client, "hooks", None),
+                )
+            )
+        return self._files_api
+
+    @operation("start_crawler_session")
     def start(self, body: StartCrawlRequest) -> StartSessionResult:
         """Start a new crawler session.
 
@@ -54,6 +219,7 @@ class CrawlerSessionService:
         """
         return self.crawler_api.v4_crawl_post(start_crawler_session_request=body)
 
+    @operation("start_crawler_session")
     def start_with_config(self, body: StartWithConfigRequest) -> StartSessionResult:
         """Start a crawler session with an existing configuration.
 
@@ -65,6 +231,7 @@ class CrawlerSessionService:
         """
         return self.crawler_api.v4_crawl_start_post(start_session_with_config_request=body)
 
+    @operation("pause_crawler_session")
     def pause(self, session_id: str) -> SessionOperationResult:
         """Pause a crawler session.
 
@@ -78,6 +245,7 @@ class CrawlerSessionService:
             pause_crawler_session_request=PauseSessionRequest(session_id=session_id)
         )
 
+    @operation("resume_crawler_session")
     def resume(self, session_id: str) -> SessionOperationResult:
         """Resume a paused crawler session.
 
@@ -91,6 +259,7 @@ class CrawlerSessionService:
             resume_crawler_session_request=ResumeSessionRequest(session_id=session_id)
         )
 
+    @operation("list_crawler_sessions")
     def list_sessions(
         self, options: Optional[ListSessionsOptions] = None
     ) -> list[CrawlerSession]:
@@ -110,6 +279,7 @@ class CrawlerSessionService:
         )
         return response.data or []
 
+    @operation("get_crawler_session_status")
     def get_session_status(self, session_id: str) -> SessionStatus:
         """Get status of a crawler session.
 
@@ -121,6 +291,7 @@ class CrawlerSessionService:
         """
         return self.crawler_api.v4_crawl_session_id_status_get(session_id=session_id)
 
+    @operation("get_crawler_pages")
     def get_pages(
         self, session_id: str, options: Optional[GetPagesOptions] = None
     ) -> SessionPagesResult:
@@ -140,6 +311,7 @@ class CrawlerSessionService:
             page_size=opts.get("page_size"),
         )
 
+    @operation("get_crawler_page")
     def get_page(
         self, session_id: str, page_id: str, options: Optional[GetPageOptions] = None
     ) -> PageContent:
@@ -160,6 +332,7 @@ class CrawlerSessionService:
             format=opts.get("format"),
         )
 
+    @operation("get_crawler_session_data")
     def get_all_session_data(
         self, session_id: str, options: Optional[GetAllDataOptions] = None
     ) -> SessionDataList:
@@ -178,6 +351,7 @@ class CrawlerSessionService:
             include_all=opts.get("include_all"),
         )
 
+    @operation("get_crawler_bucket_file")
     def get_bucket_file(self, filenameb64: str) -> object:
         """Get a file from the crawling bucket.
 
@@ -190,3 +364,469 @@ class CrawlerSessionService:
         return self.crawler_api.v4_crawl_bucket_data_filenameb64_get(
             filenameb64=filenameb64
         )
+
+    def track(
+        self,
+        session_ids: Iterable[str],
+        *,
+        on_progress: Optional[ProgressListener] = None,
+        realtime: Optional["Realtime"] = None,
+        min_interval_ms: int = DEFAULT_MIN_POLL_INTERVAL_MS,
+        max_interval_ms: int = DEFAULT_MAX_POLL_INTERVAL_MS,
+        use_listing: Optional[bool] = None,
+    ) -> CrawlSessionTracker:
+        """Track many crawler sessions through one multiplexed poller.
+
+        See ``CrawlSessionTracker`` for the polling strategy. More sessions
+        can be added with ``tracker.track`` while it is waiting.
+
+        Args:
+            session_ids: Sessions to track
+            on_progress: Called with every new progress sample
+            realtime: Connection whose events start a poll round early;
+                defaults to the client's realtime connection when connected
+            min_interval_ms: Shortest pause between poll rounds
+            max_interval_ms: Longest pause between poll rounds
+            use_listing: Read stats from the session listing (default: when
+                more than one session is pending)
+
+        Returns:
+            Tracker; call ``wait`` or ``wait_async`` on it
+
+        Example:
+            ```python
+            tracker = client.crawler.session.track(session_ids)
+            for session_id, progress in tracker.wait().items():
+                print(session_id, progress.crawled_pages, progress.error)
+            ```
+        """
+        if realtime is None:
+            realtime = getattr(self._client, "realtime", None)
+            if realtime is not None and not realtime.is_connected():
+                realtime = None
+        tracker = CrawlSessionTracker(
+            self,
+            on_progress=on_progress,
+            realtime=realtime,
+            min_interval_ms=min_interval_ms,
+            max_interval_ms=max_interval_ms,
+            use_listing=use_listing,
+        )
+        tracker.track(session_ids)
+        return tracker
+
+    def wait(
+        self,
+        session_id: str,
+        *,
+        on_progress: Optional[ProgressListener] = None,
+        timeout_ms: Optional[int] = None,
+        realtime: Optional["Realtime"] = None,
+        min_interval_ms: int = DEFAULT_MIN_POLL_INTERVAL_MS,
+        max_interval_ms: int = DEFAULT_MAX_POLL_INTERVAL_MS,
+    ) -> CrawlProgress:
+        """Wait for a crawler session to finish.
+
+        Polls the session status with adaptive backoff (and early rounds on
+        realtime events for the session), reporting each sample with its
+        crawl rate, ETA and trend to ``on_progress``.
+
+        Args:
+            session_id: Session ID
+            on_progress: Called with every new progress sample
+            timeout_ms: Give up after this long (default: no limit)
+            realtime: Connection whose events start a poll round early;
+                defaults to the client's realtime connection when connected
+            min_interval_ms: Shortest pause between polls
+            max_interval_ms: Longest pause between polls
+
+        Returns:
+            Final progress of the session; ``error`` is set if the status
+            reported one instead of the session's stats
+
+        Raises:
+            KadoaSdkError: If the timeout expires
+            KadoaHttpError: If a status request fails
+
+        Example:
+            ```python
+            result = client.crawler.session.start(body)
+            progress = client.crawler.session.wait(
+                result.session_id,
+                on_progress=lambda p: print(p.crawled_pages, p.eta_seconds, p.trend),
+            )
+            ```
+        """
+        tracker = self.track(
+            [session_id],
+            on_progress=on_progress,
+            realtime=realtime,
+            min_interval_ms=min_interval_ms,
+            max_interval_ms=max_interval_ms,
+        )
+        return tracker.wait(timeout_ms)[session_id]
+
+    async def wait_async(
+        self,
+        session_id: str,
+        *,
+        on_progress: Optional[ProgressListener] = None,
+        timeout_ms: Optional[int] = None,
+        realtime: Optional["Realtime"] = None,
+        min_interval_ms: int = DEFAULT_MIN_POLL_INTERVAL_MS,
+        max_interval_ms: int = DEFAULT_MAX_POLL_INTERVAL_MS,
+    ) -> CrawlProgress:
+        """Async variant of ``wait``; status requests run in a worker thread."""
+        tracker = self.track(
+            [session_id],
+            on_progress=on_progress,
+            realtime=realtime,
+            min_interval_ms=min_interval_ms,
+            max_interval_ms=max_interval_ms,
+        )
+        return (await tracker.wait_async(timeout_ms))[session_id]
+
+    def _pages_window(
+        self, session_id: str, skip: int, limit: int
+    ) -> Tuple[List[SessionPage], Optional[int]]:
+        result = self.get_pages(
+            session_id, {"current_page": skip // limit + 1, "page_size": limit}
+        )
+        pagination = getattr(result, "pagination", None)
+        total = getattr(pagination, "total_items", None)
+        pages = list(getattr(result, "payload", None) or [])
+        return pages, None if total is None else int(total)
+
+    def _fetch_crawled_page(
+        self, session_id: str, index: int, page: SessionPage, format: Optional[str]
+    ) -> CrawledPage:
+        crawled = CrawledPage(index, page.id, page.url, page.status)
+        options: GetPageOptions = {}
+        if format:
+            options["format"] = format  # type: ignore[typeddict-item]
+        try:
+            crawled.content = self.get_page(session_id, page.id, options)
+        except Exception as error:
+            crawled.error = KadoaHttpError.wrap(
+                error,
+                message="Failed to fetch crawled page",
+                details={"sessionId": session_id, "pageId": page.id},
+            )
+        return crawled
+
+    def iter_pages(
+        self,
+        session_id: str,
+        *,
+        format: Optional[str] = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        ordered: bool = True,
+        start: int = 0,
+        statuses: Optional[Iterable[str]] = ("DONE",),
+        page_size: int = DEFAULT_PAGES_PAGE_SIZE,
+        prefetch: int = 2,
+    ) -> Iterator[CrawledPage]:
+        """Iterate over the pages of a crawler session with their content.
+
+        Walks the session's page listing (``prefetch`` listing pages in
+        flight once the total is known) and fetches page contents on up to
+        ``concurrency`` threads, with at most twice that many fetches queued
+        so memory stays bounded on large crawls. Pages listed after the walk
+        started (while the crawl is still running) are not included.
+
+        A failed content fetch doesn't stop the walk: the page is yielded with
+        ``error`` set. Listing errors are raised.
+
+        Args:
+            session_id: Session ID
+            format: Page content format (``"html"`` or ``"markdown"``)
+            concurrency: Page contents fetched at once
+            ordered: Yield pages in crawl order; with False pages are yielded
+                as soon as their content arrives
+            start: Listing position to start at, e.g. ``page.index + 1`` of
+                the last page processed before an interruption
+            statuses: Only yield pages in these statuses (None for all);
+                pages that are still crawling have no content yet
+            page_size: Pages per listing request
+            prefetch: Listing requests in flight at once
+
+        Yields:
+            Crawled pages with content
+
+        Raises:
+            KadoaHttpError: If a listing request fails
+
+        Example:
+            ```python
+            pages = client.crawler.session.iter_pages(session_id, format="markdown")
+            for page in pages:
+                if page.error is None:
+                    store(page.url, page.content.payload)
+                checkpoint(page.index + 1)
+            ```
+        """
+        wanted = None if statuses is None else frozenset(statuses)
+        workers = max(1, concurrency)
+        aligned = start - start % page_size
+        windows = iter_windows(
+            lambda skip, limit: self._pages_window(session_id, skip, limit),
+            start=aligned,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+        pending: Deque[Future[CrawledPage]] = deque()
+
+        def take() -> Iterator[CrawledPage]:
+            if ordered:
+                yield pending.popleft().result()
+                return
+            done, _ = wait_futures(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: f.result().index):
+                pending.remove(future)
+                yield future.result()
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="kadoa-crawl"
+        ) as executor:
+            try:
+                index = aligned
+                for window in windows:
+                    for page in window:
+                        index += 1
+                        if index <= start:
+                            continue
+                        if wanted is not None and page.status not in wanted:
+                            continue
+                        pending.append(
+                            executor.submit(
+                                copy_context().run,
+                                self._fetch_crawled_page,
+                                session_id,
+                                index - 1,
+                                page,
+                                format,
+                            )
+                        )
+                        while len(pending) >= 2 * workers:
+                            yield from take()
+                while pending:
+                    yield from take()
+            finally:
+                windows.close()
+                for future in pending:
+                    future.cancel()
+
+    @operation("bulk_download_files")
+    def _open_bulk(self, names: List[str]) -> Any:
+        try:
+            return self.files_api.v4_files_bulk_download_post_without_preload_content(
+                v4_files_bulk_download_post_request=BulkDownloadRequest(files=names)
+            )
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error,
+                message="Failed to bulk download artifacts",
+                details={"files": len(names)},
+            )
+
+    @operation("download_file")
+    def _open_file(self, name: str, headers: Optional[Dict[str, str]]) -> Any:
+        try:
+            return self.files_api.v4_files_file_name_get_without_preload_content(
+                file_name=name, _headers=headers
+            )
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error, message="Failed to download artifact", details={"file": name}
+            )
+
+    def _download_archive(
+        self,
+        names: List[str],
+        root: Path,
+        members: Optional[Callable[[str], bool]],
+        chunk_size: int,
+    ) -> Tuple[List[ArtifactDownload], List[str]]:
+        """Download one bulk archive and extract it member by member.
+
+        Returns the extracted files and the requested names that are missing
+        from the archive.
+        """
+        response = self._open_bulk(names)
+        raise_for_download_status(
+            response, "Failed to bulk download artifacts", {"files": len(names)}
+        )
+        handle, archive_path = tempfile.mkstemp(
+            prefix=".kadoa-bulk-", suffix=".zip", dir=root
+        )
+        try:
+            with os.fdopen(handle, "wb") as archive_file:
+                for chunk in iter_chunks(response, chunk_size):
+                    archive_file.write(chunk)
+            lookup = _member_lookup(names)
+            seen: Set[str] = set()
+            downloads: List[ArtifactDownload] = []
+            with zipfile.ZipFile(archive_path) as archive:
+                for info in archive.infolist():
+                    name = None if info.is_dir() else lookup(info.filename)
+                    if name is None or name in seen:
+                        continue
+                    seen.add(name)
+                    if members is not None and not members(info.filename):
+                        continue
+                    download = ArtifactDownload(name, bulk=True)
+                    try:
+                        target = _artifact_path(root, name)
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        partial = target.with_name(target.name + ".part")
+                        with archive.open(info) as source, partial.open("wb") as sink:
+                            shutil.copyfileobj(source, sink, chunk_size)
+                        os.replace(partial, target)
+                        download.path, download.size = target, info.file_size
+                    except Exception as error:
+                        download.error = KadoaHttpError.wrap(
+                            error,
+                            message="Failed to extract artifact",
+                            details={"file": name},
+                        )
+                    downloads.append(download)
+            return downloads, [name for name in names if name not in seen]
+        finally:
+            os.unlink(archive_path)
+
+    def _download_artifact(
+        self, name: str, root: Path, chunk_size: int
+    ) -> ArtifactDownload:
+        try:
+            path, size, _ = download_to_path(
+                lambda headers: self._open_file(name, headers),
+                _artifact_path(root, name),
+                chunk_size=chunk_size,
+                message="Failed to download artifact",
+                details={"file": name},
+            )
+            return ArtifactDownload(name, path, size)
+        except Exception as error:
+            wrapped = KadoaHttpError.wrap(
+                error, message="Failed to download artifact", details={"file": name}
+            )
+            return ArtifactDownload(name, error=wrapped)
+
+    def download_artifacts(
+        self,
+        names: Iterable[str],
+        directory: Union[str, os.PathLike[str]],
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        members: Optional[Callable[[str], bool]] = None,
+        max_concurrency: int = DEFAULT_ARTIFACT_CONCURRENCY,
+        fallback: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[ArtifactDownload]:
+        """Download many stored files (e.g. crawl screenshots and HTML) at once.
+
+        Names are sent ``batch_size`` at a time to ``/v4/files/bulk-download``.
+        Each ZIP archive is streamed to a temporary file in ``directory`` and
+        extracted member by member as soon as it is complete, while the other
+        batches are still downloading; up to ``max_concurrency`` requests run
+        at once. Files keep their names (including subdirectories) below
+        ``directory``.
+
+        With ``fallback``, files of a failed bulk request and files missing
+        from an archive are downloaded one by one from ``/v4/files/{name}``.
+        A failed file doesn't stop the others: its error is returned in
+        ``ArtifactDownload.error``.
+
+        Args:
+            names: Stored file names
+            directory: Target directory
+            batch_size: File names per bulk request
+            members: Only write files whose archive member name (or, for
+                single downloads, file name) passes this filter
+            max_concurrency: Requests running at once
+            fallback: Download files one by one when a bulk request fails
+            chunk_size: Bytes per chunk
+
+        Returns:
+            One download per distinct name that passed ``members``, in input
+            order
+
+        Example:
+            ```python
+            downloads = client.crawler.session.download_artifacts(
+                screenshot_names,
+                "artifacts",
+                members=lambda name: name.endswith(".png"),
+            )
+            failed = [download.name for download in downloads if download.error]
+            ```
+        """
+        ordered = list(dict.fromkeys(names))
+        if not ordered:
+            return []
+        root = Path(directory)
+        root.mkdir(parents=True, exist_ok=True)
+        root = root.resolve()
+        size = max(1, batch_size)
+        batches = [ordered[i : i + size] for i in range(0, len(ordered), size)]
+        results: Dict[str, ArtifactDownload] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_concurrency), thread_name_prefix="kadoa-artifacts"
+        ) as executor:
+
+            def single(name: str) -> Future[Any]:
+                return executor.submit(
+                    copy_context().run, self._download_artifact, name, root, chunk_size
+                )
+
+            bulk: Dict[Future[Any], List[str]] = {
+                executor.submit(
+                    copy_context().run,
+                    self._download_archive,
+                    batch,
+                    root,
+                    members,
+                    chunk_size,
+                ): batch
+                for batch in batches
+            }
+            pending: Set[Future[Any]] = set(bulk)
+            while pending:
+                done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future not in bulk:
+                        download = future.result()
+                        results[download.name] = download
+                        continue
+                    batch = bulk[future]
+                    try:
+                        extracted, missing = future.result()
+                    except Exception as error:
+                        if not fallback:
+                            wrapped = KadoaHttpError.wrap(
+                                error,
+                                message="Failed to bulk download artifacts",
+                                details={"files": len(batch)},
+                            )
+                            for name in batch:
+                                results[name] = ArtifactDownload(name, error=wrapped)
+                            continue
+                        extracted, missing = [], batch
+                    for download in extracted:
+                        results[download.name] = download
+                    for name in missing:
+                        if members is not None and not members(name):
+                            continue
+                        if fallback:
+                            pending.add(single(name))
+                            continue
+                        results[name] = ArtifactDownload(
+                            name,
+                            error=KadoaSdkError(
+                                "Artifact missing from bulk download",
+                                code=KadoaErrorCode.NOT_FOUND,
+                                details={"file": name},
+                            ),
+                        )
+        return [results[name] for name in ordered if name in results]
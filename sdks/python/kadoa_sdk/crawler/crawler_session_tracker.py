@@ -0,0 +1,437 @@
+"""Progress tracking and waiting for crawler sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..core.exceptions import KadoaErrorCode, KadoaSdkError
+from ..core.logger import crawl as logger
+from ..core.tracing import span
+
+if TYPE_CHECKING:
+    from ..core.realtime import Realtime, RealtimeEvent
+    from .crawler_session_service import CrawlerSessionService
+
+debug = logger.debug
+
+DEFAULT_MIN_POLL_INTERVAL_MS = 5_000
+DEFAULT_MAX_POLL_INTERVAL_MS = 60_000
+DEFAULT_LISTING_PAGES = 3
+_LISTING_PAGE_SIZE = 100
+
+# Time constants (seconds) of the rate averages: the reported rate and ETA use
+# the slow one, the trend compares the fast one against it
+_RATE_TAU = 60.0
+_RECENT_TAU = 15.0
+# Seconds without a new page before a running session counts as stalled
+_STALL_AFTER = 120.0
+
+ProgressListener = Callable[["CrawlProgress"], None]
+
+
+class CrawlProgress:
+    """Progress snapshot of a crawler session.
+
+    ``pages_per_sec`` is a time-weighted moving average over about a minute.
+    ``eta_seconds`` divides the queued and running jobs by that rate; the
+    crawl may still discover more pages, so it is a lower bound. ``trend`` is
+    ``"accelerating"``, ``"steady"``, ``"slowing"`` or ``"stalled"`` once two
+    samples are available. A session whose status came back with an ``error``
+    and no payload is reported as ``finished`` with that ``error``.
+    """
+
+    __slots__ = (
+        "session_id",
+        "crawled_pages",
+        "active_jobs",
+        "waiting_jobs",
+        "finished",
+        "state",
+        "error",
+        "pages_per_sec",
+        "eta_seconds",
+        "trend",
+        "elapsed_seconds",
+    )
+
+    def __init__(
+        self,
+        session_id: str,
+        crawled_pages: Optional[int] = None,
+        active_jobs: Optional[int] = None,
+        waiting_jobs: Optional[int] = None,
+        finished: bool = False,
+        state: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self.session_id = session_id
+        self.crawled_pages = crawled_pages
+        self.active_jobs = active_jobs
+        self.waiting_jobs = waiting_jobs
+        self.finished = finished
+        self.state = state
+        self.error = error
+        self.pages_per_sec: Optional[float] = None
+        self.eta_seconds: Optional[float] = None
+        self.trend: Optional[str] = None
+        self.elapsed_seconds = 0.0
+
+    @property
+    def remaining_jobs(self) -> Optional[int]:
+        """Queued plus running jobs, when the API reports them."""
+        if self.active_jobs is None and self.waiting_jobs is None:
+            return None
+        return (self.active_jobs or 0) + (self.waiting_jobs or 0)
+
+    def __repr__(self) -> str:
+        rate = "" if self.pages_per_sec is None else f", pages_per_sec={self.pages_per_sec:.2f}"
+        return (
+            f"CrawlProgress(session_id={self.session_id!r}, "
+            f"crawled_pages={self.crawled_pages}, finished={self.finished}{rate})"
+        )
+
+
+def _field(source: Any, *names: str) -> Any:
+    for name in names:
+        value = source.get(name) if isinstance(source, dict) else getattr(source, name, None)
+        if value is not None:
+            return value
+    return None
+
+
+def _count(value: Any) -> Optional[int]:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _progress_from(session_id: str, source: Any, error: Optional[str] = None) -> CrawlProgress:
+    """Read live stats from a listing item or a status payload (dict or model).
+
+    Only the ``finished`` flag (documented on the session listing items) marks
+    a session as done; the reported ``status``/``state`` is informational.
+    """
+    state = _field(source, "status", "state")
+    state = str(state) if state is not None else None
+    return CrawlProgress(
+        session_id,
+        crawled_pages=_count(_field(source, "crawled_pages", "crawledPages")),
+        active_jobs=_count(_field(source, "active_jobs", "activeJobs")),
+        waiting_jobs=_count(_field(source, "waiting_jobs", "waitingJobs")),
+        finished=bool(_field(source, "finished")),
+        state=state,
+        error=error,
+    )
+
+
+def _event_session_id(event: "RealtimeEvent") -> Optional[str]:
+    message = event.get("message") if isinstance(event, dict) else None
+    if not isinstance(message, dict):
+        return None
+    session_id = _field(message, "sessionId", "session_id")
+    return str(session_id) if session_id is not None else None
+
+
+class _RateEstimator:
+    """Time-weighted moving averages of the crawl rate of one session."""
+
+    __slots__ = ("started", "last_at", "last_pages", "progress_at", "rate", "recent")
+
+    def __init__(self, now: float) -> None:
+        self.started = now
+        self.last_at: Optional[float] = None
+        self.last_pages: Optional[int] = None
+        self.progress_at = now
+        self.rate: Optional[float] = None
+        self.recent: Optional[float] = None
+
+    def update(self, now: float, progress: CrawlProgress) -> bool:
+        """Fold a sample into the averages and fill in the derived fields.
+
+        Returns whether the crawled page count changed.
+        """
+        pages = progress.crawled_pages
+        changed = pages is not None and pages != self.last_pages
+        if pages is not None and self.last_pages is not None and self.last_at is not None:
+            elapsed = now - self.last_at
+            if elapsed > 0:
+                instant = max(0, pages - self.last_pages) / elapsed
+                if self.rate is None or self.recent is None:
+                    self.rate = self.recent = instant
+                else:
+                    self.rate += (instant - self.rate) * (1 - math.exp(-elapsed / _RATE_TAU))
+                    self.recent += (instant - self.recent) * (1 - math.exp(-elapsed / _RECENT_TAU))
+        if pages is not None:
+            if changed:
+                self.progress_at = now
+            self.last_at, self.last_pages = now, pages
+
+        progress.elapsed_seconds = now - self.started
+        progress.pages_per_sec = self.rate
+        remaining = progress.remaining_jobs
+        if progress.finished:
+            progress.eta_seconds = 0.0
+        elif remaining is not None and self.rate:
+            progress.eta_seconds = remaining / self.rate
+        progress.trend = self._trend(now, progress)
+        return changed
+
+    def _trend(self, now: float, progress: CrawlProgress) -> Optional[str]:
+        if self.rate is None or self.recent is None or progress.finished:
+            return None
+        if now - self.progress_at >= _STALL_AFTER:
+            return "stalled"
+        if self.recent > self.rate * 1.2:
+            return "accelerating"
+        if self.recent < self.rate * 0.8:
+            return "slowing"
+        return "steady"
+
+
+class CrawlSessionTracker:
+    """Track the progress of many crawler sessions through one poller.
+
+    With more than one session pending, a round reads the live stats of all of
+    them from the session listing; sessions it doesn't reach get a status
+    request each. The interval doubles while no session makes progress (up to
+    ``max_interval_ms``) and resets once one does. Realtime events naming a
+    tracked ``sessionId`` start a round right away.
+
+    Usually created through ``CrawlerSessionService.track``.
+
+    Example:
+        ```python
+        tracker = client.crawler.session.track(
+            session_ids,
+            on_progress=lambda p: print(p.session_id, p.crawled_pages, p.eta_seconds),
+        )
+        results = tracker.wait(timeout_ms=2 * 60 * 60 * 1000)
+        ```
+    """
+
+    def __init__(
+        self,
+        service: "CrawlerSessionService",
+        *,
+        on_progress: Optional[ProgressListener] = None,
+        realtime: Optional["Realtime"] = None,
+        min_interval_ms: int = DEFAULT_MIN_POLL_INTERVAL_MS,
+        max_interval_ms: int = DEFAULT_MAX_POLL_INTERVAL_MS,
+        use_listing: Optional[bool] = None,
+        listing_pages: int = DEFAULT_LISTING_PAGES,
+    ) -> None:
+        """
+        Args:
+            service: Session service used for polling
+            on_progress: Called with every new progress sample
+            realtime: Connection whose events wake the poller
+            min_interval_ms: Shortest pause between poll rounds
+            max_interval_ms: Longest pause between poll rounds
+            use_listing: Read stats from the session listing (default: when
+                more than one session is pending)
+            listing_pages: Listing pages read per round before the remaining
+                sessions are polled individually
+        """
+        self._service = service
+        self._on_progress = on_progress
+        self._realtime = realtime
+        self._min_interval = max(0, min_interval_ms) / 1000
+        self._max_interval = max(self._min_interval, max_interval_ms / 1000)
+        self._use_listing = use_listing
+        self._listing_pages = max(1, listing_pages)
+        self._lock = threading.Lock()
+        self._estimators: Dict[str, _RateEstimator] = {}
+        self._progress: Dict[str, CrawlProgress] = {}
+        self._interval = self._min_interval
+        self._wake = threading.Event()
+        self._async_wake: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = None
+
+    def track(self, session_ids: Iterable[str]) -> None:
+        """Start tracking more sessions."""
+        now = time.monotonic()
+        with self._lock:
+            for session_id in session_ids:
+                self._estimators.setdefault(session_id, _RateEstimator(now))
+        self._interval = self._min_interval
+        self._notify()
+
+    def untrack(self, session_id: str) -> None:
+        """Stop tracking a session."""
+        with self._lock:
+            self._estimators.pop(session_id, None)
+            self._progress.pop(session_id, None)
+
+    def progress(self, session_id: str) -> Optional[CrawlProgress]:
+        """Latest progress of a session (None before its first poll)."""
+        with self._lock:
+            return self._progress.get(session_id)
+
+    @property
+    def pending(self) -> List[str]:
+        """Tracked sessions that haven't finished."""
+        with self._lock:
+            return [
+                session_id
+                for session_id in self._estimators
+                if not getattr(self._progress.get(session_id), "finished", False)
+            ]
+
+    def poll(self) -> List[CrawlProgress]:
+        """Run one poll round over the pending sessions.
+
+        Returns:
+            The new progress samples
+
+        Raises:
+            KadoaHttpError: If a status or listing request fails
+        """
+        pending = self.pending
+        samples: List[CrawlProgress] = []
+        if not pending:
+            return samples
+        use_listing = self._use_listing if self._use_listing is not None else len(pending) > 1
+        remaining = set(pending)
+        if use_listing:
+            for page in range(1, self._listing_pages + 1):
+                sessions = self._service.list_sessions(
+                    {"page": page, "page_size": _LISTING_PAGE_SIZE}
+                )
+                for session in sessions:
+                    session_id = _field(session, "session_id", "sessionId")
+                    if session_id in remaining:
+                        remaining.discard(session_id)
+                        samples.append(_progress_from(session_id, session))
+                if not remaining or len(sessions) < _LISTING_PAGE_SIZE:
+                    break
+        for session_id in pending:
+            if session_id in remaining:
+                status = self._service.get_session_status(session_id)
+                payload = getattr(status, "payload", None)
+                error = getattr(status, "error", None)
+                progress = _progress_from(session_id, payload or {}, error)
+                if error and not payload:
+                    # No stats to wait on; polling again wouldn't change that
+                    progress.finished = True
+                samples.append(progress)
+
+        now = time.monotonic()
+        progressed = False
+        with self._lock:
+            for progress in samples:
+                estimator = self._estimators.get(progress.session_id)
+                if estimator is None:
+                    continue
+                progressed = estimator.update(now, progress) or progressed
+                self._progress[progress.session_id] = progress
+        if progressed:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(self._max_interval, self._interval * 2)
+        for progress in samples:
+            debug(
+                "crawl session %s: %s pages, finished=%s",
+                progress.session_id,
+                progress.crawled_pages,
+                progress.finished,
+            )
+            if self._on_progress is not None:
+                self._on_progress(progress)
+        return samples
+
+    def wait(self, timeout_ms: Optional[int] = None) -> Dict[str, CrawlProgress]:
+        """Poll until every tracked session has finished.
+
+        Args:
+            timeout_ms: Give up after this long (default: no limit)
+
+        Returns:
+            Final progress by session id
+
+        Raises:
+            KadoaSdkError: If the timeout expires
+            KadoaHttpError: If a status or listing request fails
+        """
+        deadline = None if timeout_ms is None else time.monotonic() + timeout_ms / 1000
+        unsubscribe = self._subscribe()
+        try:
+            attempts = 0
+            while True:
+                attempts += 1
+                self._wake.clear()
+                with span("kadoa.poll_attempt", {"kadoa.poll.attempt": attempts}):
+                    self.poll()
+                if not self.pending:
+                    return self._results()
+                delay = self._next_delay(deadline, timeout_ms, attempts)
+                self._wake.wait(delay)
+        finally:
+            if unsubscribe is not None:
+                unsubscribe()
+
+    async def wait_async(self, timeout_ms: Optional[int] = None) -> Dict[str, CrawlProgress]:
+        """Async variant of ``wait``; requests run in a worker thread."""
+        deadline = None if timeout_ms is None else time.monotonic() + timeout_ms / 1000
+        wake = asyncio.Event()
+        self._async_wake = (asyncio.get_running_loop(), wake)
+        unsubscribe = self._subscribe()
+        try:
+            attempts = 0
+            while True:
+                attempts += 1
+                wake.clear()
+                with span("kadoa.poll_attempt", {"kadoa.poll.attempt": attempts}):
+                    await asyncio.to_thread(self.poll)
+                if not self.pending:
+                    return self._results()
+                delay = self._next_delay(deadline, timeout_ms, attempts)
+                try:
+                    await asyncio.wait_for(wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._async_wake = None
+            if unsubscribe is not None:
+                unsubscribe()
+
+    def _results(self) -> Dict[str, CrawlProgress]:
+        with self._lock:
+            return dict(self._progress)
+
+    def _next_delay(
+        self, deadline: Optional[float], timeout_ms: Optional[int], attempts: int
+    ) -> float:
+        if deadline is None:
+            return self._interval
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise KadoaSdkError(
+                f"Waiting for crawler sessions timed out after {timeout_ms}ms",
+                code=KadoaErrorCode.TIMEOUT,
+                details={"timeoutMs": timeout_ms, "attempts": attempts, "pending": self.pending},
+            )
+        return min(self._interval, left)
+
+    def _subscribe(self) -> Optional[Callable[[], None]]:
+        realtime = self._realtime
+        if realtime is None:
+            return None
+
+        def on_event(event: "RealtimeEvent") -> None:
+            session_id = _event_session_id(event)
+            with self._lock:
+                tracked = session_id in self._estimators
+            if tracked:
+                self._notify()
+
+        return realtime.on_event(on_event)
+
+    def _notify(self) -> None:
+        self._wake.set()
+        if self._async_wake is not None:
+            loop, wake = self._async_wake
+            loop.call_soon_threadsafe(wake.set)
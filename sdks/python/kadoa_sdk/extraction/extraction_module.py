@@ -250,7 +250,7 @@ class ExtractionModule:
                 details={"urls": options.urls},
             )
 
-    def fetch_data(self, options: FetchDataOptions) -> FetchDataResult:
+    def fetch_data(self, options: FetchDataOptions, *, validate: bool = True) -> FetchDataResult:
         """Fetch a page of workflow data with pagination support.
 
         Retrieves a single page of extracted data from a workflow.
@@ -266,6 +266,9 @@ class ExtractionModule:
                 - order: Sort order ("asc" or "desc")
                 - filters: Filter string
                 - include_anomalies: Whether to include anomaly data
+            validate: With False, the page is parsed from the raw response
+                without pydantic validation of the response or its rows.
+                Faster for large pages.
 
         Returns:
             FetchDataResult: Result containing:
@@ -302,9 +305,11 @@ class ExtractionModule:
                 )
             ```
         """
-        return self.data_fetcher.fetch_data(options)
+        return self.data_fetcher.fetch_data(options, validate=validate)
 
-    def fetch_all_data(self, options: FetchDataOptions) -> List[Dict[str, Any]]:
+    def fetch_all_data(
+        self, options: FetchDataOptions, *, validate: bool = True
+    ) -> List[Dict[str, Any]]:
         """Fetch all pages of workflow data (auto-pagination).
 
         Automatically fetches all pages of data from a workflow and returns
@@ -314,6 +319,8 @@ class ExtractionModule:
         Args:
             options: Fetch data options. Note that page will be overridden
                 to fetch all pages. Limit controls records per page request.
+            validate: With False, pages skip pydantic validation (see
+                ``fetch_data``).
 
         Returns:
             List[Dict[str, Any]]: Combined list of all extracted records
@@ -334,10 +341,10 @@ class ExtractionModule:
             print(f"Total records fetched: {len(all_data)}")
             ```
         """
-        return self.data_fetcher.fetch_all_data(options)
+        return self.data_fetcher.fetch_all_data(options, validate=validate)
 
     async def fetch_data_pages(
-        self, options: FetchDataOptions
+        self, options: FetchDataOptions, *, validate: bool = True
     ) -> AsyncGenerator[FetchDataResult, None]:
         """Async generator for paginated workflow data pages.
 
@@ -346,6 +353,8 @@ class ExtractionModule:
 
         Args:
             options: Fetch data options. Limit controls records per page.
+            validate: With False, pages skip pydantic validation (see
+                ``fetch_data``).
 
         Yields:
             FetchDataResult: Each page of data with pagination info
@@ -363,7 +372,7 @@ class ExtractionModule:
                     process_record(record)
             ```
         """
-        async for page in self.data_fetcher.fetch_data_pages(options):
+        async for page in self.data_fetcher.fetch_data_pages(options, validate=validate):
             yield page
 
     def export_data(self, options: ExportDataOptions) -> ExportDataResult:
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
 
 from ..extraction_acl import V4WorkflowsWorkflowIdDataGet200Response
 
 if TYPE_CHECKING:  # pragma: no cover
     from ...client import KadoaClient
+from ...core.downloads import raise_for_download_status
 from ...core.exceptions import KadoaHttpError, KadoaSdkError
 from ...core.http import get_workflows_api
+from ...core.json_codec import get_json_decoder
 from ...core.pagination import PagedIterator, PageInfo, PageOptions, PagedResponse
+from ...core.operations import operation
 from ..types import ExportDataOptions, ExportDataResult, FetchDataOptions, FetchDataResult
 
 
@@ -28,6 +31,7 @@ class DataFetcherService:
         self.client = client
         self._default_limit = 100
 
+    @operation("fetch_data")
     def fetch_workflow_data(self, workflow_id: str, limit: int) -> List[Dict[str, Any]]:
         """Legacy method for backward compatibility"""
         api = get_workflows_api(self.client)
@@ -53,7 +57,8 @@ class DataFetcherService:
                 details={"workflowId": workflow_id, "limit": limit},
             )
 
-    def fetch_data(self, options: FetchDataOptions) -> FetchDataResult:
+    @operation("fetch_data")
+    def fetch_data(self, options: FetchDataOptions, *, validate: bool = True) -> FetchDataResult:
         """Fetch a page of workflow data with pagination support.
 
         Retrieves a single page of extracted data from a workflow with
@@ -69,6 +74,9 @@ class DataFetcherService:
                 - order: Sort order, "asc" or "desc"
                 - filters: Filter string for data filtering
                 - include_anomalies: Whether to include anomaly records
+            validate: With False, the response JSON is parsed once and the
+                result is built without pydantic validation (rows are returned
+                as parsed). Faster for large pages.
 
         Returns:
             FetchDataResult: Result containing data page and pagination info
@@ -77,17 +85,21 @@ class DataFetcherService:
             KadoaHttpError: If API request fails or workflow not found
         """
         api = get_workflows_api(self.client)
+        params: Dict[str, Any] = {
+            "workflow_id": options.workflow_id,
+            "run_id": options.run_id,
+            "sort_by": options.sort_by,
+            "order": options.order,
+            "filters": options.filters,
+            "page": options.page or 1,
+            "limit": options.limit or self._default_limit,
+            "include_anomalies": options.include_anomalies,
+        }
         try:
-            response = api.v4_workflows_workflow_id_data_get(
-                workflow_id=options.workflow_id,
-                run_id=options.run_id,
-                sort_by=options.sort_by,
-                order=options.order,
-                filters=options.filters,
-                page=options.page or 1,
-                limit=options.limit or self._default_limit,
-                include_anomalies=options.include_anomalies,
-            )
+            if not validate:
+                return self._fetch_data_raw(api, options, params)
+
+            response = api.v4_workflows_workflow_id_data_get(**params)
 
             if isinstance(response, V4WorkflowsWorkflowIdDataGet200Response):
                 result = response
@@ -138,7 +150,61 @@ class DataFetcherService:
                 },
             )
 
-    def fetch_all_data(self, options: FetchDataOptions) -> List[Dict[str, Any]]:
+    def _fetch_data_raw(
+        self, api: Any, options: FetchDataOptions, params: Dict[str, Any]
+    ) -> FetchDataResult:
+        response = api.v4_workflows_workflow_id_data_get_without_preload_content(**params)
+        raise_for_download_status(response, KadoaSdkError.ERROR_MESSAGES["DATA_FETCH_FAILED"])
+        try:
+            raw = response.read()
+        finally:
+            response.release_conn()
+        payload = get_json_decoder()(raw) if raw else {}
+
+        data = payload.get("data")
+        pagination = payload.get("pagination")
+        if isinstance(pagination, dict):
+            page_info = PageInfo.model_construct(
+                total_count=pagination.get("totalCount"),
+                page=pagination.get("page"),
+                total_pages=pagination.get("totalPages"),
+                limit=pagination.get("limit"),
+            )
+        else:
+            page_info = PageInfo.model_construct(page=params["page"], limit=params["limit"])
+
+        return FetchDataResult.model_construct(
+            data=data if isinstance(data, list) else [],
+            workflow_id=options.workflow_id,
+            run_id=payload.get("runId") or options.run_id,
+            executed_at=payload.get("executedAt"),
+            pagination=page_info,
+        )
+
+    def _page_fetcher(
+        self, options: FetchDataOptions, validate: bool
+    ) -> Callable[[PageOptions], PagedResponse[Dict[str, Any]]]:
+        def fetch_page(page_options: PageOptions) -> PagedResponse[Dict[str, Any]]:
+            fetch_result = self.fetch_data(
+                options.model_copy(
+                    update={
+                        "page": page_options.page,
+                        "limit": page_options.limit or options.limit or self._default_limit,
+                    }
+                ),
+                validate=validate,
+            )
+            pagination = fetch_result.pagination or PageInfo()
+            if not validate:
+                return PagedResponse.model_construct(data=fetch_result.data, pagination=pagination)
+            return PagedResponse(data=fetch_result.data, pagination=pagination)
+
+        return fetch_page
+
+    @operation("fetch_all_data")
+    def fetch_all_data(
+        self, options: FetchDataOptions, *, validate: bool = True
+    ) -> List[Dict[str, Any]]:
         """Fetch all pages of workflow data (auto-pagination).
 
         Automatically fetches all pages of data by making multiple requests.
@@ -148,6 +214,8 @@ class DataFetcherService:
         Args:
             options: Fetch data options. The page parameter is ignored as
                 all pages are fetched. Limit controls records per page request.
+            validate: With False, pages skip pydantic validation (see
+                ``fetch_data``).
 
         Returns:
             List[Dict[str, Any]]: Combined list of all records across all pages.
@@ -157,32 +225,14 @@ class DataFetcherService:
             KadoaHttpError: If API requests fail
         """
 
-        def fetch_page(page_options: PageOptions) -> PagedResponse[Dict[str, Any]]:
-            fetch_result = self.fetch_data(
-                FetchDataOptions(
-                    workflow_id=options.workflow_id,
-                    run_id=options.run_id,
-                    sort_by=options.sort_by,
-                    order=options.order,
-                    filters=options.filters,
-                    include_anomalies=options.include_anomalies,
-                    page=page_options.page,
-                    limit=page_options.limit or options.limit or self._default_limit,
-                )
-            )
-            return PagedResponse(
-                data=fetch_result.data,
-                pagination=fetch_result.pagination or PageInfo(),
-            )
-
-        iterator = PagedIterator(fetch_page)
+        iterator = PagedIterator(self._page_fetcher(options, validate))
         all_data: List[Dict[str, Any]] = iterator.fetch_all(
             PageOptions(limit=options.limit or self._default_limit)
         )
         return all_data
 
     async def fetch_data_pages(
-        self, options: FetchDataOptions
+        self, options: FetchDataOptions, *, validate: bool = True
     ) -> AsyncGenerator[FetchDataResult, None]:
         """Async generator for paginated workflow data pages.
 
@@ -192,6 +242,8 @@ class DataFetcherService:
 
         Args:
             options: Fetch data options. Limit controls records per page.
+            validate: With False, pages skip pydantic validation (see
+                ``fetch_data``).
 
         Yields:
             FetchDataResult: Each page of data with pagination information
@@ -207,38 +259,20 @@ class DataFetcherService:
                 process_page(page.data)
             ```
         """
-        from ...core.pagination import PagedResponse
-
-        def fetch_page(page_options: PageOptions) -> PagedResponse[Dict[str, Any]]:
-            fetch_result = self.fetch_data(
-                FetchDataOptions(
-                    workflow_id=options.workflow_id,
-                    run_id=options.run_id,
-                    sort_by=options.sort_by,
-                    order=options.order,
-                    filters=options.filters,
-                    include_anomalies=options.include_anomalies,
-                    page=page_options.page,
-                    limit=page_options.limit or options.limit or self._default_limit,
-                )
-            )
-            return PagedResponse(
-                data=fetch_result.data,
-                pagination=fetch_result.pagination or PageInfo(),
-            )
-
-        iterator = PagedIterator(fetch_page)
+        iterator = PagedIterator(self._page_fetcher(options, validate))
+        make_result = FetchDataResult if validate else FetchDataResult.model_construct
 
         async for page in iterator.pages(PageOptions(limit=options.limit or self._default_limit)):
             # Convert PagedResponse back to FetchDataResult
             page_data: List[Dict[str, Any]] = page.data
-            yield FetchDataResult(
+            yield make_result(
                 data=page_data,
                 workflow_id=options.workflow_id,
                 run_id=options.run_id,
                 pagination=page.pagination,
             )
 
+    @operation("export_data")
     def export_data(self, options: ExportDataOptions) -> ExportDataResult:
         """Materialize the workflow's full data set and return a signed
         self-authenticating download URL.
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, Union
 
 from ...core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from ...core.operations import operation
 
 if TYPE_CHECKING:  # pragma: no cover
     from ...client import KadoaClient
@@ -15,6 +16,7 @@ class EntityDetectorService:
     def __init__(self, client: "KadoaClient") -> None:
         self.client = client
 
+    @operation("fetch_entity_fields")
     def fetch_entity_fields(
         self, *, link: str, location: Union[Dict[str, Any], "LocationConfig"]
     ) -> Dict[str, Any]:
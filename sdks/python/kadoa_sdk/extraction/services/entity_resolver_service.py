@@ -7,6 +7,7 @@ from pydantic import BaseModel
 if TYPE_CHECKING:  # pragma: no cover
     from ...client import KadoaClient
 from ...core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from ...core.operations import operation
 from ..types import EntityConfig, LocationConfig
 
 ENTITY_API_ENDPOINT = "/v4/entity"
@@ -128,6 +129,7 @@ class EntityResolverService:
             details={"entity": entity_config},
         )
 
+    @operation("fetch_entity_fields")
     def fetch_entity_fields(
         self,
         *,
@@ -17,6 +17,7 @@ from ..extraction_acl import (
 
 if TYPE_CHECKING:  # pragma: no cover
     from ...client import KadoaClient
+    from ...workflows.workflows_core_service import WorkflowStatus
 from ...core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
 from ...core.http import get_workflows_api
 from ...core.utils import PollingOptions, poll_until
@@ -344,6 +345,19 @@ class ExtractionBuilderService:
                 details={"workflowId": workflow_id},
             )
 
+    def _poll_workflow_status(self, workflow_id: str) -> WorkflowStatus:
+        """Get the workflow status fields only, for polling loops"""
+        try:
+            return self.client.workflow.get_status(workflow_id)
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error,
+                message=KadoaSdkError.ERROR_MESSAGES.get(
+                    "PROGRESS_CHECK_FAILED", "Failed to get workflow status"
+                ),
+                details={"workflowId": workflow_id},
+            )
+
     def extract(self, options: ExtractOptions) -> PreparedExtraction:
         """Create a prepared extraction with fluent API.
 
@@ -575,9 +589,7 @@ class ExtractionBuilderService:
                 raise KadoaSdkError(
                     KadoaSdkError.ERROR_MESSAGES["NO_WORKFLOW_ID"],
                     code=KadoaErrorCode.INTERNAL_ERROR,
-                    details={
-                        "response": (resp.model_dump() if hasattr(resp, "model_dump") else resp)
-                    },
+                    details={"response": resp},
                 )
             return workflow_id
         except Exception as error:
@@ -597,10 +609,10 @@ class ExtractionBuilderService:
         poll_interval_ms = (options.poll_interval_ms if options else None) or 5000
         timeout_ms = (options.timeout_ms if options else None) or 300000
 
-        def poll_fn() -> GetWorkflowResponse:
-            return self._get_workflow_status(workflow_id)
+        def poll_fn() -> WorkflowStatus:
+            return self._poll_workflow_status(workflow_id)
 
-        def is_complete(workflow: GetWorkflowResponse) -> bool:
+        def is_complete(workflow: WorkflowStatus) -> bool:
             return workflow.state == target_state or (
                 target_state == "PREVIEW" and workflow.state == "ACTIVE"
             )
@@ -612,7 +624,6 @@ class ExtractionBuilderService:
 
         try:
             result = poll_until(poll_fn, is_complete, polling_options)
-            return result.result
         except KadoaSdkError as e:
             if e.code == KadoaErrorCode.TIMEOUT:
                 raise KadoaSdkError(
@@ -621,6 +632,7 @@ class ExtractionBuilderService:
                     details={"workflowId": workflow_id, "targetState": target_state},
                 )
             raise
+        return result.result.to_workflow()
 
     def _run(
         self,
@@ -720,9 +732,9 @@ class ExtractionBuilderService:
             raise
 
     def _find_active_workflow_job(self, workflow_id: str) -> Optional[str]:
-        workflow = self._get_workflow_status(workflow_id)
-        job_id = getattr(workflow, "job_id", None) or getattr(workflow, "jobId", None)
-        run_state = getattr(workflow, "run_state", None) or getattr(workflow, "runState", None)
+        workflow = self._poll_workflow_status(workflow_id)
+        job_id = workflow.job_id
+        run_state = workflow.run_state
 
         if not job_id or not run_state:
             return None
@@ -759,8 +771,7 @@ class ExtractionBuilderService:
         poll_interval_ms = 5000  # 5 seconds
 
         def poll_fn() -> Optional[str]:
-            workflow = self._get_workflow_status(workflow_id)
-            return workflow.run_state
+            return self._poll_workflow_status(workflow_id).run_state
 
         def is_complete(run_state: Optional[str]) -> bool:
             return bool(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from urllib.parse import urlparse
@@ -19,8 +20,10 @@ from ..extraction_acl import (
 
 if TYPE_CHECKING:  # pragma: no cover
     from ...client import KadoaClient
+    from ...workflows.workflows_core_service import WorkflowStatus
 from ...core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
 from ...core.http import get_workflows_api
+from ...core.operations import operation
 from ...core.utils import PollingOptions, poll_until
 from ..types import DEFAULTS, ExtractionOptions
 
@@ -62,6 +65,7 @@ class WorkflowManagerService:
     def is_terminal_run_state(self, run_state: Optional[str]) -> bool:
         return bool(run_state and run_state.upper() in TERMINAL_RUN_STATES)
 
+    @operation("create_workflow")
     def create_workflow(
         self,
         *,
@@ -131,9 +135,7 @@ class WorkflowManagerService:
                 raise KadoaSdkError(
                     KadoaSdkError.ERROR_MESSAGES["NO_WORKFLOW_ID"],
                     code=KadoaErrorCode.INTERNAL_ERROR,
-                    details={
-                        "response": resp.model_dump() if hasattr(resp, "model_dump") else resp
-                    },
+                    details={"response": resp},
                 )
             return workflow_id
         except Exception as error:
@@ -143,6 +145,7 @@ class WorkflowManagerService:
                 details={"entity": entity, "fields": fields},
             )
 
+    @operation("get_workflow")
     def get_workflow_status(self, workflow_id: str) -> GetWorkflowResponse:
         try:
             return self.client.workflow.get(workflow_id)
@@ -153,15 +156,29 @@ class WorkflowManagerService:
                 details={"workflowId": workflow_id},
             )
 
+    def _poll_workflow_status(self, workflow_id: str) -> WorkflowStatus:
+        try:
+            return self.client.workflow.get_status(workflow_id)
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error,
+                message=KadoaSdkError.ERROR_MESSAGES["PROGRESS_CHECK_FAILED"],
+                details={"workflowId": workflow_id},
+            )
+
     def wait_for_workflow_completion(
         self,
         workflow_id: str,
         polling_interval: float,
         max_wait_time: float,
     ) -> GetWorkflowResponse:
-        """Wait for workflow to complete using polling utility"""
+        """Wait for workflow to complete using polling utility
+
+        Polls the workflow status fields only and validates the full workflow
+        from the poll that reached a terminal run state.
+        """
         start = time.time()
-        last_status: Optional[GetWorkflowResponse] = None
+        last_status: Optional[WorkflowStatus] = None
         self._logger.debug(
             "poll start: id=%s intervalSec=%s maxWaitSec=%s",
             workflow_id,
@@ -169,10 +186,10 @@ class WorkflowManagerService:
             max_wait_time,
         )
 
-        def poll_fn() -> GetWorkflowResponse:
+        def poll_fn() -> WorkflowStatus:
             nonlocal last_status
-            current = self.get_workflow_status(workflow_id)
-            if (
+            current = self._poll_workflow_status(workflow_id)
+            if self._logger.isEnabledFor(logging.DEBUG) and (
                 last_status is None
                 or last_status.state != current.state
                 or last_status.run_state != current.run_state
@@ -188,7 +205,7 @@ class WorkflowManagerService:
             last_status = current
             return current
 
-        def is_complete(workflow: GetWorkflowResponse) -> bool:
+        def is_complete(workflow: WorkflowStatus) -> bool:
             if self.is_terminal_run_state(workflow.run_state):
                 self._logger.debug(
                     "terminal: id=%s state=%s runState=%s",
@@ -206,7 +223,6 @@ class WorkflowManagerService:
 
         try:
             result = poll_until(poll_fn, is_complete, polling_options)
-            return result.result
         except KadoaSdkError as e:
             if e.code == KadoaErrorCode.TIMEOUT:
                 self._logger.warning(
@@ -222,3 +238,4 @@ class WorkflowManagerService:
                     details={"workflowId": workflow_id, "maxWaitTime": max_wait_time},
                 )
             raise
+        return result.result.to_workflow()
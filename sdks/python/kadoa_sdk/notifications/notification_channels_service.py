@@ -17,6 +17,7 @@ from openapi_client.models.v5_notifications_channels_get200_response_data_channe
 )
 
 from ..core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from ..core.operations import operation
 from ..user import UserService
 from .notifications_acl import (
     CreateChannelRequest,
@@ -47,6 +48,7 @@ class NotificationChannelsService:
         self._api = notifications_api
         self._user_service = user_service
 
+    @operation("list_notification_channels")
     def list_channels(
         self, filters: Optional[ListChannelsRequest] = None
     ) -> list[NotificationChannel]:
@@ -112,6 +114,7 @@ class NotificationChannelsService:
 
         return all_channels
 
+    @operation("delete_notification_channel")
     def delete_channel(self, channel_id: str) -> None:
         """Delete a notification channel
 
@@ -129,6 +132,7 @@ class NotificationChannelsService:
                 message="Failed to delete channel",
             )
 
+    @operation("create_notification_channel")
     def create_channel(
         self,
         channel_type: NotificationChannelType,
@@ -8,6 +8,7 @@ if TYPE_CHECKING:  # pragma: no cover
     pass
 
 from ..core.exceptions import KadoaHttpError
+from ..core.operations import operation
 from .notifications_acl import (
     CreateSettingsRequest,
     ListSettingsRequest,
@@ -26,6 +27,7 @@ class NotificationSettingsService:
     def __init__(self, notifications_api: NotificationsApi) -> None:
         self._api = notifications_api
 
+    @operation("create_notification_settings")
     def create_settings(self, request_data: CreateSettingsRequest) -> NotificationSettings:
         """Create notification settings
 
@@ -61,6 +63,7 @@ class NotificationSettingsService:
                 message="Failed to create notification settings",
             )
 
+    @operation("list_notification_settings")
     def list_settings(
         self, filters: Optional[ListSettingsRequest] = None
     ) -> list[NotificationSettings]:
@@ -101,6 +104,7 @@ class NotificationSettingsService:
                 message="Failed to list notification settings",
             )
 
+    @operation("list_notification_events")
     def list_all_events(self) -> list[NotificationSettingsEventType]:
         """List all available notification event types
 
@@ -109,6 +113,7 @@ class NotificationSettingsService:
         """
         return list(NotificationSettingsEventTypeEnum)
 
+    @operation("update_notification_settings")
     def update_settings(
         self,
         settings_id: str,
@@ -166,6 +171,7 @@ class NotificationSettingsService:
                 message="Failed to update notification settings",
             )
 
+    @operation("delete_notification_settings")
     def delete_settings(self, settings_id: str) -> None:
         """Delete notification settings
 
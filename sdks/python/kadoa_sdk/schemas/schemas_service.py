@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 from ..core.exceptions import KadoaErrorCode, KadoaSdkError
 from ..core.http import get_schemas_api
 from ..core.logger import schemas as logger
+from ..core.operations import operation
 from .schema_builder import SchemaBuilder
 from .schemas_acl import (
     CreateSchemaRequest,
@@ -47,6 +48,7 @@ class SchemasService:
         """
         return SchemaBuilderWithCreate(self, entity_name)
 
+    @operation("get_schema")
     def get_schema(self, schema_id: str) -> SchemaResponse:
         """Get a schema by ID
 
@@ -81,6 +83,7 @@ class SchemasService:
             description=schema_data.description,
         )
 
+    @operation("list_schemas")
     def list_schemas(self) -> list[SchemaResponse]:
         """List all schemas
 
@@ -93,6 +96,7 @@ class SchemasService:
         response = self.schemas_api.v4_schemas_get()
         return response.data
 
+    @operation("create_schema")
     def create_schema(self, body: CreateSchemaRequest) -> SchemaResponse:
         """Create a new schema
 
@@ -119,6 +123,7 @@ class SchemasService:
         # Fetch the created schema to return the full schema object
         return self.get_schema(schema_id)
 
+    @operation("update_schema")
     def update_schema(self, schema_id: str, body: UpdateSchemaRequest) -> SchemaResponse:
         """Update an existing schema
 
@@ -136,6 +141,7 @@ class SchemasService:
         # Fetch the updated schema to return the full schema object
         return self.get_schema(schema_id)
 
+    @operation("delete_schema")
     def delete_schema(self, schema_id: str) -> None:
         """Delete a schema
 
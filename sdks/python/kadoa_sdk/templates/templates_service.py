@@ -22,6 +22,7 @@ from openapi_client.models.update_template_body import UpdateTemplateBody
 
 from ..core.exceptions import KadoaErrorCode, KadoaSdkError
 from ..core.http import get_templates_api
+from ..core.operations import operation
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..client import KadoaClient
@@ -40,11 +41,13 @@ class TemplatesService:
     def _api(self):
         return get_templates_api(self.client)
 
+    @operation("list_templates")
     def list(self) -> List[TemplateResponse]:
         """List all active templates for the current team."""
         response = self._api().v4_templates_get()
         return list(getattr(response, "data", []) or [])
 
+    @operation("get_template")
     def get(self, template_id: str) -> TemplateDetailResponseBodyData:
         """Get a template by ID, including all published versions."""
         response = self._api().v4_templates_template_id_get(template_id=template_id)
@@ -57,6 +60,7 @@ class TemplatesService:
             )
         return template
 
+    @operation("create_template")
     def create(
         self, body: Union[CreateTemplateBody, dict]
     ) -> TemplateCreatedResponseData:
@@ -71,6 +75,7 @@ class TemplatesService:
             )
         return template
 
+    @operation("update_template")
     def update(
         self, template_id: str, body: Union[UpdateTemplateBody, dict]
     ) -> TemplateUpdatedResponseData:
@@ -88,10 +93,12 @@ class TemplatesService:
             )
         return template
 
+    @operation("delete_template")
     def delete(self, template_id: str) -> None:
         """Delete (archive) a template. Existing workflows are unaffected."""
         self._api().v4_templates_template_id_delete(template_id=template_id)
 
+    @operation("create_template_version")
     def create_version(
         self,
         template_id: str,
@@ -115,11 +122,13 @@ class TemplatesService:
             )
         return version
 
+    @operation("list_template_schemas")
     def list_schemas(self, template_id: str) -> List[TemplateSchemasResponseDataInner]:
         """List schemas associated with a template."""
         response = self._api().v4_templates_template_id_schemas_get(template_id=template_id)
         return list(getattr(response, "data", []) or [])
 
+    @operation("create_template_from_workflow")
     def create_from_workflow(
         self, body: Union[SaveFromWorkflowBody, dict]
     ) -> SaveFromWorkflowResponseData:
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, List
 from pydantic import BaseModel
 
 from ..core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from ..core.operations import operation
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..client import KadoaClient
@@ -28,6 +29,7 @@ class UserService:
     def __init__(self, client: "KadoaClient") -> None:
         self.client = client
 
+    @operation("get_current_user")
     async def get_current_user(self) -> KadoaUser:
         """Get current user details
 
@@ -11,6 +11,7 @@ from kadoa_sdk.core.utils import PollingOptions, poll_until
 
 if TYPE_CHECKING:  # pragma: no cover
     from kadoa_sdk.client import KadoaClient
+from ..core.operations import operation
 from .validation_acl import (
     DataValidationApi,
     GetAnomaliesByRuleResponse,
@@ -43,6 +44,7 @@ class ValidationCoreService:
             self._validation_api = get_validation_api(self.client)
         return self._validation_api
 
+    @operation("list_workflow_validations")
     def list_workflow_validations(
         self, filters: ListWorkflowValidationsRequest
     ) -> ListValidationsResponse:
@@ -95,6 +97,7 @@ class ValidationCoreService:
                 },
             )
 
+    @operation("get_validation")
     def get_validation_details(self, validation_id: str) -> GetValidationResponse:
         """
         Get validation details by ID.
@@ -143,6 +146,7 @@ class ValidationCoreService:
                 details={"validationId": validation_id},
             )
 
+    @operation("schedule_validation")
     def schedule_validation(self, workflow_id: str, job_id: str) -> ScheduleValidationResponse:
         """
         Schedule a validation run for a workflow/job.
@@ -192,6 +196,7 @@ class ValidationCoreService:
                 details={"workflowId": workflow_id, "jobId": job_id},
             )
 
+    @operation("toggle_validation")
     def toggle_validation_enabled(self, workflow_id: str) -> ToggleValidationResponse:
         """
         Enable/disable validation for a workflow.
@@ -242,6 +247,7 @@ class ValidationCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("get_latest_validation")
     def get_latest_validation(
         self, workflow_id: str, job_id: Optional[str] = None
     ) -> GetValidationResponse:
@@ -298,6 +304,7 @@ class ValidationCoreService:
                 details={"workflowId": workflow_id, "jobId": job_id},
             )
 
+    @operation("get_validation_anomalies")
     def get_validation_anomalies(self, validation_id: str) -> GetAnomaliesByRuleResponse:
         """
         Get aggregated anomalies for a validation.
@@ -343,6 +350,7 @@ class ValidationCoreService:
                 details={"validationId": validation_id},
             )
 
+    @operation("get_validation_anomalies_by_rule")
     def get_validation_anomalies_by_rule(
         self, validation_id: str, rule_name: str
     ) -> GetAnomalyRulePageResponse:
@@ -11,6 +11,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 from kadoa_sdk.core.exceptions import KadoaHttpError
 from kadoa_sdk.core.http import get_validation_api
+from kadoa_sdk.core.operations import operation
 
 from .validation_acl import (
     BulkApproveRulesRequest,
@@ -50,6 +51,7 @@ class ValidationRulesService:
             self._validation_api = get_validation_api(self.client)
         return self._validation_api
 
+    @operation("list_rules")
     def list_rules(self, options: Optional[ListRulesRequest] = None) -> ListRulesResponse:
         """
         List validation rules with filtering.
@@ -102,6 +104,7 @@ class ValidationRulesService:
                 message="Failed to list validation rules",
             )
 
+    @operation("get_rule")
     def get_rule_by_id(self, rule_id: str) -> Optional[Rule]:
         """
         Get rule by ID.
@@ -231,6 +234,7 @@ class ValidationRulesService:
                 details={"name": name},
             )
 
+    @operation("disable_rule")
     def disable_rule(self, data: DisableRuleRequest) -> Rule:
         """
         Disable a rule.
@@ -294,6 +298,7 @@ class ValidationRulesService:
                 details={"ruleId": data.rule_id},
             )
 
+    @operation("generate_rule")
     def generate_rule(self, data: GenerateRuleRequest) -> Rule:
         """
         Generate a rule using AI.
@@ -356,6 +361,7 @@ class ValidationRulesService:
                 message="Failed to generate validation rule",
             )
 
+    @operation("generate_rules")
     def generate_rules(self, data: GenerateRulesRequest) -> list[Rule]:
         """
         Generate multiple rules using AI.
@@ -421,6 +427,7 @@ class ValidationRulesService:
                 message="Failed to generate validation rules",
             )
 
+    @operation("bulk_approve_rules")
     def bulk_approve_rules(self, data: BulkApproveRulesRequest) -> BulkApproveRulesResponseData:
         """
         Bulk approve rules.
@@ -483,6 +490,7 @@ class ValidationRulesService:
                 message="Failed to bulk approve validation rules",
             )
 
+    @operation("bulk_delete_rules")
     def bulk_delete_rules(self, data: BulkDeleteRulesRequest) -> BulkDeleteRulesResponseData:
         """
         Bulk delete rules.
@@ -545,6 +553,7 @@ class ValidationRulesService:
                 message="Failed to bulk delete validation rules",
             )
 
+    @operation("delete_all_rules")
     def delete_all_rules(self, data: DeleteAllRulesRequest) -> DeleteAllRulesResponseData:
         """
         Delete all rules for a workflow.
@@ -607,6 +616,7 @@ class ValidationRulesService:
                 message="Failed to delete all validation rules",
             )
 
+    @operation("delete_rule")
     def delete_rule(self, data: DeleteRuleRequest):
         """Delete a single validation rule by ID.
 
@@ -8,6 +8,7 @@ from openapi_client.models.variable import Variable
 
 from ..core.exceptions import KadoaErrorCode, KadoaSdkError
 from ..core.http import get_variables_api
+from ..core.operations import operation
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..client import KadoaClient
@@ -26,11 +27,13 @@ class VariablesService:
     def _api(self):
         return get_variables_api(self.client)
 
+    @operation("list_variables")
     def list(self) -> List[Variable]:
         """List all variables in the current team scope."""
         response = self._api().v4_variables_get()
         return list(getattr(response, "variables", []) or [])
 
+    @operation("get_variable")
     def get(self, variable_id: str) -> Variable:
         """Get a variable by ID."""
         response = self._api().v4_variables_variable_id_get(variable_id=variable_id)
@@ -43,6 +46,7 @@ class VariablesService:
             )
         return variable
 
+    @operation("create_variable")
     def create(self, body: Union[CreateVariableBody, dict]) -> Variable:
         """Create a new variable."""
         payload = body if isinstance(body, CreateVariableBody) else CreateVariableBody(**body)
@@ -55,6 +59,7 @@ class VariablesService:
             )
         return variable
 
+    @operation("update_variable")
     def update(
         self, variable_id: str, body: Union[UpdateVariableBody, dict]
     ) -> Variable:
@@ -88,6 +93,7 @@ class VariablesService:
         # Round-trip via GET to return the fully-typed Variable
         return self.get(variable_id)
 
+    @operation("delete_variable")
     def delete(self, variable_id: str) -> None:
         """Delete a variable by ID."""
         # Use the no-preload variant: the API's DELETE response only returns
@@ -7,16 +7,22 @@ from ..extraction.extraction_acl import (
     UpdateWorkflowResponse,
     WorkflowListItemResponse,
 )
+from .workflow_index import WorkflowIndex
 from .workflows_core_service import (
     TERMINAL_JOB_STATES,
     TERMINAL_RUN_STATES,
     CreateWorkflowInput,
     CreateWorkflowResult,
+    JobStatus,
     WorkflowsCoreService,
+    WorkflowStatus,
 )
 
 __all__ = [
     "WorkflowsCoreService",
+    "WorkflowIndex",
+    "WorkflowStatus",
+    "JobStatus",
     "TERMINAL_JOB_STATES",
     "TERMINAL_RUN_STATES",
     "CreateWorkflowInput",
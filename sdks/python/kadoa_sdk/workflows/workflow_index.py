@@ -0,0 +1,546 @@
+"""Local, incrementally updated index of workflow metadata."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import ValidationError
+
+from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError
+from kadoa_sdk.core.logger import workflow as logger
+from kadoa_sdk.core.realtime import _event_workflow_id
+
+from ..extraction.extraction_acl import ListWorkflowsRequest, WorkflowListItemResponse
+from .workflows_core_service import _workflow_builder
+
+if TYPE_CHECKING:  # pragma: no cover
+    from kadoa_sdk.core.realtime import Realtime, RealtimeEvent
+
+    from .workflows_core_service import WorkflowsCoreService
+
+# lookup keyword -> workflow field. ``tags`` holds several values per workflow.
+_LOOKUPS: Dict[str, str] = {
+    "name": "name",
+    "tag": "tags",
+    "state": "state",
+    "run_state": "run_state",
+    "display_state": "display_state",
+    "template_id": "template_id",
+    "update_interval": "update_interval",
+}
+INDEXED_FIELDS: Tuple[str, ...] = ("id", *_LOOKUPS.values())
+
+# Payload keys of realtime status events -> workflow field
+_EVENT_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("currentState", "state"),
+    ("finalState", "state"),
+    ("state", "state"),
+    ("currentRunState", "run_state"),
+    ("finalRunState", "run_state"),
+    ("runState", "run_state"),
+    ("displayState", "display_state"),
+    ("name", "name"),
+)
+
+AUDIT_PAGE_SIZE = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    name TEXT,
+    state TEXT,
+    template_id TEXT,
+    update_interval TEXT,
+    audit_cursor TEXT,
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workflows_name ON workflows (name);
+CREATE INDEX IF NOT EXISTS workflows_state ON workflows (state);
+CREATE INDEX IF NOT EXISTS workflows_template_id ON workflows (template_id);
+CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class WorkflowIndex:
+    """In-memory workflow snapshot with indexed lookups.
+
+    Args:
+        workflows: Service used to list, fetch and audit workflows
+        path: Optional sqlite database to persist the snapshot in. Loaded if
+            it already exists.
+        project: Extra workflow fields to keep besides the indexed ones
+            (``INDEXED_FIELDS``). By default whole workflow list items are
+            kept; with ``project`` items are built from the selected fields
+            without validation, which makes ``build()`` faster and the
+            snapshot smaller.
+    """
+
+    def __init__(
+        self,
+        workflows: "WorkflowsCoreService",
+        *,
+        path: Optional[Union[str, os.PathLike[str]]] = None,
+        project: Optional[Iterable[str]] = None,
+    ) -> None:
+        self._workflows = workflows
+        self._project = (*INDEXED_FIELDS, *project) if project is not None else None
+        self._build_item = _workflow_builder(self._project)
+        # API key (runState) -> field name (run_state) of the kept fields
+        self._api_fields = {
+            field.alias or name: name
+            for name, field in WorkflowListItemResponse.model_fields.items()
+        }
+        if self._project is not None:
+            kept = {self._api_fields.get(key, key) for key in self._project}
+            self._api_fields = {key: name for key, name in self._api_fields.items() if name in kept}
+        self._items: Dict[str, WorkflowListItemResponse] = {}
+        # listing order of each workflow; updates keep it, new workflows go last
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        # field -> value -> workflow ids
+        self._lookups: Dict[str, Dict[Any, Dict[str, None]]] = {
+            field: {} for field in _LOOKUPS.values()
+        }
+        self._audit_cursors: Dict[str, datetime] = {}
+        self._stale: Dict[str, None] = {}
+        self._built_at: Optional[datetime] = None
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(os.fspath(path), check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+            self._load()
+
+    # -- building and persistence -------------------------------------------
+
+    def build(
+        self,
+        filters: Optional[ListWorkflowsRequest] = None,
+        *,
+        page_size: Optional[int] = None,
+        prefetch: int = 4,
+    ) -> "WorkflowIndex":
+        """(Re)build the snapshot from the workflow listing.
+
+        Args:
+            filters: Optional listing filters; only matching workflows are indexed
+            page_size: Workflows per listing request
+            prefetch: Listing windows fetched concurrently
+
+        Returns:
+            The index itself
+
+        Raises:
+            KadoaHttpError: If a listing request fails (the previous snapshot is kept)
+        """
+        built_at = datetime.now(timezone.utc)
+        items = list(
+            self._workflows.iter_all(
+                filters, page_size=page_size, prefetch=prefetch, project=self._project
+            )
+        )
+        with self._lock:
+            self._items.clear()
+            self._positions.clear()
+            self._next_position = 0
+            for lookup in self._lookups.values():
+                lookup.clear()
+            self._audit_cursors.clear()
+            self._built_at = built_at
+            for item in items:
+                self._items[item.id] = item
+                self._assign_position(item.id)
+                self._add_to_lookups(item)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM workflows")
+                    self._db.executemany(
+                        "INSERT INTO workflows VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [self._row(item) for item in items],
+                    )
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO index_meta VALUES ('built_at', ?)",
+                        (built_at.isoformat(),),
+                    )
+        logger.debug("Indexed %d workflows", len(items))
+        return self
+
+    def _load(self) -> None:
+        assert self._db is not None
+        meta = dict(self._db.execute("SELECT key, value FROM index_meta"))
+        self._built_at = _parse_time(meta.get("built_at"))
+        for workflow_id, cursor, item in self._db.execute(
+            "SELECT id, audit_cursor, item FROM workflows ORDER BY position"
+        ):
+            self._put(self._build_item(json.loads(item)), persist=False)
+            parsed = _parse_time(cursor)
+            if parsed is not None:
+                self._audit_cursors[workflow_id] = parsed
+
+    def _row(self, item: Any) -> Tuple[Any, ...]:
+        cursor = self._audit_cursors.get(item.id)
+        return (
+            item.id,
+            self._positions[item.id],
+            getattr(item, "name", None),
+            getattr(item, "state", None),
+            getattr(item, "template_id", None),
+            getattr(item, "update_interval", None),
+            cursor.isoformat() if cursor is not None else None,
+            json.dumps(item.model_dump(mode="json", by_alias=True, exclude_none=True)),
+        )
+
+    def close(self) -> None:
+        """Close the sqlite database, if any. The in-memory snapshot stays usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # -- lookups --------------------------------------------------------------
+
+    def get(self, workflow_id: str) -> Optional[WorkflowListItemResponse]:
+        """The indexed workflow with this id, if any."""
+        return self._items.get(workflow_id)
+
+    def get_by_name(self, name: str) -> Optional[WorkflowListItemResponse]:
+        """The first indexed workflow (in listing order) with exactly this name."""
+        with self._lock:
+            ids = self._lookups["name"].get(name)
+            if not ids:
+                return None
+            return self._items[min(ids, key=self._positions.__getitem__)]
+
+    def find(
+        self,
+        *,
+        name: Optional[str] = None,
+        tag: Optional[str] = None,
+        state: Optional[str] = None,
+        run_state: Optional[str] = None,
+        display_state: Optional[str] = None,
+        template_id: Optional[str] = None,
+        update_interval: Optional[str] = None,
+    ) -> List[WorkflowListItemResponse]:
+        """Indexed workflows matching every given criterion, in listing order.
+
+        Example:
+            ```python
+            index.find(tag="prices", state="ACTIVE", update_interval="DAILY")
+            ```
+        """
+        criteria = {
+            "name": name,
+            "tag": tag,
+            "state": state,
+            "run_state": run_state,
+            "display_state": display_state,
+            "template_id": template_id,
+            "update_interval": update_interval,
+        }
+        with self._lock:
+            buckets = [
+                self._lookups[_LOOKUPS[key]].get(value, {})
+                for key, value in criteria.items()
+                if value is not None
+            ]
+            if not buckets:
+                return list(self._items.values())
+            buckets.sort(key=len)
+            matches: AbstractSet[str] = buckets[0].keys()
+            for bucket in buckets[1:]:
+                matches = matches & bucket.keys()
+            items = self._items
+            return [items[i] for i in sorted(matches, key=self._positions.__getitem__)]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, workflow_id: object) -> bool:
+        return workflow_id in self._items
+
+    def __iter__(self) -> Iterator[WorkflowListItemResponse]:
+        with self._lock:
+            return iter(list(self._items.values()))
+
+    @property
+    def built_at(self) -> Optional[datetime]:
+        """When the snapshot was last built from the listing (UTC)."""
+        return self._built_at
+
+    @property
+    def stale_ids(self) -> List[str]:
+        """Workflows waiting for ``sync()``."""
+        with self._lock:
+            return list(self._stale)
+
+    # -- incremental updates --------------------------------------------------
+
+    def _add_to_lookups(self, item: Any) -> None:
+        for field, lookup in self._lookups.items():
+            value = getattr(item, field, None)
+            if value is None:
+                continue
+            for key in value if field == "tags" else (value,):
+                lookup.setdefault(key, {})[item.id] = None
+
+    def _remove_from_lookups(self, item: Any) -> None:
+        for field, lookup in self._lookups.items():
+            value = getattr(item, field, None)
+            if value is None:
+                continue
+            for key in value if field == "tags" else (value,):
+                bucket = lookup.get(key)
+                if bucket is not None:
+                    bucket.pop(item.id, None)
+                    if not bucket:
+                        del lookup[key]
+
+    def _assign_position(self, workflow_id: str) -> None:
+        if workflow_id not in self._positions:
+            self._positions[workflow_id] = self._next_position
+            self._next_position += 1
+
+    def _put(self, item: Any, *, persist: bool = True) -> None:
+        with self._lock:
+            previous = self._items.get(item.id)
+            if previous is not None:
+                self._remove_from_lookups(previous)
+            self._items[item.id] = item
+            if previous is None:
+                self._assign_position(item.id)
+            self._add_to_lookups(item)
+            if persist and self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO workflows VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        self._row(item),
+                    )
+
+    def _update(self, workflow_id: str, changes: Dict[str, Any]) -> bool:
+        with self._lock:
+            item = self._items.get(workflow_id)
+            if item is None:
+                return False
+            changes = {
+                field: value
+                for field, value in changes.items()
+                if getattr(item, field, None) != value
+            }
+            if changes:
+                self._put(item.model_copy(update=changes))
+            return True
+
+    def _merge(self, workflow_id: str, changes: Mapping[str, Any]) -> bool:
+        """Rebuild an item with API-keyed ``changes`` applied.
+
+        The merged item goes through the item builder, so raw audit-log values
+        are validated like listed workflows. Returns False if validation fails.
+        """
+        with self._lock:
+            item = self._items.get(workflow_id)
+            if item is None:
+                return True
+            data = item.model_dump(mode="json", by_alias=True, exclude_none=True)
+            data.update(changes)
+            try:
+                merged = self._build_item(data)
+            except ValidationError:
+                return False
+            self._put(merged)
+            return True
+
+    def discard(self, workflow_id: str) -> None:
+        """Remove a workflow from the index (no-op if it isn't indexed)."""
+        with self._lock:
+            item = self._items.pop(workflow_id, None)
+            if item is not None:
+                self._remove_from_lookups(item)
+                del self._positions[workflow_id]
+            self._audit_cursors.pop(workflow_id, None)
+            self._stale.pop(workflow_id, None)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM workflows WHERE id = ?", (workflow_id,))
+
+    def mark_stale(self, workflow_id: str) -> None:
+        """Queue a workflow for the next ``sync()``."""
+        with self._lock:
+            self._stale[workflow_id] = None
+
+    def apply_event(self, event: Mapping[str, Any]) -> bool:
+        """Apply a realtime event to the index.
+
+        State fields carried by the event (``currentState``, ``finalRunState``,
+        ``displayState``, ...) are applied right away. Events for workflows the
+        index doesn't know, or that carry no indexed fields, mark the workflow
+        stale so the next ``sync()`` fetches its changes.
+
+        Returns:
+            True if the event was applied to an indexed workflow
+        """
+        workflow_id = _event_workflow_id(dict(event))
+        if workflow_id is None:
+            return False
+        payload = event.get("message")
+        if not isinstance(payload, Mapping):
+            payload = event
+        event_type = str(event.get("type") or "")
+        if event_type.endswith("deleted") or payload.get("currentState") == "DELETED":
+            self.discard(workflow_id)
+            return True
+        changes: Dict[str, Any] = {}
+        for key, field in _EVENT_FIELDS:
+            value = payload.get(key)
+            if isinstance(value, str) and field not in changes:
+                changes[field] = value
+        if changes and self._update(workflow_id, changes):
+            return True
+        self.mark_stale(workflow_id)
+        return False
+
+    def attach(self, realtime: "Realtime") -> Callable[[], None]:
+        """Keep the index updated from a realtime connection.
+
+        Returns:
+            Function that detaches the index again
+        """
+
+        def listener(event: "RealtimeEvent") -> None:
+            self.apply_event(event)
+
+        return realtime.on_event(listener)
+
+    def sync(self, workflow_ids: Optional[Iterable[str]] = None) -> int:
+        """Refresh stale workflows (or the given ones) from the API.
+
+        Indexed workflows apply the audit-log entries recorded since their last
+        sync (or since the snapshot was built): updates are merged into the
+        indexed item, deletions remove it. Workflows the index doesn't know yet
+        are fetched once.
+
+        Returns:
+            Number of workflows refreshed
+
+        Raises:
+            KadoaHttpError: If a request fails; unsynced workflows stay stale
+        """
+        with self._lock:
+            if workflow_ids is None:
+                pending = list(self._stale)
+                self._stale.clear()
+            else:
+                pending = list(dict.fromkeys(workflow_ids))
+        for position, workflow_id in enumerate(pending):
+            try:
+                if workflow_id in self._items:
+                    self._sync_from_audit_log(workflow_id)
+                else:
+                    self._sync_from_api(workflow_id)
+            except Exception:
+                for remaining in pending[position:]:
+                    self.mark_stale(remaining)
+                raise
+        return len(pending)
+
+    def _sync_from_api(self, workflow_id: str) -> None:
+        try:
+            data = self._workflows._get_raw(workflow_id)
+        except KadoaHttpError as error:
+            if error.code == KadoaErrorCode.NOT_FOUND:
+                self.discard(workflow_id)
+                return
+            raise
+        if data.get("state") == "DELETED":
+            self.discard(workflow_id)
+            return
+        item = self._build_item(
+            {key: value for key, value in data.items() if key in self._api_fields}
+        )
+        with self._lock:
+            self._audit_cursors[workflow_id] = datetime.now(timezone.utc)
+            self._put(item)
+
+    def _sync_from_audit_log(self, workflow_id: str) -> None:
+        since = self._audit_cursors.get(workflow_id) or self._built_at
+        entries: List[Tuple[datetime, Dict[str, Any]]] = []
+        page = 1
+        while True:
+            response = self._workflows._audit_log_raw(workflow_id, page, AUDIT_PAGE_SIZE)
+            log_entries = response.get("logEntries") or []
+            # Entries are listed newest first: stop at the first one already applied
+            reached_cursor = False
+            for entry in log_entries:
+                created_at = _parse_time(entry.get("createdAt"))
+                if created_at is None:
+                    continue
+                if since is not None and created_at <= since:
+                    reached_cursor = True
+                    continue
+                entries.append((created_at, entry))
+            total_pages = (response.get("pagination") or {}).get("totalPages") or page
+            if reached_cursor or not log_entries or page >= total_pages:
+                break
+            page += 1
+
+        entries.sort(key=lambda pair: pair[0])
+        for created_at, entry in entries:
+            if entry.get("operationType") == "DELETE":
+                self.discard(workflow_id)
+                return
+            new_value = entry.get("newValue")
+            if isinstance(new_value, Mapping):
+                changes = {
+                    key: value
+                    for key, value in new_value.items()
+                    if key in self._api_fields and key != "id"
+                }
+                if changes and not self._merge(workflow_id, changes):
+                    # The entry doesn't fit the workflow model: fetch the workflow instead
+                    self._sync_from_api(workflow_id)
+                    return
+        if entries:
+            with self._lock:
+                self._audit_cursors[workflow_id] = entries[-1][0]
+                item = self._items.get(workflow_id)
+                if item is not None:
+                    self._put(item)
+
+    def __enter__(self) -> "WorkflowIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+__all__ = ["INDEXED_FIELDS", "WorkflowIndex"]
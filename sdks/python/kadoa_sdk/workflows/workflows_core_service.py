@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import time
+from collections.abc import AsyncGenerator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 from uuid import UUID
 
@@ -15,8 +21,13 @@ from kadoa_sdk.core.utils import PollingOptions, poll_until
 if TYPE_CHECKING:  # pragma: no cover
     from kadoa_sdk.client import KadoaClient
 
+    from .workflow_index import WorkflowIndex
+
 from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
 from kadoa_sdk.core.http import get_workflows_api
+from kadoa_sdk.core.json_codec import get_json_decoder
+from kadoa_sdk.core.operations import operation
+from kadoa_sdk.core.pagination import aiter_windows, iter_windows
 from kadoa_sdk.extraction.types import RunWorkflowOptions
 from openapi_client.models.create_schema_body_fields_inner import CreateSchemaBodyFieldsInner
 from openapi_client.models.location import Location
@@ -74,6 +85,127 @@ class CreateWorkflowResult(BaseModel):
     id: str
 
 
+class WorkflowStatus:
+    """Status fields of a workflow, as returned by ``get_status``.
+
+    Built straight from the decoded response, without validating the rest of
+    the workflow document (schema, configuration, monitoring, ...). The
+    document is kept, so a wait loop can turn its last poll into the full
+    workflow with ``to_workflow()`` instead of fetching it again.
+    """
+
+    _FIELDS = ("id", "state", "run_state", "display_state", "job_id", "started_at", "finished_at")
+    __slots__ = (*_FIELDS, "_document")
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        state: Optional[str] = None,
+        run_state: Optional[str] = None,
+        display_state: Optional[str] = None,
+        job_id: Optional[str] = None,
+        started_at: Optional[str] = None,
+        finished_at: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.state = state
+        self.run_state = run_state
+        self.display_state = display_state
+        self.job_id = job_id
+        self.started_at = started_at
+        self.finished_at = finished_at
+        self._document: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowStatus":
+        """Pick the status fields out of a workflow document (API field names)."""
+        get = data.get
+        status = cls(
+            get("id"),
+            get("state"),
+            get("runState"),
+            get("displayState"),
+            get("jobId"),
+            get("startedAt"),
+            get("finishedAt"),
+        )
+        status._document = data
+        return status
+
+    def to_workflow(self) -> GetWorkflowResponse:
+        """Validate the polled workflow document into a ``GetWorkflowResponse``.
+
+        Raises:
+            KadoaSdkError: If the status wasn't built from a workflow document
+                (``from_dict``) or the document doesn't validate
+        """
+        if self._document is None:
+            raise KadoaSdkError(
+                "WorkflowStatus holds no workflow document",
+                code=KadoaErrorCode.INTERNAL_ERROR,
+                details={"workflowId": self.id},
+            )
+        try:
+            workflow: GetWorkflowResponse = GetWorkflowResponse.model_validate(self._document)
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error, message="Failed to get workflow", details={"workflowId": self.id}
+            )
+        return workflow
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WorkflowStatus):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self._FIELDS)
+
+    def __repr__(self) -> str:
+        return (
+            f"WorkflowStatus(id={self.id!r}, state={self.state!r}, "
+            f"run_state={self.run_state!r}, job_id={self.job_id!r})"
+        )
+
+
+class JobStatus:
+    """State of one job, as returned by ``get_job_statuses``.
+
+    ``error`` is set (and ``state`` is None) when the job's status could not
+    be fetched, including when the batch deadline passed first.
+    """
+
+    __slots__ = ("workflow_id", "job_id", "state", "started_at", "finished_at", "error")
+
+    def __init__(
+        self,
+        workflow_id: str,
+        job_id: str,
+        state: Optional[str] = None,
+        started_at: Optional[str] = None,
+        finished_at: Optional[str] = None,
+        error: Optional[KadoaSdkError] = None,
+    ) -> None:
+        self.workflow_id = workflow_id
+        self.job_id = job_id
+        self.state = state
+        self.started_at = started_at
+        self.finished_at = finished_at
+        self.error = error
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.state is not None and self.state.upper() in TERMINAL_JOB_STATES
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JobStatus):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (
+            f"JobStatus(workflow_id={self.workflow_id!r}, job_id={self.job_id!r}, "
+            f"state={self.state!r}, error={self.error!r})"
+        )
+
+
 TERMINAL_JOB_STATES = {
     "FINISHED",
     "FAILED",
@@ -92,6 +224,41 @@ TERMINAL_RUN_STATES = {
 
 debug = logger.debug
 DEFAULT_AGENTIC_PROMPT = "extract all the data for the main entity of this page"
+DEFAULT_LIST_PAGE_SIZE = 100
+DEFAULT_JOB_STATUS_CONCURRENCY = 8
+DEFAULT_JOB_STATUS_DEADLINE_MS = 30_000
+
+# Workflow run states from the listing that map to a job state without loss.
+# Failed runs are fetched per job to tell FAILED from NOT_SUPPORTED and
+# FAILED_INSUFFICIENT_FUNDS.
+_LISTED_RUN_STATE_TO_JOB_STATE = {"RUNNING": "IN_PROGRESS", "FINISHED": "FINISHED"}
+
+
+def _workflow_builder(project: Optional[Iterable[str]]) -> Callable[[Dict[str, Any]], Any]:
+    """Turn raw listing items into workflow responses, optionally projected."""
+    if project is None:
+        validate: Callable[[Dict[str, Any]], Any] = WorkflowListItemResponse.model_validate
+        return validate
+
+    # Accept field names (run_state) and API names (runState)
+    keys: Dict[str, Tuple[str, str]] = {}
+    for name, field in WorkflowListItemResponse.model_fields.items():
+        keys[name] = keys[field.alias or name] = (name, field.alias or name)
+    requested = list(project)
+    unknown = [name for name in requested if name not in keys]
+    if unknown:
+        raise KadoaSdkError(
+            f"Unknown workflow fields: {', '.join(unknown)}",
+            code=KadoaErrorCode.VALIDATION_ERROR,
+            details={"project": requested},
+        )
+    selected = tuple(dict.fromkeys(keys[name] for name in requested))
+    construct = WorkflowListItemResponse.model_construct
+
+    def build(item: Dict[str, Any]) -> Any:
+        return construct(**{name: item.get(key) for name, key in selected})
+
+    return build
 
 
 class WorkflowsCoreService:
@@ -104,6 +271,8 @@ class WorkflowsCoreService:
         """
         self.client = client
         self._workflows_api: Optional[WorkflowsApi] = None
+        # Local workflow index kept up to date by this service (see build_index)
+        self.index: Optional["WorkflowIndex"] = None
 
     @property
     def workflows_api(self) -> WorkflowsApi:
@@ -131,6 +300,7 @@ class WorkflowsCoreService:
                 "additional_data must be JSON-serializable", code=KadoaErrorCode.VALIDATION_ERROR
             )
 
+    @operation("create_workflow")
     def create(self, input: CreateWorkflowInput) -> CreateWorkflowResult:
         """
         Create a new workflow.
@@ -269,13 +439,11 @@ class WorkflowsCoreService:
                 raise KadoaSdkError(
                     KadoaSdkError.ERROR_MESSAGES["NO_WORKFLOW_ID"],
                     code=KadoaErrorCode.INTERNAL_ERROR,
-                    details={
-                        "response": response.model_dump()
-                        if hasattr(response, "model_dump")
-                        else response
-                    },
+                    details={"response": response},
                 )
 
+            if self.index is not None:
+                self.index.mark_stale(workflow_id)
             return CreateWorkflowResult(id=workflow_id)
 
         except KadoaSdkError:
@@ -287,6 +455,7 @@ class WorkflowsCoreService:
                 details={"urls": input.urls},
             )
 
+    @operation("get_workflow")
     def get(self, workflow_id: str) -> GetWorkflowResponse:
         """
         Get workflow details by ID.
@@ -301,23 +470,10 @@ class WorkflowsCoreService:
             KadoaHttpError: If workflow not found or request fails
         """
         try:
-            response = self.workflows_api.v4_workflows_workflow_id_get_without_preload_content(
-                workflow_id=workflow_id
+            workflow: GetWorkflowResponse = GetWorkflowResponse.model_validate(
+                self._get_raw(workflow_id)
             )
-            try:
-                raw = response.read()
-                response_data = json.loads(raw) if raw else {}
-            finally:
-                response.release_conn()
-            if response.status != 200:
-                raise KadoaHttpError(
-                    "Failed to get workflow",
-                    http_status=response.status,
-                    response_body=response_data,
-                    code=KadoaHttpError.map_status_to_code(response.status),
-                    details={"workflowId": workflow_id},
-                )
-            return GetWorkflowResponse.model_validate(response_data)
+            return workflow
         except Exception as error:
             raise KadoaHttpError.wrap(
                 error,
@@ -325,6 +481,60 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("get_workflow_status")
+    def get_status(self, workflow_id: str) -> WorkflowStatus:
+        """
+        Get the status fields of a workflow.
+
+        A lightweight alternative to ``get`` for polling: only state, run state,
+        display state, job id and run timestamps are read from the response,
+        and the full workflow document is not validated.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            WorkflowStatus with the current status fields
+
+        Raises:
+            KadoaHttpError: If workflow not found or request fails
+
+        Example:
+            ```python
+            status = client.workflow.get_status(workflow_id)
+            if status.run_state == "RUNNING":
+                print(f"job {status.job_id} running since {status.started_at}")
+            ```
+        """
+        try:
+            return WorkflowStatus.from_dict(self._get_raw(workflow_id))
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error,
+                message="Failed to get workflow status",
+                details={"workflowId": workflow_id},
+            )
+
+    def _get_raw(self, workflow_id: str) -> Dict[str, Any]:
+        response = self.workflows_api.v4_workflows_workflow_id_get_without_preload_content(
+            workflow_id=workflow_id
+        )
+        try:
+            raw = response.read()
+            response_data = get_json_decoder()(raw) if raw else {}
+        finally:
+            response.release_conn()
+        if response.status != 200:
+            raise KadoaHttpError(
+                "Failed to get workflow",
+                http_status=response.status,
+                response_body=response_data,
+                code=KadoaHttpError.map_status_to_code(response.status),
+                details={"workflowId": workflow_id},
+            )
+        return response_data
+
+    @operation("list_workflows")
     def list(
         self,
         filters: Optional[ListWorkflowsRequest] = None,
@@ -346,20 +556,7 @@ class WorkflowsCoreService:
             if filters is not None:
                 filter_dict = filters.model_dump(exclude_none=True, by_alias=True)
 
-            response = self.workflows_api.v4_workflows_get_without_preload_content(**filter_dict)
-            try:
-                raw = response.read()
-                response_data = json.loads(raw) if raw else {}
-            finally:
-                response.release_conn()
-            if response.status != 200:
-                raise KadoaHttpError(
-                    "Failed to list workflows",
-                    http_status=response.status,
-                    response_body=response_data,
-                    code=KadoaHttpError.map_status_to_code(response.status),
-                    details={"filters": filter_dict},
-                )
+            response_data = self._list_raw(filter_dict)
             workflows = response_data.get("workflows", [])
             if not workflows:
                 return []
@@ -373,6 +570,140 @@ class WorkflowsCoreService:
                 details={"filters": filter_dict if "filter_dict" in locals() else {}},
             )
 
+    def _list_raw(self, filter_dict: Dict[str, Any]) -> Dict[str, Any]:
+        response = self.workflows_api.v4_workflows_get_without_preload_content(**filter_dict)
+        try:
+            raw = response.read()
+            response_data = json.loads(raw) if raw else {}
+        finally:
+            response.release_conn()
+        if response.status != 200:
+            raise KadoaHttpError(
+                "Failed to list workflows",
+                http_status=response.status,
+                response_body=response_data,
+                code=KadoaHttpError.map_status_to_code(response.status),
+                details={"filters": filter_dict},
+            )
+        return response_data
+
+    @operation("list_workflows")
+    def _list_window(
+        self, filter_dict: Dict[str, Any], skip: int, limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        window = {**filter_dict, "skip": skip, "limit": limit}
+        try:
+            response_data = self._list_raw(window)
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error, message="Failed to list workflows", details={"filters": window}
+            )
+        pagination = response_data.get("pagination") or {}
+        return response_data.get("workflows") or [], pagination.get("totalCount")
+
+    def _iter_setup(
+        self,
+        filters: Optional[ListWorkflowsRequest],
+        page_size: Optional[int],
+        project: Optional[Iterable[str]],
+    ) -> Tuple[Callable[[int, int], Any], int, int, Callable[[Dict[str, Any]], Any]]:
+        filter_dict: Dict[str, Any] = {}
+        if filters is not None:
+            filter_dict = filters.model_dump(exclude_none=True, by_alias=True)
+        start = filter_dict.pop("skip", 0)
+        limit = page_size or filter_dict.pop("limit", None) or DEFAULT_LIST_PAGE_SIZE
+        filter_dict.pop("limit", None)  # page_size given
+        fetch_window = functools.partial(self._list_window, filter_dict)
+        return fetch_window, start, limit, _workflow_builder(project)
+
+    def iter_all(
+        self,
+        filters: Optional[ListWorkflowsRequest] = None,
+        *,
+        page_size: Optional[int] = None,
+        prefetch: int = 4,
+        project: Optional[Iterable[str]] = None,
+    ) -> Iterator[WorkflowListItemResponse]:
+        """
+        Iterate over all workflows matching the filters, across all pages.
+
+        Walks ``skip``/``limit`` windows of the listing. Once the first window
+        reports the total count, up to ``prefetch`` further windows are fetched
+        concurrently while earlier ones are consumed; items are yielded in
+        listing order. Workflows created or deleted during the walk can shift
+        window boundaries, as with manual paging.
+
+        Args:
+            filters: Optional filters; ``skip`` is the starting offset and
+                ``limit`` the window size unless ``page_size`` is given
+            page_size: Workflows per request (default: 100)
+            prefetch: Windows requested concurrently (1 fetches sequentially)
+            project: Only build these fields (e.g. ``("id", "state",
+                "run_state")``; API names like ``runState`` work too). Items
+                are then constructed without validation and hold the values as
+                returned by the API, which is much cheaper for large inventories.
+
+        Yields:
+            Workflow responses
+
+        Raises:
+            KadoaHttpError: If a request fails
+            KadoaSdkError: If ``project`` names an unknown field
+
+        Example:
+            ```python
+            for workflow in client.workflow.iter_all(project=("id", "state")):
+                print(workflow.id, workflow.state)
+            ```
+        """
+        fetch_window, start, limit, build = self._iter_setup(filters, page_size, project)
+        for window in iter_windows(fetch_window, start=start, page_size=limit, prefetch=prefetch):
+            for item in window:
+                yield build(item)
+
+    async def iter_all_async(
+        self,
+        filters: Optional[ListWorkflowsRequest] = None,
+        *,
+        page_size: Optional[int] = None,
+        prefetch: int = 4,
+        project: Optional[Iterable[str]] = None,
+    ) -> AsyncGenerator[WorkflowListItemResponse, None]:
+        """
+        Async variant of ``iter_all``; requests run in worker threads.
+
+        Example:
+            ```python
+            async for workflow in client.workflow.iter_all_async(
+                ListWorkflowsRequest(state="ACTIVE"), project=("id",)
+            ):
+                ids.append(workflow.id)
+            ```
+        """
+        fetch_window, start, limit, build = self._iter_setup(filters, page_size, project)
+        async for window in aiter_windows(
+            fetch_window, start=start, page_size=limit, prefetch=prefetch
+        ):
+            for item in window:
+                yield build(item)
+
+    def list_all(
+        self,
+        filters: Optional[ListWorkflowsRequest] = None,
+        *,
+        page_size: Optional[int] = None,
+        prefetch: int = 4,
+        project: Optional[Iterable[str]] = None,
+    ) -> List[WorkflowListItemResponse]:
+        """
+        List all workflows matching the filters (see ``iter_all``).
+
+        Returns:
+            List of workflow responses across all pages
+        """
+        return list(self.iter_all(filters, page_size=page_size, prefetch=prefetch, project=project))
+
+    @operation("get_workflow_audit_log")
     def get_audit_log(
         self,
         workflow_id: str,
@@ -409,10 +740,93 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("get_workflow_audit_log")
+    def _audit_log_raw(self, workflow_id: str, page: int, limit: int) -> Dict[str, Any]:
+        details = {"workflowId": workflow_id, "page": page}
+        try:
+            api = self.workflows_api
+            response = api.v5_workflows_workflow_id_auditlog_get_without_preload_content(
+                workflow_id=workflow_id, page=page, limit=limit
+            )
+            try:
+                raw = response.read()
+                response_data = json.loads(raw) if raw else {}
+            finally:
+                response.release_conn()
+            if response.status != 200:
+                raise KadoaHttpError(
+                    "Failed to get workflow audit log",
+                    http_status=response.status,
+                    response_body=response_data,
+                    code=KadoaHttpError.map_status_to_code(response.status),
+                    details=details,
+                )
+            return response_data
+        except Exception as error:
+            raise KadoaHttpError.wrap(
+                error, message="Failed to get workflow audit log", details=details
+            )
+
+    def build_index(
+        self,
+        filters: Optional[ListWorkflowsRequest] = None,
+        *,
+        path: Optional[str] = None,
+        project: Optional[Iterable[str]] = None,
+        prefetch: int = 4,
+    ) -> "WorkflowIndex":
+        """
+        Build a local workflow index and keep it attached to this service.
+
+        While attached, ``get_by_name`` answers exact name matches from the
+        index; create/update/pause/resume calls mark the affected workflows
+        stale and delete removes them. ``index.attach(realtime)`` applies state
+        changes from realtime events and ``index.sync()`` refreshes stale
+        workflows from their audit log. With ``path`` the snapshot is loaded
+        from and written through to sqlite; a loaded snapshot is as fresh as
+        its last update.
+
+        Args:
+            filters: Optional listing filters; only matching workflows are indexed
+            path: Optional sqlite database to persist the snapshot in
+            project: Extra fields to keep besides the indexed ones (default: all)
+            prefetch: Listing windows fetched concurrently
+
+        Returns:
+            The attached WorkflowIndex
+
+        Raises:
+            KadoaHttpError: If listing fails
+
+        Example:
+            ```python
+            index = client.workflow.build_index(path="workflows.sqlite3")
+            index.attach(await client.connect_realtime())
+            active = index.find(tag="prices", state="ACTIVE")
+            index.sync()
+            ```
+        """
+        from .workflow_index import WorkflowIndex
+
+        index = WorkflowIndex(self, path=path, project=project)
+        try:
+            index.build(filters, prefetch=prefetch)
+        except Exception:
+            index.close()
+            raise
+        if self.index is not None:
+            self.index.close()
+        self.index = index
+        return index
+
     def get_by_name(self, name: str) -> Optional[WorkflowListItemResponse]:
         """
         Get workflow by name.
 
+        Searches all result pages for an exact name match; without one, the
+        first search result is returned. With an index attached (see
+        ``build_index``) exact matches are answered locally.
+
         Args:
             name: Workflow name to search for
 
@@ -422,9 +836,20 @@ class WorkflowsCoreService:
         Raises:
             KadoaHttpError: If request fails
         """
-        workflows = self.list(filters=ListWorkflowsRequest(search=name))
-        return workflows[0] if workflows else None
-
+        if self.index is not None:
+            indexed = self.index.get_by_name(name)
+            if indexed is not None:
+                return indexed
+        first: Optional[WorkflowListItemResponse] = None
+        for workflow in self.iter_all(ListWorkflowsRequest(search=name), prefetch=1):
+            if getattr(workflow, "name", None) == name:
+                return workflow
+            if first is None:
+                first = workflow
+        # No exact match: keep returning the best search hit
+        return first
+
+    @operation("update_workflow")
     def update(
         self,
         workflow_id: str,
@@ -454,6 +879,8 @@ class WorkflowsCoreService:
                 workflow_id=workflow_id,
                 v4_workflows_workflow_id_metadata_put_request=input,
             )
+            if self.index is not None:
+                self.index.mark_stale(workflow_id)
             return response
         except Exception as error:
             raise KadoaHttpError.wrap(
@@ -462,6 +889,7 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("delete_workflow")
     def delete(self, workflow_id: str) -> None:
         """
         Delete a workflow by ID.
@@ -474,6 +902,8 @@ class WorkflowsCoreService:
         """
         try:
             self.workflows_api.v4_workflows_workflow_id_delete(workflow_id=workflow_id)
+            if self.index is not None:
+                self.index.discard(workflow_id)
         except Exception as error:
             raise KadoaHttpError.wrap(
                 error,
@@ -481,6 +911,7 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("pause_workflow")
     def pause(self, workflow_id: str) -> None:
         """
         Pause an active workflow.
@@ -493,6 +924,8 @@ class WorkflowsCoreService:
         """
         try:
             self.workflows_api.v4_workflows_workflow_id_pause_put(workflow_id=workflow_id)
+            if self.index is not None:
+                self.index.mark_stale(workflow_id)
         except Exception as error:
             raise KadoaHttpError.wrap(
                 error,
@@ -500,6 +933,7 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("resume_workflow")
     def resume(self, workflow_id: str) -> None:
         """
         Resume a paused workflow.
@@ -512,6 +946,8 @@ class WorkflowsCoreService:
         """
         try:
             self.workflows_api.v4_workflows_workflow_id_resume_put(workflow_id=workflow_id)
+            if self.index is not None:
+                self.index.mark_stale(workflow_id)
         except Exception as error:
             raise KadoaHttpError.wrap(
                 error,
@@ -519,6 +955,7 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("run_workflow")
     def run_workflow(
         self,
         workflow_id: str,
@@ -560,6 +997,7 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id},
             )
 
+    @operation("get_job_status")
     def get_job_status(self, workflow_id: str, job_id: str) -> GetJobResponse:
         """
         Get job status directly without polling workflow details.
@@ -587,6 +1025,171 @@ class WorkflowsCoreService:
                 details={"workflowId": workflow_id, "jobId": job_id},
             )
 
+    @operation("get_job_statuses")
+    def get_job_statuses(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        *,
+        max_concurrency: int = DEFAULT_JOB_STATUS_CONCURRENCY,
+        deadline_ms: Optional[int] = DEFAULT_JOB_STATUS_DEADLINE_MS,
+        use_listing: Optional[bool] = None,
+    ) -> Dict[Tuple[str, str], JobStatus]:
+        """
+        Get the status of many jobs at once.
+
+        Repeated ``(workflow_id, job_id)`` pairs are fetched once. Jobs that are
+        the latest run of their workflow are answered from the workflow listing,
+        which returns a hundred workflows per request; the rest get one request
+        each, at most ``max_concurrency`` at a time. By default the listing is
+        only used while it needs fewer requests than the jobs it may answer.
+
+        Failures don't fail the batch: jobs whose status could not be fetched
+        before ``deadline_ms`` carry the error in ``JobStatus.error``.
+
+        Args:
+            jobs: ``(workflow_id, job_id)`` pairs
+            max_concurrency: Per-job requests in flight at once
+            deadline_ms: Time budget for the whole batch (None: no deadline)
+            use_listing: Force (True) or skip (False) the listing
+
+        Returns:
+            Mapping of ``(workflow_id, job_id)`` to JobStatus, in input order
+
+        Example:
+            ```python
+            statuses = client.workflow.get_job_statuses(
+                [(run.workflow_id, run.job_id) for run in runs], deadline_ms=10_000
+            )
+            running = [key for key, status in statuses.items() if not status.is_terminal]
+            ```
+        """
+        keys = list(dict.fromkeys((str(workflow_id), str(job_id)) for workflow_id, job_id in jobs))
+        deadline = time.monotonic() + deadline_ms / 1000 if deadline_ms is not None else None
+        results: Dict[Tuple[str, str], JobStatus] = {}
+        if keys and use_listing is not False:
+            try:
+                self._job_statuses_from_listing(keys, results, deadline, force=bool(use_listing))
+            except KadoaSdkError as error:
+                debug("Workflow listing failed, fetching job statuses per job: %s", error)
+        remaining = [key for key in keys if key not in results]
+        if remaining:
+            self._job_statuses_per_job(remaining, results, max_concurrency, deadline)
+        return {key: results[key] for key in keys}
+
+    def _job_statuses_from_listing(
+        self,
+        keys: List[Tuple[str, str]],
+        results: Dict[Tuple[str, str], JobStatus],
+        deadline: Optional[float],
+        force: bool,
+    ) -> None:
+        wanted: Dict[str, List[str]] = {}
+        for workflow_id, job_id in keys:
+            wanted.setdefault(workflow_id, []).append(job_id)
+        totals: List[Optional[int]] = []
+
+        def fetch_window(skip: int, limit: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            items, total = self._list_window({}, skip, limit)
+            totals.append(total)
+            return items, total
+
+        windows = iter_windows(fetch_window, page_size=DEFAULT_LIST_PAGE_SIZE, deadline=deadline)
+        try:
+            for index, window in enumerate(windows):
+                for item in window:
+                    job_ids = wanted.get(item.get("id", ""))
+                    state = _LISTED_RUN_STATE_TO_JOB_STATE.get(item.get("runState", ""))
+                    if not job_ids or state is None or item.get("jobId") not in job_ids:
+                        continue
+                    key = (item["id"], item["jobId"])
+                    results[key] = JobStatus(
+                        key[0], key[1], state, item.get("startedAt"), item.get("finishedAt")
+                    )
+                if len(results) == len(keys):
+                    return
+                if index == 0 and not force:
+                    # Keep listing only while it is cheaper than per-job requests
+                    total = totals[0] if totals else None
+                    windows_left = (
+                        -(-(total - len(window)) // DEFAULT_LIST_PAGE_SIZE)
+                        if total is not None
+                        else len(keys)
+                    )
+                    if windows_left >= len(keys) - len(results):
+                        return
+        finally:
+            windows.close()
+
+    def _job_statuses_per_job(
+        self,
+        keys: List[Tuple[str, str]],
+        results: Dict[Tuple[str, str], JobStatus],
+        max_concurrency: int,
+        deadline: Optional[float],
+    ) -> None:
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, max_concurrency), thread_name_prefix="kadoa-jobs"
+        )
+        futures: Dict[Future[JobStatus], Tuple[str, str]] = {}
+        for workflow_id, job_id in keys:
+            fetch = functools.partial(self._fetch_job_status, workflow_id, job_id)
+            futures[executor.submit(copy_context().run, fetch)] = (workflow_id, job_id)
+        try:
+            pending = set(futures)
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = wait_futures(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[futures[future]] = future.result()
+                if not done:
+                    break  # deadline passed
+            for future in pending:
+                workflow_id, job_id = futures[future]
+                results[(workflow_id, job_id)] = JobStatus(
+                    workflow_id,
+                    job_id,
+                    error=KadoaSdkError(
+                        "Job status not fetched before the batch deadline",
+                        code=KadoaErrorCode.TIMEOUT,
+                        details={"workflowId": workflow_id, "jobId": job_id},
+                    ),
+                )
+        finally:
+            # Don't wait for requests still in flight past the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_job_status(self, workflow_id: str, job_id: str) -> JobStatus:
+        details = {"workflowId": workflow_id, "jobId": job_id}
+        try:
+            api = self.workflows_api
+            response = api.v4_workflows_workflow_id_jobs_job_id_get_without_preload_content(
+                workflow_id=workflow_id, job_id=job_id
+            )
+            try:
+                raw = response.read()
+                data = get_json_decoder()(raw) if raw else {}
+            finally:
+                response.release_conn()
+            if response.status != 200:
+                raise KadoaHttpError(
+                    "Failed to get job status",
+                    http_status=response.status,
+                    response_body=data,
+                    code=KadoaHttpError.map_status_to_code(response.status),
+                    details=details,
+                )
+        except Exception as error:
+            return JobStatus(
+                workflow_id,
+                job_id,
+                error=KadoaHttpError.wrap(
+                    error, message="Failed to get job status", details=details
+                ),
+            )
+        return JobStatus(
+            workflow_id, job_id, data.get("state"), data.get("startedAt"), data.get("finishedAt")
+        )
+
     def wait(
         self,
         workflow_id: str,
@@ -597,6 +1200,8 @@ class WorkflowsCoreService:
         """
         Wait for a workflow to reach the target state or a terminal state.
 
+        Polls ``get_status`` and validates the full workflow from the last poll.
+
         Args:
             workflow_id: Workflow ID
             target_state: Target state to wait for (optional)
@@ -611,33 +1216,24 @@ class WorkflowsCoreService:
         """
         options = PollingOptions(poll_interval_ms=poll_interval_ms, timeout_ms=timeout_ms)
 
-        def poll_fn() -> GetWorkflowResponse:
-            current = self.get(workflow_id)
+        def poll_fn() -> WorkflowStatus:
+            current = self.get_status(workflow_id)
 
-            debug(
-                "workflow %s state: %s",
-                workflow_id,
-                getattr(current, "run_state", None),
-            )
+            debug("workflow %s state: %s", workflow_id, current.run_state)
 
             return current
 
-        def is_complete(current: GetWorkflowResponse) -> bool:
-            if target_state and getattr(current, "state", None) == target_state:
+        def is_complete(current: WorkflowStatus) -> bool:
+            if target_state and current.state == target_state:
                 return True
 
-            run_state = getattr(current, "run_state", None)
-            if (
-                run_state
-                and run_state.upper() in TERMINAL_RUN_STATES
-                and getattr(current, "state", None) != "QUEUED"
-            ):
+            run_state = current.run_state
+            if run_state and run_state.upper() in TERMINAL_RUN_STATES and current.state != "QUEUED":
                 return True
 
             return False
 
-        result = poll_until(poll_fn, is_complete, options)
-        return result.result
+        return poll_until(poll_fn, is_complete, options).result.to_workflow()
 
     def wait_for_job_completion(
         self,
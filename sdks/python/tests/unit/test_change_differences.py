@@ -0,0 +1,90 @@
+import random
+from unittest.mock import Mock
+
+import pytest
+
+import kadoa_sdk.changes.changes_service as changes_module
+from kadoa_sdk.changes import ColumnarDifferences
+
+
+def _diffs(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    diffs = []
+    for index in range(count):
+        row = f"row-{rng.randrange(count // 2 or 1)}"
+        fields = [
+            {"key": key, "value": f"{key}-{index}"}
+            for key in rng.sample(["title", "price", "url", None], rng.randrange(0, 4))
+        ]
+        kind = rng.choice(["added", "removed", "changed"])
+        diff = {"type": kind, "fields": fields}
+        if kind == "added":
+            diff["rowRef"] = {"currentRowId": row}
+        elif kind == "removed":
+            diff["rowRef"] = {"previousRowId": row}
+        else:
+            fields.append({"key": "stock", "value": "1", "previousValue": "0"})
+        diffs.append(diff)
+    return diffs
+
+
+def _as_tuples(differences) -> list:
+    return [
+        (d.type, [(f.key, f.value, f.previous_value) for f in d.fields or []]) for d in differences
+    ]
+
+
+@pytest.mark.unit
+def test_columnar_coalescing_matches_model_coalescing():
+    raw = _diffs(400)
+
+    columns = changes_module._coalesce_columnar(raw)
+    models = changes_module._coalesce_differences(raw)
+
+    assert isinstance(columns, ColumnarDifferences)
+    assert len(columns) == len(models) and len(columns.offsets) == len(models) + 1
+    assert _as_tuples(columns) == _as_tuples(models)
+    assert columns.field_count == sum(len(d.fields or []) for d in models)
+    assert _as_tuples(columns.to_models()) == _as_tuples(models)
+    assert changes_module._coalesce_columnar([]) is None
+
+
+@pytest.mark.unit
+def test_columnar_view_reads_models_and_row_indices():
+    added = Mock(
+        type="added",
+        fields=[Mock(key="name", value="new", previous_value=None)],
+        row_ref=Mock(current_row_id="row-1", previous_row_id=None),
+    )
+    removed = Mock(
+        type="removed",
+        fields=[
+            Mock(key="name", value="old", previous_value=None),
+            Mock(key="sku", value="A1", previous_value=None),
+        ],
+        row_ref=Mock(current_row_id=None, previous_row_id="row-1"),
+    )
+    other = Mock(type="changed", fields=[], row_ref=None)
+
+    columns = changes_module._coalesce_columnar([added, removed, other])
+
+    assert columns.to_dict() == {
+        "row": [0, 0],
+        "type": ["changed", "changed"],
+        "key": ["name", "sku"],
+        "value": ["new", None],
+        "previous_value": ["old", "A1"],
+    }
+    assert columns[-1].type == "changed" and columns[-1].fields is None
+    assert [d.type for d in columns[0:1]] == ["changed"]
+    with pytest.raises(IndexError):
+        columns[2]
+
+
+@pytest.mark.unit
+def test_map_change_columnar_leaves_models_unset():
+    change = changes_module._map_change({"id": "c1", "differences": _diffs(10)}, columnar=True)
+
+    assert change.differences is None
+    assert change.difference_columns is not None
+    assert "difference_columns" not in change.model_dump()
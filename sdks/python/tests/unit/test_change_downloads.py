@@ -0,0 +1,151 @@
+import threading
+from typing import Dict, List, Optional
+
+import pytest
+
+import kadoa_sdk.changes.changes_service as changes_module
+from kadoa_sdk.changes import Change, ChangesService
+from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError
+
+
+class StreamResponse:
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        self.body = body
+        self.status = status
+        self.released = False
+
+    def stream(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self.body[:amt]
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+def _csv(change_id: str) -> bytes:
+    return "".join(f"{change_id},row {index},9.99\n" for index in range(200)).encode()
+
+
+class FakeDownloadsApi:
+    def __init__(self, honor_range: bool = True) -> None:
+        self.honor_range = honor_range
+        self.requests: List[Dict[str, object]] = []
+        self.responses: List[StreamResponse] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.gate = threading.Barrier(1)
+        self._lock = threading.Lock()
+
+    def _respond(self, body: bytes, headers: Optional[Dict[str, str]]) -> StreamResponse:
+        status = 200
+        if headers and self.honor_range:
+            offset = int(headers["Range"][len("bytes=") : -1])
+            body, status = body[offset:], 206
+        response = StreamResponse(body, status)
+        self.responses.append(response)
+        return response
+
+    def v5_notifications_workflows_workflow_id_changes_change_id_csv_get_without_preload_content(
+        self, workflow_id, change_id, _headers=None, **params
+    ):
+        with self._lock:
+            self.requests.append({"change_id": change_id, "headers": _headers, **params})
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            self.gate.wait(timeout=1)
+        except threading.BrokenBarrierError:
+            pass
+        with self._lock:
+            self.in_flight -= 1
+        if change_id == "gone":
+            return StreamResponse(b'{"error": "The change set is no longer retrievable"}', 409)
+        return self._respond(_csv(change_id), _headers)
+
+    def v4_changes_files_encoded_path_get_without_preload_content(
+        self, encoded_path, _headers=None
+    ):
+        self.requests.append({"encoded_path": encoded_path, "headers": _headers})
+        return self._respond(b"%PDF-1.7 " + encoded_path.encode() * 100, _headers)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = FakeDownloadsApi()
+    monkeypatch.setattr(changes_module, "get_notifications_api", lambda _client: api)
+    monkeypatch.setattr(changes_module, "get_workflows_api", lambda _client: api)
+    return api
+
+
+@pytest.fixture
+def service():
+    return ChangesService(object())
+
+
+@pytest.mark.unit
+def test_iter_csv_streams_chunks_and_reports_errors(api, service):
+    chunks = list(service.iter_csv("wf-1", "c1", expires="123", sig="abc", chunk_size=1000))
+
+    assert b"".join(chunks) == _csv("c1")
+    assert max(len(chunk) for chunk in chunks) == 1000
+    assert api.requests[0] == {"change_id": "c1", "headers": None, "expires": "123", "sig": "abc"}
+    assert api.responses[0].released
+
+    with pytest.raises(KadoaHttpError) as raised:
+        next(service.iter_csv("wf-1", "gone"))
+    assert raised.value.http_status == 409
+    assert raised.value.code == KadoaErrorCode.VALIDATION_ERROR
+    assert raised.value.response_body == {"error": "The change set is no longer retrievable"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("honor_range", [True, False])
+def test_download_csv_resumes_partial_files(api, service, tmp_path, honor_range):
+    api.honor_range = honor_range
+    target = tmp_path / "c1.csv"
+    (tmp_path / "c1.csv.part").write_bytes(_csv("c1")[:1234])
+
+    download = service.download_csv("wf-1", "c1", target, chunk_size=512)
+
+    assert target.read_bytes() == _csv("c1")
+    assert not (tmp_path / "c1.csv.part").exists()
+    assert api.requests[0]["headers"] == {"Range": "bytes=1234-"}
+    assert download.resumed is honor_range
+    assert download.size == len(_csv("c1")) and download.path == target
+
+
+@pytest.mark.unit
+def test_download_csvs_runs_in_parallel_and_keeps_failures_per_change(api, service, tmp_path):
+    api.gate = threading.Barrier(2)
+    changes = [
+        Change(id="c1", workflow_id="wf-1"),
+        ("wf-2", "c2"),
+        ("wf-1", "gone"),
+        Change(id="c1", workflow_id="wf-1"),
+    ]
+
+    downloads = service.download_csvs(changes, tmp_path / "out", max_concurrency=2)
+
+    assert [(d.workflow_id, d.change_id) for d in downloads] == [
+        ("wf-1", "c1"),
+        ("wf-2", "c2"),
+        ("wf-1", "gone"),
+    ]
+    assert (tmp_path / "out" / "wf-2_c2.csv").read_bytes() == _csv("c2")
+    assert downloads[0].error is None and downloads[0].path.name == "wf-1_c1.csv"
+    assert isinstance(downloads[2].error, KadoaHttpError) and downloads[2].path is None
+    assert api.max_in_flight == 2
+
+
+@pytest.mark.unit
+def test_download_file_accepts_change_file_urls(api, service, tmp_path):
+    url = "https://api.kadoa.com/v4/changes/files/cGF0aC9maWxlLnBkZg%3D%3D?download=1"
+
+    path = service.download_file(url, tmp_path / "change.pdf")
+
+    assert api.requests[0] == {"encoded_path": "cGF0aC9maWxlLnBkZg==", "headers": None}
+    assert path.read_bytes().startswith(b"%PDF-1.7 cGF0aC9maWxlLnBkZg==")
+    assert b"".join(service.iter_file("cGF0aC9maWxlLnBkZg==")) == path.read_bytes()
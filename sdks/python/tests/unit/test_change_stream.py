@@ -0,0 +1,185 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+import kadoa_sdk.changes.changes_service as changes_module
+from kadoa_sdk.changes import ChangesService, FileCheckpointStore, MemoryCheckpointStore
+from kadoa_sdk.core.exceptions import KadoaHttpError
+from tests.utils.raw_response import RawResponse
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+NOW = datetime.now(timezone.utc)
+
+
+class FakeChangesApi:
+    def __init__(self) -> None:
+        self.changes: List[Dict[str, Any]] = []
+        self.calls: List[Dict[str, Any]] = []
+        self.failure: Optional[RawResponse] = None
+
+    def add(self, change_id: str, created_at: datetime, **extra: Any) -> None:
+        self.changes.append(
+            {
+                "id": change_id,
+                "workflowId": "wf-1",
+                "createdAt": _iso(created_at),
+                "differences": [
+                    {
+                        "type": "added",
+                        "fields": [{"key": "price", "value": "2"}],
+                        "rowRef": {"currentRowId": f"row-{change_id}"},
+                    },
+                    {
+                        "type": "removed",
+                        "fields": [{"key": "price", "value": "1"}],
+                        "rowRef": {"previousRowId": f"row-{change_id}"},
+                    },
+                ],
+                **extra,
+            }
+        )
+
+    def _list(self, version: str, params: Dict[str, Any]) -> RawResponse:
+        self.calls.append({"version": version, **params})
+        if self.failure is not None:
+            return self.failure
+        start, end = params.get("start_date"), params["end_date"]
+        matches = [
+            change
+            for change in sorted(self.changes, key=lambda c: c["createdAt"], reverse=True)
+            if (start is None or _parse(change["createdAt"]) >= _parse(start))
+            and _parse(change["createdAt"]) <= _parse(end)
+        ]
+        window = matches[params["skip"] : params["skip"] + params["limit"]]
+        return RawResponse({"changes": window, "pagination": {"totalCount": len(matches)}})
+
+    def v5_changes_get_without_preload_content(self, **params):
+        return self._list("v5", params)
+
+    def v4_changes_get_without_preload_content(self, **params):
+        return self._list("v4", params)
+
+
+class FakeRealtime:
+    def __init__(self) -> None:
+        self.listener: Optional[Any] = None
+        self.filters: Dict[str, Any] = {}
+
+    def on_event(self, listener, *, types=None, workflow_ids=None):
+        self.listener = listener
+        self.filters = {"types": types, "workflow_ids": workflow_ids}
+
+        def unsubscribe() -> None:
+            self.listener = None
+
+        return unsubscribe
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = FakeChangesApi()
+    monkeypatch.setattr(changes_module, "get_workflows_api", lambda _client: api)
+    return api
+
+
+@pytest.mark.unit
+def test_stream_pages_lazily_and_resumes_from_checkpoint(api):
+    for index in range(5):
+        api.add(f"c{index}", NOW - timedelta(hours=5 - index))
+    store = MemoryCheckpointStore()
+    service = ChangesService(Mock())
+
+    stream = service.stream(["wf-1"], checkpoint=store, page_size=2)
+    first = next(stream)
+    assert first.id == "c4" and first.workflow_id == "wf-1"
+    assert first.differences[0].type == "changed"
+    assert first.differences[0].fields[0].previous_value == "1"
+    assert len(api.calls) <= 3
+    assert [change.id for change in stream] == ["c3", "c2", "c1", "c0"]
+    assert api.calls[0]["version"] == "v5" and api.calls[0]["workflow_ids"] == "wf-1"
+    assert "start_date" not in api.calls[0]
+    watermark = store.load("wf-1")
+    assert watermark is not None
+
+    api.add("c5", _parse(watermark) + timedelta(milliseconds=1))
+    api.calls.clear()
+    resumed = list(service.stream(["wf-1"], checkpoint=store))
+
+    assert [change.id for change in resumed] == ["c5"]
+    assert _parse(api.calls[0]["start_date"]) == _parse(watermark) - timedelta(seconds=5)
+
+
+@pytest.mark.unit
+def test_stream_reports_http_errors_with_non_json_bodies(api):
+    api.failure = RawResponse(b"<html>Service Unavailable</html>", status=503)
+
+    with pytest.raises(KadoaHttpError) as raised:
+        next(ChangesService(Mock()).stream(["wf-1"]))
+
+    assert raised.value.http_status == 503
+    assert raised.value.response_body == "<html>Service Unavailable</html>"
+
+
+@pytest.mark.unit
+def test_stream_since_exclude_and_file_checkpoint(api, tmp_path):
+    api.add("old", NOW - timedelta(days=2))
+    api.add("new", NOW - timedelta(hours=1))
+    store = FileCheckpointStore(tmp_path / "state" / "changes.json")
+
+    changes = list(
+        ChangesService(Mock()).stream(
+            since=NOW - timedelta(days=1), exclude="data", checkpoint=store
+        )
+    )
+
+    assert [change.id for change in changes] == ["new"]
+    assert api.calls[0]["version"] == "v4" and api.calls[0]["exclude"] == "data"
+    assert FileCheckpointStore(tmp_path / "state" / "changes.json").load("*") is not None
+
+
+@pytest.mark.unit
+def test_pending_changes_are_held_back_until_their_data_is_stored(api):
+    api.add("ready", NOW - timedelta(minutes=2))
+    api.add("pending", NOW - timedelta(minutes=1), dataPending=True)
+    api.add("stale-pending", NOW - timedelta(hours=1), dataPending=True)
+    store = MemoryCheckpointStore()
+    service = ChangesService(Mock())
+
+    assert [c.id for c in service.stream(checkpoint=store)] == ["ready", "stale-pending"]
+    assert store.load("*") == _iso(NOW - timedelta(minutes=1))
+
+    api.changes[1]["dataPending"] = False
+    assert [c.id for c in service.stream(checkpoint=store)] == ["pending"]
+
+
+@pytest.mark.unit
+def test_follow_tails_changes_on_realtime_events(api):
+    api.add("c0", NOW - timedelta(minutes=10))
+    realtime = FakeRealtime()
+
+    stream = ChangesService(Mock()).stream(
+        ["wf-1", "wf-2"], follow=True, realtime=realtime, poll_interval_ms=5_000
+    )
+    assert next(stream).id == "c0"
+    assert realtime.filters == {
+        "types": ("workflow_data_change",),
+        "workflow_ids": ["wf-1", "wf-2"],
+    }
+
+    api.add("c1", datetime.now(timezone.utc))
+    realtime.listener({"type": "workflow_data_change", "message": {"workflowId": "wf-1"}})
+    assert next(stream).id == "c1"
+    assert len(api.calls) == 2
+
+    stream.close()
+    assert realtime.listener is None
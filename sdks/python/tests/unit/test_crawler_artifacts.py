@@ -0,0 +1,134 @@
+import io
+import threading
+import zipfile
+from typing import Dict, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from kadoa_sdk.core.exceptions import KadoaHttpError, KadoaSdkError
+from kadoa_sdk.crawler import ArtifactDownload, CrawlerSessionService
+
+
+class StreamResponse:
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        self.body = body
+        self.status = status
+        self.released = False
+
+    def stream(self, chunk_size: int):
+        for offset in range(0, len(self.body), chunk_size):
+            yield self.body[offset : offset + chunk_size]
+
+    def read(self, amount: Optional[int] = None) -> bytes:
+        return self.body[:amount]
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+class FakeFilesApi:
+    def __init__(self, files: Dict[str, bytes]) -> None:
+        self.files = files
+        self.bulk_calls: List[List[str]] = []
+        self.single_calls: List[str] = []
+        self.failing_batches = 0
+        self.flatten = False
+        self.lock = threading.Lock()
+
+    def v4_files_bulk_download_post_without_preload_content(
+        self, v4_files_bulk_download_post_request
+    ):
+        names = list(v4_files_bulk_download_post_request.files)
+        with self.lock:
+            self.bulk_calls.append(names)
+            if self.failing_batches:
+                self.failing_batches -= 1
+                return StreamResponse(b'{"message": "storage unavailable"}', 500)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name in names:
+                if name in self.files and not name.startswith("lost"):
+                    member = name.rsplit("/", 1)[-1] if self.flatten else name
+                    archive.writestr(member, self.files[name])
+        return StreamResponse(buffer.getvalue())
+
+    def v4_files_file_name_get_without_preload_content(self, file_name, _headers=None):
+        with self.lock:
+            self.single_calls.append(file_name)
+        if file_name not in self.files:
+            return StreamResponse(b'{"message": "File not found"}', 404)
+        return StreamResponse(self.files[file_name])
+
+
+def _service(api: FakeFilesApi) -> CrawlerSessionService:
+    service = CrawlerSessionService(Mock())
+    service._files_api = api
+    return service
+
+
+FILES = {
+    f"session-1/page-{index}.{kind}": f"{kind} {index}".encode() * 100
+    for index in range(5)
+    for kind in ("html", "png")
+}
+
+
+@pytest.mark.unit
+def test_download_artifacts_batches_extracts_and_filters(tmp_path):
+    api = FakeFilesApi({**FILES, "lost.png": b"single"})
+    api.flatten = True
+    names = list(FILES) + ["lost.png"]
+
+    downloads = _service(api).download_artifacts(
+        names,
+        tmp_path,
+        batch_size=4,
+        members=lambda name: name.endswith(".png"),
+        chunk_size=256,
+    )
+
+    assert sorted(len(batch) for batch in api.bulk_calls) == [3, 4, 4]
+    assert [d.name for d in downloads] == [n for n in names if n.endswith(".png")]
+    assert all(isinstance(d, ArtifactDownload) and d.error is None for d in downloads)
+    assert api.single_calls == ["lost.png"]
+    assert (tmp_path / "lost.png").read_bytes() == b"single"
+    assert not downloads[-1].bulk and downloads[0].bulk
+    for download in downloads[:-1]:
+        assert download.path == (tmp_path / download.name).resolve()
+        assert download.path.read_bytes() == FILES[download.name]
+    assert not (tmp_path / "session-1" / "page-0.html").exists()
+    assert not list(tmp_path.glob(".kadoa-bulk-*"))
+
+
+@pytest.mark.unit
+def test_failed_bulk_requests_fall_back_to_single_downloads(tmp_path):
+    api = FakeFilesApi(FILES)
+    api.failing_batches = 1
+    names = list(FILES)[:3] + ["missing.html", "../escape.html"]
+
+    downloads = _service(api).download_artifacts(names, tmp_path, batch_size=10)
+
+    assert sorted(api.single_calls) == sorted(list(FILES)[:3] + ["missing.html"])
+    by_name = {download.name: download for download in downloads}
+    assert by_name[names[0]].path.read_bytes() == FILES[names[0]]
+    assert isinstance(by_name["missing.html"].error, KadoaHttpError)
+    assert by_name["missing.html"].error.http_status == 404
+    assert by_name["../escape.html"].error.code == "VALIDATION_ERROR"
+    assert not (tmp_path.parent / "escape.html").exists()
+
+
+@pytest.mark.unit
+def test_without_fallback_bulk_failures_are_reported_per_file(tmp_path):
+    api = FakeFilesApi(FILES)
+    api.failing_batches = 1
+    names = list(FILES)[:2] + ["lost.png"]
+
+    failed = _service(api).download_artifacts(names, tmp_path, fallback=False)
+    assert api.single_calls == []
+    assert [d.error.http_status for d in failed] == [500, 500, 500]
+
+    downloads = _service(api).download_artifacts(names, tmp_path, fallback=False)
+    assert [d.error is None for d in downloads] == [True, True, False]
+    assert isinstance(downloads[-1].error, KadoaSdkError)
+    assert downloads[-1].error.code == "NOT_FOUND"
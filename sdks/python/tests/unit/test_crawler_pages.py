@@ -0,0 +1,87 @@
+import threading
+import time
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from kadoa_sdk.core.exceptions import KadoaSdkError
+from kadoa_sdk.crawler import CrawlerSessionService
+
+
+class FakeCrawlerApi:
+    def __init__(self, pages: int, pending: int = 0) -> None:
+        self.pages = [
+            SimpleNamespace(
+                id=f"p{index}",
+                url=f"https://example.com/{index}",
+                status="PENDING" if index >= pages - pending else "DONE",
+            )
+            for index in range(pages)
+        ]
+        self.listing_calls: List[int] = []
+        self.content_calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def v4_crawl_session_id_pages_get(self, session_id, current_page, page_size):
+        self.listing_calls.append(current_page)
+        start = (current_page - 1) * page_size
+        return SimpleNamespace(
+            payload=self.pages[start : start + page_size],
+            pagination=SimpleNamespace(total_items=float(len(self.pages))),
+        )
+
+    def v4_crawl_session_id_pages_page_id_get(self, session_id, page_id, format):
+        with self._lock:
+            self.content_calls.append(page_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            index = int(page_id[1:])
+            # Earlier pages are slower, so completion order differs from crawl order
+            time.sleep(0.004 if index % 4 == 0 else 0.0005)
+            if page_id == "p5":
+                raise RuntimeError("connection reset")
+            return SimpleNamespace(pageId=page_id, pageFormat=format, payload=f"# {page_id}")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _service(api: FakeCrawlerApi) -> CrawlerSessionService:
+    service = CrawlerSessionService(SimpleNamespace())
+    service._crawler_api = api
+    return service
+
+
+@pytest.mark.unit
+def test_iter_pages_fetches_contents_concurrently_in_crawl_order():
+    api = FakeCrawlerApi(pages=45, pending=3)
+
+    pages = list(_service(api).iter_pages("s-1", format="markdown", concurrency=3, page_size=10))
+
+    assert [page.index for page in pages] == list(range(42))
+    assert pages[0].content.payload == "# p0" and pages[0].content.pageFormat == "markdown"
+    assert pages[7].url == "https://example.com/7" and pages[7].status == "DONE"
+    assert isinstance(pages[5].error, KadoaSdkError) and pages[5].content is None
+    assert sorted(api.listing_calls) == [1, 2, 3, 4, 5]
+    assert api.max_in_flight == 3
+
+
+@pytest.mark.unit
+def test_iter_pages_as_completed_restart_and_all_statuses():
+    api = FakeCrawlerApi(pages=30, pending=2)
+
+    pages = list(
+        _service(api).iter_pages(
+            "s-1", ordered=False, start=13, statuses=None, concurrency=4, page_size=10
+        )
+    )
+
+    assert sorted(page.index for page in pages) == list(range(13, 30))
+    assert [page.index for page in pages] != list(range(13, 30))
+    assert pages[-1].status in ("DONE", "PENDING")
+    assert sorted(api.listing_calls) == [2, 3]
+    assert "p12" not in api.content_calls
@@ -0,0 +1,187 @@
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from kadoa_sdk.core.exceptions import KadoaSdkError
+from kadoa_sdk.crawler import CrawlerSessionService, CrawlProgress
+from kadoa_sdk.crawler.crawler_session_tracker import _RateEstimator
+
+
+class FakeCrawlerApi:
+    def __init__(self, statuses: Dict[str, List[Dict[str, Any]]]) -> None:
+        self.statuses = statuses
+        self.status_calls: List[str] = []
+        self.listing_calls = 0
+        self.listed: Dict[str, Dict[str, Any]] = {}
+
+    def v4_crawl_session_id_status_get(self, session_id):
+        self.status_calls.append(session_id)
+        queue = self.statuses[session_id]
+        payload = queue.pop(0) if len(queue) > 1 else queue[0]
+        return SimpleNamespace(session_id=session_id, payload=payload, error=None)
+
+    def v4_crawl_sessions_get(self, page=None, page_size=None, user_id=None):
+        self.listing_calls += 1
+        items = [
+            SimpleNamespace(
+                session_id=session_id,
+                crawled_pages=stats["crawledPages"],
+                active_jobs=stats.get("activeJobs"),
+                waiting_jobs=stats.get("waitingJobs"),
+                finished=stats.get("finished", False),
+            )
+            for session_id, stats in self.listed.items()
+        ]
+        return SimpleNamespace(data=items)
+
+
+class FakeRealtime:
+    def __init__(self) -> None:
+        self.listeners: List[Any] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    def on_event(self, listener):
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def emit(self, session_id: str) -> None:
+        for listener in list(self.listeners):
+            listener({"type": "crawl_progress", "message": {"sessionId": session_id}})
+
+
+def _service(api: FakeCrawlerApi, realtime: Any = None) -> CrawlerSessionService:
+    service = CrawlerSessionService(Mock(realtime=realtime))
+    service._crawler_api = api
+    return service
+
+
+@pytest.mark.unit
+def test_wait_polls_until_finished_and_reports_progress():
+    api = FakeCrawlerApi(
+        {
+            "s1": [
+                {"crawledPages": 10, "activeJobs": 2, "waitingJobs": 30},
+                {"crawledPages": 10, "activeJobs": 2, "waitingJobs": 30},
+                {"crawledPages": 25, "activeJobs": 2, "waitingJobs": 10},
+                {"crawledPages": 40, "activeJobs": 0, "waitingJobs": 0, "finished": True},
+            ]
+        }
+    )
+    samples: List[CrawlProgress] = []
+
+    progress = _service(api).wait(
+        "s1", on_progress=samples.append, min_interval_ms=1, max_interval_ms=5
+    )
+
+    assert progress.finished and progress.crawled_pages == 40 and progress.eta_seconds == 0
+    assert [sample.crawled_pages for sample in samples] == [10, 10, 25, 40]
+    assert samples[0].pages_per_sec is None
+    assert samples[2].pages_per_sec > 0 and samples[2].eta_seconds > 0
+    assert api.status_calls == ["s1"] * 4
+
+
+@pytest.mark.unit
+def test_wait_times_out():
+    api = FakeCrawlerApi({"s1": [{"crawledPages": 1}]})
+
+    with pytest.raises(KadoaSdkError) as raised:
+        _service(api).wait("s1", timeout_ms=20, min_interval_ms=5, max_interval_ms=5)
+
+    assert raised.value.code == "TIMEOUT"
+    assert raised.value.details["pending"] == ["s1"]
+
+
+@pytest.mark.unit
+def test_rate_eta_and_trend():
+    estimator = _RateEstimator(0.0)
+    samples = [(0, 0), (10, 100), (20, 200), (30, 300), (40, 600), (50, 620), (60, 630)]
+    trends = []
+    for at, pages in samples:
+        progress = CrawlProgress("s1", crawled_pages=pages, waiting_jobs=500)
+        estimator.update(float(at), progress)
+        trends.append(progress.trend)
+
+    assert trends[:4] == [None, "steady", "steady", "steady"]
+    assert trends[4] == "accelerating" and trends[-1] == "slowing"
+    assert progress.eta_seconds == pytest.approx(500 / progress.pages_per_sec)
+
+    stalled = CrawlProgress("s1", crawled_pages=630)
+    estimator.update(200.0, stalled)
+    assert stalled.trend == "stalled"
+
+
+@pytest.mark.unit
+def test_tracker_multiplexes_sessions_through_the_listing():
+    api = FakeCrawlerApi({"s3": [{"crawledPages": 5}, {"crawledPages": 7, "finished": True}]})
+    api.listed = {"s1": {"crawledPages": 3}, "s2": {"crawledPages": 8}}
+    rounds = []
+
+    def on_progress(progress: CrawlProgress) -> None:
+        rounds.append(progress.session_id)
+        if len(rounds) == 3:
+            api.listed = {
+                "s1": {"crawledPages": 9, "finished": True},
+                "s2": {"crawledPages": 8, "finished": True},
+            }
+
+    tracker = _service(api).track(
+        ["s1", "s2", "s3"], on_progress=on_progress, min_interval_ms=1, max_interval_ms=5
+    )
+    results = tracker.wait()
+
+    assert sorted(results) == ["s1", "s2", "s3"]
+    assert all(progress.finished for progress in results.values())
+    assert api.listing_calls == 2
+    assert api.status_calls == ["s3", "s3"]
+    assert tracker.progress("s1").crawled_pages == 9
+
+
+@pytest.mark.unit
+def test_realtime_events_wake_the_poller():
+    api = FakeCrawlerApi({"s1": [{"crawledPages": 1}, {"crawledPages": 2, "finished": True}]})
+    realtime = FakeRealtime()
+    service = _service(api, realtime)
+    timer = threading.Timer(0.05, realtime.emit, args=("s1",))
+    timer.start()
+
+    started = time.monotonic()
+    progress = service.wait("s1", min_interval_ms=10_000)
+
+    assert progress.finished and time.monotonic() - started < 5
+    assert realtime.listeners == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_wait_async_with_realtime_wake():
+    api = FakeCrawlerApi({"s1": [{"crawledPages": 1}, {"crawledPages": 2, "finished": True}]})
+    realtime = FakeRealtime()
+    service = _service(api, realtime)
+    api.statuses["s2"] = [{"crawledPages": 0}]
+    timer = threading.Timer(0.05, realtime.emit, args=("s2",))
+    timer.start()
+    threading.Timer(0.1, realtime.emit, args=("s1",)).start()
+
+    started = time.monotonic()
+    progress = await service.wait_async("s1", min_interval_ms=10_000)
+
+    assert progress.crawled_pages == 2 and time.monotonic() - started < 5
+    assert api.status_calls == ["s1", "s1"]
+
+
+@pytest.mark.unit
+def test_wait_ends_when_the_status_reports_an_error_without_payload():
+    api = FakeCrawlerApi({})
+    api.v4_crawl_session_id_status_get = lambda session_id: SimpleNamespace(
+        session_id=session_id, payload=None, error="Session not found"
+    )
+
+    progress = _service(api).wait("s1", timeout_ms=1_000, min_interval_ms=1, max_interval_ms=5)
+
+    assert progress.finished and progress.error == "Session not found"
@@ -0,0 +1,102 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError
+from kadoa_sdk.core.pagination import PageInfo
+from kadoa_sdk.extraction.services import data_fetcher_service
+from kadoa_sdk.extraction.services.data_fetcher_service import DataFetcherService
+from kadoa_sdk.extraction.types import FetchDataOptions
+
+
+class FakeRawResponse:
+    def __init__(self, status: int, payload: object) -> None:
+        self.status = status
+        self.data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.released = False
+
+    def read(self, amt=None) -> bytes:
+        return self.data[:amt]
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+def _page(page: int, total_pages: int, rows: int = 2) -> dict:
+    return {
+        "workflowId": "wf-1",
+        "runId": "run-1",
+        "executedAt": "2024-01-01T00:00:00Z",
+        "data": [{"id": f"{page}-{index}", "price": index} for index in range(rows)],
+        "pagination": {"totalCount": total_pages * rows, "page": page, "totalPages": total_pages},
+    }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = Mock()
+    monkeypatch.setattr(data_fetcher_service, "get_workflows_api", lambda client: api)
+    return api
+
+
+@pytest.mark.unit
+def test_fetch_data_without_validation_parses_raw_page(api):
+    response = FakeRawResponse(200, _page(1, 3))
+    api.v4_workflows_workflow_id_data_get_without_preload_content.return_value = response
+
+    result = DataFetcherService(Mock()).fetch_data(
+        FetchDataOptions(workflow_id="wf-1", limit=2, sort_by="price"), validate=False
+    )
+
+    api.v4_workflows_workflow_id_data_get.assert_not_called()
+    kwargs = api.v4_workflows_workflow_id_data_get_without_preload_content.call_args.kwargs
+    assert kwargs["page"] == 1 and kwargs["limit"] == 2 and kwargs["sort_by"] == "price"
+    assert response.released
+    assert result.data == [{"id": "1-0", "price": 0}, {"id": "1-1", "price": 1}]
+    assert result.run_id == "run-1"
+    assert result.executed_at == "2024-01-01T00:00:00Z"
+    assert result.pagination == PageInfo(total_count=6, page=1, total_pages=3)
+
+
+@pytest.mark.unit
+def test_fetch_all_data_without_validation_follows_pages(api):
+    api.v4_workflows_workflow_id_data_get_without_preload_content.side_effect = [
+        FakeRawResponse(200, _page(page, 3)) for page in (1, 2, 3)
+    ]
+
+    rows = DataFetcherService(Mock()).fetch_all_data(
+        FetchDataOptions(workflow_id="wf-1", filters="x"), validate=False
+    )
+
+    assert [row["id"] for row in rows] == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    calls = api.v4_workflows_workflow_id_data_get_without_preload_content.call_args_list
+    assert [call.kwargs["page"] for call in calls] == [1, 2, 3]
+    assert all(call.kwargs["filters"] == "x" for call in calls)
+
+
+@pytest.mark.unit
+def test_fetch_data_without_validation_raises_http_error(api):
+    api.v4_workflows_workflow_id_data_get_without_preload_content.return_value = FakeRawResponse(
+        404, {"error": True, "message": "Workflow not found"}
+    )
+
+    with pytest.raises(KadoaHttpError) as raised:
+        DataFetcherService(Mock()).fetch_data(FetchDataOptions(workflow_id="wf-1"), validate=False)
+
+    assert raised.value.http_status == 404
+    assert raised.value.code == KadoaErrorCode.NOT_FOUND
+    assert raised.value.response_body == {"error": True, "message": "Workflow not found"}
+
+
+@pytest.mark.unit
+def test_fetch_data_without_validation_tolerates_non_json_error_bodies(api):
+    response = FakeRawResponse(502, b"<html>Bad Gateway</html>")
+    api.v4_workflows_workflow_id_data_get_without_preload_content.return_value = response
+
+    with pytest.raises(KadoaHttpError) as raised:
+        DataFetcherService(Mock()).fetch_data(FetchDataOptions(workflow_id="wf-1"), validate=False)
+
+    assert raised.value.http_status == 502
+    assert raised.value.response_body == "<html>Bad Gateway</html>"
+    assert response.released
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from kadoa_sdk.core.events import KadoaEvent, KadoaEventEmitter
+
+
+@pytest.mark.unit
+def test_lazy_events_skip_validation_until_requested():
+    received: list[KadoaEvent] = []
+    emitter = KadoaEventEmitter(validate_events=False)
+    emitter.on_event(received.append)
+
+    emitter.emit("extraction:started", {"workflowId": "wf-1", "name": "n", "urls": []})
+
+    event = received[0]
+    assert isinstance(event, KadoaEvent)
+    assert event.type == "extraction:started"
+    assert event.payload["workflowId"] == "wf-1"
+    assert isinstance(event.timestamp, datetime)
+    assert event.validated().type == "extraction:started"
+
+
+@pytest.mark.unit
+def test_lazy_event_validation_reports_invalid_events():
+    event = KadoaEvent.construct_lazy("not-an-event", {})  # type: ignore[arg-type]
+
+    with pytest.raises(ValidationError):
+        event.validated()
+
+
+@pytest.mark.unit
+def test_emit_skips_event_construction_without_matching_listeners(monkeypatch):
+    built: list[str] = []
+    original = KadoaEventEmitter._build_event
+
+    def counting_build(self, event_name, *args):
+        built.append(event_name)
+        return original(self, event_name, *args)
+
+    monkeypatch.setattr(KadoaEventEmitter, "_build_event", counting_build)
+    emitter = KadoaEventEmitter()
+    received: list[KadoaEvent] = []
+    emitter.on_event(received.append, event_names=["extraction:completed"])
+
+    emitter.emit("realtime:error", {"message": "ignored"})
+    emitter.emit("extraction:completed", {"workflowId": "wf-1", "success": True})
+
+    assert built == ["extraction:completed"]
+    assert [event.type for event in received] == ["extraction:completed"]
+    assert emitter.has_listeners("extraction:completed")
+    assert not emitter.has_listeners("realtime:error")
+
+
+@pytest.mark.unit
+def test_subscription_changes_during_dispatch_apply_to_next_emit():
+    emitter = KadoaEventEmitter(validate_events=False)
+    calls: list[str] = []
+
+    def late(event: KadoaEvent) -> None:
+        calls.append("late")
+
+    def first(event: KadoaEvent) -> None:
+        calls.append("first")
+        emitter.on_event(late)
+        unsubscribe_second()
+
+    def second(event: KadoaEvent) -> None:
+        calls.append("second")
+
+    emitter.on_event(first)
+    unsubscribe_second = emitter.on_event(second)
+
+    emitter.emit("realtime:error", {"message": "1"})
+    assert calls == ["first", "second"]
+
+    calls.clear()
+    emitter.off_event(first)
+    emitter.emit("realtime:error", {"message": "2"})
+    assert calls == ["late"]
+
+
+@pytest.mark.unit
+def test_once_listener_fires_once_and_errors_do_not_stop_dispatch():
+    emitter = KadoaEventEmitter(validate_events=False)
+    received: list[str] = []
+
+    def failing(event: KadoaEvent) -> None:
+        raise RuntimeError("boom")
+
+    emitter.on_event(failing)
+    emitter.once_event(lambda event: received.append(event.type), ["realtime:error"])
+
+    emitter.emit("realtime:error", {"message": "1"})
+    emitter.emit("realtime:error", {"message": "2"})
+
+    assert received == ["realtime:error"]
+    assert emitter._named_listeners == {}
+    emitter.remove_all_event_listeners()
+    assert not emitter.has_listeners()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_emit_async_awaits_async_listeners():
+    emitter = KadoaEventEmitter(validate_events=False)
+    received: list[str] = []
+
+    async def slow(event: KadoaEvent) -> None:
+        await asyncio.sleep(0)
+        received.append("async")
+
+    async def failing(event: KadoaEvent) -> None:
+        raise RuntimeError("boom")
+
+    emitter.on_event(slow)
+    emitter.on_event(failing)
+    emitter.on_event(lambda event: received.append("sync"))
+
+    await emitter.emit_async("realtime:error", {"message": "x"})
+
+    assert sorted(received) == ["async", "sync"]
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+
+
+class CountingResponse(BaseModel):
+    workflow_id: str = ""
+    dumps: int = 0
+
+    def model_dump(self, **kwargs):
+        object.__setattr__(self, "dumps", self.dumps + 1)
+        return super().model_dump(**kwargs)
+
+
+@pytest.mark.unit
+def test_details_are_materialized_on_first_access():
+    response = CountingResponse()
+    error = KadoaSdkError("no id", details={"response": response, "workflowId": "wf-1"})
+    wrapped = KadoaHttpError.wrap(error, message="create failed")
+
+    assert wrapped is error
+    assert response.dumps == 0
+
+    assert error.details == {"response": {"workflow_id": "", "dumps": 1}, "workflowId": "wf-1"}
+    error.to_json()
+    error.to_detailed_string()
+    assert response.dumps == 1
+
+
+@pytest.mark.unit
+def test_details_factory_is_called_once():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"attempt": 3}
+
+    error = KadoaHttpError("rate limited", http_status=429, details=build)
+    assert calls == []
+    assert error.to_json()["details"] == {"attempt": 3}
+    assert error.details == {"attempt": 3}
+    assert calls == [1]
+
+    error.details = {"attempt": 4}
+    assert error.details == {"attempt": 4}
+
+
+@pytest.mark.unit
+def test_errors_keep_attributes_in_slots_and_pickle():
+    error = KadoaHttpError(
+        "missing",
+        http_status=404,
+        endpoint="/v4/workflows/wf-1",
+        method="GET",
+        code=KadoaErrorCode.NOT_FOUND,
+        details={"workflowId": "wf-1"},
+    )
+    assert not getattr(error, "__dict__", None)
+
+    restored = pickle.loads(pickle.dumps(error))
+    assert str(restored) == "missing"
+    assert restored.code == KadoaErrorCode.NOT_FOUND
+    assert restored.http_status == 404
+    assert restored.details == {"workflowId": "wf-1"}
+    assert restored.to_json() == error.to_json()
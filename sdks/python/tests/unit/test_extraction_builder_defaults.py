@@ -56,7 +56,7 @@ def test_builder_defaults_to_agentic_navigation_with_default_prompt():
 @pytest.mark.unit
 def test_builder_run_waits_up_to_thirty_minutes(monkeypatch):
     builder = builder_module.ExtractionBuilderService(Mock())
-    builder._get_workflow_status = Mock(return_value=SimpleNamespace(run_state="FINISHED"))
+    builder._poll_workflow_status = Mock(return_value=SimpleNamespace(run_state="FINISHED"))
     captured_options = None
 
     def capture_polling_options(_poll_fn, _is_complete, options):
@@ -242,7 +242,7 @@ def test_builder_run_reuses_existing_started_job():
             )
         ).create()
 
-        builder._get_workflow_status = Mock(
+        builder._poll_workflow_status = Mock(
             return_value=SimpleNamespace(job_id="job-existing", run_state="RUNNING")
         )
         builder._run_workflow = Mock(return_value="job-new")
@@ -284,7 +284,7 @@ def test_builder_submit_reuses_existing_started_job():
             )
         ).create()
 
-        builder._get_workflow_status = Mock(
+        builder._poll_workflow_status = Mock(
             return_value=SimpleNamespace(job_id="job-existing", run_state="RUNNING")
         )
         builder._run_workflow = Mock(return_value="job-new")
@@ -0,0 +1,140 @@
+import asyncio
+import gzip
+from types import SimpleNamespace
+
+import pytest
+
+from kadoa_sdk.core.exceptions import KadoaHttpError
+from kadoa_sdk.core.hooks import HookPipeline, HttpHook, HttpRequest, HttpResponse
+from kadoa_sdk.core.instrumentation import ApiClientInstrumentationMixin
+from tests.unit.test_metrics import FakeGeneratedApiClient, FakeRestResponse
+
+
+class HeaderRecordingClient(FakeGeneratedApiClient):
+    def call_api(self, method, url, header_params=None, body=None, post_params=None, **kwargs):
+        self.sent = (method, url, header_params, body)
+        return super().call_api(method, url, header_params, body, post_params, **kwargs)
+
+
+class HookedFake(ApiClientInstrumentationMixin, HeaderRecordingClient):
+    def __init__(self, hooks: HookPipeline) -> None:
+        super().__init__()
+        self.hooks = hooks
+
+
+class Recorder(HttpHook):
+    def __init__(self, name: str, calls: list) -> None:
+        self.name = name
+        self.calls = calls
+
+    def before_request(self, request):
+        self.calls.append(f"{self.name}.before")
+        request.headers[f"x-{self.name}"] = "1"
+
+    def after_response(self, request, response):
+        self.calls.append(f"{self.name}.after:{response.status}")
+
+    def on_error(self, request, error):
+        self.calls.append(f"{self.name}.error:{type(error).__name__}")
+
+
+@pytest.mark.unit
+def test_hooks_run_in_onion_order_and_can_modify_the_request():
+    calls: list = []
+    hooks = HookPipeline()
+    hooks.add(Recorder("outer", calls))
+    hooks.add(Recorder("inner", calls))
+    api_client = HookedFake(hooks)
+
+    api_client.request("GET", "/v4/workflows")
+    assert calls == ["outer.before", "inner.before", "inner.after:200", "outer.after:200"]
+    assert api_client.sent[2] == {"x-outer": "1", "x-inner": "1"}
+
+    calls.clear()
+    api_client.next_response = FakeRestResponse(404, b"{}")
+    with pytest.raises(KadoaHttpError):
+        api_client.request("GET", "/v4/workflows")
+    assert calls[2:] == [
+        "inner.after:404",
+        "outer.after:404",
+        "inner.error:KadoaHttpError",
+        "outer.error:KadoaHttpError",
+    ]
+
+    calls.clear()
+    api_client.next_response = TimeoutError("read timed out")
+    with pytest.raises(TimeoutError):
+        api_client.request("GET", "/v4/workflows")
+    assert calls[2:] == ["inner.error:TimeoutError", "outer.error:TimeoutError"]
+
+
+@pytest.mark.unit
+def test_async_hooks_run_on_the_sync_transport_and_can_rewrite_responses():
+    class Gunzip(HttpHook):
+        async def after_response(self, request, response):
+            await asyncio.sleep(0)
+            response.data = gzip.decompress(response.data)
+
+    hooks = HookPipeline()
+    remove = hooks.add(Gunzip())
+    api_client = HookedFake(hooks)
+    api_client.next_response = FakeRestResponse(200, gzip.compress(b'{"ok":true}'))
+
+    assert api_client.request("GET", "/v4/changes") == b'{"ok":true}'
+
+    remove()
+    assert not hooks
+    api_client.next_response = FakeRestResponse(200, gzip.compress(b'{"ok":true}'))
+    assert api_client.request("GET", "/v4/changes") == gzip.compress(b'{"ok":true}')
+
+
+@pytest.mark.unit
+def test_hooks_run_for_responses_returned_unread():
+    calls: list = []
+    hooks = HookPipeline()
+    hooks.add(Recorder("hook", calls))
+    hooks.add(
+        SimpleNamespace(
+            after_response=lambda request, response: setattr(
+                response, "data", response.data and response.data.upper()
+            )
+        )
+    )
+    api_client = HookedFake(hooks)
+
+    api_client.next_response = FakeRestResponse(200, b'{"ok":true}')
+    response = api_client.request_without_preload_content("GET", "/v4/changes")
+    assert response.read() == b'{"OK":TRUE}'
+    response.release_conn()
+    assert calls == ["hook.before", "hook.after:200"]
+
+    calls.clear()
+    api_client.next_response = FakeRestResponse(500, b"upstream failure")
+    response = api_client.request_without_preload_content("GET", "/v4/changes")
+    assert response.read(8) == b"upstream"
+    response.release_conn()
+    assert calls == ["hook.before", "hook.after:500", "hook.error:KadoaHttpError"]
+
+
+@pytest.mark.unit
+def test_async_dispatch_awaits_hooks():
+    seen: list = []
+
+    class Hook(HttpHook):
+        async def before_request(self, request):
+            seen.append(request.method)
+
+        def on_error(self, request, error):
+            seen.append(str(error))
+
+    hooks = HookPipeline()
+    hooks.add(Hook())
+    request = HttpRequest("POST", "https://api.test/v4/oauth2/token")
+
+    async def run() -> None:
+        await hooks.abefore_request(request)
+        await hooks.aafter_response(request, HttpResponse(200, {}, b"{}"))
+        await hooks.aon_error(request, RuntimeError("boom"))
+
+    asyncio.run(run())
+    assert seen == ["POST", "boom"]
@@ -0,0 +1,187 @@
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError
+from kadoa_sdk.workflows import JobStatus, WorkflowsCoreService
+from tests.utils.raw_response import RawResponse
+
+
+class FakeJobsApi:
+    """Workflows wf-0..wf-N whose latest job is job-<n>-latest."""
+
+    def __init__(self, workflows: int, run_states: Optional[Dict[str, str]] = None) -> None:
+        self.workflows = [
+            {
+                "id": f"wf-{index}",
+                "jobId": f"job-{index}-latest",
+                "runState": (run_states or {}).get(f"wf-{index}", "FINISHED"),
+                "finishedAt": "2024-01-01T00:00:00Z",
+            }
+            for index in range(workflows)
+        ]
+        self.list_calls: List[int] = []
+        self.job_calls: List[Tuple[str, str]] = []
+        self.list_status = 200
+        self.list_gate: Optional[threading.Event] = None
+        self.job_gate: Optional[threading.Event] = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def v4_workflows_get_without_preload_content(self, skip, limit):
+        self.list_calls.append(skip)
+        if self.list_gate is not None and skip > 0:
+            self.list_gate.wait(5)
+        if self.list_status != 200:
+            return RawResponse({"error": "unavailable"}, status=self.list_status)
+        return RawResponse(
+            {
+                "workflows": self.workflows[skip : skip + limit],
+                "pagination": {"totalCount": len(self.workflows)},
+            }
+        )
+
+    def v4_workflows_workflow_id_jobs_job_id_get_without_preload_content(self, workflow_id, job_id):
+        with self._lock:
+            self.job_calls.append((workflow_id, job_id))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.job_gate is not None:
+                self.job_gate.wait(5)
+            if job_id == "missing":
+                return RawResponse({"error": "Job not found"}, status=404)
+            state = "FAILED_INSUFFICIENT_FUNDS" if job_id.endswith("latest") else "FINISHED"
+            return RawResponse({"id": job_id, "workflowId": workflow_id, "state": state})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def install(monkeypatch):
+    def install(api):
+        monkeypatch.setattr(WorkflowsCoreService, "workflows_api", property(lambda _self: api))
+        return WorkflowsCoreService(Mock())
+
+    return install
+
+
+@pytest.mark.unit
+def test_listing_answers_latest_jobs_and_the_rest_is_fetched_per_job(install):
+    api = FakeJobsApi(workflows=250, run_states={"wf-1": "RUNNING", "wf-2": "FAILED"})
+    service = install(api)
+
+    statuses = service.get_job_statuses(
+        [
+            ("wf-1", "job-1-latest"),
+            ("wf-0", "job-0-latest"),
+            ("wf-1", "job-1-latest"),
+            ("wf-2", "job-2-latest"),
+            ("wf-0", "job-0-older"),
+        ],
+        use_listing=True,
+    )
+
+    assert list(statuses) == [
+        ("wf-1", "job-1-latest"),
+        ("wf-0", "job-0-latest"),
+        ("wf-2", "job-2-latest"),
+        ("wf-0", "job-0-older"),
+    ]
+    assert statuses[("wf-1", "job-1-latest")].state == "IN_PROGRESS"
+    assert statuses[("wf-0", "job-0-latest")] == JobStatus(
+        "wf-0", "job-0-latest", "FINISHED", finished_at="2024-01-01T00:00:00Z"
+    )
+    assert statuses[("wf-2", "job-2-latest")].state == "FAILED_INSUFFICIENT_FUNDS"
+    assert statuses[("wf-0", "job-0-older")].is_terminal
+    assert sorted(api.list_calls) == [0, 100, 200]
+    assert sorted(api.job_calls) == [("wf-0", "job-0-older"), ("wf-2", "job-2-latest")]
+
+
+@pytest.mark.unit
+def test_listing_stops_once_every_job_is_answered(install):
+    api = FakeJobsApi(workflows=5_000)
+    api.list_gate = threading.Event()
+
+    try:
+        statuses = install(api).get_job_statuses(
+            [("wf-3", "job-3-latest"), ("wf-9", "job-9-latest")], use_listing=True
+        )
+    finally:
+        api.list_gate.set()
+
+    assert all(status.state == "FINISHED" for status in statuses.values())
+    assert len(api.list_calls) <= 5
+    assert api.job_calls == []
+
+
+@pytest.mark.unit
+def test_deadline_bounds_a_slow_listing_window(install):
+    api = FakeJobsApi(workflows=250)
+    api.list_gate = threading.Event()
+    api.job_gate = threading.Event()
+
+    started = time.monotonic()
+    try:
+        statuses = install(api).get_job_statuses(
+            [("wf-0", "job-0-latest"), ("wf-150", "job-150-latest")],
+            deadline_ms=200,
+            use_listing=True,
+        )
+        elapsed = time.monotonic() - started
+    finally:
+        api.list_gate.set()
+        api.job_gate.set()
+
+    assert elapsed < 2
+    assert statuses[("wf-0", "job-0-latest")].state == "FINISHED"
+    assert statuses[("wf-150", "job-150-latest")].error.code == KadoaErrorCode.TIMEOUT
+
+
+@pytest.mark.unit
+def test_listing_is_skipped_when_per_job_requests_are_cheaper(install):
+    api = FakeJobsApi(workflows=1_000)
+
+    statuses = install(api).get_job_statuses([("wf-500", "job-500-latest"), ("wf-7", "older")])
+
+    assert api.list_calls == [0]
+    assert sorted(api.job_calls) == [("wf-500", "job-500-latest"), ("wf-7", "older")]
+    assert all(status.error is None for status in statuses.values())
+
+
+@pytest.mark.unit
+def test_failures_are_reported_per_job_and_listing_errors_fall_back(install):
+    api = FakeJobsApi(workflows=3)
+    api.list_status = 503
+
+    statuses = install(api).get_job_statuses(
+        [("wf-0", "job-0-older"), ("wf-0", "missing")], use_listing=True
+    )
+
+    assert statuses[("wf-0", "job-0-older")].state == "FINISHED"
+    missing = statuses[("wf-0", "missing")]
+    assert missing.state is None and isinstance(missing.error, KadoaHttpError)
+    assert missing.error.code == KadoaErrorCode.NOT_FOUND
+
+
+@pytest.mark.unit
+def test_deadline_and_concurrency_limit(install):
+    api = FakeJobsApi(workflows=1)
+    api.job_gate = threading.Event()
+    jobs = [("wf-0", f"job-{index}") for index in range(6)]
+
+    try:
+        statuses = install(api).get_job_statuses(
+            jobs, max_concurrency=2, deadline_ms=100, use_listing=False
+        )
+    finally:
+        api.job_gate.set()
+
+    assert api.max_in_flight == 2
+    assert all(status.error.code == KadoaErrorCode.TIMEOUT for status in statuses.values())
+    assert api.list_calls == []
@@ -0,0 +1,87 @@
+import json
+import logging
+
+import pytest
+
+from kadoa_sdk.core import logger as kadoa_logger
+from kadoa_sdk.core.logger import (
+    JsonFormatter,
+    LogfmtFormatter,
+    SamplingFilter,
+    get_log_config,
+    reload_log_config,
+    set_sample_rate,
+)
+
+
+@pytest.fixture
+def restore_log_config():
+    names = ("kadoa", "kadoa.wss", "kadoa.http")
+    levels = {name: logging.getLogger(name).level for name in names}
+    root_handlers = list(logging.root.handlers)
+    root_level = logging.root.level
+    yield
+    get_log_config.cache_clear()
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+    set_sample_rate("wss", None)
+    set_sample_rate("http", None)
+    logging.root.handlers[:] = root_handlers
+    logging.root.setLevel(root_level)
+
+
+def _record(level: int = logging.DEBUG, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("kadoa.wss", level, __file__, 1, "event %s", ("wf-1",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.mark.unit
+def test_log_config_is_parsed_once(monkeypatch, restore_log_config):
+    monkeypatch.setenv("DEBUG", "kadoa:wss,kadoa:http")
+    monkeypatch.setenv("KADOA_LOG_FORMAT", "JSON")
+    monkeypatch.setenv("KADOA_LOG_SAMPLE", "wss=0.25,kadoa:http=2,broken")
+    config = reload_log_config()
+
+    assert config.debug_namespaces == {"wss", "http"}
+    assert config.format == "json"
+    assert config.sample_rates == {"wss": 0.25, "http": 1.0}
+
+    monkeypatch.setattr(kadoa_logger, "_parse_debug_env", lambda: pytest.fail("re-parsed"))
+    kadoa_logger.create_logger("wss")
+    assert get_log_config() is config
+
+
+@pytest.mark.unit
+def test_structured_formatters_include_extra_fields():
+    payload = json.loads(JsonFormatter().format(_record(workflow_id="wf-1")))
+    assert payload["level"] == "debug"
+    assert payload["logger"] == "kadoa.wss"
+    assert payload["msg"] == "event wf-1"
+    assert payload["workflow_id"] == "wf-1"
+
+    line = LogfmtFormatter().format(_record(reason='closed "by" server'))
+    assert "level=debug logger=kadoa.wss" in line
+    assert 'msg="event wf-1"' in line
+    assert 'reason="closed \\"by\\" server"' in line
+
+
+@pytest.mark.unit
+def test_sampling_keeps_one_in_n_and_all_warnings():
+    sampler = SamplingFilter(0.25)
+    kept = [sampler.filter(_record()) for _ in range(8)]
+    assert kept == [True, False, False, False, True, False, False, False]
+    assert all(sampler.filter(_record(logging.WARNING)) for _ in range(3))
+    assert not SamplingFilter(0).filter(_record(logging.INFO))
+
+
+@pytest.mark.unit
+def test_set_sample_rate_replaces_previous_filter(restore_log_config):
+    wss = logging.getLogger("kadoa.wss")
+    set_sample_rate("wss", 0.1)
+    set_sample_rate("wss", 0.5)
+    samplers = [f for f in wss.filters if isinstance(f, SamplingFilter)]
+    assert [s.rate for s in samplers] == [0.5]
+
+    set_sample_rate("wss", None)
+    assert not any(isinstance(f, SamplingFilter) for f in wss.filters)
@@ -0,0 +1,188 @@
+import json
+
+import pytest
+
+from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError
+from kadoa_sdk.core.instrumentation import ApiClientInstrumentationMixin
+from kadoa_sdk.core.metrics import LatencyHistogram, MetricsRegistry
+from kadoa_sdk.core.operations import current_operation, operation
+
+
+class FakeUrllib3Response:
+    def __init__(self, status: int, body: bytes, retries: int) -> None:
+        self.status = status
+        self.body = body
+        self.retries = type("Retry", (), {"history": tuple(range(retries))})()
+        self.released = False
+
+    def read(self, amt=None):
+        data, self.body = (self.body, b"") if amt is None else (self.body[:amt], self.body[amt:])
+        return data
+
+    def release_conn(self):
+        self.released = True
+
+
+class FakeRestResponse:
+    def __init__(self, status: int, data: bytes, retries: int = 0) -> None:
+        self.status = status
+        self.data = data
+        self.response = FakeUrllib3Response(status, data, retries)
+
+
+class FakePoolManager:
+    def urlopen(self, method, url, body=None, **kwargs):
+        return None
+
+
+class FakeGeneratedApiClient:
+    """Mimics the request flow of the generated ApiClient."""
+
+    def __init__(self) -> None:
+        self.next_response: object = FakeRestResponse(200, b"{}")
+        self.rest_client = type("RESTClientObject", (), {"pool_manager": FakePoolManager()})()
+
+    def param_serialize(self, method, resource_path, path_params=None, body=None, **kwargs):
+        url = "https://api.test" + resource_path.format(**(path_params or {}))
+        return method, url, {}, body, []
+
+    def call_api(self, method, url, header_params=None, body=None, post_params=None, **kwargs):
+        if isinstance(self.next_response, Exception):
+            raise self.next_response
+        encoded = json.dumps(body) if body is not None else None
+        self.rest_client.pool_manager.urlopen(method, url, body=encoded)
+        return self.next_response
+
+    def response_deserialize(self, response_data, response_types_map=None):
+        if response_data.status >= 400:
+            raise KadoaHttpError(
+                "failed",
+                http_status=response_data.status,
+                code=KadoaHttpError.map_status_to_code(response_data.status),
+            )
+        return response_data.data
+
+    def request(self, method, resource_path, **kwargs):
+        serialized = self.param_serialize(method=method, resource_path=resource_path, **kwargs)
+        response = self.call_api(*serialized)
+        return self.response_deserialize(response, {})
+
+    def request_without_preload_content(self, method, resource_path, **kwargs):
+        serialized = self.param_serialize(method=method, resource_path=resource_path, **kwargs)
+        return self.call_api(*serialized).response
+
+
+class InstrumentedFake(ApiClientInstrumentationMixin, FakeGeneratedApiClient):
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        super().__init__()
+        self.metrics = metrics
+
+
+@pytest.mark.unit
+def test_histogram_percentiles_stay_within_bucket_precision():
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(500, rel=0.035)
+    assert histogram.percentile(99) == pytest.approx(990, rel=0.035)
+    assert histogram.percentile(100) == pytest.approx(1000)
+    assert histogram.summary().min_ms == 1.0
+
+    histogram.record(10**9)  # clamped instead of growing the histogram
+    assert len(histogram._counts) == LatencyHistogram._BUCKET_COUNT
+
+
+@pytest.mark.unit
+def test_requests_are_attributed_to_the_active_operation():
+    metrics = MetricsRegistry()
+    api_client = InstrumentedFake(metrics)
+
+    class Service:
+        @operation("get_workflow")
+        def get(self) -> bytes:
+            assert current_operation() == "get_workflow"
+            return api_client.request("GET", "/v4/workflows/{id}", path_params={"id": "wf-1"})
+
+    api_client.next_response = FakeRestResponse(200, b'{"id":"wf-1"}', retries=2)
+    Service().get()
+    api_client.next_response = FakeRestResponse(404, b'{"error":"missing"}')
+    with pytest.raises(KadoaHttpError):
+        Service().get()
+    api_client.next_response = FakeRestResponse(201, b"{}")
+    api_client.request("POST", "/v4/workflows", body={"name": "n"})
+
+    snapshot = metrics.snapshot()
+    get_workflow = snapshot.operations["get_workflow"]
+    assert get_workflow.requests == 2
+    assert get_workflow.errors_by_code == {KadoaErrorCode.NOT_FOUND.value: 1}
+    assert get_workflow.status_codes == {200: 1, 404: 1}
+    assert get_workflow.bytes_in == len(b'{"id":"wf-1"}') + len(b'{"error":"missing"}')
+    assert get_workflow.retries == 2
+    assert get_workflow.latency.count == 2
+
+    untagged = snapshot.operations["POST /v4/workflows"]
+    assert untagged.bytes_out == len('{"name": "n"}')
+    assert current_operation() is None
+
+
+@pytest.mark.unit
+def test_requests_without_preload_content_are_recorded_on_release():
+    metrics = MetricsRegistry()
+    api_client = InstrumentedFake(metrics)
+
+    api_client.next_response = FakeRestResponse(200, b'{"data": [1, 2, 3]}', retries=1)
+    response = api_client.request_without_preload_content("GET", "/v4/changes")
+    assert metrics.snapshot().operations == {}
+    try:
+        body = response.read()
+    finally:
+        response.release_conn()
+
+    api_client.next_response = FakeRestResponse(404, b"not json")
+    response = api_client.request_without_preload_content("GET", "/v4/changes")
+    assert response.read(3) == b"not"
+    response.release_conn()
+
+    changes = metrics.snapshot().operations["GET /v4/changes"]
+    assert body == b'{"data": [1, 2, 3]}' and response.released
+    assert changes.requests == 2
+    assert changes.status_codes == {200: 1, 404: 1}
+    assert changes.errors_by_code == {KadoaErrorCode.NOT_FOUND.value: 1}
+    assert changes.bytes_in == len(body) + 3
+    assert changes.retries == 1
+
+
+@pytest.mark.unit
+def test_transport_errors_are_counted_and_disabled_registry_records_nothing():
+    metrics = MetricsRegistry()
+    api_client = InstrumentedFake(metrics)
+    api_client.next_response = TimeoutError("read timed out")
+
+    with pytest.raises(TimeoutError):
+        api_client.request("GET", "/v4/changes")
+
+    operation_metrics = metrics.snapshot().operations["GET /v4/changes"]
+    assert operation_metrics.errors_by_code == {KadoaErrorCode.TIMEOUT.value: 1}
+    assert operation_metrics.status_codes == {}
+
+    disabled = MetricsRegistry(enabled=False)
+    disabled.record("noop", 0.1)
+    assert disabled.snapshot().operations == {}
+
+
+@pytest.mark.unit
+def test_prometheus_text_export():
+    metrics = MetricsRegistry()
+    metrics.record("fetch_data", 0.25, status=200, bytes_in=512)
+    metrics.record("fetch_data", 0.5, status=429, error_code="RATE_LIMITED", retries=1)
+
+    text = metrics.snapshot().to_prometheus()
+
+    assert "# TYPE kadoa_sdk_requests_total counter" in text
+    assert 'kadoa_sdk_requests_total{operation="fetch_data"} 2' in text
+    assert 'kadoa_sdk_errors_total{operation="fetch_data",code="RATE_LIMITED"} 1' in text
+    assert 'kadoa_sdk_responses_total{operation="fetch_data",status="429"} 1' in text
+    assert 'kadoa_sdk_received_bytes_total{operation="fetch_data"} 512' in text
+    assert 'kadoa_sdk_request_duration_seconds_count{operation="fetch_data"} 2' in text
@@ -0,0 +1,141 @@
+import json
+import time
+
+import pytest
+
+from kadoa_sdk.core.instrumentation import ApiClientInstrumentationMixin
+from kadoa_sdk.core.metrics import MetricsRegistry
+from kadoa_sdk.core.operations import operation
+from kadoa_sdk.core.profiling import current_profiler, profile
+from tests.unit.test_metrics import FakeGeneratedApiClient, FakeRestResponse, FakeUrllib3Response
+
+
+class SlowGeneratedApiClient(FakeGeneratedApiClient):
+    """Spends measurable time in each phase of the generated request flow."""
+
+    def call_api(self, method, url, header_params=None, body=None, post_params=None, **kwargs):
+        time.sleep(0.02)
+        return super().call_api(method, url, header_params, body, post_params, **kwargs)
+
+    def response_deserialize(self, response_data, response_types_map=None):
+        time.sleep(0.01)
+        return self._ApiClient__deserialize(json.loads(response_data.data), "object")
+
+    def _ApiClient__deserialize(self, data, klass):  # noqa: N802
+        time.sleep(0.01)
+        return data
+
+
+class ProfiledFake(ApiClientInstrumentationMixin, SlowGeneratedApiClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.metrics = MetricsRegistry(enabled=False)
+        self.next_response = FakeRestResponse(200, b'{"data": [1, 2]}')
+
+
+@pytest.mark.unit
+def test_profile_splits_operation_time_into_phases(tmp_path):
+    api_client = ProfiledFake()
+
+    @operation("fetch_data")
+    def fetch_data():
+        return api_client.request("GET", "/v4/workflows/{id}/data", path_params={"id": "wf-1"})
+
+    @operation("fetch_all_data")
+    def fetch_all_data():
+        pages = [fetch_data(), fetch_data()]
+        time.sleep(0.01)
+        return pages
+
+    path = tmp_path / "profile.speedscope.json"
+    with profile(speedscope_path=path) as profiler:
+        assert current_profiler() is profiler
+        assert fetch_all_data() == [{"data": [1, 2]}] * 2
+    assert current_profiler() is None
+
+    report = profiler.report()
+    fetch = report.operations["fetch_data"]
+    assert fetch.calls == 2
+    assert fetch.network_ms >= 40
+    assert fetch.decode_ms >= 20
+    assert fetch.validation_ms >= 20
+    phases = (
+        fetch.connect_ms
+        + fetch.network_ms
+        + fetch.decode_ms
+        + fetch.validation_ms
+        + fetch.post_processing_ms
+    )
+    assert phases == pytest.approx(fetch.wall_ms, abs=0.01)
+
+    parent = report.operations["fetch_all_data"]
+    assert parent.calls == 1
+    assert parent.wall_ms >= fetch.wall_ms
+    assert parent.network_ms == 0
+    assert 10 <= parent.post_processing_ms < parent.wall_ms - fetch.wall_ms + 0.01
+    assert "fetch_all_data" in report.to_text()
+
+    speedscope = json.loads(path.read_text())
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert {"fetch_all_data", "fetch_data", "network", "decode", "validation"} <= set(frames)
+    (events,) = [item["events"] for item in speedscope["profiles"]]
+    depth = 0
+    for event in events:
+        depth += 1 if event["type"] == "O" else -1
+        assert depth >= 0
+    assert depth == 0
+    assert [event["at"] for event in events] == sorted(event["at"] for event in events)
+
+
+@pytest.mark.unit
+def test_nothing_is_recorded_outside_a_profile():
+    api_client = ProfiledFake()
+
+    @operation("get_workflow")
+    def get_workflow():
+        return api_client.request("GET", "/v4/workflows/wf-1")
+
+    with profile(max_events=2) as profiler:
+        get_workflow()
+    get_workflow()
+
+    report = profiler.report()
+    assert report.operations["get_workflow"].calls == 1
+    assert sum(len(item["events"]) for item in profiler.to_speedscope()["profiles"]) == 2
+
+
+@pytest.mark.unit
+def test_raw_responses_stay_readable_and_body_reads_count_as_network():
+    class SlowBody(FakeUrllib3Response):
+        def read(self, amt=None):
+            time.sleep(0.02)
+            return super().read(amt)
+
+    api_client = ProfiledFake()
+    api_client.next_response.response = SlowBody(200, b'{"data": [1, 2]}', 0)
+
+    @operation("download")
+    def download():
+        response = api_client.request_without_preload_content("GET", "/v4/files/f")
+        try:
+            return response.read()
+        finally:
+            response.release_conn()
+
+    with profile() as profiler:
+        assert download() == b'{"data": [1, 2]}'
+
+    assert profiler.report().operations["download"].network_ms >= 40
+
+
+@pytest.mark.unit
+def test_connect_probe_is_removed_when_the_last_profile_exits():
+    urllib3_connection = pytest.importorskip("urllib3.connection")
+    original = urllib3_connection.HTTPConnection.__dict__["connect"]
+
+    with profile():
+        with profile():
+            probed = urllib3_connection.HTTPConnection.__dict__["connect"]
+            assert probed is not original and probed.__wrapped__ is original
+        assert urllib3_connection.HTTPConnection.__dict__["connect"] is probed
+    assert urllib3_connection.HTTPConnection.__dict__["connect"] is original
@@ -22,12 +22,15 @@ if "kadoa_sdk.core" not in sys.modules:
 
 if "kadoa_sdk.core.logger" not in sys.modules:
     logger_module = types.ModuleType("kadoa_sdk.core.logger")
-    logger_module.wss = SimpleNamespace(debug=lambda *args, **kwargs: None)
+    logger_module.wss = SimpleNamespace(
+        debug=lambda *args, **kwargs: None, isEnabledFor=lambda level: False
+    )
     sys.modules["kadoa_sdk.core.logger"] = logger_module
 
 if "kadoa_sdk.core.settings" not in sys.modules:
     settings_module = types.ModuleType("kadoa_sdk.core.settings")
     settings_module.get_settings = SimpleNamespace
+    settings_module.KadoaSettings = SimpleNamespace
     sys.modules["kadoa_sdk.core.settings"] = settings_module
 
 if "kadoa_sdk.version" not in sys.modules:
@@ -59,10 +62,12 @@ class FakeWebSocket:
     async def send(self, payload: str) -> None:
         self.sent.append(payload)
 
-    async def recv(self) -> str:
+    async def recv(self, decode: bool | None = None) -> str | bytes:
         message = await self._messages.get()
         if isinstance(message, Exception):
             raise message
+        if decode is False:
+            return message.encode()
         return message
 
     async def close(self) -> None:
@@ -74,6 +79,9 @@ class FakeWebSocket:
     def queue_message(self, payload: dict) -> None:
         self._messages.put_nowait(json.dumps(payload))
 
+    def queue_raw(self, payload: str) -> None:
+        self._messages.put_nowait(payload)
+
 
 async def wait_for_socket(created: list[FakeWebSocket], index: int) -> FakeWebSocket:
     for _ in range(50):
@@ -83,6 +91,43 @@ async def wait_for_socket(created: list[FakeWebSocket], index: int) -> FakeWebSo
     raise AssertionError(f"Timed out waiting for socket {index}")
 
 
+def install_fake_transport(
+    monkeypatch, created: list[FakeWebSocket], acknowledged: list[str] | None = None
+) -> None:
+    if acknowledged is None:
+        acknowledged = []
+
+    async def fake_connect(uri: str) -> FakeWebSocket:
+        socket = FakeWebSocket(uri)
+        created.append(socket)
+        return socket
+
+    async def fake_get_oauth_token(self) -> tuple[str, str]:
+        return "token", "team-123"
+
+    async def fake_ack(self, event_id: str) -> None:
+        acknowledged.append(event_id)
+
+    monkeypatch.setattr(realtime_module.websockets, "connect", fake_connect)
+    monkeypatch.setattr(
+        realtime_module.websockets.exceptions,
+        "ConnectionClosed",
+        FakeConnectionClosedError,
+    )
+    monkeypatch.setattr(
+        realtime_module,
+        "get_settings",
+        lambda: SimpleNamespace(
+            wss_api_uri="ws://example.test/realtime",
+            wss_neo_api_uri="ws://example.test/events/ws",
+            realtime_api_uri="http://example.test/realtime",
+            public_api_uri="http://example.test/public",
+        ),
+    )
+    monkeypatch.setattr(Realtime, "_get_oauth_token", fake_get_oauth_token)
+    monkeypatch.setattr(Realtime, "_acknowledge_event", fake_ack)
+
+
 @pytest.mark.unit
 class TestRealtime:
     @pytest.mark.asyncio
@@ -317,3 +362,299 @@ class TestRealtime:
         assert second_socket is not None
 
         await realtime.close_async()
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_skip_the_decoder(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+        decoded: list[bytes] = []
+
+        def counting_decoder(payload: bytes):
+            decoded.append(payload)
+            return json.loads(payload)
+
+        realtime = Realtime(RealtimeConfig(api_key="test-key", json_decoder=counting_decoder))
+        events: list[dict] = []
+        realtime.on_event(events.append)
+
+        await realtime.connect()
+        socket = await wait_for_socket(created, 0)
+        realtime._heartbeat_at[socket] = 0
+
+        socket.queue_message({"type": "heartbeat", "timestamp": 1})
+        socket.queue_raw('{"type":"heartbeat","timestamp":2}')
+        socket.queue_message({"type": "workflow.updated", "timestamp": 3, "message": {}})
+        await asyncio.sleep(0.01)
+
+        assert realtime._heartbeat_at[socket] > 0
+        assert len(decoded) == 1
+        assert isinstance(decoded[0], bytes)
+        assert [event["type"] for event in events] == ["workflow.updated"]
+
+        await realtime.close_async()
+
+    @pytest.mark.asyncio
+    async def test_configured_settings_are_used_instead_of_the_environment(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+        monkeypatch.setattr(realtime_module, "get_settings", lambda: pytest.fail("env read"))
+        settings = realtime_module.KadoaSettings.model_construct(
+            wss_api_uri="ws://configured.test/realtime"
+        )
+
+        realtime = Realtime(RealtimeConfig(api_key="test-key", settings=settings))
+        await realtime.connect()
+        socket = await wait_for_socket(created, 0)
+
+        assert socket.uri == "ws://configured.test/realtime?access_token=token"
+        await realtime.close_async()
+
+    @pytest.mark.asyncio
+    async def test_malformed_frames_are_skipped_without_closing_the_socket(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+
+        realtime = Realtime(RealtimeConfig(api_key="test-key"))
+        events: list[dict] = []
+        realtime.on_event(events.append)
+
+        await realtime.connect()
+        socket = await wait_for_socket(created, 0)
+
+        socket.queue_raw("{not json")
+        socket.queue_raw("[1, 2, 3]")
+        socket.queue_message({"type": "workflow.updated", "timestamp": 1, "message": {}})
+        await asyncio.sleep(0.01)
+
+        assert realtime.is_connected()
+        assert [event["type"] for event in events] == ["workflow.updated"]
+
+        await realtime.close_async()
+
+    @pytest.mark.asyncio
+    async def test_filtered_listeners_only_receive_matching_events(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+
+        realtime = Realtime(RealtimeConfig(api_key="test-key"))
+        received: dict[str, list[str]] = {"all": [], "type": [], "workflow": [], "both": []}
+        realtime.on_event(lambda event: received["all"].append(event["id"]))
+        realtime.on_event(
+            lambda event: received["type"].append(event["id"]), types=["workflow_finished"]
+        )
+        realtime.on_event(
+            lambda event: received["workflow"].append(event["id"]), workflow_ids=["wf-1"]
+        )
+        unsubscribe = realtime.on_event(
+            lambda event: received["both"].append(event["id"]),
+            types=["workflow_finished", "workflow_failed"],
+            workflow_ids=["wf-2"],
+        )
+
+        await realtime.connect()
+        socket = await wait_for_socket(created, 0)
+
+        def event(event_id: str, event_type: str, workflow_id: str | None) -> dict:
+            message = {"workflowId": workflow_id} if workflow_id else {}
+            return {"type": event_type, "id": event_id, "timestamp": 1, "message": message}
+
+        socket.queue_message(event("e1", "workflow_finished", "wf-1"))
+        socket.queue_message(event("e2", "workflow_finished", "wf-2"))
+        socket.queue_message(event("e3", "workflow_failed", "wf-2"))
+        socket.queue_message(event("e4", "workflow_started", "wf-1"))
+        socket.queue_message(event("e5", "workflow_finished", None))
+        await asyncio.sleep(0.01)
+
+        assert received["all"] == ["e1", "e2", "e3", "e4", "e5"]
+        assert received["type"] == ["e1", "e2", "e5"]
+        assert received["workflow"] == ["e1", "e4"]
+        assert received["both"] == ["e2", "e3"]
+
+        unsubscribe()
+        assert realtime._filtered_listeners.get("workflow_failed") is None
+        socket.queue_message(event("e6", "workflow_finished", "wf-2"))
+        await asyncio.sleep(0.01)
+        assert received["both"] == ["e2", "e3"]
+
+        await realtime.close_async()
+
+    @pytest.mark.asyncio
+    async def test_server_side_filter_hints_are_sent_and_widened(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+
+        realtime = Realtime(RealtimeConfig(api_key="test-key", server_side_filters=True))
+        realtime.on_event(lambda event: None, types=["workflow_finished"], workflow_ids=["wf-1"])
+
+        await realtime.connect()
+        socket = await wait_for_socket(created, 0)
+        assert json.loads(socket.sent[0]) == {
+            "action": "subscribe",
+            "channel": "team-123",
+            "filters": {"types": ["workflow_finished"], "workflowIds": ["wf-1"]},
+        }
+
+        # Narrower or equal subscriptions do not trigger a resubscribe.
+        realtime.on_event(lambda event: None, types=["workflow_finished"], workflow_ids=["wf-1"])
+        await asyncio.sleep(0.01)
+        assert len(socket.sent) == 1
+
+        realtime.on_event(lambda event: None, workflow_ids=["wf-2"])
+        await asyncio.sleep(0.01)
+        assert json.loads(socket.sent[1])["filters"] == {"workflowIds": ["wf-1", "wf-2"]}
+
+        realtime.on_event(lambda event: None)
+        await asyncio.sleep(0.01)
+        assert "filters" not in json.loads(socket.sent[2])
+
+        await realtime.close_async()
+
+    @pytest.mark.asyncio
+    async def test_stream_transport_handles_batches_and_resumes_from_cursor(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        acknowledged: list[str] = []
+        install_fake_transport(monkeypatch, created, acknowledged)
+
+        realtime = Realtime(
+            RealtimeConfig(api_key="test-key", reconnect_delay=2), _transport="stream"
+        )
+        events: list[str] = []
+        realtime.on_event(lambda event: events.append(event["id"]))
+
+        await realtime.connect()
+        first_socket = await wait_for_socket(created, 0)
+        assert first_socket.uri == "ws://example.test/events/ws?access_token=token"
+
+        first_socket.queue_raw(
+            json.dumps(
+                [
+                    {"type": "workflow.updated", "id": "e1", "_cursor": "c1", "timestamp": 1},
+                    {"type": "heartbeat", "timestamp": 2},
+                    {"type": "workflow.updated", "id": "e2", "_cursor": "c2", "timestamp": 3},
+                ]
+            )
+        )
+        first_socket.queue_message({"type": "control.draining", "retryAfterMs": 1})
+        second_socket = await wait_for_socket(created, 1)
+        await asyncio.sleep(0.01)
+
+        assert json.loads(second_socket.sent[0])["lastCursor"] == "c2"
+        second_socket.queue_raw(
+            json.dumps(
+                [
+                    {"type": "workflow.updated", "id": "e2", "_cursor": "c2", "timestamp": 3},
+                    {"type": "workflow.updated", "id": "e3", "_cursor": "c3", "timestamp": 4},
+                ]
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        assert events == ["e1", "e2", "e3"]
+        assert acknowledged == ["e1", "e2", "e2", "e3"]
+
+        await realtime.close_async()
+
+    @pytest.mark.asyncio
+    async def test_watchdog_closes_silent_socket_and_reconnects(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+
+        realtime = Realtime(
+            RealtimeConfig(api_key="test-key", reconnect_delay=2, missed_heartbeats_limit=100)
+        )
+        connection_states: list[tuple[bool, str | None]] = []
+        realtime.on_connection(
+            lambda connected, reason=None: connection_states.append((connected, reason))
+        )
+
+        await realtime.connect()
+        first_socket = await wait_for_socket(created, 0)
+
+        for _ in range(4):
+            await asyncio.sleep(0.03)
+            first_socket.queue_message({"type": "heartbeat", "timestamp": 1})
+        assert first_socket.close_code is None
+
+        await asyncio.sleep(0.15)
+        assert first_socket.close_code is not None
+        second_socket = await wait_for_socket(created, 1)
+        await asyncio.sleep(0.01)
+
+        assert connection_states[:2] == [(True, None), (False, "Connection closed")]
+        assert list(realtime._watchdogs) == [second_socket]
+
+        await realtime.close_async()
+        assert realtime._watchdogs == {}
+
+    @pytest.mark.asyncio
+    async def test_draining_socket_keeps_its_own_watchdog(self, monkeypatch):
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+
+        realtime = Realtime(RealtimeConfig(api_key="test-key", reconnect_delay=2))
+        await realtime.connect()
+        first_socket = await wait_for_socket(created, 0)
+
+        first_socket.queue_message({"type": "control.draining", "retryAfterMs": 1})
+        second_socket = await wait_for_socket(created, 1)
+        await asyncio.sleep(0.01)
+
+        assert set(realtime._watchdogs) == {first_socket, second_socket}
+        await first_socket.close()
+        await asyncio.sleep(0.01)
+        assert set(realtime._watchdogs) == {second_socket}
+
+        await realtime.close_async()
+
+    def test_latency_reports_websocket_ping_rtt(self):
+        realtime = Realtime(RealtimeConfig(api_key="test-key"))
+        assert realtime.get_latency_ms() is None
+
+        realtime._ws = SimpleNamespace(latency=0.0125)
+        assert realtime.get_latency_ms() == pytest.approx(12.5)
+
+    @pytest.mark.asyncio
+    async def test_recorder_captures_frames_and_connection_markers(self, monkeypatch, tmp_path):
+        recorder_module = sys.modules["kadoa_sdk.core.realtime_recorder"]
+        created: list[FakeWebSocket] = []
+        install_fake_transport(monkeypatch, created)
+
+        path = tmp_path / "traffic.kdrt"
+        recorder = recorder_module.RealtimeRecorder(path, include_heartbeats=False)
+        realtime = Realtime(RealtimeConfig(api_key="test-key", recorder=recorder))
+        received: list[dict] = []
+        realtime.on_event(received.append)
+
+        await realtime.connect()
+        socket = await wait_for_socket(created, 0)
+        socket.queue_message({"type": "heartbeat", "timestamp": 1})
+        socket.queue_raw('{"type":"workflow.finished","id":"evt-1"}')
+        for _ in range(50):
+            if received:
+                break
+            await asyncio.sleep(0.001)
+        await realtime.close_async()
+        recorder.close()
+
+        entries = list(recorder_module.read_recording(path))
+        assert [entry.kind for entry in entries] == [
+            recorder_module.RECORD_CONNECT,
+            recorder_module.RECORD_FRAME,
+            recorder_module.RECORD_DISCONNECT,
+        ]
+        assert entries[1].payload == b'{"type":"workflow.finished","id":"evt-1"}'
+        assert recorder.frames_recorded == 1
+
+    def test_read_recording_rejects_foreign_and_truncated_files(self, tmp_path):
+        recorder_module = sys.modules["kadoa_sdk.core.realtime_recorder"]
+        foreign = tmp_path / "foreign.bin"
+        foreign.write_bytes(b"not a recording")
+        with pytest.raises(ValueError, match="Not a realtime recording"):
+            list(recorder_module.read_recording(foreign))
+
+        path = tmp_path / "traffic.kdrt"
+        with recorder_module.RealtimeRecorder(path) as recorder:
+            recorder.record_frame("hello")
+        path.write_bytes(path.read_bytes()[:-2])
+        with pytest.raises(ValueError, match="Truncated"):
+            list(recorder_module.read_recording(path))
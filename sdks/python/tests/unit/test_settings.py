@@ -0,0 +1,79 @@
+import pytest
+
+from kadoa_sdk.client import KadoaClientConfig
+from kadoa_sdk.client import client as client_module
+from kadoa_sdk.core import settings as settings_module
+from kadoa_sdk.core.settings import KadoaSettings, get_settings
+
+
+@pytest.fixture
+def fresh_settings():
+    settings_module._find_env_file.cache_clear()
+    get_settings.cache_clear()
+    yield
+    settings_module._find_env_file.cache_clear()
+    get_settings.cache_clear()
+
+
+def _no_fs_walk(*args, **kwargs):
+    pytest.fail(".env discovery should not run")
+
+
+@pytest.mark.unit
+def test_env_file_is_not_resolved_at_class_definition():
+    assert KadoaSettings.model_config.get("env_file") is settings_module._LOCATE_ENV_FILE
+
+
+@pytest.mark.unit
+def test_explicit_env_file_overrides_discovery(monkeypatch, tmp_path, fresh_settings):
+    monkeypatch.setattr("dotenv.find_dotenv", _no_fs_walk)
+    monkeypatch.delenv("KADOA_PUBLIC_API_URI", raising=False)
+    custom = tmp_path / "custom.env"
+    custom.write_text("KADOA_PUBLIC_API_URI=https://custom.example.com\n")
+
+    assert KadoaSettings(_env_file=custom).public_api_uri == "https://custom.example.com"
+    assert KadoaSettings(_env_file=None).public_api_uri == "https://api.kadoa.com"
+
+
+@pytest.mark.unit
+def test_kadoa_no_dotenv_skips_discovery(monkeypatch, fresh_settings):
+    monkeypatch.setattr("dotenv.find_dotenv", _no_fs_walk)
+    monkeypatch.setenv("KADOA_NO_DOTENV", "1")
+    monkeypatch.setenv("KADOA_PUBLIC_API_URI", "https://api.example.test")
+
+    assert get_settings().public_api_uri == "https://api.example.test"
+
+
+@pytest.mark.unit
+def test_dotenv_discovery_runs_once(monkeypatch, tmp_path, fresh_settings):
+    env_file = tmp_path / ".env"
+    env_file.write_text("KADOA_TIMEOUT=45000\n")
+    calls = []
+
+    def find_dotenv(usecwd: bool = False) -> str:
+        calls.append(usecwd)
+        return str(env_file)
+
+    monkeypatch.delenv("KADOA_NO_DOTENV", raising=False)
+    monkeypatch.delenv("KADOA_TIMEOUT", raising=False)
+    monkeypatch.setattr("dotenv.find_dotenv", find_dotenv)
+
+    assert get_settings().timeout_ms == 45000
+    get_settings.cache_clear()
+    assert get_settings().timeout_ms == 45000
+    assert calls == [True]
+
+
+@pytest.mark.unit
+def test_client_with_explicit_config_does_not_read_settings(monkeypatch):
+    monkeypatch.setattr(client_module, "get_settings", _no_fs_walk)
+
+    explicit = KadoaClientConfig(api_key="key", base_url="https://api.example.test", timeout=5)
+    client_module._settings_for(explicit)
+
+    defaults = client_module._settings_for(KadoaClientConfig(api_key="key", load_env=False))
+    assert defaults.public_api_uri == "https://api.kadoa.com"
+    assert defaults.get_timeout_seconds() == 30
+
+    monkeypatch.setattr(client_module, "get_settings", lambda: "from-env")
+    assert client_module._settings_for(KadoaClientConfig(api_key="key")) == "from-env"
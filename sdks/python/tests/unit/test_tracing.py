@@ -0,0 +1,114 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+
+from kadoa_sdk.core.exceptions import KadoaHttpError  # noqa: E402
+from kadoa_sdk.core.instrumentation import ApiClientInstrumentationMixin  # noqa: E402
+from kadoa_sdk.core.metrics import MetricsRegistry  # noqa: E402
+from kadoa_sdk.core.operations import operation  # noqa: E402
+from kadoa_sdk.core.tracing import disable_tracing, enable_tracing, get_tracer  # noqa: E402
+from kadoa_sdk.core.utils import PollingOptions, poll_until  # noqa: E402
+from tests.unit.test_metrics import FakeGeneratedApiClient, FakeRestResponse  # noqa: E402
+
+
+class HeaderRecordingClient(FakeGeneratedApiClient):
+    def call_api(self, method, url, header_params=None, body=None, post_params=None, **kwargs):
+        self.sent_headers = header_params
+        return super().call_api(method, url, header_params, body, post_params, **kwargs)
+
+
+class RecordingFake(ApiClientInstrumentationMixin, HeaderRecordingClient):
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        super().__init__()
+        self.metrics = metrics
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    enable_tracing(provider)
+    yield exporter
+    disable_tracing()
+
+
+@pytest.mark.unit
+def test_operation_span_parents_http_span_and_propagates_traceparent(exporter):
+    api_client = RecordingFake(MetricsRegistry(enabled=False))
+
+    @operation("get_workflow")
+    def get_workflow():
+        return api_client.request("GET", "/v4/workflows/{id}", path_params={"id": "wf-1"})
+
+    get_workflow()
+    api_client.next_response = FakeRestResponse(404, b"{}")
+    with pytest.raises(KadoaHttpError):
+        get_workflow()
+
+    ok_http, ok_op, failed_http, failed_op = exporter.get_finished_spans()
+    assert ok_op.name == "kadoa.get_workflow"
+    assert ok_http.name == "GET /v4/workflows/{id}"
+    assert ok_http.kind == SpanKind.CLIENT
+    assert ok_http.parent.span_id == ok_op.context.span_id
+    assert ok_http.attributes["http.response.status_code"] == 200
+    assert ok_http.attributes["url.full"] == "https://api.test/v4/workflows/wf-1"
+
+    trace_id = format(failed_http.context.trace_id, "032x")
+    span_id = format(failed_http.context.span_id, "016x")
+    assert api_client.sent_headers["traceparent"].startswith(f"00-{trace_id}-{span_id}-")
+    assert failed_http.status.status_code == StatusCode.ERROR
+    assert failed_op.status.status_code == StatusCode.ERROR
+
+
+@pytest.mark.unit
+def test_http_span_of_a_raw_response_ends_on_release(exporter):
+    api_client = RecordingFake(MetricsRegistry(enabled=False))
+
+    api_client.next_response = FakeRestResponse(503, b'{"message": "unavailable"}')
+    response = api_client.request_without_preload_content(
+        "POST", "/v4/workflows", body={"name": "n"}
+    )
+    assert exporter.get_finished_spans() == ()
+    response.read()
+    response.release_conn()
+    response.release_conn()
+
+    (http_span,) = exporter.get_finished_spans()
+    assert http_span.name == "POST /v4/workflows"
+    assert http_span.attributes["http.response.status_code"] == 503
+    assert http_span.attributes["http.response.body.size"] == len(b'{"message": "unavailable"}')
+    assert http_span.attributes["http.request.body.size"] == len('{"name": "n"}')
+    assert http_span.status.status_code == StatusCode.ERROR
+
+
+@pytest.mark.unit
+def test_poll_attempts_are_traced(exporter, monkeypatch):
+    monkeypatch.setattr("kadoa_sdk.core.utils.time.sleep", lambda seconds: None)
+    states = iter([False, False, True])
+
+    result = poll_until(
+        lambda: next(states),
+        lambda done: done,
+        PollingOptions(poll_interval_ms=1000, timeout_ms=10_000),
+    )
+
+    assert result.attempts == 3
+    spans = exporter.get_finished_spans()
+    assert [s.attributes["kadoa.poll.attempt"] for s in spans] == [1, 2, 3]
+    assert [s.attributes["kadoa.poll.complete"] for s in spans] == [False, False, True]
+
+
+@pytest.mark.unit
+def test_tracing_is_a_no_op_by_default():
+    assert get_tracer() is None
+    api_client = RecordingFake(MetricsRegistry(enabled=False))
+    api_client.request("GET", "/v4/changes")
+    assert "traceparent" not in (api_client.sent_headers or {})
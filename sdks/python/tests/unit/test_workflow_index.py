@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+import kadoa_sdk.workflows.workflow_index as index_module
+import kadoa_sdk.workflows.workflows_core_service as core_module
+from kadoa_sdk.workflows.workflow_index import WorkflowIndex
+from kadoa_sdk.workflows.workflows_core_service import WorkflowsCoreService
+from tests.utils.raw_response import RawResponse
+
+
+class IndexedWorkflow(BaseModel):
+    id: Optional[str] = None
+    name: Optional[str] = None
+    state: Optional[str] = None
+    run_state: Optional[str] = Field(default=None, alias="runState")
+    display_state: Optional[str] = Field(default=None, alias="displayState")
+    tags: Optional[List[str]] = None
+    template_id: Optional[str] = Field(default=None, alias="templateId")
+    update_interval: Optional[str] = Field(default=None, alias="updateInterval")
+    url: Optional[str] = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+class FakeWorkflowsApi:
+    def __init__(self) -> None:
+        self.workflows = {
+            "wf-1": {"id": "wf-1", "name": "shop", "state": "ACTIVE", "tags": ["prices"]},
+            "wf-2": {"id": "wf-2", "name": "news", "state": "ACTIVE", "tags": ["daily"]},
+            "wf-3": {
+                "id": "wf-3",
+                "name": "shop",
+                "state": "PAUSED",
+                "tags": ["prices", "daily"],
+                "templateId": "tpl-1",
+                "updateInterval": "DAILY",
+            },
+        }
+        self.audit_logs: dict = {}
+        self.calls: List[str] = []
+
+    def v4_workflows_get_without_preload_content(self, **params):
+        self.calls.append("list")
+        workflows = list(self.workflows.values())[params["skip"] :][: params["limit"]]
+        return RawResponse({"workflows": workflows, "pagination": {"totalCount": 3}})
+
+    def v4_workflows_workflow_id_get_without_preload_content(self, workflow_id):
+        self.calls.append(f"get {workflow_id}")
+        if workflow_id not in self.workflows:
+            return RawResponse({"error": True, "message": "Workflow not found"}, status=404)
+        return RawResponse({**self.workflows[workflow_id], "schemaId": "schema-1"})
+
+    def v5_workflows_workflow_id_auditlog_get_without_preload_content(
+        self, workflow_id, page, limit
+    ):
+        self.calls.append(f"audit {workflow_id}")
+        entries = self.audit_logs.get(workflow_id, [])
+        return RawResponse(
+            {
+                "id": workflow_id,
+                "logEntries": entries[(page - 1) * limit : page * limit],
+                "pagination": {"page": page, "totalPages": max(1, -(-len(entries) // limit))},
+            }
+        )
+
+    def v4_workflows_workflow_id_delete(self, workflow_id):
+        self.workflows.pop(workflow_id)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setattr(core_module, "WorkflowListItemResponse", IndexedWorkflow)
+    monkeypatch.setattr(index_module, "WorkflowListItemResponse", IndexedWorkflow)
+    api = FakeWorkflowsApi()
+    monkeypatch.setattr(WorkflowsCoreService, "workflows_api", property(lambda _self: api))
+    return api
+
+
+@pytest.fixture
+def service(api):
+    return WorkflowsCoreService(Mock())
+
+
+@pytest.mark.unit
+def test_lookups_by_name_tag_state_template_and_schedule(service):
+    index = WorkflowIndex(service).build(page_size=2)
+
+    assert len(index) == 3 and "wf-2" in index
+    assert index.get_by_name("shop").id == "wf-1"
+    assert [w.id for w in index.find(tag="prices")] == ["wf-1", "wf-3"]
+    assert [w.id for w in index.find(tag="daily", state="PAUSED")] == ["wf-3"]
+    assert [w.id for w in index.find(template_id="tpl-1", update_interval="DAILY")] == ["wf-3"]
+    assert index.find(name="shop", state="DRAFT") == []
+    assert [w.id for w in index.find()] == ["wf-1", "wf-2", "wf-3"]
+
+
+@pytest.mark.unit
+def test_realtime_events_update_lookups_or_mark_stale(service):
+    index = WorkflowIndex(service, project=("url",)).build()
+
+    assert index.apply_event(
+        {
+            "type": "extraction:status_changed",
+            "message": {
+                "workflowId": "wf-1",
+                "currentState": "PAUSED",
+                "currentRunState": "RUNNING",
+            },
+        }
+    )
+    assert [w.id for w in index.find(state="PAUSED")] == ["wf-1", "wf-3"]
+    assert index.get("wf-1").run_state == "RUNNING"
+
+    assert not index.apply_event({"type": "workflow.updated", "message": {"workflowId": "wf-9"}})
+    assert not index.apply_event({"type": "workflow.updated", "message": {"workflowId": "wf-2"}})
+    assert index.stale_ids == ["wf-9", "wf-2"]
+
+    index.apply_event({"type": "workflow.deleted", "message": {"workflowId": "wf-3"}})
+    assert "wf-3" not in index and [w.id for w in index.find(tag="daily")] == ["wf-2"]
+
+
+@pytest.mark.unit
+def test_sync_applies_audit_log_entries_since_build(service, api):
+    index = WorkflowIndex(service).build()
+    before, after = index.built_at - timedelta(hours=1), index.built_at + timedelta(seconds=1)
+    api.audit_logs["wf-1"] = [
+        {"operationType": "UPDATE", "createdAt": _iso(before), "newValue": {"name": "old"}},
+        {
+            "operationType": "UPDATE",
+            "createdAt": _iso(after + timedelta(seconds=1)),
+            "newValue": {"name": "renamed", "tags": ["archive"]},
+        },
+        {"operationType": "UPDATE", "createdAt": _iso(after), "newValue": {"name": "interim"}},
+    ]
+    api.audit_logs["wf-2"] = [{"operationType": "DELETE", "createdAt": _iso(after)}]
+    api.workflows["wf-4"] = {"id": "wf-4", "name": "fresh", "state": "DRAFT", "tags": []}
+    for workflow_id in ("wf-1", "wf-2", "wf-4", "wf-5"):
+        index.mark_stale(workflow_id)
+
+    assert index.sync() == 4
+
+    assert index.get("wf-1").name == "renamed"
+    assert index.get_by_name("shop").id == "wf-3"
+    assert [w.id for w in index.find(tag="archive")] == ["wf-1"]
+    assert "wf-2" not in index and "wf-5" not in index
+    assert index.get("wf-4").state == "DRAFT"
+    assert index.stale_ids == []
+
+    # Already applied entries are not applied again
+    api.audit_logs["wf-1"].append(
+        {"operationType": "UPDATE", "createdAt": _iso(before), "newValue": {"name": "old"}}
+    )
+    index.sync(["wf-1"])
+    assert index.get("wf-1").name == "renamed"
+
+
+@pytest.mark.unit
+def test_invalid_audit_values_are_not_merged(service, api):
+    index = WorkflowIndex(service).build()
+    after = index.built_at + timedelta(seconds=1)
+    api.audit_logs["wf-1"] = [
+        {"operationType": "UPDATE", "createdAt": _iso(after), "newValue": {"tags": "sale"}}
+    ]
+    api.workflows["wf-1"] = {**api.workflows["wf-1"], "name": "shop v2", "tags": ["sale"]}
+
+    index.sync(["wf-1"])
+
+    assert index.get("wf-1").tags == ["sale"] and index.get("wf-1").name == "shop v2"
+    assert api.calls[-2:] == ["audit wf-1", "get wf-1"]
+
+
+@pytest.mark.unit
+def test_sqlite_snapshot_is_written_through_and_reloaded(service, tmp_path):
+    path = tmp_path / "workflows.sqlite3"
+    with WorkflowIndex(service, path=path) as index:
+        index.build()
+        index.apply_event({"type": "x", "message": {"workflowId": "wf-2", "finalState": "PAUSED"}})
+        index.discard("wf-1")
+
+    with WorkflowIndex(service, path=path) as reloaded:
+        assert [w.id for w in reloaded.find(state="PAUSED")] == ["wf-2", "wf-3"]
+        assert reloaded.get("wf-3").tags == ["prices", "daily"]
+        assert "wf-1" not in reloaded
+        assert reloaded.built_at is not None and reloaded.built_at.tzinfo == timezone.utc
+
+
+@pytest.mark.unit
+def test_attached_index_answers_get_by_name_and_tracks_deletes(service, api):
+    index = service.build_index()
+    api.calls.clear()
+
+    assert service.get_by_name("news").id == "wf-2"
+    assert api.calls == []
+
+    service.delete("wf-2")
+    assert "wf-2" not in index
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+from typing import Optional
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+import kadoa_sdk.workflows.workflows_core_service as core_module
+from kadoa_sdk.core.exceptions import KadoaHttpError, KadoaSdkError
+from kadoa_sdk.core.pagination import iter_windows
+from kadoa_sdk.extraction.extraction_acl import ListWorkflowsRequest
+from kadoa_sdk.workflows.workflows_core_service import WorkflowsCoreService
+from tests.utils.raw_response import RawResponse
+
+
+class ListedWorkflow(BaseModel):
+    id: Optional[str] = None
+    name: Optional[str] = None
+    state: Optional[str] = None
+    run_state: Optional[str] = Field(default=None, alias="runState")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class FakeListingApi:
+    """Serves skip/limit windows of ``total`` workflows."""
+
+    def __init__(self, total: int, names=None, fail_at: Optional[int] = None) -> None:
+        self.names = names or [f"workflow {index}" for index in range(total)]
+        self.fail_at = fail_at
+        self.calls = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def v4_workflows_get_without_preload_content(self, **params):
+        with self._lock:
+            self.calls.append(params)
+            self.threads.add(threading.current_thread().name)
+        skip, limit = params["skip"], params["limit"]
+        if skip == self.fail_at:
+            return RawResponse({"error": "boom"}, status=500)
+        workflows = [
+            {"id": f"wf-{index}", "name": name, "state": "ACTIVE", "runState": "FINISHED"}
+            for index, name in enumerate(self.names)
+        ][skip : skip + limit]
+        return RawResponse({"workflows": workflows, "pagination": {"totalCount": len(self.names)}})
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(core_module, "WorkflowListItemResponse", ListedWorkflow)
+    service = WorkflowsCoreService(Mock())
+
+    def install(api):
+        monkeypatch.setattr(WorkflowsCoreService, "workflows_api", property(lambda _self: api))
+        return service
+
+    return install
+
+
+@pytest.mark.unit
+def test_iter_all_walks_every_window_in_order_with_prefetch(service):
+    api = FakeListingApi(total=1_005)
+
+    workflows = list(
+        service(api).iter_all(ListWorkflowsRequest(state="ACTIVE"), page_size=100, prefetch=4)
+    )
+
+    assert [workflow.id for workflow in workflows] == [f"wf-{index}" for index in range(1_005)]
+    assert workflows[0].run_state == "FINISHED"
+    assert sorted(call["skip"] for call in api.calls) == list(range(0, 1_005, 100))
+    assert all(call["limit"] == 100 and call["state"] == "ACTIVE" for call in api.calls)
+    assert any(name.startswith("kadoa-page") for name in api.threads)
+
+
+@pytest.mark.unit
+def test_iter_all_projection_skips_validation(service, monkeypatch):
+    api = FakeListingApi(total=3)
+    monkeypatch.setattr(
+        ListedWorkflow, "model_validate", Mock(side_effect=AssertionError("validated"))
+    )
+
+    workflows = service(api).list_all(project=("id", "runState"))
+
+    assert [(workflow.id, workflow.run_state, workflow.name) for workflow in workflows] == [
+        ("wf-0", "FINISHED", None),
+        ("wf-1", "FINISHED", None),
+        ("wf-2", "FINISHED", None),
+    ]
+    with pytest.raises(KadoaSdkError, match="Unknown workflow fields: nope"):
+        service(api).list_all(project=("id", "nope"))
+
+
+@pytest.mark.unit
+def test_iter_all_async_matches_sync(service):
+    api = FakeListingApi(total=250)
+
+    async def collect():
+        return [
+            workflow.id
+            async for workflow in service(api).iter_all_async(page_size=50, project=("id",))
+        ]
+
+    assert asyncio.run(collect()) == [f"wf-{index}" for index in range(250)]
+
+
+@pytest.mark.unit
+def test_iter_all_raises_http_errors_from_later_windows(service):
+    api = FakeListingApi(total=300, fail_at=200)
+
+    with pytest.raises(KadoaHttpError) as raised:
+        list(service(api).iter_all(page_size=100))
+
+    assert raised.value.http_status == 500
+
+
+@pytest.mark.unit
+def test_get_by_name_prefers_exact_match_beyond_first_page(service):
+    names = [f"shop {index}" for index in range(150)] + ["shop"]
+    api = FakeListingApi(total=len(names), names=names)
+
+    assert service(api).get_by_name("shop").id == "wf-150"
+    no_exact_match = FakeListingApi(total=2, names=["shop a", "shop b"])
+    assert service(no_exact_match).get_by_name("shop").id == "wf-0"
+
+
+@pytest.mark.unit
+def test_iter_windows_stops_at_short_window_without_total():
+    rows = list(range(25))
+    calls = []
+
+    def fetch(skip, limit):
+        calls.append(skip)
+        return rows[skip : skip + limit], None
+
+    windows = list(iter_windows(fetch, page_size=10, prefetch=4))
+
+    assert [len(window) for window in windows] == [10, 10, 5]
+    assert calls == [0, 10, 20]
@@ -0,0 +1,122 @@
+from unittest.mock import Mock
+
+import pytest
+
+import kadoa_sdk.core.utils as utils_module
+import kadoa_sdk.workflows.workflows_core_service as core_module
+from kadoa_sdk.core.exceptions import KadoaErrorCode, KadoaHttpError, KadoaSdkError
+from kadoa_sdk.extraction.services.extraction_builder_service import ExtractionBuilderService
+from kadoa_sdk.extraction.services.workflow_manager_service import WorkflowManagerService
+from kadoa_sdk.workflows import WorkflowsCoreService, WorkflowStatus
+from tests.utils.raw_response import RawResponse
+
+
+def _workflow(run_state: str, state: str = "ACTIVE") -> dict:
+    return {
+        "id": "wf-1",
+        "name": "shop",
+        "state": state,
+        "runState": run_state,
+        "displayState": "RUNNING",
+        "jobId": "job-1",
+        "startedAt": "2024-01-01T00:00:00Z",
+        "schema": [{"name": "title", "dataType": "STRING"}],
+        "monitoring": {"enabled": False},
+    }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = Mock()
+    monkeypatch.setattr(WorkflowsCoreService, "workflows_api", property(lambda _self: api))
+    monkeypatch.setattr(utils_module.time, "sleep", lambda seconds: None)
+    return api
+
+
+@pytest.mark.unit
+def test_get_status_reads_status_fields_without_model_validation(api, monkeypatch):
+    api.v4_workflows_workflow_id_get_without_preload_content.return_value = RawResponse(
+        _workflow("RUNNING")
+    )
+    validate = Mock(side_effect=AssertionError("validated"))
+    monkeypatch.setattr(core_module.GetWorkflowResponse, "model_validate", validate)
+
+    status = WorkflowsCoreService(Mock()).get_status("wf-1")
+
+    assert status == WorkflowStatus(
+        id="wf-1",
+        state="ACTIVE",
+        run_state="RUNNING",
+        display_state="RUNNING",
+        job_id="job-1",
+        started_at="2024-01-01T00:00:00Z",
+    )
+    assert not hasattr(status, "__dict__")
+
+
+@pytest.mark.unit
+def test_get_status_preserves_http_errors(api):
+    api.v4_workflows_workflow_id_get_without_preload_content.return_value = RawResponse(
+        {"error": "Workflow not found"}, status=404
+    )
+
+    with pytest.raises(KadoaHttpError) as raised:
+        WorkflowsCoreService(Mock()).get_status("wf-404")
+
+    assert raised.value.code == KadoaErrorCode.NOT_FOUND
+    assert raised.value.details["workflowId"] == "wf-404"
+
+
+@pytest.mark.unit
+def test_wait_returns_the_terminal_poll_without_refetching(api, monkeypatch):
+    api.v4_workflows_workflow_id_get_without_preload_content.side_effect = [
+        RawResponse(_workflow("RUNNING", state="QUEUED")),
+        RawResponse(_workflow("FINISHED", state="QUEUED")),
+        RawResponse(_workflow("FINISHED")),
+    ]
+    validate = Mock(side_effect=lambda data: data)
+    monkeypatch.setattr(core_module.GetWorkflowResponse, "model_validate", validate)
+
+    workflow = WorkflowsCoreService(Mock()).wait("wf-1", timeout_ms=60_000)
+
+    assert workflow == _workflow("FINISHED")
+    assert api.v4_workflows_workflow_id_get_without_preload_content.call_count == 3
+    validate.assert_called_once()
+
+
+@pytest.mark.unit
+def test_wait_for_workflow_completion_polls_status_only(monkeypatch):
+    monkeypatch.setattr(utils_module.time, "sleep", lambda seconds: None)
+    client = Mock()
+    client.workflow.get_status.side_effect = [
+        WorkflowStatus.from_dict(_workflow("RUNNING")),
+        WorkflowStatus.from_dict(_workflow("FINISHED")),
+    ]
+    monkeypatch.setattr(core_module.GetWorkflowResponse, "model_validate", lambda data: data)
+
+    manager = WorkflowManagerService(client)
+    assert manager.wait_for_workflow_completion("wf-1", 10, 60) == _workflow("FINISHED")
+    assert client.workflow.get_status.call_count == 2
+    client.workflow.get.assert_not_called()
+
+
+@pytest.mark.unit
+def test_wait_for_ready_returns_the_ready_poll(monkeypatch):
+    monkeypatch.setattr(utils_module.time, "sleep", lambda seconds: None)
+    client = Mock()
+    client.workflow.get_status.side_effect = [
+        WorkflowStatus.from_dict(_workflow("RUNNING", state="QUEUED")),
+        WorkflowStatus.from_dict(_workflow("RUNNING", state="PREVIEW")),
+    ]
+    monkeypatch.setattr(core_module.GetWorkflowResponse, "model_validate", lambda data: data)
+
+    workflow = ExtractionBuilderService(client)._wait_for_ready("wf-1")
+
+    assert workflow == _workflow("RUNNING", state="PREVIEW")
+    client.workflow.get.assert_not_called()
+
+
+@pytest.mark.unit
+def test_status_without_document_cannot_become_a_workflow():
+    with pytest.raises(KadoaSdkError):
+        WorkflowStatus(id="wf-1", run_state="FINISHED").to_workflow()
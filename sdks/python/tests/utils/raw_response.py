@@ -0,0 +1,18 @@
+"""Fake urllib3 response for ``*_without_preload_content`` API calls."""
+
+import json
+from typing import Any, Optional
+
+
+class RawResponse:
+    """Undecoded response holding ``body`` as JSON (or as given, for bytes)."""
+
+    def __init__(self, body: Any, status: int = 200) -> None:
+        self.data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.status = status
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self.data[:amt]
+
+    def release_conn(self) -> None:
+        pass